@@ -10,6 +10,7 @@ from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from pbc_regulations.icrawler import pbc_monitor
 from pbc_regulations.icrawler.crawler import safe_filename
+from pbc_regulations.icrawler.state import read_state_data
 from pbc_regulations.icrawler.text_pipeline import (
     EntryTextRecord,
     ProcessReport,
@@ -45,7 +46,8 @@ def run(
     *,
     progress_callback: Optional[Callable[[EntryTextRecord, int, int], None]] = None,
 ) -> Tuple[ProcessReport, Dict[str, Any]]:
-    data: Dict[str, Any] = json.loads(state_path.read_text(encoding="utf-8"))
+    loaded = read_state_data(str(state_path))
+    data: Dict[str, Any] = loaded if isinstance(loaded, dict) else {"entries": []}
     total_entries = 0
     raw_entries = data.get("entries")
     if isinstance(raw_entries, list):
@@ -59,11 +61,19 @@ def run(
         if progress_callback is not None:
             progress_callback(record, processed_count, total_entries)
 
+    previous_state: Optional[Dict[str, Any]] = None
+    if output_state_path is not None and output_state_path.exists():
+        try:
+            previous_state = json.loads(output_state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            previous_state = None
+
     report = process_state_data(
         data,
         output_dir,
         state_path=state_path,
         progress_callback=_handle_progress if progress_callback is not None else None,
+        previous_state=previous_state if isinstance(previous_state, dict) else None,
     )
     if output_state_path is not None:
         output_state_path.parent.mkdir(parents=True, exist_ok=True)
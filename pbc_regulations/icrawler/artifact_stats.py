@@ -0,0 +1,322 @@
+"""Running file-count and byte totals for artifact directories."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Optional
+
+try:  # pragma: no cover - optional dependency
+    import fcntl
+except ImportError:  # pragma: no cover - optional dependency
+    fcntl = None  # type: ignore[assignment]
+
+from .fetching import VALIDATORS_SUFFIX
+
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = ".artifact_stats.json"
+MANIFEST_VERSION = 1
+
+# How long a manifest's totals are trusted before the next full audit.
+DEFAULT_AUDIT_INTERVAL = timedelta(hours=24)
+
+# Number of most recent writes kept in the manifest for change notifications.
+RECENT_WRITES_LIMIT = 20
+
+# Files written next to artifacts that are not artifacts themselves.
+_IGNORED_SUFFIXES = (VALIDATORS_SUFFIX, ".part", ".link", ".tmp")
+
+
+__all__ = [
+    "DEFAULT_AUDIT_INTERVAL",
+    "MANIFEST_FILENAME",
+    "RECENT_WRITES_LIMIT",
+    "ArtifactStats",
+    "artifact_file_size",
+    "audit_artifact_directory",
+    "load_artifact_stats",
+    "manifest_path",
+    "record_artifact_write",
+    "tracked_artifact_stats",
+]
+
+
+def manifest_path(directory: str) -> str:
+    return os.path.join(directory, MANIFEST_FILENAME)
+
+
+def _is_artifact(filename: str) -> bool:
+    if filename == MANIFEST_FILENAME or filename.startswith(f"{MANIFEST_FILENAME}."):
+        return False
+    return not filename.endswith(_IGNORED_SUFFIXES)
+
+
+def _file_type(filename: str) -> str:
+    return os.path.splitext(filename)[1].lower().lstrip(".") or "none"
+
+
+def _now() -> str:
+    return datetime.now().isoformat(timespec="seconds")
+
+
+@dataclass
+class ArtifactStats:
+    """File count and byte totals of one directory, overall and per extension.
+
+    ``writes`` counts every recorded write and numbers the entries of
+    ``recent``, the last :data:`RECENT_WRITES_LIMIT` files written, so a
+    reader can tell which writes it has not seen yet.
+    """
+
+    files: int = 0
+    bytes: int = 0
+    types: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    audited_at: Optional[str] = None
+    updated_at: Optional[str] = None
+    writes: int = 0
+    recent: List[Dict[str, object]] = field(default_factory=list)
+
+    def add(self, file_type: str, size: int, count: int = 1) -> None:
+        self.files += count
+        self.bytes += size
+        totals = self.types.setdefault(file_type, {"files": 0, "bytes": 0})
+        totals["files"] += count
+        totals["bytes"] += size
+        if totals["files"] <= 0 and totals["bytes"] <= 0:
+            del self.types[file_type]
+
+    def audit_due(self, interval: timedelta = DEFAULT_AUDIT_INTERVAL) -> bool:
+        if not self.audited_at:
+            return True
+        try:
+            audited = datetime.fromisoformat(self.audited_at)
+        except ValueError:
+            return True
+        return datetime.now() - audited >= interval
+
+    def to_jsonable(self) -> Dict[str, object]:
+        return {
+            "version": MANIFEST_VERSION,
+            "files": self.files,
+            "bytes": self.bytes,
+            "types": {key: dict(value) for key, value in sorted(self.types.items())},
+            "audited_at": self.audited_at,
+            "updated_at": self.updated_at,
+            "writes": self.writes,
+            "recent": [dict(item) for item in self.recent],
+        }
+
+    @classmethod
+    def from_jsonable(cls, data: object) -> Optional["ArtifactStats"]:
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return None
+        types: Dict[str, Dict[str, int]] = {}
+        raw_types = data.get("types")
+        if isinstance(raw_types, dict):
+            for key, value in raw_types.items():
+                if isinstance(value, dict):
+                    types[str(key)] = {
+                        "files": int(value.get("files") or 0),
+                        "bytes": int(value.get("bytes") or 0),
+                    }
+        try:
+            return cls(
+                files=int(data.get("files") or 0),
+                bytes=int(data.get("bytes") or 0),
+                types=types,
+                audited_at=data.get("audited_at") or None,
+                updated_at=data.get("updated_at") or None,
+                writes=int(data.get("writes") or 0),
+                recent=[item for item in data.get("recent") or [] if isinstance(item, dict)],
+            )
+        except (TypeError, ValueError):
+            return None
+
+
+def load_artifact_stats(directory: Optional[str]) -> Optional[ArtifactStats]:
+    """Return the manifest of *directory*, or ``None`` if it is missing or invalid."""
+
+    if not directory:
+        return None
+    try:
+        with open(manifest_path(directory), "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    return ArtifactStats.from_jsonable(data)
+
+
+def _save_artifact_stats(directory: str, stats: ArtifactStats) -> None:
+    target = manifest_path(directory)
+    tmp_path = f"{target}.{os.getpid()}.{threading.get_ident()}"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(stats.to_jsonable(), handle, ensure_ascii=False)
+        os.replace(tmp_path, target)
+    except OSError as exc:
+        logger.warning("Failed to write artifact manifest %s: %s", target, exc)
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+@contextmanager
+def _directory_lock(directory: str) -> Iterator[None]:
+    """Serialise manifest updates of *directory* across threads and processes.
+
+    Threads share a per-directory lock; processes (the monitor and a text
+    extraction run writing the same tree) take an ``flock`` on a lock file
+    next to the manifest. Where ``fcntl`` is unavailable only threads are
+    serialised and concurrent processes may drop each other's updates until
+    the next audit.
+    """
+
+    key = os.path.abspath(directory)
+    with _locks_guard:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = _locks[key] = threading.Lock()
+    with lock:
+        handle = None
+        if fcntl is not None:
+            try:
+                handle = open(f"{manifest_path(key)}.lock", "a")
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            except OSError as exc:
+                logger.debug("Failed to lock artifact manifest in %s: %s", key, exc)
+                if handle is not None:
+                    handle.close()
+                    handle = None
+        try:
+            yield
+        finally:
+            if handle is not None:
+                handle.close()
+
+
+def _manifest_root(path: str, root: Optional[str] = None) -> Optional[str]:
+    """Return the nearest directory above *path* that holds a manifest.
+
+    Audits count a whole tree into the manifest at its root, so a write to a
+    subdirectory belongs to the manifest of the enclosing task directory. The
+    search stops at *root* (inclusive) when given, so a tree without any
+    manifest costs one check per level below *root* rather than one per
+    ancestor up to ``/``.
+    """
+
+    current = os.path.dirname(os.path.abspath(path))
+    boundary = os.path.abspath(root) if root else None
+    if boundary is not None and os.path.commonpath([current, boundary]) != boundary:
+        return None
+    while True:
+        if os.path.isfile(manifest_path(current)):
+            return current
+        parent = os.path.dirname(current)
+        if current == boundary or parent == current:
+            return None
+        current = parent
+
+
+def audit_artifact_directory(directory: Optional[str]) -> ArtifactStats:
+    """Recount *directory* in one ``os.scandir`` pass and rewrite its manifest."""
+
+    stats = ArtifactStats()
+    if not directory or not os.path.isdir(directory):
+        return stats
+    with _directory_lock(directory):
+        previous = load_artifact_stats(directory)
+        if previous is not None:
+            stats.writes = previous.writes
+            stats.recent = previous.recent
+        pending: List[str] = [directory]
+        while pending:
+            current = pending.pop()
+            try:
+                with os.scandir(current) as iterator:
+                    for item in iterator:
+                        try:
+                            if item.is_dir(follow_symlinks=False):
+                                pending.append(item.path)
+                            elif item.is_file() and _is_artifact(item.name):
+                                stats.add(_file_type(item.name), item.stat().st_size)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+        stats.audited_at = stats.updated_at = _now()
+        _save_artifact_stats(directory, stats)
+    return stats
+
+
+def tracked_artifact_stats(
+    directory: Optional[str],
+    audit_interval: timedelta = DEFAULT_AUDIT_INTERVAL,
+) -> ArtifactStats:
+    """Return the manifest of *directory*, auditing it first when missing or due."""
+
+    stats = load_artifact_stats(directory)
+    if stats is None or stats.audit_due(audit_interval):
+        stats = audit_artifact_directory(directory)
+    return stats
+
+
+def artifact_file_size(path: str) -> Optional[int]:
+    """Return the size of *path* before it is overwritten, or ``None`` if absent."""
+
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return None
+
+
+def record_artifact_write(
+    path: str,
+    previous_size: Optional[int] = None,
+    root: Optional[str] = None,
+) -> None:
+    """Account for *path* having just been written in its enclosing manifest.
+
+    The write is recorded in the nearest manifest above *path*, the one whose
+    audit counts it; only directories up to *root* are searched when it is
+    given. *previous_size* is the size of the file it replaced (see
+    :func:`artifact_file_size`). Without a manifest nothing is recorded; the
+    next audit counts the file.
+    """
+
+    filename = os.path.basename(path)
+    if not _is_artifact(filename):
+        return
+    size = artifact_file_size(path)
+    if size is None:
+        return
+    directory = _manifest_root(path, root)
+    if directory is None:
+        return
+    name = os.path.relpath(os.path.abspath(path), directory)
+    with _directory_lock(directory):
+        stats = load_artifact_stats(directory)
+        if stats is None:
+            return
+        file_type = _file_type(filename)
+        if previous_size is not None:
+            stats.add(file_type, -previous_size, count=-1)
+        stats.add(file_type, size)
+        stats.updated_at = _now()
+        stats.writes += 1
+        stats.recent.append(
+            {"seq": stats.writes, "name": name, "bytes": size, "at": stats.updated_at}
+        )
+        del stats.recent[:-RECENT_WRITES_LIMIT]
+        _save_artifact_stats(directory, stats)
@@ -0,0 +1,315 @@
+"""Shared asyncio HTTP engine behind ``fetch`` and ``download_file``."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Dict, Mapping, Optional
+
+import requests
+
+from .fetcher import (
+    DEFAULT_HEADERS,
+    FetchedPage,
+    normalize_response_encoding,
+    response_validators,
+)
+from .throttle import _host_key, get_host_throttle
+
+try:
+    import httpx
+except ModuleNotFoundError:  # pragma: no cover - optional dependency guard
+    httpx = None
+
+
+logger = logging.getLogger(__name__)
+
+
+__all__ = [
+    "AsyncFetchEngine",
+    "get_fetch_engine",
+    "install_fetch_engine",
+]
+
+
+class AsyncFetchEngine:
+    """Run every HTTP request of the process on one background event loop.
+
+    Callers stay synchronous: :meth:`fetch_text` and :meth:`download_to` block
+    until the request finishes, while :meth:`prefetch` returns a future so
+    pagination pages can be requested ahead of the crawl. Politeness moves into
+    the loop: requests to a host are spaced by the caller's ``delay`` plus a
+    random ``jitter``, and the shared :class:`~.throttle.HostThrottle` is
+    honoured the same way. A request claims its slot only when it is about to
+    be sent, so a queued request that is cancelled never holds back later
+    ones. Waiting is an ``asyncio.sleep`` rather than a blocked thread.
+
+    With ``httpx`` installed all tasks share a single ``AsyncClient`` holding at
+    most *max_connections* sockets. Without it, requests are issued through
+    ``requests`` on a pool of *max_connections* threads.
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 4,
+        *,
+        session_factory: Optional[Callable[[], requests.Session]] = None,
+        use_httpx: Optional[bool] = None,
+    ) -> None:
+        self.max_connections = max(1, int(max_connections))
+        if use_httpx is None:
+            use_httpx = httpx is not None
+        if use_httpx and httpx is None:
+            raise RuntimeError("httpx is required for the httpx backend")
+        self.backend = "httpx" if use_httpx else "requests"
+        self._session_factory = session_factory
+        self._local = threading.local()
+        self._next_slot: Dict[str, float] = {}
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._client: Any = None
+        self._limit: Optional[asyncio.Semaphore] = None
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self._loop.run_forever,
+            name="fetch-engine",
+            daemon=True,
+        )
+        self._thread.start()
+        self._submit(self._setup()).result()
+
+    async def _setup(self) -> None:
+        self._limit = asyncio.Semaphore(self.max_connections)
+        if self.backend == "httpx":
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=self.max_connections),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_connections,
+                thread_name_prefix="fetch",
+            )
+
+    def _submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    async def _pace(self, url: str, delay: float, jitter: float) -> None:
+        interval = max(0.0, delay)
+        if jitter > 0:
+            interval += random.uniform(0, jitter)
+        key = _host_key(url)
+        throttle = get_host_throttle()
+        while True:
+            now = time.monotonic()
+            wait = self._next_slot.get(key, now) - now
+            if wait <= 0 and throttle is not None:
+                wait = throttle.try_reserve(url)
+            if wait <= 0:
+                self._next_slot[key] = now + interval
+                return
+            await asyncio.sleep(wait)
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            factory = self._session_factory
+            if factory is None:
+                from .fetching import create_session as factory
+            session = factory()
+            self._local.session = session
+        return session
+
+    def _blocking_get(
+        self,
+        url: str,
+        timeout: float,
+        stream: bool,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> requests.Response:
+        request_kwargs: Dict[str, Any] = {"stream": stream, "timeout": timeout}
+        if headers:
+            request_kwargs["headers"] = dict(headers)
+        try:
+            response = self._session().get(url, **request_kwargs)
+        except requests.RequestException as exc:
+            raise RuntimeError(f"Request to {url} failed: {exc}") from exc
+        response.raise_for_status()
+        return response
+
+    def _blocking_page(
+        self,
+        url: str,
+        timeout: float,
+        headers: Optional[Mapping[str, str]],
+    ) -> FetchedPage:
+        response = self._blocking_get(url, timeout, stream=False, headers=headers)
+        status = getattr(response, "status_code", 200)
+        if status == 304:
+            return FetchedPage(304, "", {})
+        normalize_response_encoding(response)
+        return FetchedPage(
+            status,
+            response.text,
+            response_validators(getattr(response, "headers", None) or {}),
+        )
+
+    def _blocking_download(self, url: str, target: str, timeout: float) -> str:
+        response = self._blocking_get(url, timeout, stream=True)
+        digest = hashlib.sha256()
+        with open(target, "wb") as handle:
+            for chunk in response.iter_content(chunk_size=8192):
+                if chunk:
+                    handle.write(chunk)
+                    digest.update(chunk)
+        return digest.hexdigest()
+
+    async def _get_page(
+        self,
+        url: str,
+        delay: float,
+        jitter: float,
+        timeout: float,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> FetchedPage:
+        await self._pace(url, delay, jitter)
+        assert self._limit is not None
+        async with self._limit:
+            if self._client is None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._executor,
+                    self._blocking_page,
+                    url,
+                    timeout,
+                    headers,
+                )
+            try:
+                response = await self._client.get(url, headers=headers, timeout=timeout)
+            except httpx.TransportError as exc:
+                raise RuntimeError(f"Request to {url} failed: {exc}") from exc
+            if response.status_code == 304:
+                return FetchedPage(304, "", {})
+            response.raise_for_status()
+            if response.charset_encoding:
+                text = response.text
+            else:
+                detected = requests.compat.chardet.detect(response.content) or {}
+                text = response.content.decode(detected.get("encoding") or "utf-8", errors="replace")
+            return FetchedPage(response.status_code, text, response_validators(response.headers))
+
+    async def _download(
+        self,
+        url: str,
+        target: str,
+        delay: float,
+        jitter: float,
+        timeout: float,
+    ) -> str:
+        await self._pace(url, delay, jitter)
+        assert self._limit is not None
+        async with self._limit:
+            if self._client is None:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._executor,
+                    self._blocking_download,
+                    url,
+                    target,
+                    timeout,
+                )
+            digest = hashlib.sha256()
+            try:
+                async with self._client.stream("GET", url, timeout=timeout) as response:
+                    response.raise_for_status()
+                    with open(target, "wb") as handle:
+                        async for chunk in response.aiter_bytes(8192):
+                            handle.write(chunk)
+                            digest.update(chunk)
+            except httpx.TransportError as exc:
+                raise RuntimeError(f"Request to {url} failed: {exc}") from exc
+        return digest.hexdigest()
+
+    def prefetch(
+        self,
+        url: str,
+        delay: float,
+        jitter: float,
+        timeout: float,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Future:
+        """Start fetching *url* and return a future resolving to a :class:`FetchedPage`."""
+
+        return self._submit(self._get_page(url, delay, jitter, timeout, headers))
+
+    def fetch_page(
+        self,
+        url: str,
+        delay: float,
+        jitter: float,
+        timeout: float,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> FetchedPage:
+        return self.prefetch(url, delay, jitter, timeout, headers).result()
+
+    def fetch_text(self, url: str, delay: float, jitter: float, timeout: float) -> str:
+        return self.fetch_page(url, delay, jitter, timeout).text
+
+    def download_to(
+        self,
+        url: str,
+        target: str,
+        delay: float,
+        jitter: float,
+        timeout: float,
+    ) -> str:
+        """Stream *url* into *target* and return the SHA-256 of its content."""
+
+        directory = os.path.dirname(target)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        return self._submit(self._download(url, target, delay, jitter, timeout)).result()
+
+    async def _shutdown(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+
+    def close(self) -> None:
+        if not self._loop.is_running():
+            return
+        try:
+            self._submit(self._shutdown()).result()
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AsyncFetchEngine":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+_active_engine: Optional[AsyncFetchEngine] = None
+
+
+def install_fetch_engine(engine: Optional[AsyncFetchEngine]) -> Optional[AsyncFetchEngine]:
+    """Route ``fetch``/``download_file`` through *engine*; return the previous one."""
+
+    global _active_engine
+    previous = _active_engine
+    _active_engine = engine
+    return previous
+
+
+def get_fetch_engine() -> Optional[AsyncFetchEngine]:
+    return _active_engine
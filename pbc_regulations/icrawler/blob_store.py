@@ -0,0 +1,115 @@
+"""Content-addressed storage shared by every task's download directory."""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIRNAME = "blobs"
+
+
+__all__ = [
+    "BLOB_DIRNAME",
+    "BlobStore",
+    "file_digest",
+    "file_sha256",
+    "get_blob_store",
+    "install_blob_store",
+]
+
+
+def file_sha256(path: str, chunk_size: int = 1 << 16) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def file_digest(path: Optional[str]) -> Optional[str]:
+    """Return the SHA-256 of *path*, or ``None`` if it cannot be read."""
+
+    if not path or not os.path.isfile(path):
+        return None
+    try:
+        return file_sha256(path)
+    except OSError:
+        return None
+
+
+class BlobStore:
+    """Keep one copy of each distinct file under ``<root>/ab/cd/<sha256>``.
+
+    Downloads are written to a temporary file while their digest is computed,
+    moved into the store unless an identical blob already exists, and then
+    hard-linked to the per-task path recorded in the state file. Filesystems
+    without hard links get a plain copy instead, which keeps the per-task
+    layout intact at the cost of the deduplication.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = os.path.abspath(root)
+        self._lock = threading.Lock()
+
+    def path_for(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest[2:4], digest)
+
+    def contains(self, digest: str) -> bool:
+        return os.path.exists(self.path_for(digest))
+
+    def ingest(self, temp_path: str, digest: str) -> str:
+        """Move *temp_path* into the store (or drop it if known) and return the blob path."""
+
+        blob_path = self.path_for(digest)
+        with self._lock:
+            if os.path.exists(blob_path):
+                os.remove(temp_path)
+                logger.info("Reusing stored blob %s", digest)
+            else:
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                os.replace(temp_path, blob_path)
+        return blob_path
+
+    def link(self, digest: str, target: str) -> str:
+        """Materialise blob *digest* at *target*, replacing whatever is there."""
+
+        blob_path = self.path_for(digest)
+        directory = os.path.dirname(target)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        staging = f"{target}.link"
+        if os.path.exists(staging):
+            os.remove(staging)
+        try:
+            os.link(blob_path, staging)
+        except OSError:
+            shutil.copy2(blob_path, staging)
+        os.replace(staging, target)
+        return target
+
+    def store(self, temp_path: str, digest: str, target: str) -> str:
+        self.ingest(temp_path, digest)
+        return self.link(digest, target)
+
+
+_active_store: Optional[BlobStore] = None
+
+
+def install_blob_store(store: Optional[BlobStore]) -> Optional[BlobStore]:
+    """Store downloads in *store* from now on and return the previous store."""
+
+    global _active_store
+    previous = _active_store
+    _active_store = store
+    return previous
+
+
+def get_blob_store() -> Optional[BlobStore]:
+    return _active_store
@@ -1,19 +1,25 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import functools
+import gzip
+import hashlib
 import json
+import logging
 import os
 import socket
 import sys
 import threading
-from collections import defaultdict
-from dataclasses import asdict, dataclass
+import time
+from collections import OrderedDict, defaultdict
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
 
 from . import pbc_monitor as core
+from .artifact_stats import load_artifact_stats, tracked_artifact_stats
 from .crawler import safe_filename
 from .fetching import build_cache_path_for_url
 from .runner import (
@@ -22,14 +28,24 @@ from .runner import (
     _prepare_http_options,
     _prepare_task_layout,
 )
-from .state import PBCState
+from .run_history import DEFAULT_HISTORY_LIMIT, default_history_path, load_run_history
+from .scheduler import default_schedule_path, load_schedule
+from .state import PBCState, journal_path
 
 try:  # pragma: no cover - optional dependency during import
     from fastapi import APIRouter, FastAPI, HTTPException, Query, Request
     from fastapi.middleware.cors import CORSMiddleware
-    from fastapi.responses import FileResponse, HTMLResponse, JSONResponse, PlainTextResponse
+    from fastapi.responses import (
+        FileResponse,
+        HTMLResponse,
+        JSONResponse,
+        PlainTextResponse,
+        Response,
+        StreamingResponse,
+    )
     import uvicorn
 except ImportError as exc:  # pragma: no cover - optional dependency during import
+    APIRouter = None  # type: ignore[assignment]
     FastAPI = None  # type: ignore[assignment]
     HTTPException = None  # type: ignore[assignment]
     Query = None  # type: ignore[assignment]
@@ -39,14 +55,44 @@ except ImportError as exc:  # pragma: no cover - optional dependency during impo
     HTMLResponse = None  # type: ignore[assignment]
     JSONResponse = None  # type: ignore[assignment]
     PlainTextResponse = None  # type: ignore[assignment]
+    Response = None  # type: ignore[assignment]
+    StreamingResponse = None  # type: ignore[assignment]
     uvicorn = None  # type: ignore[assignment]
     _FASTAPI_IMPORT_ERROR = exc
 else:
     _FASTAPI_IMPORT_ERROR = None
 
+try:  # pragma: no cover - optional dependency during import
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional at runtime
+    brotli = None
+
 
 WEB_DIR = Path(__file__).resolve().parent.parent / "web"
 
+# Seconds a served overview snapshot stays current before a refresh starts.
+DEFAULT_OVERVIEW_MAX_AGE = 5.0
+
+# Seconds between change checks while event-stream clients are connected.
+DEFAULT_EVENT_POLL_INTERVAL = 2.0
+
+# Seconds of silence after which an event stream sends a keep-alive comment.
+EVENT_KEEPALIVE_SECONDS = 15.0
+
+# Largest page the entries endpoints return.
+MAX_ENTRIES_PAGE = 1000
+
+# Entry states accepted by the entries endpoints' ``status`` filter.
+ENTRY_STATUSES = ("downloaded", "pending")
+
+# Responses smaller than this are sent uncompressed.
+COMPRESSION_MIN_BYTES = 1024
+
+# Keyword marking abolished regulations, matched like the entries page does.
+ABOLISH_KEYWORD = "废止"
+
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class TaskOverview:
@@ -80,6 +126,9 @@ class TaskOverview:
     status: str
     status_reason: str
     parser_spec: Optional[str]
+    next_run_at: Optional[datetime] = None
+    schedule_status: Optional[str] = None
+    output_type_totals: Optional[Dict[str, Dict[str, int]]] = None
     entries: Optional[List[Dict[str, object]]] = None
 
     def to_jsonable(self) -> Dict[str, object]:
@@ -93,6 +142,7 @@ class TaskOverview:
         data["page_cache_last_fetch"] = _dt(self.page_cache_last_fetch)
         data["next_run_earliest"] = _dt(self.next_run_earliest)
         data["next_run_latest"] = _dt(self.next_run_latest)
+        data["next_run_at"] = _dt(self.next_run_at)
         if self.entries is None:
             data.pop("entries", None)
         return data
@@ -134,37 +184,178 @@ def _load_config(path: str) -> Dict[str, object]:
         return json.load(handle)
 
 
-def _count_files(directory: Optional[str]) -> int:
-    if not directory or not os.path.isdir(directory):
-        return 0
-    total = 0
-    for _, _, files in os.walk(directory):
-        total += len(files)
-    return total
+def _resolve_artifact_dir(config: Dict[str, object], artifact_dir_override: Optional[str]) -> str:
+    if artifact_dir_override:
+        config["artifact_dir"] = artifact_dir_override
+    return str(config.get("artifact_dir") or ".")
 
 
-def _sum_file_sizes(directory: Optional[str]) -> int:
-    if not directory or not os.path.isdir(directory):
-        return 0
-    total = 0
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            try:
-                total += os.path.getsize(os.path.join(root, filename))
-            except OSError:
-                continue
-    return total
+def _parse_history_params(
+    limit: Optional[int], since: Optional[str]
+) -> Tuple[int, Optional[datetime]]:
+    if limit is None:
+        limit = DEFAULT_HISTORY_LIMIT
+    else:
+        try:
+            limit = int(limit)
+        except (TypeError, ValueError):
+            raise ValueError("invalid_limit") from None
+        if limit < 1:
+            raise ValueError("invalid_limit")
+    since_value: Optional[datetime] = None
+    if since:
+        try:
+            since_value = datetime.fromisoformat(str(since).strip())
+        except ValueError:
+            raise ValueError("invalid_since") from None
+    return limit, since_value
 
 
-def _count_pages(directory: Optional[str]) -> int:
+class _DirectoryScan(NamedTuple):
+    pages: int
+    # ``(path, st_mtime_ns)`` of every directory visited by the walk.
+    fingerprint: Tuple[Tuple[str, int], ...]
+
+
+_EMPTY_SCAN = _DirectoryScan(0, ())
+
+
+def _scan_directory(directory: Optional[str]) -> _DirectoryScan:
+    """Count the cached HTML pages below *directory*."""
+
     if not directory or not os.path.isdir(directory):
-        return 0
-    total = 0
-    for root, _, files in os.walk(directory):
-        for filename in files:
-            if filename.lower().endswith(".html") or filename.lower().endswith(".htm"):
-                total += 1
-    return total
+        return _EMPTY_SCAN
+    pages = 0
+    fingerprint: List[Tuple[str, int]] = []
+    for root, _, filenames in os.walk(directory):
+        try:
+            fingerprint.append((root, os.stat(root).st_mtime_ns))
+        except OSError:
+            continue
+        for filename in filenames:
+            lowered = filename.lower()
+            if lowered.endswith(".html") or lowered.endswith(".htm"):
+                pages += 1
+    return _DirectoryScan(pages, tuple(fingerprint))
+
+
+def _directories_unchanged(fingerprint: Tuple[Tuple[str, int], ...]) -> bool:
+    for path, mtime_ns in fingerprint:
+        try:
+            if os.stat(path).st_mtime_ns != mtime_ns:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _file_signature(path: Optional[str]) -> Optional[Tuple[int, int]]:
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _state_signature(state_file: Optional[str]) -> Tuple[Any, Any]:
+    return (
+        _file_signature(state_file),
+        _file_signature(journal_path(state_file)) if state_file else None,
+    )
+
+
+@dataclass
+class _StateSummary:
+    entries_total: int
+    documents_total: int
+    downloaded_total: int
+    entries_without_documents: int
+    tracked_files: int
+    tracked_downloaded: int
+    document_type_counts: Dict[str, int]
+
+
+def _load_task_state(state_file: Optional[str], parser_spec: Optional[str]) -> PBCState:
+    # Pin the parser for this thread only: overviews may be collected in the
+    # background while a request thread loads another task's state.
+    core._set_thread_parser_module(core._load_parser_module(parser_spec))
+    try:
+        return core.load_state(state_file, core.classify_document_type)
+    finally:
+        core._set_thread_parser_module(None)
+
+
+def _summarize_state(state: PBCState) -> _StateSummary:
+    entries_total = sum(1 for entry in state.entries.values() if isinstance(entry, dict))
+    documents_total = 0
+    downloaded_total = 0
+    entries_without_documents = 0
+    for entry in state.entries.values():
+        documents = [doc for doc in entry.get("documents", []) if isinstance(doc, dict)]
+        if not documents:
+            entries_without_documents += 1
+        documents_total += len(documents)
+        downloaded_total += sum(1 for doc in documents if doc.get("downloaded"))
+
+    tracked_files = sum(1 for record in state.files.values() if isinstance(record, dict))
+    tracked_downloaded = sum(
+        1
+        for record in state.files.values()
+        if isinstance(record, dict) and record.get("downloaded")
+    )
+    return _StateSummary(
+        entries_total=entries_total,
+        documents_total=documents_total,
+        downloaded_total=downloaded_total,
+        entries_without_documents=entries_without_documents,
+        tracked_files=tracked_files,
+        tracked_downloaded=tracked_downloaded,
+        document_type_counts=_document_type_counts(state),
+    )
+
+
+class OverviewMemo:
+    """Remember the expensive parts of :func:`collect_task_overviews` per task.
+
+    A state summary is reused while the state file and its journal keep their
+    mtime and size. A page-cache scan is reused while every directory it
+    walked keeps its mtime, which changes whenever a file is added, removed
+    or renamed inside it. Download totals come from the directory's
+    artifact manifest instead (see :mod:`.artifact_stats`).
+    """
+
+    def __init__(self) -> None:
+        self._states: Dict[Tuple[Optional[str], Optional[str]], Tuple[Any, _StateSummary]] = {}
+        self._scans: Dict[str, _DirectoryScan] = {}
+        self.state_loads = 0
+        self.directory_scans = 0
+
+    def state_summary(self, state_file: Optional[str], parser_spec: Optional[str]) -> _StateSummary:
+        key = (state_file, parser_spec)
+        signature = _state_signature(state_file)
+        cached = self._states.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        summary = _summarize_state(_load_task_state(state_file, parser_spec))
+        self.state_loads += 1
+        self._states[key] = (signature, summary)
+        return summary
+
+    def scan(self, directory: Optional[str]) -> _DirectoryScan:
+        if not directory:
+            return _EMPTY_SCAN
+        cached = self._scans.get(directory)
+        if cached is not None and cached.fingerprint and _directories_unchanged(cached.fingerprint):
+            return cached
+        result = _scan_directory(directory)
+        self.directory_scans += 1
+        self._scans[directory] = result
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        return {"state_loads": self.state_loads, "directory_scans": self.directory_scans}
 
 
 def _safe_mtime(path: Optional[str]) -> Optional[datetime]:
@@ -208,13 +399,21 @@ def collect_task_overviews(
     task: Optional[str] = None,
     artifact_dir_override: Optional[str] = None,
     include_entries: bool = False,
+    memo: Optional[OverviewMemo] = None,
 ) -> List[TaskOverview]:
+    """Describe every configured task.
+
+    Pass the same *memo* to repeated calls to skip reloading state files and
+    rescanning directories that have not changed since the previous call.
+    """
+
+    if memo is None:
+        memo = OverviewMemo()
     config = _load_config(config_path)
-    if artifact_dir_override:
-        config["artifact_dir"] = artifact_dir_override
-    artifact_dir = str(config.get("artifact_dir") or ".")
+    artifact_dir = _resolve_artifact_dir(config, artifact_dir_override)
     runner_args = _default_runner_args(task)
     tasks = _build_tasks(runner_args, config, artifact_dir)
+    schedule = load_schedule(default_schedule_path(artifact_dir))
     overviews: List[TaskOverview] = []
     slug_counts: Dict[str, int] = defaultdict(int)
 
@@ -224,37 +423,27 @@ def collect_task_overviews(
         http_options = _prepare_http_options(spec, runner_args, config)
         _ = _prepare_cache_behavior(spec, runner_args, config)
 
-        if spec.parser_spec:
-            module = core._load_parser_module(spec.parser_spec)
+        entries_payload: Optional[List[Dict[str, object]]] = None
+        if include_entries:
+            state = _load_task_state(layout.state_file, spec.parser_spec)
+            summary = _summarize_state(state)
+            jsonable = state.to_jsonable()
+            entries = jsonable.get("entries") if isinstance(jsonable, dict) else None
+            if isinstance(entries, list):
+                entries_payload = entries
         else:
-            module = core._load_parser_module(None)
-        core._set_parser_module(module)
-
-        state = core.load_state(layout.state_file, core.classify_document_type)
-
-        entries_total = sum(1 for entry in state.entries.values() if isinstance(entry, dict))
-        documents_total = 0
-        downloaded_total = 0
-        entries_without_documents = 0
-        for entry in state.entries.values():
-            documents = [doc for doc in entry.get("documents", []) if isinstance(doc, dict)]
-            if not documents:
-                entries_without_documents += 1
-            documents_total += len(documents)
-            downloaded_total += sum(1 for doc in documents if doc.get("downloaded"))
-
-        pending_total = max(0, documents_total - downloaded_total)
-
-        tracked_files = sum(1 for record in state.files.values() if isinstance(record, dict))
-        tracked_downloaded = sum(
-            1
-            for record in state.files.values()
-            if isinstance(record, dict) and record.get("downloaded")
-        )
+            summary = memo.state_summary(layout.state_file, spec.parser_spec)
+        pending_total = max(0, summary.documents_total - summary.downloaded_total)
 
         state_last_updated = _safe_mtime(layout.state_file)
+        if layout.state_file:
+            journal_updated = _safe_mtime(journal_path(layout.state_file))
+            if journal_updated is not None and (
+                state_last_updated is None or journal_updated > state_last_updated
+            ):
+                state_last_updated = journal_updated
         page_cache_dir = layout.pages_dir
-        pages_cached = _count_pages(page_cache_dir)
+        pages_cached = memo.scan(page_cache_dir).pages
         cache_path = None
         if spec.start_url:
             cache_path = build_cache_path_for_url(page_cache_dir, spec.start_url)
@@ -262,41 +451,44 @@ def collect_task_overviews(
         page_cache_fresh = core._listing_cache_is_fresh(page_cache_dir, spec.start_url)
 
         output_dir = layout.output_dir
-        output_files = _count_files(output_dir)
-        output_size_bytes = _sum_file_sizes(output_dir)
+        output_stats = tracked_artifact_stats(output_dir)
 
         next_run_earliest: Optional[datetime] = None
         next_run_latest: Optional[datetime] = None
-        if state_last_updated is not None:
+        next_run_at: Optional[datetime] = None
+        schedule_status: Optional[str] = None
+        scheduled = schedule.get(spec.name)
+        if scheduled:
+            next_run_earliest = scheduled.get("next_run_earliest")  # type: ignore[assignment]
+            next_run_latest = scheduled.get("next_run_latest")  # type: ignore[assignment]
+            next_run_at = scheduled.get("next_run_at")  # type: ignore[assignment]
+            status_value = scheduled.get("status")
+            schedule_status = str(status_value) if status_value else None
+        if next_run_earliest is None and state_last_updated is not None:
             next_run_earliest = state_last_updated + timedelta(hours=http_options.min_hours)
             next_run_latest = state_last_updated + timedelta(hours=http_options.max_hours)
 
-        status, reason = _compute_status(entries_total, pending_total, page_cache_fresh, pages_cached)
-
-        entries_payload: Optional[List[Dict[str, object]]] = None
-        if include_entries:
-            jsonable = state.to_jsonable()
-            entries = jsonable.get("entries") if isinstance(jsonable, dict) else None
-            if isinstance(entries, list):
-                entries_payload = entries
+        status, reason = _compute_status(
+            summary.entries_total, pending_total, page_cache_fresh, pages_cached
+        )
 
         overview = TaskOverview(
             name=spec.name,
             slug=slug,
             start_url=spec.start_url,
-            entries_total=entries_total,
-            documents_total=documents_total,
-            downloaded_total=downloaded_total,
+            entries_total=summary.entries_total,
+            documents_total=summary.documents_total,
+            downloaded_total=summary.downloaded_total,
             pending_total=pending_total,
-            entries_without_documents=entries_without_documents,
-            tracked_files=tracked_files,
-            tracked_downloaded=tracked_downloaded,
-            document_type_counts=_document_type_counts(state),
+            entries_without_documents=summary.entries_without_documents,
+            tracked_files=summary.tracked_files,
+            tracked_downloaded=summary.tracked_downloaded,
+            document_type_counts=dict(summary.document_type_counts),
             state_file=layout.state_file,
             state_last_updated=state_last_updated,
             output_dir=output_dir,
-            output_files=output_files,
-            output_size_bytes=output_size_bytes,
+            output_files=output_stats.files,
+            output_size_bytes=output_stats.bytes,
             page_cache_dir=page_cache_dir,
             pages_cached=pages_cached,
             page_cache_fresh=page_cache_fresh,
@@ -311,6 +503,9 @@ def collect_task_overviews(
             status=status,
             status_reason=reason,
             parser_spec=spec.parser_spec,
+            next_run_at=next_run_at,
+            schedule_status=schedule_status,
+            output_type_totals=output_stats.types,
             entries=entries_payload,
         )
         overviews.append(overview)
@@ -318,6 +513,500 @@ def collect_task_overviews(
     return overviews
 
 
+class OverviewCache:
+    """Serve the latest task overviews and refresh them off the request path.
+
+    :meth:`get` returns the current snapshot at once. When the snapshot is
+    older than *max_age* seconds, one background thread recollects it
+    through a shared :class:`OverviewMemo`, so unchanged tasks cost only a
+    few ``stat`` calls. Only the very first call waits for a collection, and
+    concurrent first callers share it. A failed background refresh keeps the
+    previous snapshot and is retried on a later call.
+    """
+
+    def __init__(
+        self,
+        collect: Callable[[OverviewMemo], List[TaskOverview]],
+        *,
+        max_age: float = DEFAULT_OVERVIEW_MAX_AGE,
+    ) -> None:
+        self._collect = collect
+        self.max_age = max_age
+        self.memo = OverviewMemo()
+        self._snapshot: Optional[List[TaskOverview]] = None
+        self._collected_at = 0.0
+        self._refresh_lock = threading.Lock()
+        self.refreshes = 0
+        self.last_error: Optional[str] = None
+
+    def _refresh(self) -> List[TaskOverview]:
+        overviews = self._collect(self.memo)
+        self._snapshot = overviews
+        self._collected_at = time.monotonic()
+        self.refreshes += 1
+        self.last_error = None
+        return overviews
+
+    def _refresh_in_background(self) -> bool:
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+
+        def run() -> None:
+            try:
+                self._refresh()
+            except Exception as exc:  # pragma: no cover - depends on disk state
+                self.last_error = str(exc)
+                logger.warning("Failed to refresh task overviews: %s", exc)
+            finally:
+                self._refresh_lock.release()
+
+        threading.Thread(target=run, name="dashboard-overviews", daemon=True).start()
+        return True
+
+    def refresh(self) -> List[TaskOverview]:
+        """Recollect the overviews now and return the new snapshot."""
+
+        with self._refresh_lock:
+            return self._refresh()
+
+    def get(self) -> List[TaskOverview]:
+        snapshot = self._snapshot
+        if snapshot is None:
+            with self._refresh_lock:
+                snapshot = self._snapshot
+                if snapshot is None:
+                    snapshot = self._refresh()
+            return snapshot
+        if time.monotonic() - self._collected_at >= self.max_age:
+            self._refresh_in_background()
+        return snapshot
+
+    def stats(self) -> Dict[str, object]:
+        snapshot = self._snapshot
+        return {
+            "tasks": len(snapshot) if snapshot is not None else None,
+            "age_seconds": (
+                round(time.monotonic() - self._collected_at, 3) if snapshot is not None else None
+            ),
+            "max_age": self.max_age,
+            "refreshes": self.refreshes,
+            "refreshing": self._refresh_lock.locked(),
+            "last_error": self.last_error,
+            **self.memo.stats(),
+        }
+
+
+class TaskEntriesCache:
+    """Keep the JSON entries of the most recently viewed task states.
+
+    Entries are rebuilt only when the state file or its journal changes. The
+    ``version`` returned with them identifies that state and feeds the
+    entries endpoints' ETags.
+    """
+
+    def __init__(self, max_tasks: int = 8) -> None:
+        self.max_tasks = max(1, max_tasks)
+        self._entries: "OrderedDict[Tuple[str, Optional[str]], Tuple[Any, str, List[Dict[str, object]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    @staticmethod
+    def version(overview: TaskOverview) -> str:
+        signature = repr((overview.state_file, overview.parser_spec, _state_signature(overview.state_file)))
+        return hashlib.sha1(signature.encode("utf-8")).hexdigest()[:20]
+
+    def get(self, overview: TaskOverview) -> Tuple[str, List[Dict[str, object]]]:
+        if not overview.state_file:
+            return "empty", []
+        key = (overview.state_file, overview.parser_spec)
+        signature = _state_signature(overview.state_file)
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None and cached[0] == signature:
+                self._entries.move_to_end(key)
+                return cached[1], cached[2]
+        version = self.version(overview)
+        jsonable = _load_task_state(overview.state_file, overview.parser_spec).to_jsonable()
+        entries = jsonable.get("entries") if isinstance(jsonable, dict) else None
+        entries = entries if isinstance(entries, list) else []
+        with self._lock:
+            self.loads += 1
+            self._entries[key] = (signature, version, entries)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_tasks:
+                self._entries.popitem(last=False)
+        return version, entries
+
+
+def _contains_abolish_keyword(entry: Dict[str, object]) -> bool:
+    values: List[object] = [entry.get("title"), entry.get("remark")]
+    for document in entry.get("documents") or []:
+        if isinstance(document, dict):
+            values.extend(document.get(key) for key in ("title", "remark", "local_path", "url"))
+    return any(isinstance(value, str) and ABOLISH_KEYWORD in value for value in values)
+
+
+@dataclass
+class EntryQuery:
+    """Filters, projection and page of an entries request."""
+
+    title: Optional[str] = None
+    document_types: Optional[Set[str]] = None
+    status: Optional[str] = None
+    abolished: bool = False
+    fields: Optional[List[str]] = None
+    limit: Optional[int] = None
+    cursor: int = 0
+
+    @classmethod
+    def parse(
+        cls,
+        *,
+        q: Optional[str] = None,
+        document_type: Optional[str] = None,
+        status: Optional[str] = None,
+        abolished: Optional[str] = None,
+        fields: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> "EntryQuery":
+        """Validate raw query parameters; raise ``ValueError`` naming the bad one."""
+
+        def _split(value: Optional[str]) -> List[str]:
+            return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+        query = cls()
+        if q and q.strip():
+            query.title = q.strip().lower()
+        types = {value.lower() for value in _split(document_type)}
+        query.document_types = types or None
+        if status and status.strip():
+            query.status = status.strip().lower()
+            if query.status not in ENTRY_STATUSES:
+                raise ValueError("invalid_status")
+        if abolished is not None and str(abolished).strip():
+            lowered = str(abolished).strip().lower()
+            if lowered not in {"1", "true", "yes", "on", "0", "false", "no", "off"}:
+                raise ValueError("invalid_abolished")
+            query.abolished = lowered in {"1", "true", "yes", "on"}
+        query.fields = _split(fields) or None
+        if limit is not None:
+            try:
+                query.limit = int(limit)
+            except (TypeError, ValueError):
+                raise ValueError("invalid_limit") from None
+            if query.limit <= 0:
+                raise ValueError("invalid_limit")
+            query.limit = min(query.limit, MAX_ENTRIES_PAGE)
+        if cursor is not None and str(cursor).strip():
+            try:
+                query.cursor = int(str(cursor).strip())
+            except ValueError:
+                raise ValueError("invalid_cursor") from None
+            if query.cursor < 0:
+                raise ValueError("invalid_cursor")
+        return query
+
+    def cache_key(self) -> str:
+        return repr(
+            (
+                self.title,
+                sorted(self.document_types or ()),
+                self.status,
+                self.abolished,
+                self.fields,
+                self.limit,
+                self.cursor,
+            )
+        )
+
+    def matches(self, entry: Dict[str, object]) -> bool:
+        if self.title is not None:
+            title = entry.get("title")
+            if not isinstance(title, str) or self.title not in title.lower():
+                return False
+        documents = [doc for doc in entry.get("documents") or [] if isinstance(doc, dict)]
+        if self.document_types is not None and not any(
+            str(doc.get("type") or "").lower() in self.document_types for doc in documents
+        ):
+            return False
+        if self.status == "downloaded" and not any(doc.get("downloaded") for doc in documents):
+            return False
+        if self.status == "pending" and all(doc.get("downloaded") for doc in documents):
+            return False
+        if self.abolished and not _contains_abolish_keyword(entry):
+            return False
+        return True
+
+    def project(self, entry: Dict[str, object]) -> Dict[str, object]:
+        if self.fields is None:
+            return entry
+        return {field_name: entry[field_name] for field_name in self.fields if field_name in entry}
+
+    def page(self, entries: Sequence[Dict[str, object]]) -> Dict[str, object]:
+        """Return the matching entries from ``cursor`` on, at most ``limit`` of them.
+
+        ``next_cursor`` is the position to resume from, or ``None`` after the
+        last match; ``total`` counts every match regardless of the page.
+        """
+
+        selected: List[Dict[str, object]] = []
+        total = 0
+        next_cursor: Optional[str] = None
+        for position, entry in enumerate(entries):
+            if not isinstance(entry, dict) or not self.matches(entry):
+                continue
+            total += 1
+            if position < self.cursor:
+                continue
+            if self.limit is not None and len(selected) >= self.limit:
+                if next_cursor is None:
+                    next_cursor = str(position)
+                continue
+            selected.append(self.project(entry))
+        return {"entries": selected, "next_cursor": next_cursor, "total": total}
+
+
+def _task_cursors(values: Optional[Sequence[str]]) -> Dict[str, int]:
+    """Parse ``slug:cursor`` values of the multi-task entries endpoint.
+
+    Raise ``ValueError("invalid_cursor")`` for a malformed value.
+    """
+
+    cursors: Dict[str, int] = {}
+    if not isinstance(values, (list, tuple)):
+        return cursors
+    for value in values:
+        slug, separator, token = str(value or "").strip().rpartition(":")
+        if not separator or not slug.strip():
+            raise ValueError("invalid_cursor")
+        cursors[slug.strip()] = EntryQuery.parse(cursor=token).cursor
+    return cursors
+
+
+def _entries_etag(
+    overviews: Sequence[Optional[TaskOverview]],
+    slugs: Sequence[str],
+    query: EntryQuery,
+    cursors: Optional[Dict[str, int]] = None,
+) -> str:
+    """Identify an entries response by task states, overviews and query."""
+
+    parts: List[object] = [query.cache_key(), sorted((cursors or {}).items())]
+    for slug, overview in zip(slugs, overviews):
+        if overview is None:
+            parts.append((slug, None))
+            continue
+        overview_json = json.dumps(overview.to_jsonable(), sort_keys=True, ensure_ascii=False)
+        parts.append((slug, TaskEntriesCache.version(overview), overview_json))
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def _accepted_encodings(header: Optional[str]) -> Set[str]:
+    accepted: Set[str] = set()
+    for part in (header or "").split(","):
+        token, _, params = part.partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0:
+            accepted.add(token)
+    return accepted
+
+
+def negotiated_json_response(
+    request: Optional[Any],
+    etag: str,
+    build: Callable[[], object],
+) -> Any:
+    """Answer ``If-None-Match`` with 304, else JSON compressed as the client accepts.
+
+    *build* is only called when the client's copy is stale. Brotli is used
+    when the optional ``brotli`` package is installed, gzip otherwise.
+    """
+
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    request_headers = getattr(request, "headers", None) or {}
+    if_none_match = request_headers.get("if-none-match")
+    if if_none_match:
+        candidates = {value.strip() for value in if_none_match.split(",")}
+        if etag in candidates or "*" in candidates:
+            return Response(status_code=304, headers=headers)
+    body = json.dumps(build(), ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if len(body) >= COMPRESSION_MIN_BYTES:
+        accepted = _accepted_encodings(request_headers.get("accept-encoding"))
+        if brotli is not None and "br" in accepted:
+            body = brotli.compress(body, quality=5)
+            headers["Content-Encoding"] = "br"
+        elif "gzip" in accepted:
+            body = gzip.compress(body, compresslevel=6)
+            headers["Content-Encoding"] = "gzip"
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def format_sse(event: str, data: object) -> str:
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+class _Subscriber:
+    __slots__ = ("loop", "queue", "overflowed")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_queue: int) -> None:
+        self.loop = loop
+        self.queue: "asyncio.Queue[Tuple[str, object]]" = asyncio.Queue(maxsize=max_queue)
+        self.overflowed = False
+
+
+class TaskEventHub:
+    """Push task changes and new downloads to event-stream subscribers.
+
+    The crawler runs in another process, so changes are detected from disk.
+    While at least one client is subscribed, a watcher thread refreshes the
+    overviews every *poll_interval* seconds through the shared
+    :class:`OverviewCache` (a few ``stat`` calls when nothing changed). It
+    publishes three kinds of event:
+
+    * ``task`` with the new overview of each task that changed;
+    * ``tasks`` with every overview, when tasks were added or removed;
+    * ``download`` for each write recorded in a task's artifact manifest.
+
+    With no subscribers the watcher stops and nothing is polled. A
+    subscriber whose queue fills up is sent a full ``tasks`` snapshot
+    instead of the events it missed.
+    """
+
+    def __init__(
+        self,
+        overview_cache: OverviewCache,
+        *,
+        poll_interval: float = DEFAULT_EVENT_POLL_INTERVAL,
+        max_queue: int = 256,
+    ) -> None:
+        self.overview_cache = overview_cache
+        self.poll_interval = poll_interval
+        self.max_queue = max_queue
+        self._lock = threading.Lock()
+        self._subscribers: List[_Subscriber] = []
+        self._overviews: Optional[Dict[str, Dict[str, object]]] = None
+        self._seen_writes: Dict[str, int] = {}
+        self._stop: Optional[threading.Event] = None
+        self.polls = 0
+        self.published = 0
+
+    def _baseline(self, overviews: Sequence[TaskOverview]) -> None:
+        self._overviews = {overview.slug: overview.to_jsonable() for overview in overviews}
+        self._seen_writes = {}
+        for overview in overviews:
+            stats = load_artifact_stats(overview.output_dir)
+            self._seen_writes[overview.slug] = stats.writes if stats is not None else 0
+
+    def snapshot(self) -> List[Dict[str, object]]:
+        with self._lock:
+            if self._overviews is None:
+                self._baseline(self.overview_cache.get())
+            return list(self._overviews.values())
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop) -> Tuple[_Subscriber, List[Dict[str, object]]]:
+        """Register a subscriber and return it with the snapshot its events follow."""
+
+        subscriber = _Subscriber(loop, self.max_queue)
+        with self._lock:
+            if self._stop is None:
+                self._baseline(self.overview_cache.get())
+                self._stop = threading.Event()
+                threading.Thread(
+                    target=self._run,
+                    args=(self._stop,),
+                    name="dashboard-events",
+                    daemon=True,
+                ).start()
+            self._subscribers.append(subscriber)
+            return subscriber, list(self._overviews.values())
+
+    def unsubscribe(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.remove(subscriber)
+            if not self._subscribers and self._stop is not None:
+                self._stop.set()
+                self._stop = None
+                self._overviews = None
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.wait(self.poll_interval):
+            try:
+                self.poll()
+            except Exception as exc:  # pragma: no cover - depends on disk state
+                logger.warning("Failed to check tasks for changes: %s", exc)
+
+    def poll(self) -> List[Tuple[str, object]]:
+        """Compare the tasks with the last poll and publish what changed."""
+
+        overviews = self.overview_cache.refresh()
+        current = {overview.slug: overview.to_jsonable() for overview in overviews}
+        with self._lock:
+            self.polls += 1
+            if self._overviews is None:
+                self._baseline(overviews)
+                return []
+            events: List[Tuple[str, object]] = []
+            if set(current) != set(self._overviews):
+                events.append(("tasks", list(current.values())))
+            else:
+                for slug, data in current.items():
+                    if data != self._overviews[slug]:
+                        events.append(("task", data))
+            for overview in overviews:
+                stats = load_artifact_stats(overview.output_dir)
+                if stats is None:
+                    continue
+                seen = self._seen_writes.get(overview.slug)
+                self._seen_writes[overview.slug] = stats.writes
+                if seen is None:
+                    continue
+                for item in stats.recent:
+                    if int(item.get("seq") or 0) > seen:
+                        events.append(
+                            ("download", {"slug": overview.slug, "task": overview.name, **item})
+                        )
+            self._overviews = current
+            for subscriber in self._subscribers:
+                for event in events:
+                    try:
+                        subscriber.loop.call_soon_threadsafe(self._deliver, subscriber, event)
+                    except RuntimeError:  # the subscriber's loop has closed
+                        break
+            self.published += len(events)
+        return events
+
+    @staticmethod
+    def _deliver(subscriber: _Subscriber, event: Tuple[str, object]) -> None:
+        try:
+            subscriber.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            subscriber.overflowed = True
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "watching": self._stop is not None,
+                "poll_interval": self.poll_interval,
+                "polls": self.polls,
+                "published": self.published,
+            }
+
+
 def _load_template(filename: str) -> str:
     if not WEB_DIR.exists():
         raise FileNotFoundError(
@@ -455,6 +1144,8 @@ def create_dashboard_app(
     artifact_dir_override: Optional[str],
     search_config: Optional[Dict[str, object]] = None,
     extra_routers: Optional[Sequence[Tuple[Any, Dict[str, Any]]]] = None,
+    overview_max_age: float = DEFAULT_OVERVIEW_MAX_AGE,
+    event_poll_interval: float = DEFAULT_EVENT_POLL_INTERVAL,
 ):
     if (
         FastAPI is None
@@ -462,6 +1153,8 @@ def create_dashboard_app(
         or JSONResponse is None
         or HTMLResponse is None
         or PlainTextResponse is None
+        or StreamingResponse is None
+        or Response is None
         or FileResponse is None
         or CORSMiddleware is None
         or HTTPException is None
@@ -472,13 +1165,26 @@ def create_dashboard_app(
             "Install them via `pip install fastapi uvicorn`."
         ) from _FASTAPI_IMPORT_ERROR
 
-    overviews_lock = threading.Lock()
+    overview_cache = OverviewCache(
+        lambda memo: collect_task_overviews(
+            config_path,
+            task=task,
+            artifact_dir_override=artifact_dir_override,
+            memo=memo,
+        ),
+        max_age=overview_max_age,
+    )
+    event_hub = TaskEventHub(overview_cache, poll_interval=event_poll_interval)
+    entries_cache = TaskEntriesCache()
 
     search_payload: Dict[str, object] = (
         dict(search_config) if isinstance(search_config, dict) else {"enabled": False}
     )
 
     app = FastAPI()
+    app.state.overview_cache = overview_cache
+    app.state.event_hub = event_hub
+    app.state.entries_cache = entries_cache
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -487,28 +1193,10 @@ def create_dashboard_app(
     )
 
     def _collect_overviews() -> List[TaskOverview]:
-        with overviews_lock:
-            return collect_task_overviews(
-                config_path,
-                task=task,
-                artifact_dir_override=artifact_dir_override,
-            )
+        return overview_cache.get()
 
-    def _build_entries_payload(overview: TaskOverview) -> Dict[str, object]:
-        if not overview.state_file:
-            return {"entries": [], "task": overview.to_jsonable()}
-        if overview.parser_spec:
-            module = core._load_parser_module(overview.parser_spec)
-        else:
-            module = core._load_parser_module(None)
-        core._set_parser_module(module)
-        state = core.load_state(overview.state_file, core.classify_document_type)
-        jsonable = state.to_jsonable()
-        entries = jsonable.get("entries") if isinstance(jsonable, dict) else None
-        return {
-            "entries": entries if isinstance(entries, list) else [],
-            "task": overview.to_jsonable(),
-        }
+    def _entries_error(code: str) -> JSONResponse:
+        return JSONResponse({"error": code}, status_code=400)
 
     @app.get("/api/tasks")
     def get_tasks() -> JSONResponse:
@@ -519,8 +1207,64 @@ def create_dashboard_app(
         except Exception as exc:  # pragma: no cover - logged to client
             return JSONResponse({"error": str(exc)}, status_code=500)
 
+    @app.get("/api/events")
+    async def task_events(request: Request) -> StreamingResponse:
+        subscriber, snapshot = await asyncio.to_thread(
+            event_hub.subscribe, asyncio.get_running_loop()
+        )
+
+        async def stream():
+            try:
+                yield format_sse("tasks", snapshot)
+                while True:
+                    try:
+                        event = await asyncio.wait_for(
+                            subscriber.queue.get(), timeout=EVENT_KEEPALIVE_SECONDS
+                        )
+                    except asyncio.TimeoutError:
+                        if await request.is_disconnected():
+                            break
+                        yield ": keep-alive\n\n"
+                        continue
+                    if subscriber.overflowed:
+                        subscriber.overflowed = False
+                        while not subscriber.queue.empty():
+                            subscriber.queue.get_nowait()
+                        event = ("tasks", await asyncio.to_thread(event_hub.snapshot))
+                    yield format_sse(*event)
+            finally:
+                event_hub.unsubscribe(subscriber)
+
+        return StreamingResponse(
+            stream(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     @app.get("/api/tasks/entries")
-    def get_tasks_entries(slugs: Optional[List[str]] = Query(None)) -> JSONResponse:
+    def get_tasks_entries(
+        slugs: Optional[List[str]] = Query(None),
+        request: Request = None,
+        q: Optional[str] = None,
+        document_type: Optional[str] = None,
+        status: Optional[str] = None,
+        abolished: Optional[str] = None,
+        fields: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[List[str]] = Query(None),
+    ) -> Response:
+        try:
+            entry_query = EntryQuery.parse(
+                q=q,
+                document_type=document_type,
+                status=status,
+                abolished=abolished,
+                fields=fields,
+                limit=limit,
+            )
+            cursors = _task_cursors(cursor)
+        except ValueError as exc:
+            return _entries_error(str(exc))
         try:
             overviews = _collect_overviews()
             overview_map = {overview.slug: overview for overview in overviews}
@@ -535,38 +1279,109 @@ def create_dashboard_app(
                     requested.append(slug_value)
             else:
                 requested = [overview.slug for overview in overviews]
-            results: List[Dict[str, object]] = []
-            errors: List[Dict[str, str]] = []
-            for slug_value in requested:
-                overview = overview_map.get(slug_value)
-                if overview is None:
-                    errors.append({"slug": slug_value, "error": "Task not found"})
-                    continue
-                try:
-                    payload = _build_entries_payload(overview)
-                except Exception as exc:  # pragma: no cover - defensive branch
-                    errors.append({"slug": slug_value, "error": str(exc)})
-                    continue
-                payload["slug"] = slug_value
-                results.append(payload)
-            response_payload: Dict[str, object] = {"results": results}
-            if errors:
-                response_payload["errors"] = errors
-            return JSONResponse(response_payload)
+            etag = _entries_etag(
+                [overview_map.get(slug_value) for slug_value in requested],
+                requested,
+                entry_query,
+                cursors,
+            )
+
+            def build() -> Dict[str, object]:
+                results: List[Dict[str, object]] = []
+                errors: List[Dict[str, str]] = []
+                for slug_value in requested:
+                    overview = overview_map.get(slug_value)
+                    if overview is None:
+                        errors.append({"slug": slug_value, "error": "Task not found"})
+                        continue
+                    try:
+                        _version, entries = entries_cache.get(overview)
+                    except Exception as exc:  # pragma: no cover - defensive branch
+                        errors.append({"slug": slug_value, "error": str(exc)})
+                        continue
+                    task_query = replace(entry_query, cursor=cursors.get(slug_value, 0))
+                    results.append(
+                        {
+                            **task_query.page(entries),
+                            "task": overview.to_jsonable(),
+                            "slug": slug_value,
+                        }
+                    )
+                response_payload: Dict[str, object] = {"results": results}
+                if errors:
+                    response_payload["errors"] = errors
+                return response_payload
+
+            return negotiated_json_response(request, etag, build)
         except HTTPException:
             raise
         except Exception as exc:  # pragma: no cover - logged to client
             return JSONResponse({"error": str(exc)}, status_code=500)
 
     @app.get("/api/tasks/{slug}/entries")
-    def get_task_entries(slug: str) -> JSONResponse:
+    def get_task_entries(
+        slug: str,
+        request: Request = None,
+        q: Optional[str] = None,
+        document_type: Optional[str] = None,
+        status: Optional[str] = None,
+        abolished: Optional[str] = None,
+        fields: Optional[str] = None,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+    ) -> Response:
+        try:
+            entry_query = EntryQuery.parse(
+                q=q,
+                document_type=document_type,
+                status=status,
+                abolished=abolished,
+                fields=fields,
+                limit=limit,
+                cursor=cursor,
+            )
+        except ValueError as exc:
+            return _entries_error(str(exc))
         try:
             overviews = _collect_overviews()
             overview = next((item for item in overviews if item.slug == slug), None)
             if overview is None:
                 raise HTTPException(status_code=404, detail="Task not found")
-            payload = _build_entries_payload(overview)
-            return JSONResponse(payload)
+            etag = _entries_etag([overview], [slug], entry_query)
+
+            def build() -> Dict[str, object]:
+                _version, entries = entries_cache.get(overview)
+                return {**entry_query.page(entries), "task": overview.to_jsonable()}
+
+            return negotiated_json_response(request, etag, build)
+        except HTTPException:
+            raise
+        except Exception as exc:  # pragma: no cover - logged to client
+            return JSONResponse({"error": str(exc)}, status_code=500)
+
+    @app.get("/api/tasks/{slug}/history")
+    def get_task_history(
+        slug: str,
+        limit: Optional[int] = None,
+        since: Optional[str] = None,
+    ) -> JSONResponse:
+        try:
+            history_limit, since_value = _parse_history_params(limit, since)
+        except ValueError as exc:
+            return _entries_error(str(exc))
+        try:
+            overviews = _collect_overviews()
+            overview = next((item for item in overviews if item.slug == slug), None)
+            if overview is None:
+                raise HTTPException(status_code=404, detail="Task not found")
+            artifact_dir = _resolve_artifact_dir(_load_config(config_path), artifact_dir_override)
+            runs = load_run_history(
+                default_history_path(artifact_dir),
+                overview.name,
+                since=since_value,
+                limit=history_limit,
+            )
+            return JSONResponse({"slug": slug, "task": overview.name, "runs": runs})
         except HTTPException:
             raise
         except Exception as exc:  # pragma: no cover - logged to client
@@ -0,0 +1,127 @@
+"""Bounded worker pool for attachment downloads."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+import requests
+
+from .fetching import create_session
+from .throttle import HostRateLimiter
+
+
+logger = logging.getLogger(__name__)
+
+DoneCallback = Callable[[Optional[Any], Optional[BaseException]], None]
+
+
+class DownloadPool:
+    """Run downloads on worker threads while results are applied by the owner.
+
+    Workers only perform network and file I/O: each call first takes a token
+    from the per-host :class:`HostRateLimiter` (which replaces the per-request
+    ``delay``/``jitter`` sleep) and then runs with a session private to the
+    worker thread. Completion callbacks are queued and executed by
+    :meth:`drain` on the thread that owns the crawl state, so that thread stays
+    the single writer of ``PBCState``. At most *max_pending* downloads are in
+    flight; :meth:`submit` drains completions while it waits for a free slot.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        rate_limiter: Optional[HostRateLimiter] = None,
+        max_pending: Optional[int] = None,
+        session_factory: Callable[[], requests.Session] = create_session,
+    ) -> None:
+        self.max_workers = max(1, int(max_workers))
+        self.max_pending = max(self.max_workers, int(max_pending or self.max_workers * 2))
+        self.rate_limiter = rate_limiter
+        self._session_factory = session_factory
+        self._local = threading.local()
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers,
+            thread_name_prefix="download",
+        )
+        self._inflight: Dict[Future, Tuple[str, DoneCallback]] = {}
+        self._pending_keys: Set[str] = set()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = self._session_factory()
+            self._local.session = session
+        return session
+
+    def _pace(self, url: str) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(url)
+
+    def _run(self, url: str, fn: Callable[..., Any], args: Tuple[Any, ...]) -> Any:
+        self._pace(url)
+        return fn(self._session(), *args)
+
+    def call(self, url: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Run *fn* on the calling thread, paced like pooled downloads."""
+
+        self._pace(url)
+        return fn(*args)
+
+    def is_pending(self, key: str) -> bool:
+        return key in self._pending_keys
+
+    def submit(
+        self,
+        key: str,
+        url: str,
+        fn: Callable[..., Any],
+        args: Tuple[Any, ...],
+        on_done: DoneCallback,
+    ) -> None:
+        """Queue ``fn(session, *args)``; *on_done* runs later via :meth:`drain`."""
+
+        while len(self._inflight) >= self.max_pending:
+            self.drain(block=True)
+        future = self._executor.submit(self._run, url, fn, args)
+        self._inflight[future] = (key, on_done)
+        self._pending_keys.add(key)
+
+    def drain(self, block: bool = False) -> int:
+        """Apply callbacks of finished downloads and return how many ran."""
+
+        if not self._inflight:
+            return 0
+        if block:
+            done, _ = wait(list(self._inflight), return_when=FIRST_COMPLETED)
+        else:
+            done = {future for future in self._inflight if future.done()}
+        completed: List[Future] = [future for future in self._inflight if future in done]
+        for future in completed:
+            key, on_done = self._inflight.pop(future)
+            self._pending_keys.discard(key)
+            error = future.exception()
+            on_done(None if error is not None else future.result(), error)
+        return len(completed)
+
+    def join(self) -> None:
+        while self._inflight:
+            self.drain(block=True)
+
+    def close(self) -> None:
+        try:
+            self.join()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "DownloadPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+__all__ = ["DownloadPool"]
@@ -30,9 +30,15 @@ class ExportReport:
     copied: int = 0
     skipped_missing_source: int = 0
     skipped_without_path: int = 0
+    skipped_duplicate: int = 0
 
     def total_processed(self) -> int:
-        return self.copied + self.skipped_missing_source + self.skipped_without_path
+        return (
+            self.copied
+            + self.skipped_missing_source
+            + self.skipped_without_path
+            + self.skipped_duplicate
+        )
 
 
 def _resolve_project_path(path: Path) -> Path:
@@ -146,8 +152,9 @@ def copy_documents_by_title(
     determines the best available title for each downloaded document, and copies
     the underlying file to *destination_dir* with a filename derived from that
     title. Existing files are preserved unless *overwrite* is ``True``; when not
-    overwriting, numeric suffixes are appended to avoid collisions. The source
-    files remain untouched.
+    overwriting, numeric suffixes are appended to avoid collisions. Documents
+    whose recorded ``sha256`` matches one already exported are skipped. The
+    source files remain untouched.
     """
 
     state = pbc_monitor.load_state(str(state_file))
@@ -156,6 +163,7 @@ def copy_documents_by_title(
     used_names: Set[str] = set()
     unnamed_counter = [1]
     plans: List[CopyPlan] = []
+    exported_digests: Set[str] = set()
 
     if not dry_run:
         os.makedirs(destination_abs, exist_ok=True)
@@ -178,6 +186,13 @@ def copy_documents_by_title(
             if isinstance(existing_record, dict):
                 file_record = existing_record
 
+        digest = document.get("sha256") or (file_record or {}).get("sha256")
+        if isinstance(digest, str) and digest:
+            if digest in exported_digests:
+                report.skipped_duplicate += 1
+                continue
+            exported_digests.add(digest)
+
         basename = _select_base_name(entry, document, file_record, unnamed_counter)
         extension = "".join(Path(local_path_value).suffixes)
         unique_name = _unique_filename(
@@ -2,13 +2,19 @@ from __future__ import annotations
 
 import random
 import time
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Dict, Mapping, Optional
 
 import requests
 
+from .throttle import wait_for_host
+
 
 __all__ = [
     "DEFAULT_HEADERS",
+    "FetchedPage",
+    "normalize_response_encoding",
+    "response_validators",
     "sleep_with_jitter",
     "get",
 ]
@@ -30,6 +36,36 @@ def sleep_with_jitter(delay: float, jitter: float) -> None:
         time.sleep(delay + random.uniform(0, jitter))
 
 
+@dataclass
+class FetchedPage:
+    """Body and cache validators of a page; ``status`` 304 means unchanged."""
+
+    status: int
+    text: str
+    validators: Dict[str, str] = field(default_factory=dict)
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+def response_validators(headers: Mapping[str, str]) -> Dict[str, str]:
+    """Pick the ``ETag``/``Last-Modified`` headers used for conditional GETs."""
+
+    validators: Dict[str, str] = {}
+    for name in ("ETag", "Last-Modified"):
+        value = headers.get(name)
+        if value:
+            validators[name] = value
+    return validators
+
+
+def normalize_response_encoding(response: requests.Response) -> None:
+    encoding = (response.encoding or "").lower()
+    if not encoding or encoding == "iso-8859-1":
+        response.encoding = response.apparent_encoding or "utf-8"
+
+
 def get(
     url: str,
     *,
@@ -40,6 +76,7 @@ def get(
     headers: Optional[dict] = None,
 ) -> requests.Response:
     sleep_with_jitter(delay, jitter)
+    wait_for_host(url)
 
     auto_session = session is None
     if auto_session:
@@ -60,7 +97,5 @@ def get(
             session.close()
 
     response.raise_for_status()
-    encoding = (response.encoding or "").lower()
-    if not encoding or encoding == "iso-8859-1":
-        response.encoding = response.apparent_encoding or "utf-8"
+    normalize_response_encoding(response)
     return response
@@ -1,13 +1,14 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
-from typing import Optional
+from typing import Dict, Mapping, Optional
 from urllib.parse import urlparse
 
 import requests
 
-from .fetcher import DEFAULT_HEADERS, get as http_get
+from .fetcher import DEFAULT_HEADERS, FetchedPage, get as http_get, response_validators
 from .crawler import safe_filename
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,11 @@ def fetch(
     jitter: float,
     timeout: float,
 ) -> str:
+    from .async_fetch import get_fetch_engine
+
+    engine = get_fetch_engine()
+    if engine is not None:
+        return engine.fetch_text(url, delay, jitter, timeout)
     response = http_get(
         url,
         session=session,
@@ -61,6 +67,83 @@ def fetch(
     return response.text
 
 
+def fetch_page(
+    session: requests.Session,
+    url: str,
+    delay: float,
+    jitter: float,
+    timeout: float,
+    headers: Optional[Mapping[str, str]] = None,
+) -> FetchedPage:
+    """Fetch *url* with extra request *headers*, keeping its cache validators.
+
+    A ``304 Not Modified`` answer to a conditional request is returned as a
+    page with ``not_modified`` set and an empty body.
+    """
+
+    from .async_fetch import get_fetch_engine
+
+    engine = get_fetch_engine()
+    if engine is not None:
+        return engine.fetch_page(url, delay, jitter, timeout, headers)
+    response = http_get(
+        url,
+        session=session,
+        delay=delay,
+        jitter=jitter,
+        timeout=timeout,
+        headers=dict(headers) if headers else None,
+    )
+    if response.status_code == 304:
+        return FetchedPage(304, "")
+    return FetchedPage(response.status_code, response.text, response_validators(response.headers))
+
+
+VALIDATORS_SUFFIX = ".validators.json"
+
+
+def validators_path(cache_path: str) -> str:
+    return f"{cache_path}{VALIDATORS_SUFFIX}"
+
+
+def load_validators(cache_path: Optional[str]) -> Dict[str, str]:
+    """Return the validators stored for *cache_path* while that copy exists."""
+
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(validators_path(cache_path), "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {str(key): str(value) for key, value in data.items() if value}
+
+
+def store_validators(cache_path: str, validators: Mapping[str, str]) -> None:
+    """Record *validators* for *cache_path*; call after the body is written."""
+
+    path = validators_path(cache_path)
+    if not validators:
+        if os.path.exists(path):
+            os.remove(path)
+        return
+    with open(path, "w", encoding="utf-8") as handle:
+        json.dump(dict(validators), handle, ensure_ascii=False)
+
+
+def conditional_headers(validators: Mapping[str, str]) -> Dict[str, str]:
+    headers: Dict[str, str] = {}
+    etag = validators.get("ETag")
+    if etag:
+        headers["If-None-Match"] = etag
+    last_modified = validators.get("Last-Modified")
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    return headers
+
+
 def build_cache_path_for_url(page_cache_dir: str, url: str) -> str:
     parsed = urlparse(url)
     components = [
@@ -1,33 +1,63 @@
 from __future__ import annotations
 
+import hashlib
 import importlib
 import json
 import logging
 import os
 import random
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import Future
+from contextlib import nullcontext
+from datetime import datetime, timedelta
 from pathlib import Path
 from types import ModuleType, SimpleNamespace
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Any, ContextManager, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
 from .crawler import safe_filename
-from .fetching import build_cache_path_for_url, create_session, fetch
-from .fetcher import DEFAULT_HEADERS, sleep_with_jitter
+from .fetching import (
+    build_cache_path_for_url,
+    conditional_headers,
+    create_session,
+    fetch,
+    fetch_page,
+    load_validators,
+    store_validators,
+)
+from .fetcher import DEFAULT_HEADERS, FetchedPage, sleep_with_jitter
 from .parser import classify_document_type as _default_classify_document_type
 from .task_models import TaskStats
-from .summary import log_task_summary
-from .state import ClassifierFn, PBCState, load_state as _load_state, save_state
+from .summary import log_task_summary, record_state_totals
+from .run_history import get_run_history
+from .artifact_stats import artifact_file_size, record_artifact_write
+from .async_fetch import get_fetch_engine
+from .blob_store import file_digest, get_blob_store
+from .download_pool import DoneCallback, DownloadPool
+from .throttle import HostRateLimiter, wait_for_host
+from .state import (
+    ClassifierFn,
+    PBCState,
+    PendingStateWrite,
+    capture_state_changes,
+    journal_state,
+    load_state as _load_state,
+    save_state,
+    write_state_changes,
+)
 
 
 logger = logging.getLogger(__name__)
 
 DEFAULT_PARSER_SPEC = "pbc_regulations.icrawler.parser"
+DEFAULT_STATE_FLUSH_INTERVAL = 5.0
+DEFAULT_FULL_SWEEP_EVERY = 24
 _current_parser_module: ModuleType = importlib.import_module(DEFAULT_PARSER_SPEC)
+_parser_override = threading.local()
 
 
 def _create_session() -> requests.Session:
@@ -45,8 +75,25 @@ def _set_parser_module(module: ModuleType) -> None:
     _current_parser_module = module
 
 
+def _set_thread_parser_module(module: Optional[ModuleType]) -> None:
+    """Pin *module* as the parser for the calling thread only.
+
+    Concurrently scheduled tasks use different parsers, so each worker thread
+    overrides the process-wide default instead of replacing it.
+    """
+
+    _parser_override.module = module
+
+
+def _active_parser_module() -> ModuleType:
+    module = getattr(_parser_override, "module", None)
+    if module is not None:
+        return module
+    return _current_parser_module
+
+
 def _parser_call(name: str):
-    return getattr(_current_parser_module, name)
+    return getattr(_active_parser_module(), name)
 
 
 def extract_listing_entries(
@@ -140,7 +187,7 @@ def extract_pagination_meta(
 
 
 def classify_document_type(url: str) -> str:
-    func = getattr(_current_parser_module, "classify_document_type", None)
+    func = getattr(_active_parser_module(), "classify_document_type", None)
     if callable(func):
         return func(url)
     return _default_classify_document_type(url)
@@ -181,6 +228,20 @@ def _fetch(
     return fetch(session, url, delay, jitter, timeout)
 
 
+def _fetch_page(
+    session: requests.Session,
+    url: str,
+    delay: float,
+    jitter: float,
+    timeout: float,
+    cache_path: Optional[str],
+) -> FetchedPage:
+    """Fetch *url*, revalidating the copy at *cache_path* when one exists."""
+
+    headers = conditional_headers(load_validators(cache_path))
+    return fetch_page(session, url, delay, jitter, timeout, headers)
+
+
 def _sleep(delay: float, jitter: float) -> None:
     sleep_with_jitter(delay, jitter)
 
@@ -196,68 +257,114 @@ def iterate_listing_pages(
     use_cache: bool = False,
     refresh_cache: bool = False,
     stats: Optional[TaskStats] = None,
+    rate_limiter: Optional[HostRateLimiter] = None,
 ) -> Iterable[Tuple[str, BeautifulSoup, Optional[str]]]:
     queue: List[str] = [start_url]
     visited: Set[str] = set()
-    while queue:
-        url = queue.pop(0)
-        if url in visited:
-            continue
-        html_path: Optional[str] = None
-        cached_html: Optional[str] = None
-        if page_cache_dir:
-            os.makedirs(page_cache_dir, exist_ok=True)
-            html_path = build_cache_path_for_url(page_cache_dir, url)
-            if (
-                use_cache
-                and not refresh_cache
-                and os.path.exists(html_path)
-            ):
-                with open(html_path, "r", encoding="utf-8") as handle:
-                    cached_html = handle.read()
-                logger.info("Loaded cached listing page: %s", html_path)
-
-        if cached_html is None:
-            logger.info("Fetching listing page: %s", url)
-            fetch_start = time.time()
-            html = _fetch(session, url, delay, jitter, timeout)
-            duration = time.time() - fetch_start
-            logger.info(
-                "Fetched listing page: %s (%.2f seconds, %d bytes)",
-                url,
-                duration,
-                len(html),
-            )
-            if html_path:
-                with open(html_path, "w", encoding="utf-8") as handle:
-                    handle.write(html)
-                logger.info("Cached listing page %s to %s", url, html_path)
-            html_content = html
-            from_cache = False
-        else:
-            html_content = cached_html
-            from_cache = True
-        if stats is not None:
-            stats.pages_total += 1
-            if from_cache:
-                stats.pages_from_cache += 1
+    # With a fetch engine installed, the next page in the queue is requested
+    # while the current one is processed and collected when the crawl gets
+    # there. Only one page is fetched ahead, so stopping early wastes at most
+    # one request.
+    engine = get_fetch_engine() if rate_limiter is None else None
+    prefetched: Dict[str, Future] = {}
+
+    def _cache_path(page_url: str) -> Optional[str]:
+        if not page_cache_dir:
+            return None
+        return build_cache_path_for_url(page_cache_dir, page_url)
+
+    def _use_cached(path: Optional[str]) -> bool:
+        return bool(path and use_cache and not refresh_cache and os.path.exists(path))
+
+    try:
+        while queue:
+            url = queue.pop(0)
+            if url in visited:
+                continue
+            page_start = time.monotonic()
+            html_path: Optional[str] = None
+            cached_html: Optional[str] = None
+            if page_cache_dir:
+                os.makedirs(page_cache_dir, exist_ok=True)
+                html_path = _cache_path(url)
+                if _use_cached(html_path):
+                    with open(html_path, "r", encoding="utf-8") as handle:
+                        cached_html = handle.read()
+                    logger.info("Loaded cached listing page: %s", html_path)
+
+            if cached_html is None:
+                logger.info("Fetching listing page: %s", url)
+                fetch_start = time.time()
+                pending = prefetched.pop(url, None)
+                if pending is not None:
+                    page = pending.result()
+                elif rate_limiter is not None:
+                    rate_limiter.acquire(url)
+                    page = _fetch_page(session, url, 0.0, 0.0, timeout, html_path)
+                else:
+                    page = _fetch_page(session, url, delay, jitter, timeout, html_path)
+                duration = time.time() - fetch_start
+                if page.not_modified and html_path and os.path.exists(html_path):
+                    with open(html_path, "r", encoding="utf-8") as handle:
+                        html_content = handle.read()
+                    logger.info(
+                        "Listing page not modified: %s (%.2f seconds)",
+                        url,
+                        duration,
+                    )
+                    from_cache = True
+                else:
+                    html = page.text
+                    logger.info(
+                        "Fetched listing page: %s (%.2f seconds, %d bytes)",
+                        url,
+                        duration,
+                        len(html),
+                    )
+                    if html_path:
+                        with open(html_path, "w", encoding="utf-8") as handle:
+                            handle.write(html)
+                        store_validators(html_path, page.validators)
+                        logger.info("Cached listing page %s to %s", url, html_path)
+                    html_content = html
+                    from_cache = False
             else:
-                stats.pages_fetched += 1
-        soup = BeautifulSoup(html_content, "html.parser")
-        yield url, soup, html_path
-        visited.add(url)
-        new_links: List[str] = []
-        for link in extract_pagination_links(url, soup, start_url):
-            if link not in visited and link not in queue and link not in new_links:
-                queue.append(link)
-                new_links.append(link)
-        if new_links:
-            logger.info(
-                "Discovered %d pagination link(s) from %s",
-                len(new_links),
-                url,
-            )
-            logger.info("Pagination queue size is now %d", len(queue))
+                html_content = cached_html
+                from_cache = True
+            if stats is not None:
+                stats.listing_seconds += time.monotonic() - page_start
+                stats.pages_total += 1
+                if from_cache:
+                    stats.pages_from_cache += 1
+                else:
+                    stats.pages_fetched += 1
+            soup = BeautifulSoup(html_content, "html.parser")
+            visited.add(url)
+            new_links: List[str] = []
+            for link in extract_pagination_links(url, soup, start_url):
+                if link not in visited and link not in queue and link not in new_links:
+                    queue.append(link)
+                    new_links.append(link)
+            if engine is not None:
+                next_url = next((link for link in queue if link not in visited), None)
+                if next_url is not None and next_url not in prefetched:
+                    next_path = _cache_path(next_url)
+                    if not _use_cached(next_path):
+                        headers = conditional_headers(load_validators(next_path))
+                        prefetched[next_url] = engine.prefetch(
+                            next_url, delay, jitter, timeout, headers
+                        )
+            if new_links:
+                logger.info(
+                    "Discovered %d pagination link(s) from %s",
+                    len(new_links),
+                    url,
+                )
+                logger.info("Pagination queue size is now %d", len(queue))
+            yield url, soup, html_path
+    finally:
+        for pending_page in prefetched.values():
+            pending_page.cancel()
 
 
 def _local_file_exists(path: Optional[str]) -> bool:
@@ -464,6 +571,31 @@ def _locate_existing_download(
     return None
 
 
+def _finalize_download(temp_path: str, target: str, digest: str, output_dir: str) -> Tuple[str, str]:
+    """Move a finished download into place, through the blob store if installed.
+
+    Returns the target path and *digest*, so callers record the hash computed
+    while writing instead of reading the file again. The write is recorded in
+    the artifact manifest of *output_dir*, the task directory audits count.
+    """
+
+    previous_size = artifact_file_size(target)
+    store = get_blob_store()
+    if store is not None:
+        store.store(temp_path, digest, target)
+    else:
+        os.replace(temp_path, target)
+    record_artifact_write(target, previous_size, root=output_dir)
+    return target, digest
+
+
+def _discard_partial(temp_path: str) -> None:
+    try:
+        os.remove(temp_path)
+    except OSError:
+        pass
+
+
 def download_file(
     session: requests.Session,
     file_url: str,
@@ -473,22 +605,38 @@ def download_file(
     timeout: float,
     preferred_name: Optional[str] = None,
     overwrite: bool = False,
-) -> str:
-    _sleep(delay, jitter)
-    response = session.get(file_url, stream=True, timeout=timeout)
-    response.raise_for_status()
+) -> Tuple[str, str]:
+    """Download *file_url* into *output_dir*; return the path and its SHA-256."""
+
     parsed = urlparse(file_url)
     filename = preferred_name or os.path.basename(parsed.path) or safe_filename(file_url)
+    engine = get_fetch_engine()
+    if engine is None:
+        _sleep(delay, jitter)
+        wait_for_host(file_url)
+        response = session.get(file_url, stream=True, timeout=timeout)
+        response.raise_for_status()
     os.makedirs(output_dir, exist_ok=True)
     if overwrite and preferred_name:
         target = os.path.join(output_dir, filename)
     else:
         target = _ensure_unique_path(output_dir, filename)
-    with open(target, "wb") as handle:
-        for chunk in response.iter_content(chunk_size=8192):
-            if chunk:
-                handle.write(chunk)
-    return target
+    temp_path = f"{target}.part"
+    try:
+        if engine is not None:
+            digest = engine.download_to(file_url, temp_path, delay, jitter, timeout)
+        else:
+            hasher = hashlib.sha256()
+            with open(temp_path, "wb") as handle:
+                for chunk in response.iter_content(chunk_size=8192):
+                    if chunk:
+                        handle.write(chunk)
+                        hasher.update(chunk)
+            digest = hasher.hexdigest()
+    except BaseException:
+        _discard_partial(temp_path)
+        raise
+    return _finalize_download(temp_path, target, digest, output_dir)
 
 
 def download_document(
@@ -499,16 +647,32 @@ def download_document(
     jitter: float,
     timeout: float,
     doc_type: Optional[str],
-) -> str:
+) -> Tuple[str, Optional[str]]:
+    """Download one document; return its path and SHA-256.
+
+    The digest is ``None`` when the server reports an HTML page unchanged and
+    the existing file is kept.
+    """
+
     normalized_type = (doc_type or "").lower()
     if normalized_type == "html":
-        html_content = _fetch(session, file_url, delay, jitter, timeout)
         filename = _structured_filename(file_url, doc_type)
-        os.makedirs(output_dir, exist_ok=True)
         target = os.path.join(output_dir, filename)
-        with open(target, "w", encoding="utf-8") as handle:
-            handle.write(html_content)
-        return target
+        page = _fetch_page(session, file_url, delay, jitter, timeout, target)
+        if page.not_modified:
+            return target, None
+        os.makedirs(output_dir, exist_ok=True)
+        data = page.text.encode("utf-8")
+        temp_path = f"{target}.part"
+        try:
+            with open(temp_path, "wb") as handle:
+                handle.write(data)
+        except BaseException:
+            _discard_partial(temp_path)
+            raise
+        result = _finalize_download(temp_path, target, hashlib.sha256(data).hexdigest(), output_dir)
+        store_validators(target, page.validators)
+        return result
     filename = _structured_filename(file_url, doc_type)
     return download_file(
         session,
@@ -522,6 +686,124 @@ def download_document(
     )
 
 
+class StateFlusher:
+    """Write state changes for *state_file* from a background thread.
+
+    While registered (use it as a context manager), :func:`_persist_state`
+    hands changes to the flusher instead of writing them inline. Changes are
+    captured on the caller's thread, merged while they wait, and written at
+    most once per *interval* seconds; an interval of ``0`` writes immediately.
+    Closing the flusher writes whatever is still pending.
+    """
+
+    def __init__(self, state_file: str, interval: float = DEFAULT_STATE_FLUSH_INTERVAL) -> None:
+        self.state_file = state_file
+        self.interval = max(0.0, float(interval))
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._pending: Optional[PendingStateWrite] = None
+        self._last_flush = 0.0
+        self._thread: Optional[threading.Thread] = None
+        self.flush_count = 0
+
+    def submit(self, state: PBCState) -> None:
+        pending = capture_state_changes(self.state_file, state)
+        if pending is None:
+            return
+        with self._lock:
+            if self._pending is None:
+                self._pending = pending
+            else:
+                self._pending.merge(pending)
+        if self.interval <= 0:
+            self.flush()
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name=f"state-flusher-{os.path.basename(self.state_file)}",
+                daemon=True,
+            )
+            self._thread.start()
+        self._wakeup.set()
+
+    def flush(self) -> None:
+        with self._write_lock:
+            with self._lock:
+                pending, self._pending = self._pending, None
+            if pending is None:
+                return
+            try:
+                write_state_changes(self.state_file, pending)
+            except Exception:
+                with self._lock:
+                    if self._pending is not None:
+                        pending.merge(self._pending)
+                    self._pending = pending
+                raise
+            self._last_flush = time.monotonic()
+            self.flush_count += 1
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wakeup.wait()
+            if self._stop.is_set():
+                break
+            remaining = self._last_flush + self.interval - time.monotonic()
+            if remaining > 0 and self._stop.wait(remaining):
+                break
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Failed to flush state file %s", self.state_file)
+
+    def close(self) -> None:
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def __enter__(self) -> "StateFlusher":
+        with _active_flushers_lock:
+            _active_flushers[self.state_file] = self
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        with _active_flushers_lock:
+            if _active_flushers.get(self.state_file) is self:
+                del _active_flushers[self.state_file]
+        self.close()
+
+
+_active_flushers: Dict[str, StateFlusher] = {}
+_active_flushers_lock = threading.Lock()
+
+
+def _state_flusher(
+    state_file: Optional[str], interval: Optional[float] = None
+) -> ContextManager[Optional[StateFlusher]]:
+    if not state_file:
+        return nullcontext()
+    if interval is None:
+        interval = DEFAULT_STATE_FLUSH_INTERVAL
+    return StateFlusher(state_file, interval)
+
+
+def _persist_state(state_file: Optional[str], state: PBCState) -> None:
+    if not state_file:
+        return
+    flusher = _active_flushers.get(state_file)
+    if flusher is not None:
+        flusher.submit(state)
+    else:
+        journal_state(state_file, state)
+
+
 def _is_supported_download_url(url: str) -> bool:
     parsed = urlparse(url)
     if parsed.scheme and parsed.scheme.lower() not in {"http", "https"}:
@@ -569,6 +851,34 @@ def _discover_detail_attachments(
     return attachments
 
 
+def _download_completion(
+    state: PBCState,
+    state_file: Optional[str],
+    entry_id: str,
+    file_url: str,
+    title: str,
+    label: str,
+    doc_type: str,
+    downloaded: List[str],
+    stats: Optional[TaskStats],
+) -> DoneCallback:
+    def _on_done(result: Optional[Tuple[str, Optional[str]]], error: Optional[BaseException]) -> None:
+        if error is not None or result is None:
+            print(f"Failed to download {file_url}: {error}")
+            return
+        path, digest = result
+        downloaded.append(path)
+        state.mark_downloaded(entry_id, file_url, title, doc_type, path, digest or file_digest(path))
+        if state_file:
+            _persist_state(state_file, state)
+        print(f"Downloaded: {label} -> {file_url}")
+        if stats is not None:
+            stats.files_downloaded += 1
+            stats.bytes_downloaded += artifact_file_size(path) or 0
+
+    return _on_done
+
+
 def _process_documents_for_entry(
     session: requests.Session,
     entry_id: str,
@@ -583,6 +893,7 @@ def _process_documents_for_entry(
     downloaded: List[str],
     allowed_types: Optional[Set[str]],
     stats: Optional[TaskStats] = None,
+    pool: Optional[DownloadPool] = None,
 ) -> bool:
     state_changed = False
     allowed_normalized: Optional[Set[str]] = None
@@ -623,6 +934,8 @@ def _process_documents_for_entry(
         if file_url in seen_urls:
             continue
         seen_urls.add(file_url)
+        if pool is not None and pool.is_pending(file_url):
+            continue
         force_download = bool(document.pop("__force_download", False))
         doc_type = document.get("type")
         normalized_type = (doc_type or classify_document_type(file_url)).lower()
@@ -660,6 +973,7 @@ def _process_documents_for_entry(
             display_name = incoming_title
             if isinstance(doc_record, dict) and incoming_title:
                 doc_record["title"] = incoming_title
+                state.mark_entry_dirty(entry_id)
                 state_changed = True
 
         if not already_downloaded:
@@ -672,9 +986,10 @@ def _process_documents_for_entry(
                     display_name or label,
                     normalized_type,
                     reused_path,
+                    file_digest(reused_path),
                 )
                 if state_file:
-                    save_state(state_file, state)
+                    _persist_state(state_file, state)
                 file_record = state.files.get(file_url, {})
                 existing_title = str((file_record or {}).get("title") or "").strip()
                 display_name = str(doc_record.get("title") or "").strip()
@@ -692,6 +1007,7 @@ def _process_documents_for_entry(
                     file_url,
                     normalized_type,
                 )
+                state.mark_entry_dirty(entry_id)
                 if not canonical_ok:
                     state.clear_downloaded(file_url)
                     already_downloaded = False
@@ -703,15 +1019,30 @@ def _process_documents_for_entry(
             )
             if not already_downloaded:
                 try:
-                    path = download_document(
-                        session,
-                        file_url,
-                        output_dir,
-                        delay,
-                        jitter,
-                        timeout,
-                        normalized_type,
-                    )
+                    if pool is not None:
+                        # Attachments are discovered from this page, so it is
+                        # fetched inline, paced by the pool's limiter.
+                        path, digest = pool.call(
+                            file_url,
+                            download_document,
+                            session,
+                            file_url,
+                            output_dir,
+                            0.0,
+                            0.0,
+                            timeout,
+                            normalized_type,
+                        )
+                    else:
+                        path, digest = download_document(
+                            session,
+                            file_url,
+                            output_dir,
+                            delay,
+                            jitter,
+                            timeout,
+                            normalized_type,
+                        )
                     downloaded.append(path)
                     label = display_name or entry_title or file_url
                     state.mark_downloaded(
@@ -720,9 +1051,10 @@ def _process_documents_for_entry(
                         display_name or label,
                         normalized_type,
                         path,
+                        digest or file_digest(path),
                     )
                     if state_file:
-                        save_state(state_file, state)
+                        _persist_state(state_file, state)
                     print(f"Downloaded: {label} -> {file_url}")
                     local_path = path
                 except Exception as exc:
@@ -730,6 +1062,7 @@ def _process_documents_for_entry(
                     continue
             if isinstance(doc_record, dict) and local_path:
                 doc_record["local_path"] = local_path
+                state.mark_entry_dirty(entry_id)
                 state_changed = True
             attachments = _discover_detail_attachments(file_url, local_path)
             for attachment in attachments:
@@ -768,6 +1101,7 @@ def _process_documents_for_entry(
                 file_url,
                 normalized_type,
             )
+            state.mark_entry_dirty(entry_id)
             if not canonical_ok:
                 state.clear_downloaded(file_url)
                 already_downloaded = False
@@ -775,7 +1109,7 @@ def _process_documents_for_entry(
         if already_downloaded:
             if display_name and display_name != original_title:
                 state_changed = True
-                save_state(state_file, state)
+                _persist_state(state_file, state)
                 print(f"Updated name for existing file: {display_name} -> {file_url}")
             label = display_name or existing_title or file_url
             print(f"Skipping existing file: {label} -> {file_url}")
@@ -783,8 +1117,29 @@ def _process_documents_for_entry(
                 stats.files_reused += 1
             continue
 
+        label = display_name or entry_title or file_url
+        on_done = _download_completion(
+            state,
+            state_file,
+            entry_id,
+            file_url,
+            display_name or label,
+            label,
+            normalized_type,
+            downloaded,
+            stats,
+        )
+        if pool is not None:
+            pool.submit(
+                file_url,
+                file_url,
+                download_document,
+                (file_url, output_dir, 0.0, 0.0, timeout, normalized_type),
+                on_done,
+            )
+            continue
         try:
-            path = download_document(
+            result = download_document(
                 session,
                 file_url,
                 output_dir,
@@ -793,24 +1148,31 @@ def _process_documents_for_entry(
                 timeout,
                 normalized_type,
             )
-            downloaded.append(path)
-            label = display_name or entry_title or file_url
-            state.mark_downloaded(
-                entry_id,
-                file_url,
-                display_name or label,
-                normalized_type,
-                path,
-            )
-            if state_file:
-                save_state(state_file, state)
-            print(f"Downloaded: {label} -> {file_url}")
-            state_changed = True
-            if stats is not None:
-                stats.files_downloaded += 1
         except Exception as exc:
-            print(f"Failed to download {file_url}: {exc}")
+            on_done(None, exc)
+        else:
+            on_done(result, None)
+            state_changed = True
     return state_changed
+
+
+def _download_pool(max_concurrency: Optional[int], delay: float, jitter: float) -> Optional[DownloadPool]:
+    """Return a worker pool when more than one concurrent download is allowed.
+
+    The pool's per-host token bucket is derived from *delay*/*jitter*, so the
+    average request rate against the site matches the sequential crawl; the
+    gain comes from overlapping transfers rather than from sending more
+    requests.
+    """
+
+    if not max_concurrency or max_concurrency <= 1:
+        return None
+    return DownloadPool(
+        max_concurrency,
+        rate_limiter=HostRateLimiter.from_delay(delay, jitter),
+    )
+
+
 def collect_new_files(
     session: requests.Session,
     start_url: str,
@@ -827,45 +1189,76 @@ def collect_new_files(
     use_cache: bool = False,
     refresh_cache: bool = False,
     stats: Optional[TaskStats] = None,
+    max_concurrency: int = 1,
+    incremental_pages: int = 0,
 ) -> List[str]:
+    """Walk the listing and download documents that are not in *state* yet.
+
+    With *incremental_pages* > 0 the walk stops once that many consecutive
+    listing pages contained only entries already recorded in *state*; new
+    items are published at the front of the listing, so the remaining pages
+    are skipped.
+    """
+
     downloaded: List[str] = []
     if stats is None:
         stats = TaskStats()
-    for page_url, soup, _ in iterate_listing_pages(
-        session,
-        start_url,
-        delay,
-        jitter,
-        timeout,
-        page_cache_dir=page_cache_dir,
-        use_cache=use_cache,
-        refresh_cache=refresh_cache,
-        stats=stats,
-    ):
-        entries = extract_listing_entries(page_url, soup)
-        stats.entries_seen += len(entries)
-        for entry in entries:
-            entry_id = state.ensure_entry(entry)
-            documents = entry.get("documents")
-            if not isinstance(documents, list):
-                continue
-            state_dirty = _process_documents_for_entry(
-                session,
-                entry_id,
-                documents,
-                state,
-                output_dir,
-                delay,
-                jitter,
-                timeout,
-                state_file,
-                verify_local,
-                downloaded,
-                allowed_types,
-                stats,
-            )
-            if state_dirty and state_file:
-                save_state(state_file, state)
+    known_streak = 0
+    pool = _download_pool(max_concurrency, delay, jitter)
+    with pool if pool is not None else nullcontext():
+        for page_url, soup, _ in iterate_listing_pages(
+            session,
+            start_url,
+            delay,
+            jitter,
+            timeout,
+            page_cache_dir=page_cache_dir,
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+            stats=stats,
+            rate_limiter=pool.rate_limiter if pool is not None else None,
+        ):
+            entries = extract_listing_entries(page_url, soup)
+            stats.entries_seen += len(entries)
+            # A page without entries (an error page served with 200, a layout
+            # change) proves nothing, so it never counts as known.
+            page_known = bool(entries) and all(state.is_known_entry(entry) for entry in entries)
+            download_start = time.monotonic()
+            for entry in entries:
+                entry_id = state.ensure_entry(entry)
+                documents = entry.get("documents")
+                if not isinstance(documents, list):
+                    continue
+                state_dirty = _process_documents_for_entry(
+                    session,
+                    entry_id,
+                    documents,
+                    state,
+                    output_dir,
+                    delay,
+                    jitter,
+                    timeout,
+                    state_file,
+                    verify_local,
+                    downloaded,
+                    allowed_types,
+                    stats,
+                    pool,
+                )
+                if pool is not None:
+                    pool.drain()
+                if state_dirty and state_file:
+                    _persist_state(state_file, state)
+            stats.download_seconds += time.monotonic() - download_start
+            if incremental_pages > 0:
+                known_streak = known_streak + 1 if page_known else 0
+                if known_streak >= incremental_pages:
+                    logger.info(
+                        "Stopping listing crawl at %s after %d page(s) without new entries",
+                        page_url,
+                        known_streak,
+                    )
+                    break
     return downloaded
 
 
@@ -880,47 +1273,62 @@ def download_from_structure(
     *,
     task_name: Optional[str] = None,
     allowed_types: Optional[Set[str]] = None,
+    state_flush_interval: Optional[float] = None,
+    max_concurrency: int = 1,
 ) -> List[str]:
     with open(structure_path, "r", encoding="utf-8") as handle:
         data = json.load(handle)
     entries = data.get("entries")
     if not isinstance(entries, list):
         return []
+    started = time.monotonic()
     session = create_session()
+    stats = TaskStats()
     state = load_state(state_file, classify_document_type)
+    stats.state_seconds += time.monotonic() - started
     downloaded: List[str] = []
-    stats = TaskStats()
-    for entry in entries:
-        if not isinstance(entry, dict):
-            continue
-        entry_id = state.ensure_entry(entry)
-        documents = entry.get("documents")
-        if not isinstance(documents, list):
-            continue
-        state_dirty = _process_documents_for_entry(
-            session,
-            entry_id,
-            documents,
-            state,
-            output_dir,
-            delay,
-            jitter,
-            timeout,
-            state_file,
-            verify_local,
-            downloaded,
-            allowed_types,
-            stats,
-        )
-        if state_dirty and state_file:
-            save_state(state_file, state)
+    pool = _download_pool(max_concurrency, delay, jitter)
+    download_start = time.monotonic()
+    with _state_flusher(state_file, state_flush_interval), (
+        pool if pool is not None else nullcontext()
+    ):
+        for entry in entries:
+            if not isinstance(entry, dict):
+                continue
+            entry_id = state.ensure_entry(entry)
+            documents = entry.get("documents")
+            if not isinstance(documents, list):
+                continue
+            state_dirty = _process_documents_for_entry(
+                session,
+                entry_id,
+                documents,
+                state,
+                output_dir,
+                delay,
+                jitter,
+                timeout,
+                state_file,
+                verify_local,
+                downloaded,
+                allowed_types,
+                stats,
+                pool,
+            )
+            if pool is not None:
+                pool.drain()
+            if state_dirty and state_file:
+                _persist_state(state_file, state)
+    stats.download_seconds += time.monotonic() - download_start
+    save_start = time.monotonic()
     save_state(state_file, state)
-    summary_state = load_state(state_file, classify_document_type)
-    log_task_summary(
+    stats.state_seconds += time.monotonic() - save_start
+    record_state_totals(stats, state)
+    stats.wall_seconds = time.monotonic() - started
+    record_task_run(
         task_name or structure_path,
         stats,
         downloaded,
-        summary_state,
         context="download-from-structure",
     )
     return downloaded
@@ -1035,7 +1443,7 @@ def snapshot_listing(
             if not isinstance(current_serial, int) or entry_id not in assigned_serials:
                 serial_counter += 1
                 if isinstance(stored_entry, dict):
-                    stored_entry["serial"] = serial_counter
+                    state.set_serial(entry_id, serial_counter)
                 assigned_serials.add(entry_id)
         unique_added = len(state.entries) - initial_count
         logger.info(
@@ -1101,31 +1509,80 @@ def monitor_once(
     stats: Optional[TaskStats] = None,
     use_cache: bool = False,
     refresh_cache: bool = False,
+    state_flush_interval: Optional[float] = None,
+    max_concurrency: int = 1,
+    incremental_pages: int = 0,
 ) -> List[str]:
+    """Run one crawl of *start_url* and return the files downloaded.
+
+    *stats*, when given, receives the run's counters, phase timings and the
+    state totals once the state has been saved.
+    """
+
+    started = time.monotonic()
+    if stats is None:
+        stats = TaskStats()
     session = create_session()
     state = load_state(state_file, classify_document_type)
+    stats.state_seconds += time.monotonic() - started
     if page_cache_dir:
         os.makedirs(page_cache_dir, exist_ok=True)
-    new_files = collect_new_files(
-        session,
-        start_url,
-        output_dir,
-        state,
-        delay,
-        jitter,
-        timeout,
-        state_file,
-        page_cache_dir,
-        verify_local,
-        allowed_types=allowed_types,
-        stats=stats,
-        use_cache=use_cache,
-        refresh_cache=refresh_cache,
-    )
+    with _state_flusher(state_file, state_flush_interval):
+        new_files = collect_new_files(
+            session,
+            start_url,
+            output_dir,
+            state,
+            delay,
+            jitter,
+            timeout,
+            state_file,
+            page_cache_dir,
+            verify_local,
+            allowed_types=allowed_types,
+            stats=stats,
+            use_cache=use_cache,
+            refresh_cache=refresh_cache,
+            max_concurrency=max_concurrency,
+            incremental_pages=incremental_pages,
+        )
+    save_start = time.monotonic()
     save_state(state_file, state)
+    stats.state_seconds += time.monotonic() - save_start
+    record_state_totals(stats, state)
+    stats.wall_seconds = time.monotonic() - started
     return new_files
 
 
+def record_task_run(
+    task_name: str,
+    stats: TaskStats,
+    new_files: Sequence[str],
+    *,
+    context: str,
+    iteration: Optional[int] = None,
+) -> None:
+    """Log the summary of a finished run and add it to the run history."""
+
+    log_task_summary(task_name, stats, new_files, None, context=context)
+    history = get_run_history()
+    if history is None:
+        return
+    finished = datetime.now()
+    try:
+        history.record(
+            task_name,
+            stats,
+            context=context,
+            iteration=iteration,
+            started_at=finished - timedelta(seconds=stats.wall_seconds),
+            finished_at=finished,
+            new_files=len(new_files),
+        )
+    except Exception as exc:  # pragma: no cover - history must not stop the crawl
+        logger.warning("Failed to record run of task '%s': %s", task_name, exc)
+
+
 def _compute_sleep_seconds(min_hours: float, max_hours: float) -> float:
     min_seconds = min_hours * 3600
     max_seconds = max_hours * 3600
@@ -1134,6 +1591,94 @@ def _compute_sleep_seconds(min_hours: float, max_hours: float) -> float:
     return random.uniform(min_seconds, max_seconds)
 
 
+def run_monitor_iteration(
+    start_url: str,
+    output_dir: str,
+    state_file: Optional[str],
+    delay: float,
+    jitter: float,
+    timeout: float,
+    page_cache_dir: Optional[str],
+    verify_local: bool = False,
+    *,
+    iteration: int = 1,
+    task_name: Optional[str] = None,
+    use_cache_default: bool = True,
+    refresh_cache_default: bool = False,
+    force_use_cache: bool = False,
+    force_no_use_cache: bool = False,
+    allowed_types: Optional[Set[str]] = None,
+    state_flush_interval: Optional[float] = None,
+    max_concurrency: int = 1,
+    incremental_pages: int = 0,
+    full_sweep_every: int = DEFAULT_FULL_SWEEP_EVERY,
+) -> List[str]:
+    """Run one monitoring pass the way each loop iteration does.
+
+    In incremental mode (*incremental_pages* > 0) the first iteration and every
+    *full_sweep_every*-th one after it still walk the whole listing, so edits
+    to older entries are eventually picked up.
+    """
+
+    print(f"[{datetime.now().isoformat(timespec='seconds')}] Iteration {iteration} start")
+    if refresh_cache_default:
+        use_cache_flag = False
+        refresh_cache_flag = True
+    elif force_use_cache:
+        use_cache_flag = True
+        refresh_cache_flag = False
+    elif force_no_use_cache:
+        use_cache_flag = False
+        refresh_cache_flag = False
+    else:
+        cache_fresh = _listing_cache_is_fresh(page_cache_dir, start_url)
+        if cache_fresh:
+            use_cache_flag = True
+            refresh_cache_flag = False
+        else:
+            use_cache_flag = False
+            refresh_cache_flag = False
+
+    sweep_pages = incremental_pages
+    if incremental_pages > 0 and (
+        iteration <= 1
+        or (full_sweep_every > 0 and (iteration - 1) % full_sweep_every == 0)
+    ):
+        logger.info("Iteration %d walks the full listing", iteration)
+        sweep_pages = 0
+
+    iteration_stats = TaskStats()
+    new_files = monitor_once(
+        start_url,
+        output_dir,
+        state_file,
+        delay,
+        jitter,
+        timeout,
+        page_cache_dir,
+        verify_local,
+        allowed_types=allowed_types,
+        stats=iteration_stats,
+        use_cache=use_cache_flag,
+        refresh_cache=refresh_cache_flag,
+        state_flush_interval=state_flush_interval,
+        max_concurrency=max_concurrency,
+        incremental_pages=sweep_pages,
+    )
+    record_task_run(
+        task_name or start_url,
+        iteration_stats,
+        new_files,
+        context=f"iteration {iteration}",
+        iteration=iteration,
+    )
+    if new_files:
+        print(f"New files downloaded: {len(new_files)}")
+    else:
+        print("No new files found")
+    return new_files
+
+
 def monitor_loop(
     start_url: str,
     output_dir: str,
@@ -1152,31 +1697,15 @@ def monitor_loop(
     force_use_cache: bool = False,
     force_no_use_cache: bool = False,
     allowed_types: Optional[Set[str]] = None,
+    state_flush_interval: Optional[float] = None,
+    max_concurrency: int = 1,
+    incremental_pages: int = 0,
+    full_sweep_every: int = DEFAULT_FULL_SWEEP_EVERY,
 ) -> None:
     iteration = 0
     while True:
         iteration += 1
-        print(f"[{datetime.now().isoformat(timespec='seconds')}] Iteration {iteration} start")
-        if refresh_cache_default:
-            use_cache_flag = False
-            refresh_cache_flag = True
-        elif force_use_cache:
-            use_cache_flag = True
-            refresh_cache_flag = False
-        elif force_no_use_cache:
-            use_cache_flag = False
-            refresh_cache_flag = False
-        else:
-            cache_fresh = _listing_cache_is_fresh(page_cache_dir, start_url)
-            if cache_fresh:
-                use_cache_flag = True
-                refresh_cache_flag = False
-            else:
-                use_cache_flag = False
-                refresh_cache_flag = False
-
-        iteration_stats = TaskStats()
-        new_files = monitor_once(
+        run_monitor_iteration(
             start_url,
             output_dir,
             state_file,
@@ -1185,23 +1714,18 @@ def monitor_loop(
             timeout,
             page_cache_dir,
             verify_local,
+            iteration=iteration,
+            task_name=task_name,
+            use_cache_default=use_cache_default,
+            refresh_cache_default=refresh_cache_default,
+            force_use_cache=force_use_cache,
+            force_no_use_cache=force_no_use_cache,
             allowed_types=allowed_types,
-            stats=iteration_stats,
-            use_cache=use_cache_flag,
-            refresh_cache=refresh_cache_flag,
+            state_flush_interval=state_flush_interval,
+            max_concurrency=max_concurrency,
+            incremental_pages=incremental_pages,
+            full_sweep_every=full_sweep_every,
         )
-        summary_state = load_state(state_file, classify_document_type)
-        log_task_summary(
-            task_name or start_url,
-            iteration_stats,
-            new_files,
-            summary_state,
-            context=f"iteration {iteration}",
-        )
-        if new_files:
-            print(f"New files downloaded: {len(new_files)}")
-        else:
-            print("No new files found")
         sleep_seconds = _compute_sleep_seconds(min_hours, max_hours)
         print(f"Sleeping for {int(sleep_seconds)} seconds before next check")
         time.sleep(sleep_seconds)
@@ -16,9 +16,23 @@ from pbc_regulations.icrawler.dashboard import (
 )
 from pbc_regulations.searcher.api_server import create_policy_router
 from pbc_regulations.searcher.clause_lookup import ClauseLookup
+from pbc_regulations.searcher.index_snapshot import (
+    SNAPSHOT_FILENAME,
+    load_index_snapshot,
+    write_index_snapshot,
+)
+from pbc_regulations.searcher.document_pool import (
+    DEFAULT_PARSE_TIMEOUT,
+    DocumentPool,
+    get_document_pool,
+    install_document_pool,
+)
+from pbc_regulations.searcher.query_cache import QueryCache
+from pbc_regulations.searcher.reloader import SearchIndexReloader
 from pbc_regulations.searcher.policy_finder import (
     Entry,
     PolicyFinder,
+    SEARCH_MODES,
     TaskConfig,
     TIAOFASI_ADMINISTRATIVE_REGULATION,
     TIAOFASI_DEPARTMENTAL_RULE,
@@ -31,12 +45,16 @@ from pbc_regulations.searcher.policy_finder import (
     default_state_path,
     discover_project_root,
     load_configured_tasks,
+    norm_text,
+    resolve_artifact_dir,
     resolve_configured_state_path,
 )
 
 DEFAULT_SEARCH_TOPK = 5
 MAX_SEARCH_TOPK = 50
+DEFAULT_SEARCH_RELOAD_INTERVAL = 30.0
 
+APIRouter = base_dashboard.APIRouter
 JSONResponse = base_dashboard.JSONResponse
 Request = base_dashboard.Request
 uvicorn = base_dashboard.uvicorn
@@ -124,9 +142,12 @@ def _prepare_policy_finder(
     config_path: str,
     disable_search: bool,
     state_overrides: Dict[str, str],
-) -> Tuple[Optional[PolicyFinder], Optional[ClauseLookup], Optional[str]]:
+    use_snapshot: bool = True,
+    snapshot_path: Optional[str] = None,
+    rebuild_snapshot: bool = False,
+) -> Tuple[Optional[SearchIndexReloader], Optional[str]]:
     if disable_search:
-        return None, None, "Search disabled by configuration"
+        return None, "Search disabled by configuration"
 
     overrides = dict(state_overrides)
 
@@ -160,22 +181,55 @@ def _prepare_policy_finder(
             missing.append(str(resolved))
 
     if missing:
-        return None, None, "Missing search state file(s): " + ", ".join(missing)
-
-    try:
-        finder = PolicyFinder(*(str(path) for path in resolved_paths))
-    except Exception as exc:  # pragma: no cover - defensive
-        return None, None, f"Failed to load search index: {exc}"
+        return None, "Missing search state file(s): " + ", ".join(missing)
 
     script_dir = Path(__file__).resolve().parent
     resolved_extract_paths = [default_extract_path(task.name, script_dir) for task in task_configs]
 
+    snapshot_file: Optional[Path] = None
+    if use_snapshot:
+        if snapshot_path:
+            snapshot_file = Path(snapshot_path).expanduser()
+        else:
+            snapshot_file = resolve_artifact_dir(config_dir) / SNAPSHOT_FILENAME
+
+    def _save_snapshot(finder: PolicyFinder, clause_lookup: Optional[ClauseLookup]) -> None:
+        assert snapshot_file is not None
+        write_index_snapshot(
+            snapshot_file,
+            finder,
+            clause_lookup,
+            resolved_paths,
+            resolved_extract_paths,
+        )
+
+    restored: Optional[Tuple[PolicyFinder, Optional[ClauseLookup]]] = None
+    if snapshot_file is not None and not rebuild_snapshot:
+        restored = load_index_snapshot(snapshot_file, resolved_paths, resolved_extract_paths)
+        if restored is not None and restored[1] is None:
+            restored = None
+
     try:
-        clause_lookup = ClauseLookup(resolved_extract_paths)
+        reloader = SearchIndexReloader(
+            resolved_paths,
+            resolved_extract_paths,
+            finder=restored[0] if restored else None,
+            clause_lookup=restored[1] if restored else None,
+            on_reload=_save_snapshot if snapshot_file is not None else None,
+        )
     except Exception as exc:  # pragma: no cover - defensive
-        return finder, None, f"Failed to load clause lookup: {exc}"
+        return None, f"Failed to load search index: {exc}"
+
+    if snapshot_file is not None and restored is None:
+        try:
+            _save_snapshot(reloader.finder, reloader.clause_lookup)
+        except OSError as exc:
+            message = f"Could not write search index snapshot {snapshot_file}: {exc}"
+            if rebuild_snapshot:
+                return None, message
+            print(f"[portal] {message}", file=sys.stderr)
 
-    return finder, clause_lookup, None
+    return reloader, None
 
 
 def _coerce_search_topk(
@@ -218,6 +272,19 @@ def _coerce_search_bool(value: Any) -> Optional[bool]:
     raise ValueError("Invalid boolean value")
 
 
+def _coerce_search_mode(value: Any) -> str:
+    if value is None:
+        return SEARCH_MODES[0]
+    if not isinstance(value, str):
+        raise ValueError("Unsupported type for mode")
+    lowered = value.strip().lower()
+    if not lowered:
+        return SEARCH_MODES[0]
+    if lowered not in SEARCH_MODES:
+        raise ValueError("Unknown search mode")
+    return lowered
+
+
 def _search_entry_payload(
     entry: Entry, score: float, include_documents: bool
 ) -> Dict[str, Any]:
@@ -234,9 +301,9 @@ def _serve_portal(
     auto_refresh: int,
     task: Optional[str],
     artifact_dir_override: Optional[str],
-    policy_finder: Optional[PolicyFinder],
-    clause_lookup: Optional[ClauseLookup],
+    search_reloader: Optional[SearchIndexReloader],
     search_settings: Dict[str, object],
+    search_reload_interval: float = DEFAULT_SEARCH_RELOAD_INTERVAL,
 ) -> None:
     if JSONResponse is None or Request is None or uvicorn is None:
         raise RuntimeError(
@@ -257,23 +324,53 @@ def _serve_portal(
     search_reason = search_settings.get("reason")
 
     search_config_payload: Dict[str, object] = {
-        "enabled": policy_finder is not None,
+        "enabled": search_reloader is not None,
         "endpoint": "/api/search",
         "defaultTopk": search_default_topk,
         "maxTopk": search_max_topk,
         "includeDocuments": search_include_documents,
     }
-    if policy_finder is None and isinstance(search_reason, str):
+    if search_reloader is None and isinstance(search_reason, str):
         search_config_payload["reason"] = search_reason
 
     extra_routers: List[Tuple[object, Dict[str, Any]]] = []
-    if policy_finder is not None:
+    # Keyed by normalised query; emptied whenever the reloader swaps in a new finder.
+    search_cache = QueryCache()
+
+    health_router = APIRouter()
+
+    @health_router.get("/health")
+    def health(request: Request) -> Dict[str, object]:
+        payload: Dict[str, object] = {"status": "ok"}
+        overview_cache = getattr(request.app.state, "overview_cache", None)
+        if overview_cache is not None:
+            payload["overviews"] = overview_cache.stats()
+        event_hub = getattr(request.app.state, "event_hub", None)
+        if event_hub is not None:
+            payload["events"] = event_hub.stats()
+        if search_reloader is not None:
+            payload["search"] = {
+                "enabled": True,
+                **search_reloader.status(),
+                "text_cache": search_reloader.finder.text_cache_stats(),
+                "query_cache": search_cache.stats(),
+            }
+        else:
+            payload["search"] = {"enabled": False}
+        pool = get_document_pool()
+        if pool is not None:
+            payload["document_pool"] = pool.stats()
+        return payload
+
+    extra_routers.append((health_router, {}))
+
+    if search_reloader is not None:
 
         def _portal_finder_dependency() -> PolicyFinder:
-            return policy_finder
+            return search_reloader.finder
 
         def _portal_clause_dependency() -> Optional[ClauseLookup]:
-            return clause_lookup
+            return search_reloader.clause_lookup
 
         policy_router = create_policy_router(
             finder_dependency=_portal_finder_dependency,
@@ -290,34 +387,43 @@ def _serve_portal(
         extra_routers=extra_routers,
     )
 
-    search_finder = policy_finder
-
     def _search_disabled_response() -> JSONResponse:
         payload: Dict[str, object] = {"error": "search_disabled"}
         if isinstance(search_reason, str):
             payload["reason"] = search_reason
         return JSONResponse(payload, status_code=404)
 
-    def _handle_search(query: str, topk: int, include_documents: bool) -> JSONResponse:
-        if search_finder is None:
+    def _handle_search(
+        query: str, topk: int, include_documents: bool, mode: str
+    ) -> JSONResponse:
+        if search_reloader is None:
             return _search_disabled_response()
-        results = [
-            _search_entry_payload(entry, score, include_documents)
-            for entry, score in search_finder.search(query, topk=topk)
-        ]
-        return JSONResponse(
-            {
+        finder = search_reloader.finder
+
+        def compute() -> Dict[str, Any]:
+            results = [
+                _search_entry_payload(entry, score, include_documents)
+                for entry, score in finder.search(query, topk=topk, mode=mode)
+            ]
+            return {
                 "query": query,
                 "topk": topk,
+                "mode": mode,
                 "include_documents": include_documents,
                 "result_count": len(results),
                 "results": results,
             }
+
+        payload = search_cache.get_or_compute(
+            finder, (norm_text(query), topk, include_documents, mode), compute
         )
+        if payload["query"] != query:
+            payload = dict(payload, query=query)
+        return JSONResponse(payload)
 
     @app.get("/api/search")
     def search_get(request: Request) -> JSONResponse:
-        if search_finder is None:
+        if search_reloader is None:
             return _search_disabled_response()
 
         params = request.query_params
@@ -346,11 +452,16 @@ def _serve_portal(
             if parsed_bool is not None:
                 include_documents = parsed_bool
 
-        return _handle_search(query, topk, include_documents)
+        try:
+            mode = _coerce_search_mode(params.get("mode"))
+        except ValueError:
+            return JSONResponse({"error": "invalid_mode"}, status_code=400)
+
+        return _handle_search(query, topk, include_documents, mode)
 
     @app.post("/api/search")
     async def search_post(request: Request) -> JSONResponse:
-        if search_finder is None:
+        if search_reloader is None:
             return _search_disabled_response()
 
         content_length = request.headers.get("content-length")
@@ -398,7 +509,12 @@ def _serve_portal(
             if parsed_bool is not None:
                 include_documents = parsed_bool
 
-        return _handle_search(query, topk, include_documents)
+        try:
+            mode = _coerce_search_mode(payload.get("mode"))
+        except ValueError:
+            return JSONResponse({"error": "invalid_mode"}, status_code=400)
+
+        return _handle_search(query, topk, include_documents, mode)
 
     host_display = host
     if host_display == "0.0.0.0":
@@ -411,7 +527,13 @@ def _serve_portal(
         file=sys.stderr,
     )
 
-    uvicorn.run(app, host=host, port=port, log_level="info")
+    if search_reloader is not None:
+        search_reloader.start(search_reload_interval)
+    try:
+        uvicorn.run(app, host=host, port=port, log_level="info")
+    finally:
+        if search_reloader is not None:
+            search_reloader.stop()
 
 
 def main(argv: Optional[List[str]] = None) -> None:
@@ -457,6 +579,27 @@ def main(argv: Optional[List[str]] = None) -> None:
         metavar="TASK=PATH",
         help="Override a search state JSON mapping (repeatable)",
     )
+    parser.add_argument(
+        "--search-snapshot",
+        metavar="PATH",
+        help=f"Search index snapshot file (default: <artifact_dir>/{SNAPSHOT_FILENAME})",
+    )
+    parser.add_argument(
+        "--no-search-snapshot",
+        action="store_true",
+        help="Always build the search index from the state files",
+    )
+    parser.add_argument(
+        "--build-search-index",
+        action="store_true",
+        help="Rebuild the search index snapshot and exit",
+    )
+    parser.add_argument(
+        "--search-reload-interval",
+        type=float,
+        default=DEFAULT_SEARCH_RELOAD_INTERVAL,
+        help="Seconds between checks for changed state/extract files (0 disables reloading)",
+    )
     parser.add_argument(
         "--search-default-topk",
         type=int,
@@ -469,6 +612,23 @@ def main(argv: Optional[List[str]] = None) -> None:
         default=MAX_SEARCH_TOPK,
         help="Maximum allowed top-k when searching",
     )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Worker processes for PDF/Word/HTML parsing (default: 0, parse in the request thread)",
+    )
+    parser.add_argument(
+        "--parse-timeout",
+        type=float,
+        default=DEFAULT_PARSE_TIMEOUT,
+        help="Seconds a request waits for one document to be parsed (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--parse-queue",
+        type=int,
+        help="Maximum parsing jobs queued or running (default: 4 per worker)",
+    )
 
     args = parser.parse_args(argv)
 
@@ -521,40 +681,57 @@ def main(argv: Optional[List[str]] = None) -> None:
                 canonicalize_task_name(definition["name"])
             ] = override_value
 
-    policy_finder, clause_lookup, search_error = _prepare_policy_finder(
+    search_reloader, search_error = _prepare_policy_finder(
         config_path=config_path,
-        disable_search=args.disable_search,
+        disable_search=args.disable_search and not args.build_search_index,
         state_overrides=search_state_overrides,
+        use_snapshot=not args.no_search_snapshot or args.build_search_index,
+        snapshot_path=args.search_snapshot,
+        rebuild_snapshot=args.build_search_index,
     )
-    if search_error:
-        if policy_finder is None:
-            if not args.disable_search:
-                print(
-                    f"[portal] Search interface disabled: {search_error}",
-                    file=sys.stderr,
-                )
-        else:
-            print(
-                f"[portal] Search interface warning: {search_error}",
-                file=sys.stderr,
-            )
+    if args.build_search_index:
+        if search_reloader is None:
+            print(f"[portal] Search index not built: {search_error}", file=sys.stderr)
+            raise SystemExit(1)
+        print(
+            f"[portal] Search index snapshot ready ({len(search_reloader.finder.entries)} entries)"
+        )
+        return
+    if search_error and not args.disable_search:
+        print(
+            f"[portal] Search interface disabled: {search_error}",
+            file=sys.stderr,
+        )
 
-    _serve_portal(
-        config_path,
-        args.host,
-        args.port,
-        auto_refresh=args.refresh,
-        task=args.task,
-        artifact_dir_override=args.artifact_dir,
-        policy_finder=policy_finder,
-        clause_lookup=clause_lookup,
-        search_settings={
-            "default_topk": search_default_topk,
-            "max_topk": search_max_topk,
-            "include_documents": True,
-            "reason": search_error,
-        },
-    )
+    pool = None
+    if args.parse_workers > 0 and search_reloader is not None:
+        pool = DocumentPool(
+            args.parse_workers,
+            timeout=args.parse_timeout,
+            max_pending=args.parse_queue,
+        )
+    previous_pool = install_document_pool(pool)
+    try:
+        _serve_portal(
+            config_path,
+            args.host,
+            args.port,
+            auto_refresh=args.refresh,
+            task=args.task,
+            artifact_dir_override=args.artifact_dir,
+            search_reloader=search_reloader,
+            search_reload_interval=args.search_reload_interval,
+            search_settings={
+                "default_topk": search_default_topk,
+                "max_topk": search_max_topk,
+                "include_documents": True,
+                "reason": search_error,
+            },
+        )
+    finally:
+        install_document_pool(previous_pool)
+        if pool is not None:
+            pool.shutdown(wait=False)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,214 @@
+"""SQLite time series of per-run crawl statistics."""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, fields
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .task_models import TaskStats
+
+
+logger = logging.getLogger(__name__)
+
+HISTORY_FILENAME = "run_history.sqlite3"
+DEFAULT_HISTORY_LIMIT = 100
+MAX_HISTORY_LIMIT = 5000
+
+_COLUMN_TYPES = {int: "INTEGER", float: "REAL", "int": "INTEGER", "float": "REAL"}
+
+
+__all__ = [
+    "DEFAULT_HISTORY_LIMIT",
+    "HISTORY_FILENAME",
+    "MAX_HISTORY_LIMIT",
+    "RunHistory",
+    "default_history_path",
+    "get_run_history",
+    "install_run_history",
+    "load_run_history",
+]
+
+
+def default_history_path(artifact_dir: str) -> str:
+    return os.path.join(artifact_dir, HISTORY_FILENAME)
+
+
+def _schema() -> str:
+    stats_columns = ",\n".join(
+        f"    {item.name} {_COLUMN_TYPES.get(item.type, 'INTEGER')} NOT NULL DEFAULT 0"
+        for item in fields(TaskStats)
+    )
+    return (
+        "CREATE TABLE IF NOT EXISTS runs (\n"
+        "    id INTEGER PRIMARY KEY AUTOINCREMENT,\n"
+        "    task TEXT NOT NULL,\n"
+        "    context TEXT NOT NULL,\n"
+        "    iteration INTEGER,\n"
+        "    started_at TEXT NOT NULL,\n"
+        "    finished_at TEXT NOT NULL,\n"
+        "    new_files INTEGER NOT NULL DEFAULT 0,\n"
+        f"{stats_columns}\n"
+        ");\n"
+        "CREATE INDEX IF NOT EXISTS runs_task_started ON runs (task, started_at);\n"
+    )
+
+
+def _isoformat(value: datetime) -> str:
+    return value.isoformat(timespec="seconds")
+
+
+def _query_runs(
+    connection: sqlite3.Connection,
+    task: str,
+    since: Optional[datetime],
+    limit: int,
+) -> List[Dict[str, object]]:
+    sql = "SELECT * FROM runs WHERE task = ?"
+    params: List[object] = [task]
+    if since is not None:
+        sql += " AND started_at >= ?"
+        params.append(_isoformat(since))
+    sql += " ORDER BY started_at DESC, id DESC LIMIT ?"
+    params.append(max(1, min(int(limit), MAX_HISTORY_LIMIT)))
+    connection.row_factory = sqlite3.Row
+    return [dict(row) for row in connection.execute(sql, params).fetchall()]
+
+
+class RunHistory:
+    """Append one row per crawl run to the ``runs`` table of *path*.
+
+    Each row holds the run's :class:`TaskStats` counters and phase timings,
+    so throughput can be charted per task over time. Every call opens its own
+    connection: the monitor writes from one thread per task while the
+    dashboard reads from another process (see :func:`load_run_history`).
+    The file and its schema are created by the first recorded run, so runs
+    that record nothing leave no database behind.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=10.0)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _ensure_schema(self, connection: sqlite3.Connection) -> None:
+        if self._schema_ready:
+            return
+        with connection:
+            connection.executescript(_schema())
+            existing = {row[1] for row in connection.execute("PRAGMA table_info(runs)")}
+            # Counters added to TaskStats later become new columns of old files.
+            for item in fields(TaskStats):
+                if item.name not in existing:
+                    connection.execute(
+                        f"ALTER TABLE runs ADD COLUMN {item.name} "
+                        f"{_COLUMN_TYPES.get(item.type, 'INTEGER')} NOT NULL DEFAULT 0"
+                    )
+        self._schema_ready = True
+
+    def record(
+        self,
+        task: str,
+        stats: TaskStats,
+        *,
+        context: str,
+        started_at: datetime,
+        finished_at: Optional[datetime] = None,
+        iteration: Optional[int] = None,
+        new_files: int = 0,
+    ) -> None:
+        values: Dict[str, object] = {
+            "task": task,
+            "context": context,
+            "iteration": iteration,
+            "started_at": _isoformat(started_at),
+            "finished_at": _isoformat(finished_at or datetime.now()),
+            "new_files": new_files,
+            **asdict(stats),
+        }
+        columns = ", ".join(values)
+        placeholders = ", ".join("?" for _ in values)
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = self._connect()
+            try:
+                self._ensure_schema(connection)
+                with connection:
+                    connection.execute(
+                        f"INSERT INTO runs ({columns}) VALUES ({placeholders})",
+                        tuple(values.values()),
+                    )
+            finally:
+                connection.close()
+
+    def query(
+        self,
+        task: str,
+        *,
+        since: Optional[datetime] = None,
+        limit: int = DEFAULT_HISTORY_LIMIT,
+    ) -> List[Dict[str, object]]:
+        """Return up to *limit* runs of *task*, newest first."""
+
+        return load_run_history(self.path, task, since=since, limit=limit)
+
+
+def load_run_history(
+    path: Optional[str],
+    task: str,
+    *,
+    since: Optional[datetime] = None,
+    limit: int = DEFAULT_HISTORY_LIMIT,
+) -> List[Dict[str, object]]:
+    """Return the recorded runs of *task*; an absent database yields no runs.
+
+    The database is opened read-only, so a reader never creates or migrates
+    the schema and never takes the write lock the monitor needs.
+    """
+
+    if not path or not os.path.exists(path):
+        return []
+    try:
+        connection = sqlite3.connect(
+            f"{Path(os.path.abspath(path)).as_uri()}?mode=ro", uri=True, timeout=10.0
+        )
+        try:
+            tables = connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'runs'"
+            ).fetchone()
+            if tables is None:
+                return []
+            return _query_runs(connection, task, since, limit)
+        finally:
+            connection.close()
+    except sqlite3.Error as exc:
+        logger.warning("Failed to read run history %s: %s", path, exc)
+        return []
+
+
+_active_history: Optional[RunHistory] = None
+
+
+def install_run_history(history: Optional[RunHistory]) -> Optional[RunHistory]:
+    """Record every monitor run in *history*; return the previous store."""
+
+    global _active_history
+    previous = _active_history
+    _active_history = history
+    return previous
+
+
+def get_run_history() -> Optional[RunHistory]:
+    return _active_history
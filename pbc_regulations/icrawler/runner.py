@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import logging
 import os
 from typing import Any, Dict, List, Optional, Sequence
 
-from .state import load_state
-from .summary import log_task_summary
+from .scheduler import MonitorScheduler, default_schedule_path
+from .async_fetch import AsyncFetchEngine, install_fetch_engine
+from .blob_store import BLOB_DIRNAME, BlobStore, install_blob_store
+from .run_history import RunHistory, default_history_path, install_run_history
+from .throttle import HostThrottle, install_host_throttle
 from .task_models import CacheBehavior, HttpOptions, TaskLayout, TaskSpec, TaskStats
 from . import pbc_monitor as core
 
@@ -501,6 +505,8 @@ def _handle_download_action(
     state_file: Optional[str],
     http_options: HttpOptions,
     verify_local: bool,
+    state_flush_interval: Optional[float] = None,
+    max_concurrency: int = 1,
 ) -> bool:
     if not download_target:
         return False
@@ -525,6 +531,8 @@ def _handle_download_action(
         http_options.timeout,
         verify_local,
         task_name=task.name,
+        state_flush_interval=state_flush_interval,
+        max_concurrency=max_concurrency,
     )
     logger.info("Attachment download finished")
     return True
@@ -548,6 +556,7 @@ def _run_task(
     args: argparse.Namespace,
     config: Dict[str, Any],
     artifact_dir: str,
+    scheduler: Optional[MonitorScheduler] = None,
 ) -> None:
     parser_module = core._load_parser_module(task.parser_spec)
     core._set_parser_module(parser_module)
@@ -594,6 +603,46 @@ def _run_task(
     max_hours = http_options.max_hours
 
     verify_local = task.verify_local
+    flush_value = core._select_task_value(
+        getattr(args, "state_flush_interval", None),
+        task.raw_config,
+        config,
+        "state_flush_interval",
+        core.DEFAULT_STATE_FLUSH_INTERVAL,
+    )
+    state_flush_interval = float(flush_value)
+    concurrency_value = core._select_task_value(
+        getattr(args, "max_concurrency", None),
+        task.raw_config,
+        config,
+        "max_concurrency",
+        1,
+    )
+    max_concurrency = max(1, int(concurrency_value))
+    incremental_pages = max(
+        0,
+        int(
+            core._select_task_value(
+                getattr(args, "incremental_pages", None),
+                task.raw_config,
+                config,
+                "incremental_pages",
+                0,
+            )
+        ),
+    )
+    full_sweep_every = max(
+        0,
+        int(
+            core._select_task_value(
+                getattr(args, "full_sweep_every", None),
+                task.raw_config,
+                config,
+                "full_sweep_every",
+                core.DEFAULT_FULL_SWEEP_EVERY,
+            )
+        ),
+    )
 
     logger.info(
         "HTTP options for task '%s': delay=%.2fs, jitter=%.2fs, timeout=%.2fs",
@@ -609,6 +658,14 @@ def _run_task(
             max_hours,
         )
     logger.info("Verify local files: %s", "enabled" if verify_local else "disabled")
+    if max_concurrency > 1:
+        logger.info("Concurrent attachment downloads: %d", max_concurrency)
+    if incremental_pages > 0:
+        logger.info(
+            "Incremental crawl: stop after %d known page(s), full sweep every %d iteration(s)",
+            incremental_pages,
+            full_sweep_every,
+        )
 
     refresh_pages = cache_behavior.refresh_pages
     use_cached_pages_flag = cache_behavior.use_cached_pages
@@ -676,6 +733,8 @@ def _run_task(
         state_file,
         http_options,
         verify_local,
+        state_flush_interval,
+        max_concurrency,
     ):
         return
 
@@ -710,18 +769,52 @@ def _run_task(
             stats=stats,
             use_cache=monitor_use_cache,
             refresh_cache=monitor_refresh_cache,
+            state_flush_interval=state_flush_interval,
+            max_concurrency=max_concurrency,
+            incremental_pages=incremental_pages,
         )
-        summary_state = load_state(state_file, core.classify_document_type)
-        log_task_summary(
-            task.name,
-            stats,
-            new_files,
-            summary_state,
-            context="run-once",
-        )
+        core.record_task_run(task.name, stats, new_files, context="run-once")
     else:
         if not start_url:
             raise SystemExit("start_url must be provided to run monitor")
+        loop_options = dict(
+            task_name=task.name,
+            use_cache_default=use_cached_pages_flag,
+            refresh_cache_default=refresh_pages,
+            force_use_cache=bool(getattr(args, "use_cached_pages", False)),
+            force_no_use_cache=bool(getattr(args, "no_use_cached_pages", False)),
+            state_flush_interval=state_flush_interval,
+            max_concurrency=max_concurrency,
+            incremental_pages=incremental_pages,
+            full_sweep_every=full_sweep_every,
+        )
+        if scheduler is not None:
+            logger.info(
+                "Scheduling task '%s' with sleep window %.2f-%.2f hours",
+                task.name,
+                min_hours,
+                max_hours,
+            )
+            iteration_fn = functools.partial(
+                core.run_monitor_iteration,
+                str(start_url),
+                str(output_dir),
+                state_file,
+                delay,
+                jitter,
+                timeout,
+                pages_dir,
+                verify_local,
+                **loop_options,
+            )
+            scheduler.add_task(
+                task.name,
+                lambda iteration: iteration_fn(iteration=iteration),
+                min_hours,
+                max_hours,
+                parser_module=parser_module,
+            )
+            return
         logger.info(
             "Entering monitoring loop for task '%s' with sleep window %.2f-%.2f hours",
             task.name,
@@ -739,11 +832,7 @@ def _run_task(
             max_hours,
             pages_dir,
             verify_local,
-            task_name=task.name,
-            use_cache_default=use_cached_pages_flag,
-            refresh_cache_default=refresh_pages,
-            force_use_cache=bool(getattr(args, "use_cached_pages", False)),
-            force_no_use_cache=bool(getattr(args, "no_use_cached_pages", False)),
+            **loop_options,
         )
 
 
@@ -796,6 +885,55 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
         default=None,
         help="maximum hours between checks when running continuously",
     )
+    parser.add_argument(
+        "--host-min-interval",
+        type=float,
+        default=None,
+        help="minimum seconds between requests to the same host across tasks",
+    )
+    parser.add_argument(
+        "--incremental-pages",
+        type=int,
+        default=None,
+        help="stop a crawl after this many consecutive listing pages with no new entries (0 walks every page)",
+    )
+    parser.add_argument(
+        "--full-sweep-every",
+        type=int,
+        default=None,
+        help="in incremental mode, walk the full listing every N loop iterations (default: 24)",
+    )
+    parser.add_argument(
+        "--no-blob-store",
+        dest="blob_store",
+        action="store_false",
+        default=None,
+        help="write each download separately instead of deduplicating by content hash",
+    )
+    parser.add_argument(
+        "--async-fetch",
+        action="store_true",
+        default=None,
+        help="serve all HTTP requests from one shared asyncio engine",
+    )
+    parser.add_argument(
+        "--max-connections",
+        type=int,
+        default=None,
+        help="sockets shared by all tasks when --async-fetch is enabled (default: 4)",
+    )
+    parser.add_argument(
+        "--state-flush-interval",
+        type=float,
+        default=None,
+        help="seconds between background state writes during a crawl (0 writes immediately)",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="number of attachments downloaded in parallel per task (default: 1)",
+    )
     parser.add_argument(
         "--build-page-structure",
         nargs="?",
@@ -907,5 +1045,47 @@ def main(argv: Optional[Sequence[str]] = None) -> None:
 
     logger.info("Executing %d task(s)", len(tasks))
 
-    for task in tasks:
-        _run_task(task, args, config, artifact_dir)
+    scheduler = None
+    if not args.run_once:
+        scheduler = MonitorScheduler(default_schedule_path(artifact_dir))
+
+    engine = None
+    if core._coerce_bool(_resolve_setting(getattr(args, "async_fetch", None), config, "async_fetch", False)):
+        max_connections = int(_resolve_setting(getattr(args, "max_connections", None), config, "max_connections", 4))
+        engine = AsyncFetchEngine(max_connections)
+        logger.info(
+            "Using shared async fetch engine (%s backend, %d connection(s))",
+            engine.backend,
+            engine.max_connections,
+        )
+    blob_store = None
+    if core._coerce_bool(_resolve_setting(getattr(args, "blob_store", None), config, "blob_store", True)):
+        blob_store = BlobStore(os.path.join(artifact_dir, BLOB_DIRNAME))
+        logger.info("Storing downloads by content hash in %s", blob_store.root)
+    previous_store = install_blob_store(blob_store)
+    previous_engine = install_fetch_engine(engine)
+    previous_history = install_run_history(RunHistory(default_history_path(artifact_dir)))
+    try:
+        for task in tasks:
+            _run_task(task, args, config, artifact_dir, scheduler)
+
+        if scheduler is None or not scheduler.tasks:
+            return
+
+        host_interval = float(_resolve_setting(args.host_min_interval, config, "host_min_interval", 1.0))
+        logger.info(
+            "Running %d task(s) concurrently; host request interval %.2fs",
+            len(scheduler.tasks),
+            host_interval,
+        )
+        previous_throttle = install_host_throttle(HostThrottle(host_interval))
+        try:
+            scheduler.run_forever()
+        finally:
+            install_host_throttle(previous_throttle)
+    finally:
+        install_blob_store(previous_store)
+        install_fetch_engine(previous_engine)
+        install_run_history(previous_history)
+        if engine is not None:
+            engine.close()
@@ -0,0 +1,260 @@
+"""Run several monitor tasks concurrently and publish their next-run times."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from types import ModuleType
+from typing import Callable, Dict, List, Optional
+
+from . import pbc_monitor as core
+
+
+logger = logging.getLogger(__name__)
+
+SCHEDULE_FILENAME = "schedule.json"
+_SCHEDULE_TIME_FIELDS = (
+    "last_started",
+    "last_finished",
+    "next_run_at",
+    "next_run_earliest",
+    "next_run_latest",
+)
+
+
+def default_schedule_path(artifact_dir: str) -> str:
+    return os.path.join(artifact_dir, SCHEDULE_FILENAME)
+
+
+def _parse_datetime(value: object) -> Optional[datetime]:
+    if not isinstance(value, str) or not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def load_schedule(path: Optional[str]) -> Dict[str, Dict[str, object]]:
+    """Return the per-task schedule written by :class:`MonitorScheduler`.
+
+    Timestamp fields are converted back to :class:`datetime` objects. A missing
+    or unreadable file yields an empty mapping so callers can fall back to
+    their own estimates.
+    """
+
+    if not path or not os.path.exists(path):
+        return {}
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            data = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    tasks = data.get("tasks") if isinstance(data, dict) else None
+    if not isinstance(tasks, dict):
+        return {}
+    schedule: Dict[str, Dict[str, object]] = {}
+    for name, record in tasks.items():
+        if not isinstance(record, dict):
+            continue
+        parsed = dict(record)
+        for key in _SCHEDULE_TIME_FIELDS:
+            parsed[key] = _parse_datetime(record.get(key))
+        schedule[str(name)] = parsed
+    return schedule
+
+
+@dataclass
+class ScheduledTask:
+    name: str
+    run: Callable[[int], object]
+    min_hours: float
+    max_hours: float
+    parser_module: Optional[ModuleType] = None
+    iteration: int = 0
+    status: str = "pending"
+    last_started: Optional[datetime] = None
+    last_finished: Optional[datetime] = None
+    next_run_at: Optional[datetime] = None
+    next_run_earliest: Optional[datetime] = None
+    next_run_latest: Optional[datetime] = None
+    last_error: Optional[str] = None
+    thread: Optional[threading.Thread] = field(default=None, repr=False)
+
+    def to_jsonable(self) -> Dict[str, object]:
+        def _dt(value: Optional[datetime]) -> Optional[str]:
+            if value is None:
+                return None
+            return value.isoformat(timespec="seconds")
+
+        return {
+            "iteration": self.iteration,
+            "status": self.status,
+            "min_hours": self.min_hours,
+            "max_hours": self.max_hours,
+            "last_started": _dt(self.last_started),
+            "last_finished": _dt(self.last_finished),
+            "next_run_at": _dt(self.next_run_at),
+            "next_run_earliest": _dt(self.next_run_earliest),
+            "next_run_latest": _dt(self.next_run_latest),
+            "last_error": self.last_error,
+        }
+
+
+class MonitorScheduler:
+    """Drive each registered task on its own thread.
+
+    Every task keeps its own ``min_hours``/``max_hours`` sleep window; requests
+    to a shared host are paced by :mod:`.throttle`. After each iteration the
+    scheduler records when the task will wake up again and, when
+    *schedule_file* is set, writes that information to disk for the dashboard.
+    """
+
+    def __init__(
+        self,
+        schedule_file: Optional[str] = None,
+        *,
+        now: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self.schedule_file = schedule_file
+        self._now = now
+        self._tasks: List[ScheduledTask] = []
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+    @property
+    def tasks(self) -> List[ScheduledTask]:
+        return list(self._tasks)
+
+    def add_task(
+        self,
+        name: str,
+        run: Callable[[int], object],
+        min_hours: float,
+        max_hours: float,
+        *,
+        parser_module: Optional[ModuleType] = None,
+    ) -> ScheduledTask:
+        if max_hours < min_hours:
+            raise ValueError("max_hours must be greater than or equal to min_hours")
+        job = ScheduledTask(
+            name=name,
+            run=run,
+            min_hours=min_hours,
+            max_hours=max_hours,
+            parser_module=parser_module,
+        )
+        self._tasks.append(job)
+        return job
+
+    def snapshot(self) -> Dict[str, Dict[str, object]]:
+        with self._lock:
+            return {job.name: job.to_jsonable() for job in self._tasks}
+
+    def _write_schedule(self) -> None:
+        if not self.schedule_file:
+            return
+        with self._lock:
+            payload = {
+                "updated_at": self._now().isoformat(timespec="seconds"),
+                "tasks": {job.name: job.to_jsonable() for job in self._tasks},
+            }
+            directory = os.path.dirname(self.schedule_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.schedule_file}.tmp"
+            try:
+                with open(tmp_path, "w", encoding="utf-8") as handle:
+                    json.dump(payload, handle, ensure_ascii=False, indent=2)
+                os.replace(tmp_path, self.schedule_file)
+            except OSError as exc:
+                logger.warning("Failed to write schedule file %s: %s", self.schedule_file, exc)
+
+    def run_iteration(self, job: ScheduledTask) -> float:
+        """Run one iteration of *job* and return the seconds until the next one."""
+
+        with self._lock:
+            job.iteration += 1
+            job.status = "running"
+            job.last_started = self._now()
+        self._write_schedule()
+
+        error: Optional[str] = None
+        try:
+            job.run(job.iteration)
+        except Exception as exc:
+            logger.exception("Task '%s' iteration %d failed", job.name, job.iteration)
+            error = str(exc) or exc.__class__.__name__
+
+        sleep_seconds = core._compute_sleep_seconds(job.min_hours, job.max_hours)
+        finished = self._now()
+        with self._lock:
+            job.status = "error" if error else "sleeping"
+            job.last_error = error
+            job.last_finished = finished
+            job.next_run_at = finished + timedelta(seconds=sleep_seconds)
+            job.next_run_earliest = finished + timedelta(hours=job.min_hours)
+            job.next_run_latest = finished + timedelta(hours=job.max_hours)
+        self._write_schedule()
+        logger.info(
+            "Task '%s' sleeping for %d seconds before next check",
+            job.name,
+            int(sleep_seconds),
+        )
+        return sleep_seconds
+
+    def _worker(self, job: ScheduledTask) -> None:
+        core._set_thread_parser_module(job.parser_module)
+        while not self._stop.is_set():
+            sleep_seconds = self.run_iteration(job)
+            if self._stop.wait(sleep_seconds):
+                break
+        with self._lock:
+            job.status = "stopped"
+        self._write_schedule()
+
+    def start(self) -> None:
+        self._stop.clear()
+        for job in self._tasks:
+            if job.thread is not None and job.thread.is_alive():
+                continue
+            thread = threading.Thread(
+                target=self._worker,
+                args=(job,),
+                name=f"monitor-{job.name}",
+                daemon=True,
+            )
+            job.thread = thread
+            thread.start()
+        logger.info("Scheduler started %d task(s)", len(self._tasks))
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        for job in self._tasks:
+            if job.thread is not None:
+                job.thread.join(timeout)
+
+    def run_forever(self) -> None:
+        self.start()
+        try:
+            while any(job.thread is not None and job.thread.is_alive() for job in self._tasks):
+                self.join(timeout=1.0)
+        except KeyboardInterrupt:
+            logger.info("Stopping scheduler")
+            self.stop()
+            self.join()
+
+
+__all__ = [
+    "MonitorScheduler",
+    "ScheduledTask",
+    "SCHEDULE_FILENAME",
+    "default_schedule_path",
+    "load_schedule",
+]
@@ -1,18 +1,141 @@
 from __future__ import annotations
 
 import json
+import logging
 import os
-from typing import Callable, Dict, List, Optional
+import stat
+import tempfile
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from .crawler import safe_filename
 
 ClassifierFn = Callable[[str], str]
 
+logger = logging.getLogger(__name__)
+
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_COMPACT_THRESHOLD = 500
+
 
 class PBCState:
     def __init__(self) -> None:
         self.entries: Dict[str, Dict[str, object]] = {}
         self.files: Dict[str, Dict[str, object]] = {}
+        # Secondary indexes kept in sync by the mutating methods below so that
+        # ingesting a listing does not rescan every stored entry per document.
+        self._url_entries: Dict[str, Dict[str, None]] = {}
+        self._entry_docs: Dict[str, Tuple[List[object], int, Dict[str, Dict[str, object]]]] = {}
+        self._serial_owners: Dict[int, str] = {}
+        self._max_serial = 0
+        self._max_serial_stale = False
+        # Journal bookkeeping: entries changed since the last persist, the
+        # snapshot the journal extends, and how many lines it already holds.
+        self._dirty_entries: Set[str] = set()
+        self._journal_base: Optional[str] = None
+        self._journal_lines = 0
+
+    def mark_entry_dirty(self, entry_id: str) -> None:
+        """Record that *entry_id* changed outside the mutating methods."""
+
+        self._dirty_entries.add(entry_id)
+
+    def _reset_journal(self, base: Optional[str] = None, lines: int = 0) -> None:
+        self._dirty_entries.clear()
+        self._journal_base = base
+        self._journal_lines = lines
+
+    def rebuild_indexes(self) -> None:
+        """Recompute lookup indexes after ``entries`` was modified directly."""
+
+        self._url_entries = {}
+        self._entry_docs = {}
+        self._serial_owners = {}
+        self._max_serial = 0
+        self._max_serial_stale = False
+        self._journal_base = None
+        for entry_id, entry in self.entries.items():
+            if not isinstance(entry, dict):
+                continue
+            serial = entry.get("serial")
+            if isinstance(serial, int):
+                self._serial_owners.setdefault(serial, entry_id)
+                self._max_serial = max(self._max_serial, serial)
+            self._documents_by_url(entry_id, entry)
+
+    def _documents_by_url(
+        self, entry_id: str, entry: Dict[str, object]
+    ) -> Dict[str, Dict[str, object]]:
+        documents = entry.get("documents")
+        if not isinstance(documents, list):
+            documents = []
+            entry["documents"] = documents
+        cached = self._entry_docs.get(entry_id)
+        if cached is not None and cached[0] is documents and cached[1] == len(documents):
+            return cached[2]
+        by_url: Dict[str, Dict[str, object]] = {}
+        for document in documents:
+            if not isinstance(document, dict):
+                continue
+            url_value = document.get("url")
+            if isinstance(url_value, str):
+                by_url.setdefault(url_value, document)
+                self._url_entries.setdefault(url_value, {})[entry_id] = None
+        self._entry_docs[entry_id] = (documents, len(documents), by_url)
+        return by_url
+
+    def _append_document(
+        self, entry_id: str, entry: Dict[str, object], document: Dict[str, object]
+    ) -> None:
+        by_url = self._documents_by_url(entry_id, entry)
+        documents = entry["documents"]
+        documents.append(document)  # type: ignore[union-attr]
+        url_value = document["url"]
+        by_url.setdefault(url_value, document)  # type: ignore[arg-type]
+        self._url_entries.setdefault(url_value, {})[entry_id] = None  # type: ignore[index]
+        self._entry_docs[entry_id] = (documents, len(documents), by_url)  # type: ignore[assignment]
+
+    def _documents_for_url(self, url_value: str) -> List[Dict[str, object]]:
+        """Return documents for *url_value*, marking their entries dirty."""
+
+        matches: List[Dict[str, object]] = []
+        for entry_id in list(self._url_entries.get(url_value, ())):
+            entry = self.entries.get(entry_id)
+            if not isinstance(entry, dict):
+                continue
+            document = self._documents_by_url(entry_id, entry).get(url_value)
+            if document is not None:
+                matches.append(document)
+                self._dirty_entries.add(entry_id)
+        return matches
+
+    def _serial_in_use(self, value: int, exclude: Optional[str] = None) -> bool:
+        owner = self._serial_owners.get(value)
+        if owner is None or owner == exclude:
+            return False
+        entry = self.entries.get(owner)
+        if isinstance(entry, dict) and entry.get("serial") == value:
+            return True
+        self._serial_owners.pop(value, None)
+        return False
+
+    def set_serial(self, entry_id: str, serial: int) -> None:
+        entry = self.entries.get(entry_id)
+        if not isinstance(entry, dict):
+            return
+        previous = entry.get("serial")
+        if isinstance(previous, int) and previous != serial:
+            # Journal lines are keyed by serial, so renumbering needs a snapshot.
+            self._journal_base = None
+        self._dirty_entries.add(entry_id)
+        if isinstance(previous, int) and self._serial_owners.get(previous) == entry_id:
+            del self._serial_owners[previous]
+            if previous >= self._max_serial and serial < previous:
+                self._max_serial_stale = True
+        entry["serial"] = serial
+        self._serial_owners.setdefault(serial, entry_id)
+        if serial > self._max_serial:
+            self._max_serial = serial
 
     def _entry_id(self, entry: Dict[str, object]) -> str:
         documents = entry.get("documents") or []
@@ -44,17 +167,23 @@ class PBCState:
         return safe_filename(serialized)
 
     def _next_serial(self) -> int:
-        highest = 0
-        for candidate in self.entries.values():
-            if not isinstance(candidate, dict):
-                continue
-            value = candidate.get("serial")
-            if isinstance(value, int) and value > highest:
-                highest = value
-        return highest + 1
+        if self._max_serial_stale:
+            self._max_serial = max(
+                (
+                    value
+                    for value in (
+                        candidate.get("serial")
+                        for candidate in self.entries.values()
+                        if isinstance(candidate, dict)
+                    )
+                    if isinstance(value, int)
+                ),
+                default=0,
+            )
+            self._max_serial_stale = False
+        return self._max_serial + 1
 
-    def ensure_entry(self, entry: Dict[str, object]) -> str:
-        entry_id: Optional[str] = None
+    def _find_entry_id(self, entry: Dict[str, object]) -> Optional[str]:
         documents = entry.get("documents")
         if isinstance(documents, list):
             for document in documents:
@@ -67,23 +196,31 @@ class PBCState:
                 if isinstance(file_record, dict):
                     existing_id = file_record.get("entry_id")
                     if isinstance(existing_id, str) and existing_id in self.entries:
-                        entry_id = existing_id
-                        break
-                for existing_id, existing_entry in self.entries.items():
-                    documents_list = existing_entry.get("documents", [])
-                    if not isinstance(documents_list, list):
-                        continue
-                    for existing_doc in documents_list:
-                        if (
-                            isinstance(existing_doc, dict)
-                            and existing_doc.get("url") == url_value
-                        ):
-                            entry_id = existing_id
-                            break
-                    if entry_id is not None:
-                        break
-                if entry_id is not None:
-                    break
+                        return existing_id
+                for existing_id in self._url_entries.get(url_value, ()):
+                    if existing_id in self.entries:
+                        return existing_id
+        return None
+
+    def is_known_entry(self, entry: Dict[str, object]) -> bool:
+        """Return True if *entry* and all of its document URLs are already recorded."""
+
+        entry_id = self._find_entry_id(entry) or self._entry_id(entry)
+        existing = self.entries.get(entry_id)
+        if not isinstance(existing, dict):
+            return False
+        known_urls = self._documents_by_url(entry_id, existing)
+        documents = entry.get("documents")
+        for document in documents if isinstance(documents, list) else []:
+            if not isinstance(document, dict):
+                continue
+            url_value = document.get("url")
+            if isinstance(url_value, str) and url_value and url_value not in known_urls:
+                return False
+        return True
+
+    def ensure_entry(self, entry: Dict[str, object]) -> str:
+        entry_id = self._find_entry_id(entry)
         if entry_id is None:
             entry_id = self._entry_id(entry)
         existing = self.entries.get(entry_id)
@@ -91,54 +228,43 @@ class PBCState:
         title = entry.get("title")
         remark = entry.get("remark")
 
-        def serial_in_use(value: int, exclude: Optional[Dict[str, object]] = None) -> bool:
-            for candidate in self.entries.values():
-                if not isinstance(candidate, dict):
-                    continue
-                if exclude is not None and candidate is exclude:
-                    continue
-                if candidate.get("serial") == value:
-                    return True
-            return False
-
         if isinstance(existing, dict):
-            if isinstance(title, str):
+            if isinstance(title, str) and existing.get("title") != title:
                 existing["title"] = title
-            if isinstance(remark, str):
+                self._dirty_entries.add(entry_id)
+            if isinstance(remark, str) and existing.get("remark") != remark:
                 existing["remark"] = remark
+                self._dirty_entries.add(entry_id)
             if isinstance(serial, int):
                 current_serial = existing.get("serial")
                 if not isinstance(current_serial, int):
                     candidate = serial if serial > 0 else None
-                    if isinstance(candidate, int) and serial_in_use(candidate, exclude=existing):
+                    if isinstance(candidate, int) and self._serial_in_use(candidate, exclude=entry_id):
                         candidate = None
                     if not isinstance(candidate, int):
                         candidate = self._next_serial()
-                    existing["serial"] = candidate
+                    self.set_serial(entry_id, candidate)
             return entry_id
 
         assigned_serial: Optional[int] = None
-        if isinstance(serial, int) and serial > 0 and not serial_in_use(serial):
+        if isinstance(serial, int) and serial > 0 and not self._serial_in_use(serial):
             assigned_serial = serial
         if not isinstance(assigned_serial, int):
             assigned_serial = self._next_serial()
 
         self.entries[entry_id] = {
-            "serial": assigned_serial,
+            "serial": None,
             "title": title if isinstance(title, str) else "",
             "remark": remark if isinstance(remark, str) else "",
             "documents": [],
         }
+        self.set_serial(entry_id, assigned_serial)
         return entry_id
 
     def merge_documents(self, entry_id: str, documents: List[Dict[str, object]]) -> None:
         entry = self.entries.setdefault(entry_id, {"documents": []})
-        existing_docs: Dict[str, Dict[str, object]] = {}
-        for item in entry.get("documents", []):
-            if isinstance(item, dict):
-                url_value = item.get("url")
-                if isinstance(url_value, str):
-                    existing_docs[url_value] = item
+        existing_docs = self._documents_by_url(entry_id, entry)
+        changed = False
         for document in documents:
             if not isinstance(document, dict):
                 continue
@@ -149,27 +275,36 @@ class PBCState:
             title = document.get("title")
             downloaded = document.get("downloaded")
             local_path = document.get("local_path")
+            sha256 = document.get("sha256")
             existing = existing_docs.get(url_value)
             if existing is None:
-                entry.setdefault("documents", []).append(
-                    {
-                        "url": url_value,
-                        "type": doc_type,
-                        "title": title if isinstance(title, str) else "",
-                        "downloaded": bool(downloaded),
-                        "local_path": local_path if isinstance(local_path, str) else None,
-                    }
-                )
-                existing_docs[url_value] = entry["documents"][-1]
+                new_doc: Dict[str, object] = {
+                    "url": url_value,
+                    "type": doc_type,
+                    "title": title if isinstance(title, str) else "",
+                    "downloaded": bool(downloaded),
+                    "local_path": local_path if isinstance(local_path, str) else None,
+                }
+                if isinstance(sha256, str) and sha256:
+                    new_doc["sha256"] = sha256
+                self._append_document(entry_id, entry, new_doc)
+                changed = True
             else:
+                updates: Dict[str, object] = {}
                 if isinstance(doc_type, str):
-                    existing["type"] = doc_type
+                    updates["type"] = doc_type
                 if isinstance(title, str) and title:
-                    existing["title"] = title
+                    updates["title"] = title
                 if downloaded:
-                    existing["downloaded"] = True
+                    updates["downloaded"] = True
                 if isinstance(local_path, str) and local_path:
-                    existing["local_path"] = local_path
+                    updates["local_path"] = local_path
+                if isinstance(sha256, str) and sha256:
+                    updates["sha256"] = sha256
+                for key, value in updates.items():
+                    if existing.get(key) != value:
+                        existing[key] = value
+                        changed = True
             self.files.setdefault(url_value, {})
             file_record = self.files[url_value]
             if isinstance(file_record, dict):
@@ -182,6 +317,10 @@ class PBCState:
                     file_record["downloaded"] = True
                 if isinstance(local_path, str) and local_path:
                     file_record["local_path"] = local_path
+                if isinstance(sha256, str) and sha256:
+                    file_record["sha256"] = sha256
+        if changed:
+            self._dirty_entries.add(entry_id)
 
     def mark_downloaded(
         self,
@@ -190,6 +329,7 @@ class PBCState:
         title: str,
         doc_type: Optional[str],
         local_path: Optional[str],
+        sha256: Optional[str] = None,
     ) -> None:
         file_record = self.files.setdefault(url_value, {})
         file_record.update(
@@ -201,21 +341,26 @@ class PBCState:
                 "local_path": local_path,
             }
         )
+        if sha256:
+            file_record["sha256"] = sha256
+        else:
+            file_record.pop("sha256", None)
         entry = self.entries.setdefault(entry_id, {"documents": []})
-        if not isinstance(entry.get("documents"), list):
-            entry["documents"] = []
-        documents = entry["documents"]
-        for doc in documents:
-            if isinstance(doc, dict) and doc.get("url") == url_value:
-                doc.update(
-                    {
-                        "title": title,
-                        "type": doc_type,
-                        "downloaded": True,
-                        "local_path": local_path,
-                    }
-                )
-                break
+        self._dirty_entries.add(entry_id)
+        doc = self._documents_by_url(entry_id, entry).get(url_value)
+        if doc is not None:
+            doc.update(
+                {
+                    "title": title,
+                    "type": doc_type,
+                    "downloaded": True,
+                    "local_path": local_path,
+                }
+            )
+            if sha256:
+                doc["sha256"] = sha256
+            else:
+                doc.pop("sha256", None)
         else:
             new_doc = {
                 "url": url_value,
@@ -225,24 +370,21 @@ class PBCState:
             }
             if local_path:
                 new_doc["local_path"] = local_path
-            entry.setdefault("documents", []).append(new_doc)
+            if sha256:
+                new_doc["sha256"] = sha256
+            self._append_document(entry_id, entry, new_doc)
 
     def clear_downloaded(self, url_value: str) -> None:
         file_record = self.files.get(url_value)
         if file_record:
             file_record["downloaded"] = False
             file_record.pop("local_path", None)
-        for entry in self.entries.values():
-            documents = entry.get("documents", [])
-            if not isinstance(documents, list):
-                continue
-            for document in documents:
-                if not isinstance(document, dict):
-                    continue
-                if document.get("url") == url_value:
-                    document.pop("local_path", None)
-                    if "downloaded" in document:
-                        document.pop("downloaded", None)
+            file_record.pop("sha256", None)
+        for document in self._documents_for_url(url_value):
+            document.pop("local_path", None)
+            document.pop("sha256", None)
+            if "downloaded" in document:
+                document.pop("downloaded", None)
 
     def update_document_title(self, url_value: str, title: str) -> None:
         if not title:
@@ -250,43 +392,41 @@ class PBCState:
         file_record = self.files.get(url_value)
         if file_record:
             file_record["title"] = title
-        for entry in self.entries.values():
-            for document in entry.get("documents", []):
-                if isinstance(document, dict) and document.get("url") == url_value:
-                    document["title"] = title
+        for document in self._documents_for_url(url_value):
+            document["title"] = title
 
-    def to_jsonable(self) -> Dict[str, object]:
-        entries_list: List[Dict[str, object]] = []
-        for entry in self.entries.values():
-            documents: List[Dict[str, object]] = []
-            for document in entry.get("documents", []):
-                if not isinstance(document, dict):
-                    continue
-                doc_output: Dict[str, object] = {
-                    "type": document.get("type"),
-                    "url": document.get("url"),
-                    "title": document.get("title", ""),
-                }
-                if document.get("downloaded"):
-                    doc_output["downloaded"] = True
-                local_path = document.get("local_path")
-                if isinstance(local_path, str) and local_path:
-                    doc_output["local_path"] = local_path
-                documents.append(doc_output)
-            entry_output: Dict[str, object] = {
-                "serial": entry.get("serial"),
-                "title": entry.get("title", ""),
-                "remark": entry.get("remark", ""),
-                "documents": documents,
+    @staticmethod
+    def _entry_to_jsonable(entry: Dict[str, object]) -> Dict[str, object]:
+        documents: List[Dict[str, object]] = []
+        for document in entry.get("documents", []):
+            if not isinstance(document, dict):
+                continue
+            doc_output: Dict[str, object] = {
+                "type": document.get("type"),
+                "url": document.get("url"),
+                "title": document.get("title", ""),
             }
-            entries_list.append(entry_output)
-        entries_list.sort(
-            key=lambda item: (
-                item.get("serial") is None,
-                item.get("serial") if isinstance(item.get("serial"), int) else 0,
-                item.get("title", ""),
-            )
-        )
+            if document.get("downloaded"):
+                doc_output["downloaded"] = True
+            local_path = document.get("local_path")
+            if isinstance(local_path, str) and local_path:
+                doc_output["local_path"] = local_path
+            sha256 = document.get("sha256")
+            if isinstance(sha256, str) and sha256:
+                doc_output["sha256"] = sha256
+            documents.append(doc_output)
+        return {
+            "serial": entry.get("serial"),
+            "title": entry.get("title", ""),
+            "remark": entry.get("remark", ""),
+            "documents": documents,
+        }
+
+    def to_jsonable(self) -> Dict[str, object]:
+        entries_list: List[Dict[str, object]] = [
+            self._entry_to_jsonable(entry) for entry in self.entries.values()
+        ]
+        _sort_entries(entries_list)
         return {"entries": entries_list}
 
     @classmethod
@@ -321,6 +461,7 @@ class PBCState:
                                 "title": document.get("title", ""),
                                 "downloaded": bool(document.get("downloaded")),
                                 "local_path": document.get("local_path"),
+                                "sha256": document.get("sha256"),
                             }
                         )
                     state.merge_documents(entry_id, documents)
@@ -365,17 +506,254 @@ class PBCState:
         return bool(record.get("downloaded"))
 
 
+def _sort_entries(entries_list: List[Dict[str, object]]) -> None:
+    entries_list.sort(
+        key=lambda item: (
+            item.get("serial") is None,
+            item.get("serial") if isinstance(item.get("serial"), int) else 0,
+            item.get("title", ""),
+        )
+    )
+
+
+def journal_path(state_file: str) -> str:
+    return f"{state_file}{JOURNAL_SUFFIX}"
+
+
+def _snapshot_signature(state_file: str) -> Optional[str]:
+    try:
+        info = os.stat(state_file)
+    except OSError:
+        return None
+    return f"{info.st_size}:{info.st_mtime_ns}"
+
+
+def _read_journal(state_file: str) -> Tuple[List[Dict[str, object]], int, bool]:
+    """Return ``(entry images, line count, clean)`` for *state_file*'s journal.
+
+    Lines are only trusted when the header matches the snapshot they extend;
+    replay stops at the first torn line, in which case ``clean`` is ``False``
+    and the caller must write a fresh snapshot before appending again.
+    """
+
+    path = journal_path(state_file)
+    if not os.path.exists(path):
+        return [], 0, True
+    images: List[Dict[str, object]] = []
+    lines = 0
+    with open(path, "r", encoding="utf-8") as fh:
+        header_line = fh.readline()
+        try:
+            header = json.loads(header_line)
+        except ValueError:
+            header = None
+        base = header.get("base") if isinstance(header, dict) else None
+        if base != _snapshot_signature(state_file):
+            logger.warning("Ignoring state journal %s: it does not match the snapshot", path)
+            return [], 0, False
+        for line in fh:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning("Ignoring torn tail of state journal %s", path)
+                return images, lines, False
+            lines += 1
+            entries = record.get("entries") if isinstance(record, dict) else None
+            if isinstance(entries, list):
+                images.extend(item for item in entries if isinstance(item, dict))
+    return images, lines, True
+
+
+def _apply_journal(data: object, images: List[Dict[str, object]]) -> object:
+    if not images:
+        return data
+    if not isinstance(data, dict) or not isinstance(data.get("entries"), list):
+        data = {"entries": []}
+    entries_list: List[Dict[str, object]] = list(data["entries"])  # type: ignore[index]
+    positions: Dict[int, int] = {}
+    for index, entry in enumerate(entries_list):
+        if isinstance(entry, dict) and isinstance(entry.get("serial"), int):
+            positions.setdefault(entry["serial"], index)  # type: ignore[arg-type]
+    for image in images:
+        serial = image.get("serial")
+        if not isinstance(serial, int):
+            continue
+        if serial in positions:
+            entries_list[positions[serial]] = image
+        else:
+            positions[serial] = len(entries_list)
+            entries_list.append(image)
+    _sort_entries(entries_list)
+    return {**data, "entries": entries_list}
+
+
+def read_state_data(state_file: Optional[str]) -> object:
+    """Return the JSON state with any journaled updates applied."""
+
+    if not state_file or not os.path.exists(state_file):
+        return {"entries": []}
+    with open(state_file, "r", encoding="utf-8") as fh:
+        data = json.load(fh)
+    images, _, _ = _read_journal(state_file)
+    return _apply_journal(data, images)
+
+
 def load_state(state_file: Optional[str], classifier: ClassifierFn) -> PBCState:
     if not state_file or not os.path.exists(state_file):
         return PBCState()
     with open(state_file, "r", encoding="utf-8") as fh:
         data = json.load(fh)
-    return PBCState.from_jsonable(data, classifier)
+    images, lines, clean = _read_journal(state_file)
+    state = PBCState.from_jsonable(_apply_journal(data, images), classifier)
+    state._reset_journal(os.path.abspath(state_file) if clean else None, lines)
+    return state
+
+
+def _fsync_directory(directory: str) -> None:
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write_snapshot(state_file: str, payload: object) -> None:
+    """Atomically replace *state_file* with *payload*.
+
+    The JSON is written to a temporary file in the same directory, fsynced and
+    renamed over the target, so concurrent readers (dashboard, portal) see
+    either the previous snapshot or the new one, never a truncated file.
+    """
+
+    directory = os.path.dirname(state_file) or "."
+    os.makedirs(directory, exist_ok=True)
+    try:
+        mode = stat.S_IMODE(os.stat(state_file).st_mode)
+    except OSError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(
+        prefix=f".{os.path.basename(state_file)}.", suffix=".tmp", dir=directory
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            json.dump(payload, fh, ensure_ascii=False, indent=2)
+            fh.flush()
+            os.fsync(fh.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, state_file)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(directory)
+    journal = journal_path(state_file)
+    if os.path.exists(journal):
+        os.remove(journal)
+
+
+def _append_journal(state_file: str, images: List[Dict[str, object]], fresh: bool) -> None:
+    path = journal_path(state_file)
+    if not fresh and not os.path.exists(path):
+        fresh = True
+    with open(path, "w" if fresh else "a", encoding="utf-8") as fh:
+        if fresh:
+            header = {"base": _snapshot_signature(state_file)}
+            fh.write(json.dumps(header) + "\n")
+        fh.write(json.dumps({"entries": images}, ensure_ascii=False, separators=(",", ":")) + "\n")
+        fh.flush()
+        os.fsync(fh.fileno())
+
+
+@dataclass
+class PendingStateWrite:
+    """State changes captured from a :class:`PBCState` but not yet on disk."""
+
+    snapshot: Optional[Dict[str, object]] = None
+    images: Dict[int, Dict[str, object]] = field(default_factory=dict)
+    fresh_journal: bool = False
+
+    def merge(self, later: "PendingStateWrite") -> None:
+        """Fold *later* into this write so that only the newest data is kept."""
+
+        if later.snapshot is not None:
+            self.snapshot = later.snapshot
+            self.images = dict(later.images)
+            self.fresh_journal = later.fresh_journal
+            return
+        if self.snapshot is None and not self.images:
+            self.fresh_journal = later.fresh_journal
+        for serial, image in later.images.items():
+            self.images.pop(serial, None)
+            self.images[serial] = image
+
+
+def capture_state_changes(
+    state_file: Optional[str], state: PBCState
+) -> Optional[PendingStateWrite]:
+    """Detach the changes made to *state* since its last persist.
+
+    Returns ``None`` when nothing changed. The result holds copies only, so it
+    can be written by another thread while *state* keeps being mutated. A full
+    snapshot is captured instead of journal images when no matching snapshot
+    exists yet, when an entry has no serial to key on, or once the journal
+    reaches ``JOURNAL_COMPACT_THRESHOLD`` lines.
+    """
+
+    if not state_file or not state._dirty_entries:
+        return None
+    images = [
+        PBCState._entry_to_jsonable(state.entries[entry_id])
+        for entry_id in sorted(state._dirty_entries)
+        if isinstance(state.entries.get(entry_id), dict)
+    ]
+    if (
+        state._journal_base != os.path.abspath(state_file)
+        or not os.path.exists(state_file)
+        or state._journal_lines >= JOURNAL_COMPACT_THRESHOLD
+        or any(not isinstance(image.get("serial"), int) for image in images)
+    ):
+        snapshot = state.to_jsonable()
+        state._reset_journal(os.path.abspath(state_file))
+        return PendingStateWrite(snapshot=snapshot)
+    pending = PendingStateWrite(
+        images={image["serial"]: image for image in images},  # type: ignore[misc]
+        fresh_journal=state._journal_lines == 0,
+    )
+    state._dirty_entries.clear()
+    state._journal_lines += 1
+    return pending
+
+
+def write_state_changes(state_file: str, pending: PendingStateWrite) -> None:
+    if pending.snapshot is not None:
+        _write_snapshot(state_file, pending.snapshot)
+    if pending.images:
+        _append_journal(state_file, list(pending.images.values()), pending.fresh_journal)
 
 
 def save_state(state_file: Optional[str], state: PBCState) -> None:
     if not state_file:
         return
-    os.makedirs(os.path.dirname(state_file), exist_ok=True)
-    with open(state_file, "w", encoding="utf-8") as fh:
-        json.dump(state.to_jsonable(), fh, ensure_ascii=False, indent=2)
+    _write_snapshot(state_file, state.to_jsonable())
+    state._reset_journal(os.path.abspath(state_file))
+
+
+def journal_state(state_file: Optional[str], state: PBCState) -> None:
+    """Persist changes since the last save by appending to the state journal.
+
+    Each call writes one compact line holding the current image of every entry
+    changed since the previous persist, so durability after a download costs
+    the size of that entry rather than of the whole state. See
+    :func:`capture_state_changes` for when a full snapshot is written instead.
+    """
+
+    pending = capture_state_changes(state_file, state)
+    if pending is not None and state_file:
+        write_state_changes(state_file, pending)
@@ -9,6 +9,23 @@ from .task_models import TaskStats
 logger = logging.getLogger(__name__)
 
 
+def record_state_totals(stats: TaskStats, state: PBCState) -> None:
+    """Copy the entry, document and file totals of *state* onto *stats*."""
+
+    stats.entries_total = sum(1 for entry in state.entries.values() if isinstance(entry, dict))
+    stats.documents_total = sum(
+        len(entry.get("documents", []))
+        for entry in state.entries.values()
+        if isinstance(entry, dict)
+    )
+    stats.files_recorded = sum(1 for record in state.files.values() if isinstance(record, dict))
+    stats.files_marked_downloaded = sum(
+        1
+        for record in state.files.values()
+        if isinstance(record, dict) and record.get("downloaded")
+    )
+
+
 def log_task_summary(
     task_name: str,
     stats: Optional[TaskStats],
@@ -17,24 +34,15 @@ def log_task_summary(
     *,
     context: str,
 ) -> None:
+    """Log the outcome of a run.
+
+    State totals are taken from *state* when given, otherwise from the totals
+    already recorded on *stats* (see :func:`record_state_totals`).
+    """
+
     stats = stats or TaskStats()
-    entries_total = 0
-    documents_total = 0
-    files_recorded = 0
-    files_marked_downloaded = 0
     if state is not None:
-        entries_total = sum(1 for entry in state.entries.values() if isinstance(entry, dict))
-        documents_total = sum(
-            len(entry.get("documents", []))
-            for entry in state.entries.values()
-            if isinstance(entry, dict)
-        )
-        files_recorded = sum(1 for record in state.files.values() if isinstance(record, dict))
-        files_marked_downloaded = sum(
-            1
-            for record in state.files.values()
-            if isinstance(record, dict) and record.get("downloaded")
-        )
+        record_state_totals(stats, state)
 
     logger.info(
         (
@@ -47,12 +55,12 @@ def log_task_summary(
         stats.pages_total,
         stats.pages_fetched,
         stats.pages_from_cache,
-        entries_total,
-        documents_total,
+        stats.entries_total,
+        stats.documents_total,
         stats.files_downloaded,
         stats.files_reused,
-        files_recorded,
-        files_marked_downloaded,
+        stats.files_recorded,
+        stats.files_marked_downloaded,
     )
     if new_files:
         max_preview = 10
@@ -26,6 +26,17 @@ class TaskStats:
     documents_seen: int = 0
     files_downloaded: int = 0
     files_reused: int = 0
+    bytes_downloaded: int = 0
+    # State totals once the run has finished.
+    entries_total: int = 0
+    documents_total: int = 0
+    files_recorded: int = 0
+    files_marked_downloaded: int = 0
+    # Wall time per phase, in seconds.
+    state_seconds: float = 0.0
+    listing_seconds: float = 0.0
+    download_seconds: float = 0.0
+    wall_seconds: float = 0.0
 
 
 @dataclass
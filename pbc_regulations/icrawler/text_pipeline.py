@@ -14,6 +14,7 @@ stack.
 from __future__ import annotations
 
 import io
+import os
 from collections import Counter
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -30,6 +31,9 @@ try:  # Optional dependency used for PDF extraction.
 except Exception:  # pragma: no cover - pdfminer is optional at runtime.
     _default_pdf_extractor = None
 
+from pbc_regulations.text_structure import structure_path_for, write_text_structure
+
+from .artifact_stats import artifact_file_size, record_artifact_write
 from .crawler import safe_filename
 
 
@@ -547,7 +551,29 @@ def _attempt_extract(candidate: DocumentCandidate) -> ExtractionAttempt:
     return ExtractionAttempt(candidate, text=text, error=None, needs_ocr=False)
 
 
-def extract_entry(entry: Dict[str, Any], state_dir: Path) -> EntryExtraction:
+def _attempt_extract_cached(
+    candidate: DocumentCandidate,
+    attempt_cache: Optional[Dict[str, ExtractionAttempt]],
+) -> ExtractionAttempt:
+    """Extract *candidate*, reusing the result for files with the same ``sha256``."""
+
+    digest = candidate.document.get("sha256")
+    if attempt_cache is None or not isinstance(digest, str) or not digest:
+        return _attempt_extract(candidate)
+    cached = attempt_cache.get(digest)
+    if cached is None:
+        attempt = _attempt_extract(candidate)
+        attempt_cache[digest] = attempt
+        return attempt
+    candidate.normalized_type = cached.candidate.normalized_type
+    return ExtractionAttempt(candidate, text=cached.text, error=cached.error, needs_ocr=cached.needs_ocr)
+
+
+def extract_entry(
+    entry: Dict[str, Any],
+    state_dir: Path,
+    attempt_cache: Optional[Dict[str, ExtractionAttempt]] = None,
+) -> EntryExtraction:
     candidates = _build_candidates(entry, state_dir)
     attempts: List[ExtractionAttempt] = []
     pdf_needs_ocr = False
@@ -555,7 +581,7 @@ def extract_entry(entry: Dict[str, Any], state_dir: Path) -> EntryExtraction:
     fallback: Optional[ExtractionAttempt] = None
 
     for candidate in candidates:
-        attempt = _attempt_extract(candidate)
+        attempt = _attempt_extract_cached(candidate, attempt_cache)
         attempts.append(attempt)
         if attempt.normalized_type == "pdf" and attempt.needs_ocr:
             pdf_needs_ocr = True
@@ -618,6 +644,16 @@ class ProcessReport:
 
 
 def _build_filename(entry: Dict[str, Any], attempt: Optional[ExtractionAttempt], index: int, used: Dict[str, int]) -> str:
+    normalized_type = attempt.normalized_type if attempt else None
+    return _build_filename_for_type(entry, normalized_type, index, used)
+
+
+def _build_filename_for_type(
+    entry: Dict[str, Any],
+    normalized_type: Optional[str],
+    index: int,
+    used: Dict[str, int],
+) -> str:
     parts: List[str] = []
     serial = entry.get("serial")
     if isinstance(serial, int):
@@ -630,8 +666,8 @@ def _build_filename(entry: Dict[str, Any], attempt: Optional[ExtractionAttempt],
         parts.append(safe_filename(remark))
     if not parts:
         parts.append(f"entry_{index + 1:04d}")
-    if attempt and attempt.normalized_type:
-        parts.append(attempt.normalized_type)
+    if normalized_type:
+        parts.append(normalized_type)
     base = "_".join(filter(None, parts))
     counter = used.get(base, 0)
     used[base] = counter + 1
@@ -662,32 +698,144 @@ def _build_text_content(text: str) -> str:
     return text
 
 
+def _index_text_documents(state_data: Optional[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Map ``source_url`` to the text document previously extracted from it."""
+
+    index: Dict[str, Dict[str, Any]] = {}
+    entries = state_data.get("entries") if isinstance(state_data, dict) else None
+    if not isinstance(entries, list):
+        return index
+    for entry in entries:
+        documents = entry.get("documents") if isinstance(entry, dict) else None
+        if not isinstance(documents, list):
+            continue
+        for document in documents:
+            if not isinstance(document, dict):
+                continue
+            url_value = document.get("url")
+            source_url = document.get("source_url")
+            if (
+                isinstance(url_value, str)
+                and url_value.startswith("local-text://")
+                and isinstance(source_url, str)
+                and document.get("source_sha256")
+            ):
+                index[source_url] = document
+    return index
+
+
+def _reusable_text_document(
+    entry: Dict[str, Any],
+    index: int,
+    used_names: Dict[str, int],
+    previous_texts: Dict[str, Dict[str, Any]],
+    state_dir: Path,
+) -> Optional[Dict[str, Any]]:
+    """Return the previous text document when its source is still the pick.
+
+    Only the highest-priority candidate, which a fresh extraction tries
+    first, is considered: it must have the URL recorded as ``source_url``
+    and still carry the ``sha256`` recorded as ``source_sha256``, and the
+    text file must still be on disk. A newly added preferred source
+    therefore forces a re-extraction. *used_names* is advanced exactly as a
+    fresh extraction would, so the filenames of later entries do not shift.
+    """
+
+    candidates = _build_candidates(entry, state_dir)
+    if not candidates:
+        return None
+    document = candidates[0].document
+    digest = document.get("sha256")
+    previous = previous_texts.get(document.get("url"))  # type: ignore[arg-type]
+    if not digest or previous is None or previous.get("source_sha256") != digest:
+        return None
+    local_path = previous.get("local_path")
+    if not isinstance(local_path, str) or not Path(local_path).is_file():
+        return None
+    probe = dict(used_names)
+    filename = _build_filename_for_type(entry, previous.get("source_type"), index, probe)
+    if previous.get("url") != f"local-text://{filename}":
+        return None
+    used_names.clear()
+    used_names.update(probe)
+    return previous
+
+
 def process_state_data(
     state_data: Dict[str, Any],
     output_dir: Path,
     *,
     state_path: Optional[Path] = None,
     progress_callback: Optional[Callable[[EntryTextRecord], None]] = None,
+    previous_state: Optional[Dict[str, Any]] = None,
 ) -> ProcessReport:
-    """Extract text for every entry and update *state_data* in place."""
+    """Extract text for every entry and update *state_data* in place.
+
+    Text documents found in *previous_state* (or in *state_data* itself) are
+    reused without re-reading the source when its ``sha256`` is unchanged.
+    Written files are recorded in the nearest artifact manifest at or below
+    the directory shared by the state file and *output_dir*.
+    """
 
     output_dir.mkdir(parents=True, exist_ok=True)
     state_dir = state_path.parent if state_path else output_dir
+    artifact_root = os.path.commonpath([os.path.abspath(output_dir), os.path.abspath(state_dir)])
     used_names: Dict[str, int] = {}
     records: List[EntryTextRecord] = []
     entries = state_data.get("entries")
     if not isinstance(entries, list):
         return ProcessReport(records=[])
 
+    attempt_cache: Dict[str, ExtractionAttempt] = {}
+    previous_texts = _index_text_documents(previous_state if previous_state is not None else state_data)
     for index, entry in enumerate(entries):
         if not isinstance(entry, dict):
             continue
-        extraction = extract_entry(entry, state_dir)
+        reused = _reusable_text_document(entry, index, used_names, previous_texts, state_dir)
+        if reused is not None:
+            reused_path = Path(reused["local_path"])
+            structure_path = structure_path_for(reused_path)
+            if not structure_path.is_file():
+                write_text_structure(reused_path, reused_path.read_text(encoding="utf-8"))
+                record_artifact_write(str(structure_path), root=artifact_root)
+            documents = entry.setdefault("documents", [])
+            if isinstance(documents, list):
+                existing = None
+                for document in documents:
+                    if isinstance(document, dict) and document.get("url") == reused.get("url"):
+                        existing = document
+                        break
+                if existing is None:
+                    existing = dict(reused)
+                    documents.append(existing)
+                existing["structure_path"] = str(structure_path)
+            record = EntryTextRecord(
+                entry_index=index,
+                serial=entry.get("serial") if isinstance(entry.get("serial"), int) else None,
+                title=entry.get("title") or "",
+                text_path=Path(reused["local_path"]),
+                status=str(reused.get("extraction_status") or "success"),
+                source_type=reused.get("source_type"),
+                source_path=reused.get("source_local_path"),
+                pdf_needs_ocr=bool(reused.get("needs_ocr")),
+            )
+            records.append(record)
+            if progress_callback is not None:
+                progress_callback(record)
+            continue
+        extraction = extract_entry(entry, state_dir, attempt_cache)
         filename = _build_filename(entry, extraction.selected, index, used_names)
         text_path = output_dir / filename
         text_content = extraction.text if extraction.text is not None else ""
         text_output = _build_text_content(text_content)
+        previous_sizes = (
+            artifact_file_size(str(text_path)),
+            artifact_file_size(str(structure_path_for(text_path))),
+        )
         text_path.write_text(text_output, encoding="utf-8")
+        structure_path = write_text_structure(text_path, text_output)
+        record_artifact_write(str(text_path), previous_sizes[0], root=artifact_root)
+        record_artifact_write(str(structure_path), previous_sizes[1], root=artifact_root)
 
         document_url = f"local-text://{filename}"
         text_document: Dict[str, Any] = {
@@ -696,6 +844,7 @@ def process_state_data(
             "title": f"{entry.get('title', '')}（文本）".strip() or "文本提取",
             "downloaded": True,
             "local_path": str(text_path),
+            "structure_path": str(structure_path),
             "extraction_status": extraction.status,
         }
         if extraction.selected:
@@ -705,6 +854,8 @@ def process_state_data(
             text_document["source_local_path"] = str(candidate.path)
             if candidate.document.get("url"):
                 text_document["source_url"] = candidate.document.get("url")
+            if candidate.document.get("sha256"):
+                text_document["source_sha256"] = candidate.document.get("sha256")
         if extraction.pdf_needs_ocr:
             text_document["needs_ocr"] = True
         if extraction.attempts:
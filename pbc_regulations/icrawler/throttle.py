@@ -0,0 +1,186 @@
+"""Per-host request pacing shared by every task running in the process."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+from urllib.parse import urlparse
+
+
+__all__ = [
+    "HostRateLimiter",
+    "HostThrottle",
+    "TokenBucket",
+    "install_host_throttle",
+    "get_host_throttle",
+    "wait_for_host",
+]
+
+
+def _host_key(url: str) -> str:
+    parsed = urlparse(url)
+    return (parsed.netloc or parsed.path or url).lower()
+
+
+class HostThrottle:
+    """Enforce a minimum interval between requests to the same host.
+
+    Callers reserve the next free slot for a host under a lock and sleep outside
+    of it, so concurrent tasks hitting the same site are serialised while tasks
+    talking to different hosts never wait on each other. The per-task
+    ``delay``/``jitter`` still apply on top of this shared budget.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.min_interval = max(0.0, float(min_interval))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._next_slot: Dict[str, float] = {}
+
+    def reserve(self, url: str) -> float:
+        """Claim the next slot for *url*'s host and return the wait in seconds."""
+
+        key = _host_key(url)
+        with self._lock:
+            now = self._clock()
+            slot = max(now, self._next_slot.get(key, now))
+            self._next_slot[key] = slot + self.min_interval
+        return slot - now
+
+    def try_reserve(self, url: str) -> float:
+        """Claim the slot for *url*'s host only if it is free now.
+
+        Returns ``0.0`` when the slot was claimed, otherwise the seconds until
+        it frees up, without booking anything.
+        """
+
+        key = _host_key(url)
+        with self._lock:
+            now = self._clock()
+            slot = self._next_slot.get(key, now)
+            if slot > now:
+                return slot - now
+            self._next_slot[key] = now + self.min_interval
+        return 0.0
+
+    def wait(self, url: str) -> float:
+        delay = self.reserve(url)
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+
+class TokenBucket:
+    """Classic token bucket: *rate* tokens per second, at most *capacity* banked.
+
+    ``acquire`` blocks until a token is available. Waiters queue up by reserving
+    future tokens under the lock, so concurrent callers are released one
+    ``1 / rate`` interval apart instead of all at once.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def reserve(self) -> float:
+        """Take one token, returning how long the caller must wait for it."""
+
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            self._sleep(delay)
+        return delay
+
+
+class HostRateLimiter:
+    """Keep one :class:`TokenBucket` per host."""
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float = 1.0,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    @classmethod
+    def from_delay(cls, delay: float, jitter: float, capacity: float = 1.0) -> Optional["HostRateLimiter"]:
+        """Build a limiter matching the average rate of ``delay + U(0, jitter)`` sleeps."""
+
+        interval = max(0.0, delay) + max(0.0, jitter) / 2.0
+        if interval <= 0:
+            return None
+        return cls(1.0 / interval, capacity)
+
+    def bucket(self, url: str) -> TokenBucket:
+        key = _host_key(url)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(self.rate, self.capacity, clock=self._clock, sleep=self._sleep)
+                self._buckets[key] = bucket
+            return bucket
+
+    def acquire(self, url: str) -> float:
+        return self.bucket(url).acquire()
+
+
+_active_throttle: Optional[HostThrottle] = None
+
+
+def install_host_throttle(throttle: Optional[HostThrottle]) -> Optional[HostThrottle]:
+    """Install *throttle* process-wide and return the previously active one."""
+
+    global _active_throttle
+    previous = _active_throttle
+    _active_throttle = throttle
+    return previous
+
+
+def get_host_throttle() -> Optional[HostThrottle]:
+    return _active_throttle
+
+
+def wait_for_host(url: str) -> float:
+    throttle = _active_throttle
+    if throttle is None:
+        return 0.0
+    return throttle.wait(url)
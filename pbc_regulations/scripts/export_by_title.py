@@ -207,6 +207,8 @@ def main() -> None:
             print(f"Missing source files: {report.skipped_missing_source}")
         if report.skipped_without_path:
             print(f"Entries without a local path: {report.skipped_without_path}")
+        if report.skipped_duplicate:
+            print(f"Duplicate files skipped: {report.skipped_duplicate}")
 
 
 if __name__ == "__main__":
@@ -24,37 +24,49 @@ from __future__ import annotations
 import argparse
 import json
 import logging
+import re
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
 
 import uvicorn
 from fastapi import APIRouter, Depends, FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, Response
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 
 from .clause_lookup import ClauseLookup
 from .policy_finder import (
+    ClauseDocumentCache,
     Entry,
     PolicyFinder,
+    SEARCH_MODES,
     TaskConfig,
     TIAOFASI_ADMINISTRATIVE_REGULATION,
     TIAOFASI_DEPARTMENTAL_RULE,
     TIAOFASI_NATIONAL_LAW,
     TIAOFASI_NORMATIVE_DOCUMENT,
+    TRANSIENT_DOCUMENT_ERRORS,
     ZHENGWUGONGKAI_ADMINISTRATIVE_NORMATIVE_DOCUMENTS,
     ZHENGWUGONGKAI_CHINESE_REGULATIONS,
-    build_outline_from_text,
     canonicalize_task_name,
     default_extract_path,
     default_state_path,
     discover_project_root,
     load_configured_tasks,
+    norm_text,
     parse_clause_reference,
     resolve_configured_state_path,
 )
+from .document_pool import DEFAULT_PARSE_TIMEOUT, DocumentPool, get_document_pool, install_document_pool
+from .query_cache import QueryCache
+from .text_cache import DEFAULT_TEXT_CACHE_BYTES
 
 LOGGER = logging.getLogger("searcher.api")
 
+# Upper bound on the number of queries accepted by the batch endpoints.
+MAX_BATCH_ITEMS = 1000
+
+_CITATION_PATTERN = re.compile(r"^\s*《(?P<title>[^》]+)》\s*(?P<clause>.*?)\s*$")
+
 
 _SEARCH_TASK_FLAG_DEFINITIONS = [
     {
@@ -197,19 +209,22 @@ def _search_payload(
     query: str,
     topk: int,
     include_documents: bool,
+    document_cache: Optional[ClauseDocumentCache] = None,
+    mode: str = "fuzzy",
 ) -> Dict[str, Any]:
     clause_ref = parse_clause_reference(query)
     results_payload = []
-    for entry, score in finder.search(query, topk=topk):
+    for entry, score in finder.search(query, topk=topk, mode=mode):
         payload = _entry_payload(entry, score, include_documents)
         if clause_ref is not None:
-            clause_result = finder.extract_clause(entry, clause_ref)
+            clause_result = finder.extract_clause(entry, clause_ref, document_cache)
             payload["clause"] = clause_result.to_dict()
         results_payload.append(payload)
 
     response: Dict[str, Any] = {
         "query": query,
         "topk": topk,
+        "mode": mode,
         "result_count": len(results_payload),
         "results": results_payload,
     }
@@ -218,6 +233,97 @@ def _search_payload(
     return response
 
 
+def _with_query(payload: Dict[str, Any], query: str) -> Dict[str, Any]:
+    """Return *payload* (cached for an equivalent query) as answered for *query*."""
+
+    if payload.get("query") == query:
+        return payload
+    raw = query.strip()
+    updated = dict(payload, query=query)
+    if "clause_reference" in updated:
+        updated["clause_reference"] = dict(updated["clause_reference"], raw=raw)
+        results = []
+        for result in updated.get("results", []):
+            clause = result.get("clause")
+            if isinstance(clause, dict) and isinstance(clause.get("reference"), dict):
+                clause = dict(clause, reference=dict(clause["reference"], raw=raw))
+                result = dict(result, clause=clause)
+            results.append(result)
+        updated["results"] = results
+    return updated
+
+
+def _payload_is_cacheable(payload: Dict[str, Any]) -> bool:
+    """Return ``False`` when a clause in *payload* failed for a temporary reason."""
+
+    for result in payload.get("results", []):
+        clause = result.get("clause")
+        if isinstance(clause, dict) and clause.get("error") in TRANSIENT_DOCUMENT_ERRORS:
+            return False
+    return True
+
+
+def cached_search_payload(
+    cache: QueryCache,
+    finder: PolicyFinder,
+    query: str,
+    topk: int,
+    include_documents: bool,
+    mode: str = "fuzzy",
+) -> Dict[str, Any]:
+    """Return :func:`_search_payload`, computed once per normalised query and index.
+
+    Payloads with a clause that hit a busy, timed-out or crashed document
+    parser are returned but not cached, so the next request parses again.
+    """
+
+    key = (norm_text(query), topk, include_documents, mode)
+    payload = cache.get_or_compute(
+        finder,
+        key,
+        lambda: _search_payload(finder, query, topk, include_documents, mode=mode),
+        _payload_is_cacheable,
+    )
+    return _with_query(payload, query)
+
+
+def _parse_batch_items(payload: Any, keys: Sequence[str]) -> List[Any]:
+    """Return the item list of a batch request body (a list or ``{key: [...]}``)."""
+
+    items: Any = payload
+    if isinstance(payload, dict):
+        items = None
+        for key in keys:
+            if key in payload:
+                items = payload[key]
+                break
+    if not isinstance(items, list):
+        raise ValueError(f"Field '{keys[0]}' must be a JSON array")
+    if len(items) > MAX_BATCH_ITEMS:
+        raise ValueError(f"At most {MAX_BATCH_ITEMS} items are allowed per batch")
+    return items
+
+
+def _stream_batch(results: Iterable[Dict[str, Any]], count: int) -> Iterator[bytes]:
+    """Yield ``{"result_count": n, "results": [...]}`` one result at a time."""
+
+    yield f'{{"result_count": {count}, "results": ['.encode("utf-8")
+    for index, result in enumerate(results):
+        prefix = ", " if index else ""
+        yield (prefix + json.dumps(result, ensure_ascii=False)).encode("utf-8")
+    yield b"]}"
+
+
+async def _read_json_body(request: Request) -> Any:
+    body = await request.body()
+    if not body:
+        raise ValueError("Empty request body")
+    try:
+        return json.loads(body.decode("utf-8"))
+    except json.JSONDecodeError as exc:
+        raise ValueError("Request body must be valid JSON") from exc
+
+
 def _parse_include_params(values: Optional[Sequence[str]]) -> List[str]:
     includes: List[str] = []
     if not values:
@@ -310,17 +416,17 @@ def create_policy_router(
         if "meta" in include_params:
             response_payload["policy"] = entry.to_dict(include_documents=False)
 
-        text_content: Optional[str] = None
-        if include_params & {"text", "outline"}:
+        if "text" in include_params:
             text_content = finder_instance.get_entry_text(entry, clause_lookup_instance)
             if text_content is None:
                 raise HTTPException(status_code=404, detail="policy_text_not_available")
-
-        if "text" in include_params and text_content is not None:
             response_payload["text"] = text_content
 
-        if "outline" in include_params and text_content is not None:
-            response_payload["outline"] = build_outline_from_text(text_content)
+        if "outline" in include_params:
+            outline = finder_instance.get_entry_outline(entry, clause_lookup_instance)
+            if outline is None:
+                raise HTTPException(status_code=404, detail="policy_text_not_available")
+            response_payload["outline"] = outline
 
         return JSONResponse(status_code=200, content=response_payload)
 
@@ -335,10 +441,13 @@ def create_policy_router(
         clause_text = clause_value.strip() if isinstance(clause_value, str) else ""
         return title_text, clause_text
 
-    def _lookup_clause_response(
-        title_text: str, clause_text: str, lookup: ClauseLookup
-    ) -> JSONResponse:
-        match, error_code = lookup.find_clause(title_text, clause_text)
+    def _clause_payload(
+        title_text: str,
+        clause_text: str,
+        lookup: ClauseLookup,
+        document_cache: Optional[ClauseDocumentCache] = None,
+    ) -> Tuple[int, Dict[str, Any]]:
+        match, error_code = lookup.find_clause(title_text, clause_text, document_cache)
         if match is None:
             status_map = {
                 "missing_title": 400,
@@ -347,7 +456,7 @@ def create_policy_router(
             }
             status = status_map.get(error_code or "", 404)
             message = error_code or "clause_lookup_failed"
-            return JSONResponse(status_code=status, content={"error": message})
+            return status, {"error": message}
 
         result_payload = match.result.to_dict()
         clause_text_value = (
@@ -367,10 +476,26 @@ def create_policy_router(
             response_payload["clause_text"] = clause_text_value
         if error_code and not clause_text_value:
             response_payload["error"] = error_code
-            return JSONResponse(status_code=404, content=response_payload)
+            return 404, response_payload
         if error_code:
             response_payload["warning"] = error_code
-        return JSONResponse(status_code=200, content=response_payload)
+        return 200, response_payload
+
+    def _lookup_clause_response(
+        title_text: str, clause_text: str, lookup: ClauseLookup
+    ) -> JSONResponse:
+        status, payload = _clause_payload(title_text, clause_text, lookup)
+        return JSONResponse(status_code=status, content=payload)
+
+    def _resolve_batch_clause_item(item: Any) -> Tuple[str, str]:
+        if isinstance(item, str):
+            match = _CITATION_PATTERN.match(item)
+            if match is None:
+                return "", ""
+            return match.group("title").strip(), match.group("clause")
+        if isinstance(item, dict):
+            return _resolve_clause_arguments(item)
+        return "", ""
 
     @router.get("/clause")
     def clause_get(
@@ -408,6 +533,35 @@ def create_policy_router(
             return bad_request("Fields 'title' and 'item' (or 'clause') are required")
         return _lookup_clause_response(title_text, clause_text, lookup)
 
+    @router.post("/clause/batch")
+    async def clause_batch(
+        request: Request,
+        lookup: ClauseLookup = Depends(_require_clause_lookup),
+    ) -> Response:
+        """Resolve many clauses; items are ``{"title", "item"}`` objects or "《title》clause" strings."""
+
+        try:
+            items = _parse_batch_items(await _read_json_body(request), ("items", "queries"))
+        except ValueError as exc:
+            return bad_request(str(exc))
+        parsed = [_resolve_batch_clause_item(item) for item in items]
+
+        def results() -> Iterator[Dict[str, Any]]:
+            # Citations of one policy share its loaded, line-split source text.
+            document_cache: ClauseDocumentCache = {}
+            for index, (title_text, clause_text) in enumerate(parsed):
+                if not title_text or not clause_text:
+                    status, payload = 400, {
+                        "error": "Fields 'title' and 'item' (or 'clause') are required"
+                    }
+                else:
+                    status, payload = _clause_payload(
+                        title_text, clause_text, lookup, document_cache
+                    )
+                yield {"index": index, "status": status, **payload}
+
+        return StreamingResponse(_stream_batch(results(), len(parsed)), media_type="application/json")
+
     return router
 
 
@@ -417,7 +571,7 @@ def _parse_search_params(
     query_error: str,
     topk_error: str,
     include_error: str,
-) -> Tuple[str, int, bool]:
+) -> Tuple[str, int, bool, str]:
     query_text = ""
     for key in ("query", "q"):
         value = params.get(key)
@@ -446,7 +600,14 @@ def _parse_search_params(
         if parsed_bool is not None:
             include_flag = parsed_bool
 
-    return query_text, topk_value, include_flag
+    mode_value = params.get("mode")
+    mode = "fuzzy"
+    if isinstance(mode_value, str) and mode_value.strip():
+        mode = mode_value.strip().lower()
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Search mode must be one of: {', '.join(SEARCH_MODES)}")
+
+    return query_text, topk_value, include_flag, mode
 
 
 def create_app(finder: PolicyFinder, clause_lookup: ClauseLookup) -> FastAPI:
@@ -462,6 +623,11 @@ def create_app(finder: PolicyFinder, clause_lookup: ClauseLookup) -> FastAPI:
 
     app.state.finder = finder
     app.state.clause_lookup = clause_lookup
+    app.state.query_cache = QueryCache()
+    if finder is not None:
+        # Read extracted texts now so /policies?query= never waits on disk;
+        # an index restored from a snapshot is kept.
+        finder.ensure_text_index(clause_lookup)
 
     def get_finder(request: Request) -> PolicyFinder:
         finder_instance = getattr(request.app.state, "finder", None)
@@ -483,14 +649,29 @@ def create_app(finder: PolicyFinder, clause_lookup: ClauseLookup) -> FastAPI:
     def root() -> Dict[str, Any]:
         return {
             "service": "policy_finder",
-            "endpoints": ["/search", "/policies", "/policies/{policy_id}"],
+            "endpoints": [
+                "/search",
+                "/search/batch",
+                "/policies",
+                "/policies/{policy_id}",
+                "/clause",
+                "/clause/batch",
+            ],
         }
 
     @app.get("/health")
     @app.get("/healthz")
     @app.get("/ping")
-    def health() -> Dict[str, str]:
-        return {"status": "ok"}
+    def health(request: Request) -> Dict[str, Any]:
+        payload: Dict[str, Any] = {"status": "ok"}
+        finder_instance = getattr(request.app.state, "finder", None)
+        if finder_instance is not None:
+            payload["text_cache"] = finder_instance.text_cache_stats()
+        payload["query_cache"] = request.app.state.query_cache.stats()
+        pool = get_document_pool()
+        if pool is not None:
+            payload["document_pool"] = pool.stats()
+        return payload
 
     @app.options("/search")
     def options_search() -> Response:
@@ -503,6 +684,7 @@ def create_app(finder: PolicyFinder, clause_lookup: ClauseLookup) -> FastAPI:
         topk: Optional[str] = Query(None),
         include_documents: Optional[str] = Query(None),
         documents: Optional[str] = Query(None),
+        mode: Optional[str] = Query(None),
         finder_instance: PolicyFinder = Depends(get_finder),
     ) -> JSONResponse:
         params = {
@@ -511,9 +693,10 @@ def create_app(finder: PolicyFinder, clause_lookup: ClauseLookup) -> FastAPI:
             "topk": topk,
             "include_documents": include_documents,
             "documents": documents,
+            "mode": mode,
         }
         try:
-            query_text, topk_value, include_flag = _parse_search_params(
+            query_text, topk_value, include_flag, mode = _parse_search_params(
                 params,
                 query_error="Missing 'query' parameter",
                 topk_error="Invalid 'topk' parameter",
@@ -522,7 +705,14 @@ def create_app(finder: PolicyFinder, clause_lookup: ClauseLookup) -> FastAPI:
         except ValueError as exc:
             return bad_request(str(exc))
 
-        payload = _search_payload(finder_instance, query_text, topk_value, include_flag)
+        payload = cached_search_payload(
+            app.state.query_cache,
+            finder_instance,
+            query_text,
+            topk_value,
+            include_flag,
+            mode,
+        )
         return JSONResponse(status_code=200, content=payload)
 
     @app.post("/search")
@@ -543,7 +733,7 @@ def create_app(finder: PolicyFinder, clause_lookup: ClauseLookup) -> FastAPI:
             return bad_request("Request body must be a JSON object")
 
         try:
-            query_text, topk_value, include_flag = _parse_search_params(
+            query_text, topk_value, include_flag, mode = _parse_search_params(
                 payload,
                 query_error="Field 'query' is required",
                 topk_error="Field 'topk' must be a positive integer",
@@ -552,9 +742,70 @@ def create_app(finder: PolicyFinder, clause_lookup: ClauseLookup) -> FastAPI:
         except ValueError as exc:
             return bad_request(str(exc))
 
-        payload_data = _search_payload(finder_instance, query_text, topk_value, include_flag)
+        payload_data = cached_search_payload(
+            app.state.query_cache,
+            finder_instance,
+            query_text,
+            topk_value,
+            include_flag,
+            mode,
+        )
         return JSONResponse(status_code=200, content=payload_data)
 
+    @app.post("/search/batch")
+    async def search_batch(
+        request: Request,
+        finder_instance: PolicyFinder = Depends(get_finder),
+    ) -> Response:
+        """Run many searches; items are query strings or ``/search`` style objects."""
+
+        try:
+            payload = await _read_json_body(request)
+            items = _parse_batch_items(payload, ("queries", "items"))
+        except ValueError as exc:
+            return bad_request(str(exc))
+        defaults = {
+            key: payload[key]
+            for key in ("topk", "include_documents", "documents", "mode")
+            if isinstance(payload, dict) and key in payload
+        }
+        parsed: List[Any] = []
+        for item in items:
+            params = {**defaults, **(item if isinstance(item, dict) else {"query": item})}
+            try:
+                parsed.append(
+                    _parse_search_params(
+                        params,
+                        query_error="Field 'query' is required",
+                        topk_error="Field 'topk' must be a positive integer",
+                        include_error="Field 'include_documents' must be boolean",
+                    )
+                )
+            except ValueError as exc:
+                parsed.append(str(exc))
+
+        def results() -> Iterator[Dict[str, Any]]:
+            document_cache: ClauseDocumentCache = {}
+            for index, params in enumerate(parsed):
+                if isinstance(params, str):
+                    yield {"index": index, "status": 400, "error": params}
+                    continue
+                query_text, topk_value, include_flag, mode = params
+                yield {
+                    "index": index,
+                    "status": 200,
+                    **_search_payload(
+                        finder_instance,
+                        query_text,
+                        topk_value,
+                        include_flag,
+                        document_cache,
+                        mode=mode,
+                    ),
+                }
+
+        return StreamingResponse(_stream_batch(results(), len(parsed)), media_type="application/json")
+
     app.include_router(
         create_policy_router(
             finder_dependency=get_finder,
@@ -626,6 +877,35 @@ def parse_args(argv: Optional[Tuple[str, ...]] = None) -> argparse.Namespace:
                 "(defaults to autodiscovery)"
             ),
         )
+    parser.add_argument(
+        "--text-cache-mb",
+        type=float,
+        default=DEFAULT_TEXT_CACHE_BYTES / (1024 * 1024),
+        help="Memory budget for cached policy texts in MiB (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-text-cache-compression",
+        dest="compress_text_cache",
+        action="store_false",
+        help="Keep every cached text uncompressed instead of zlib-compressing cold ones",
+    )
+    parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=0,
+        help="Worker processes for PDF/Word/HTML parsing (default: 0, parse in the request thread)",
+    )
+    parser.add_argument(
+        "--parse-timeout",
+        type=float,
+        default=DEFAULT_PARSE_TIMEOUT,
+        help="Seconds a request waits for one document to be parsed (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--parse-queue",
+        type=int,
+        help="Maximum parsing jobs queued or running (default: 4 per worker)",
+    )
     parser.add_argument(
         "--state",
         dest="state_overrides",
@@ -705,7 +985,11 @@ def main(argv: Optional[Tuple[str, ...]] = None) -> int:
         )
         resolved_extract_paths.append(resolved_extract)
 
-    finder = PolicyFinder(*(str(path) for path in resolved_state_paths))
+    finder = PolicyFinder(
+        *(str(path) for path in resolved_state_paths),
+        text_cache_bytes=int(args.text_cache_mb * 1024 * 1024),
+        compress_text_cache=args.compress_text_cache,
+    )
     clause_lookup = ClauseLookup(resolved_extract_paths)
 
     app = create_app(finder, clause_lookup)
@@ -713,10 +997,23 @@ def main(argv: Optional[Tuple[str, ...]] = None) -> int:
     port = args.port
     LOGGER.info("Serving policy finder API on %s:%s", host, port)
 
+    pool = None
+    if args.parse_workers > 0:
+        pool = DocumentPool(
+            args.parse_workers,
+            timeout=args.parse_timeout,
+            max_pending=args.parse_queue,
+        )
+        LOGGER.info("Parsing documents in %d worker process(es)", pool.max_workers)
+    previous_pool = install_document_pool(pool)
     try:
         uvicorn.run(app, host=host, port=port, log_level="info")
     except KeyboardInterrupt:
         LOGGER.info("Stopping policy finder API")
+    finally:
+        install_document_pool(previous_pool)
+        if pool is not None:
+            pool.shutdown(wait=False)
     return 0
 
 
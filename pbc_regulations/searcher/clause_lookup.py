@@ -4,11 +4,12 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from difflib import get_close_matches
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Sequence, Tuple
 
 from .policy_finder import (
+    ClauseDocumentCache,
+    ClauseReference,
     ClauseResult,
     Entry,
     default_extract_path,
@@ -17,6 +18,7 @@ from .policy_finder import (
     parse_clause_reference,
     _resolve_document_path,
 )
+from .title_index import TitleIndex
 
 
 @dataclass
@@ -77,6 +79,7 @@ class ClauseLookup:
 
     def __init__(self, extract_paths: Sequence[Path]):
         self._entries_by_norm: Dict[str, List[ClauseLookupEntry]] = {}
+        self._title_index = TitleIndex()
         self._all_entries: List[ClauseLookupEntry] = []
         self._load_extracts(extract_paths)
 
@@ -85,10 +88,21 @@ class ClauseLookup:
         paths = [default_extract_path(task, start) for task in task_names]
         return cls(paths)
 
+    @classmethod
+    def from_entries(cls, entries: Iterable[ClauseLookupEntry]) -> "ClauseLookup":
+        lookup = cls([])
+        for entry in entries:
+            lookup._register_entry(entry)
+        return lookup
+
+    def all_entries(self) -> List[ClauseLookupEntry]:
+        return list(self._all_entries)
+
     def _register_entry(self, entry: ClauseLookupEntry) -> None:
         key = norm_text(entry.title)
         bucket = self._entries_by_norm.setdefault(key, [])
         bucket.append(entry)
+        self._title_index.add(key)
         self._all_entries.append(entry)
 
     def _load_extracts(self, extract_paths: Sequence[Path]) -> None:
@@ -167,19 +181,18 @@ class ClauseLookup:
         matches = list(self._entries_by_norm.get(normalized, [])) if normalized else []
         if matches:
             return matches
-        if normalized:
-            partial = [
-                entry
-                for key, bucket in self._entries_by_norm.items()
-                if normalized in key or key in normalized
-                for entry in bucket
-            ]
-            if partial:
-                return partial
-            keys = list(self._entries_by_norm.keys())
-            close = get_close_matches(normalized, keys, n=1, cutoff=0.75)
-        if close:
-            return list(self._entries_by_norm.get(close[0], []))
+        if not normalized:
+            return []
+        partial = [
+            entry
+            for key in self._title_index.containing(normalized)
+            for entry in self._entries_by_norm[key]
+        ]
+        if partial:
+            return partial
+        close = self._title_index.close_match(normalized)
+        if close is not None:
+            return list(self._entries_by_norm[close])
         return []
 
     def find_text_path(self, title: str) -> Optional[Path]:
@@ -222,13 +235,26 @@ class ClauseLookup:
         return None
 
     def find_clause(
-        self, title: str, clause_text: str
+        self,
+        title: str,
+        clause_text: str,
+        document_cache: Optional[ClauseDocumentCache] = None,
     ) -> Tuple[Optional[ClauseLookupMatch], Optional[str]]:
         if not title:
             return None, "missing_title"
         reference = parse_clause_reference(clause_text or "")
         if reference is None:
             return None, "invalid_clause_reference"
+        return self.find_reference(title, reference, document_cache)
+
+    def find_reference(
+        self,
+        title: str,
+        reference: ClauseReference,
+        document_cache: Optional[ClauseDocumentCache] = None,
+    ) -> Tuple[Optional[ClauseLookupMatch], Optional[str]]:
+        """Resolve an already parsed *reference* within the policy titled *title*."""
+
         candidates = self._match_entries(title)
         if not candidates:
             return None, "policy_not_found"
@@ -263,7 +289,7 @@ class ClauseLookup:
                 if signature in seen_signatures:
                     continue
                 seen_signatures.add(signature)
-                result = extract_clause_from_entry(entry_obj, reference)
+                result = extract_clause_from_entry(entry_obj, reference, document_cache)
                 last_result = result
                 last_entry = candidate
                 if result.error in {"article_not_found", "paragraph_not_found", "item_not_found"}:
@@ -0,0 +1,225 @@
+"""Process pool that keeps heavy document parsing off the request threads."""
+
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import threading
+import time
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.connection import Connection
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+
+__all__ = [
+    "DEFAULT_PARSE_TIMEOUT",
+    "DocumentPool",
+    "DocumentPoolBusy",
+    "get_document_pool",
+    "install_document_pool",
+]
+
+
+DEFAULT_PARSE_TIMEOUT = 30.0
+
+T = TypeVar("T")
+
+
+class DocumentPoolBusy(RuntimeError):
+    """Raised when every queue slot of the pool is taken."""
+
+
+def _worker_main(connection: Connection) -> None:
+    """Run ``(fn, args)`` jobs received on *connection* until told to stop."""
+
+    while True:
+        try:
+            job = connection.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        fn, args = job
+        try:
+            reply = ("ok", fn(*args))
+        except BaseException as exc:  # pragma: no cover - depends on the job
+            reply = ("error", exc)
+        try:
+            connection.send(reply)
+        except Exception as exc:  # pragma: no cover - unpicklable result
+            connection.send(("error", RuntimeError(f"cannot return job result: {exc!r}")))
+
+
+class _Worker:
+    """One worker process and the parent's end of its pipe."""
+
+    def __init__(self, context: Any) -> None:
+        self.connection, child = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child,), daemon=True)
+        self.process.start()
+        child.close()
+
+    def stop(self, wait: bool) -> None:
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        if wait:
+            self.process.join(timeout=5)
+        if not wait or self.process.is_alive():
+            self.kill()
+        self.connection.close()
+
+    def kill(self) -> None:
+        self.process.terminate()
+        self.process.join()
+        self.connection.close()
+
+
+class DocumentPool:
+    """Run parsing jobs (pdfminer, BeautifulSoup, docx) in worker processes.
+
+    A request thread that hands a job to :meth:`run` waits without holding the
+    GIL, so cheap requests keep being served while several heavy documents are
+    parsed in parallel on other cores. At most *max_pending* jobs may be queued
+    or running; further jobs fail fast with :class:`DocumentPoolBusy`. A job
+    that exceeds its timeout raises :class:`TimeoutError` for the caller, and
+    the worker running it is terminated and replaced, so a stuck parser cannot
+    hold a worker for good. Jobs running on the other workers are unaffected.
+    Workers are spawned (not forked) on first use.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        *,
+        timeout: float = DEFAULT_PARSE_TIMEOUT,
+        max_pending: Optional[int] = None,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_pending = max_pending if max_pending is not None else max_workers * 4
+        # Request servers are multi-threaded; forking them can copy held locks.
+        self._context = multiprocessing.get_context("spawn")
+        # ``None`` marks a worker slot whose process has not been started yet.
+        self._idle: "queue.Queue[Optional[_Worker]]" = queue.Queue()
+        for _ in range(max_workers):
+            self._idle.put(None)
+        self._closed = False
+        self._slots = threading.BoundedSemaphore(max(1, self.max_pending))
+        self._stats_lock = threading.Lock()
+        self.pending = 0
+        self.submitted = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.recycled = 0
+
+    def _return_worker(self, worker: Optional[_Worker]) -> None:
+        if self._closed and worker is not None:
+            worker.stop(wait=False)
+            return
+        self._idle.put(worker)
+
+    def _call(self, fn: Callable[..., T], args: Any, timeout: float) -> T:
+        deadline = time.monotonic() + timeout
+        try:
+            worker = self._idle.get(timeout=max(0.0, timeout))
+        except queue.Empty:
+            raise TimeoutError("document parsing timed out") from None
+        try:
+            if worker is None or not worker.process.is_alive():
+                worker = _Worker(self._context)
+            worker.connection.send((fn, args))
+        except BaseException:
+            self._return_worker(worker)
+            raise
+        if not worker.connection.poll(max(0.0, deadline - time.monotonic())):
+            worker.kill()
+            with self._stats_lock:
+                self.recycled += 1
+            self._return_worker(None)
+            raise TimeoutError("document parsing timed out")
+        try:
+            status, value = worker.connection.recv()
+        except (EOFError, OSError):
+            # The worker died (e.g. out of memory); start a fresh one next time.
+            worker.kill()
+            self._return_worker(None)
+            raise BrokenProcessPool("document worker exited unexpectedly") from None
+        self._return_worker(worker)
+        if status == "error":
+            raise value
+        return value
+
+    def run(self, fn: Callable[..., T], *args: Any, timeout: Optional[float] = None) -> T:
+        """Run ``fn(*args)`` in a worker and return its result."""
+
+        if not self._slots.acquire(blocking=False):
+            with self._stats_lock:
+                self.rejected += 1
+            raise DocumentPoolBusy("document parsing queue is full")
+        with self._stats_lock:
+            self.pending += 1
+            self.submitted += 1
+        try:
+            return self._call(fn, args, self.timeout if timeout is None else timeout)
+        except TimeoutError:
+            with self._stats_lock:
+                self.timeouts += 1
+            raise
+        finally:
+            with self._stats_lock:
+                self.pending -= 1
+                self.completed += 1
+            self._slots.release()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return {
+                "workers": self.max_workers,
+                "timeout": self.timeout,
+                "pending": self.pending,
+                "max_pending": self.max_pending,
+                "submitted": self.submitted,
+                "completed": self.completed,
+                "timeouts": self.timeouts,
+                "rejected": self.rejected,
+                "recycled": self.recycled,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop idle workers; busy ones stop when their job returns."""
+
+        self._closed = True
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            if worker is not None:
+                worker.stop(wait)
+
+    def __enter__(self) -> "DocumentPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+
+_active_pool: Optional[DocumentPool] = None
+
+
+def install_document_pool(pool: Optional[DocumentPool]) -> Optional[DocumentPool]:
+    """Parse non-text documents through *pool*; return the previous pool."""
+
+    global _active_pool
+    previous = _active_pool
+    _active_pool = pool
+    return previous
+
+
+def get_document_pool() -> Optional[DocumentPool]:
+    return _active_pool
@@ -0,0 +1,275 @@
+"""Versioned on-disk snapshot of the built search index.
+
+Building :class:`PolicyFinder` and :class:`ClauseLookup` means parsing every
+state file, running ``Entry.build`` (regexes and tokenisation) per entry and
+deduplicating across tasks; the full-text index behind keyword queries also
+reads every extracted text. The snapshot stores all of it once so later starts
+only have to map the file and unpickle it.
+
+Layout::
+
+    b"PBCIDX" | version (uint16) | header length (uint32) | JSON header | pickle
+
+The JSON header lists every source file, including each state file's
+journal, with its size, ``mtime_ns`` and SHA-256. A snapshot is used only when
+the version matches and every source is unchanged. The text files the
+full-text index was built from are listed separately: when one of them changed
+the finder and lookup are still restored, but the full-text index is dropped
+and rebuilt by the caller. Files whose size and mtime differ are re-hashed, so
+a ``touch`` alone does not invalidate the snapshot; rewriting a snapshot
+reuses the previous header's hashes of files whose size and mtime match. The file is read through
+``mmap``, which lets several workers share its pages through the OS page cache
+while they unpickle. Snapshots are trusted local artifacts; never load one
+from an untrusted location.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import mmap
+import os
+import pickle
+import struct
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from pbc_regulations.icrawler.state import journal_path
+
+from .clause_lookup import ClauseLookup
+from .policy_finder import PolicyFinder
+
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_MAGIC = b"PBCIDX"
+SNAPSHOT_VERSION = 3
+SNAPSHOT_FILENAME = "search_index.bin"
+
+_PREFIX = struct.Struct("<6sHI")
+
+PathLike = Union[str, Path]
+
+
+__all__ = [
+    "SNAPSHOT_FILENAME",
+    "SNAPSHOT_VERSION",
+    "load_index_snapshot",
+    "write_index_snapshot",
+]
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fingerprint(path: PathLike, known: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Any]:
+    """Return the size, mtime and SHA-256 of *path*.
+
+    The hash recorded in *known* (fingerprints of the previous snapshot, by
+    path) is reused while size and ``mtime_ns`` are unchanged, so rewriting
+    the snapshot after a reload only hashes files that changed.
+    """
+
+    resolved = Path(path).expanduser().resolve()
+    try:
+        stat = resolved.stat()
+    except OSError:
+        return {"path": str(resolved), "missing": True}
+    previous = (known or {}).get(str(resolved))
+    if (
+        previous is not None
+        and previous.get("size") == stat.st_size
+        and previous.get("mtime_ns") == stat.st_mtime_ns
+        and previous.get("sha256")
+    ):
+        digest = previous["sha256"]
+    else:
+        digest = _file_sha256(resolved)
+    return {
+        "path": str(resolved),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": digest,
+    }
+
+
+def _read_header(mapped: Union[bytes, mmap.mmap]) -> Optional[Tuple[Dict[str, Any], int]]:
+    """Return the JSON header of a snapshot and the offset of its payload."""
+
+    if len(mapped) < _PREFIX.size:
+        return None
+    magic, version, header_length = _PREFIX.unpack_from(mapped, 0)
+    if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+        return None
+    header_end = _PREFIX.size + header_length
+    try:
+        header = json.loads(bytes(mapped[_PREFIX.size:header_end]).decode("utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(header, dict):
+        return None
+    return header, header_end
+
+
+def _known_fingerprints(snapshot_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Return the fingerprints recorded in the snapshot at *snapshot_path*, by path."""
+
+    try:
+        with snapshot_path.open("rb") as handle:
+            prefix = handle.read(_PREFIX.size)
+            if len(prefix) < _PREFIX.size:
+                return {}
+            header_length = _PREFIX.unpack(prefix)[2]
+            parsed = _read_header(prefix + handle.read(header_length))
+    except (OSError, struct.error):
+        return {}
+    if parsed is None:
+        return {}
+    header = parsed[0]
+    known: Dict[str, Dict[str, Any]] = {}
+    for record in [*(header.get("sources") or []), *(header.get("text_sources") or [])]:
+        if isinstance(record, dict) and record.get("path") and not record.get("missing"):
+            known[str(record["path"])] = record
+    return known
+
+
+def _source_unchanged(recorded: Dict[str, Any]) -> bool:
+    path = Path(recorded["path"])
+    try:
+        stat = path.stat()
+    except OSError:
+        return bool(recorded.get("missing"))
+    if recorded.get("missing"):
+        return False
+    if stat.st_size != recorded.get("size"):
+        return False
+    if stat.st_mtime_ns == recorded.get("mtime_ns"):
+        return True
+    try:
+        return _file_sha256(path) == recorded.get("sha256")
+    except OSError:
+        return False
+
+
+def _source_list(state_paths: Sequence[PathLike], extract_paths: Sequence[PathLike]) -> List[Tuple[str, str]]:
+    sources: List[Tuple[str, str]] = []
+    for p in state_paths:
+        resolved = str(Path(p).expanduser().resolve())
+        sources.append(("state", resolved))
+        sources.append(("journal", journal_path(resolved)))
+    sources.extend(("extract", str(Path(p).expanduser().resolve())) for p in extract_paths if p)
+    return sources
+
+
+def write_index_snapshot(
+    snapshot_path: PathLike,
+    finder: PolicyFinder,
+    clause_lookup: Optional[ClauseLookup],
+    state_paths: Sequence[PathLike],
+    extract_paths: Sequence[PathLike] = (),
+) -> Path:
+    """Persist *finder* and *clause_lookup* built from the given source files."""
+
+    target = Path(snapshot_path)
+    known = _known_fingerprints(target)
+    sources = []
+    for kind, path in _source_list(state_paths, extract_paths):
+        record = _fingerprint(path, known)
+        record["kind"] = kind
+        sources.append(record)
+    text_index = finder.text_index
+    text_sources = (
+        [_fingerprint(path, known) for path in text_index.sources] if text_index is not None else []
+    )
+    header = json.dumps(
+        {"created": time.time(), "sources": sources, "text_sources": text_sources},
+        ensure_ascii=False,
+    ).encode("utf-8")
+    payload = pickle.dumps(
+        {
+            "entries": finder.all_entries(),
+            "excluded_entries": finder.excluded_entries(),
+            "search_index": finder.search_index,
+            "clause_entries": clause_lookup.all_entries() if clause_lookup is not None else None,
+            "text_index": text_index,
+            "text_index_uses_lookup": finder.text_index_uses_lookup,
+        },
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temp = target.with_name(target.name + ".tmp")
+    with temp.open("wb") as handle:
+        handle.write(_PREFIX.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(header)))
+        handle.write(header)
+        handle.write(payload)
+    os.replace(temp, target)
+    logger.info("Wrote search index snapshot %s (%d entries)", target, len(finder.entries))
+    return target
+
+
+def load_index_snapshot(
+    snapshot_path: PathLike,
+    state_paths: Sequence[PathLike],
+    extract_paths: Sequence[PathLike] = (),
+) -> Optional[Tuple[PolicyFinder, Optional[ClauseLookup]]]:
+    """Return the snapshotted finder and lookup, or ``None`` if stale or unreadable."""
+
+    path = Path(snapshot_path)
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return None
+    with handle:
+        try:
+            mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return None
+        with mapped:
+            parsed = _read_header(mapped)
+            if parsed is None:
+                logger.info("Ignoring search index snapshot %s: unsupported version", path)
+                return None
+            header, header_end = parsed
+            sources = header.get("sources") or []
+            expected = _source_list(state_paths, extract_paths)
+            recorded = [(item.get("kind"), item.get("path")) for item in sources]
+            if recorded != expected:
+                logger.info("Ignoring search index snapshot %s: source list changed", path)
+                return None
+            if not all(_source_unchanged(item) for item in sources):
+                logger.info("Ignoring search index snapshot %s: sources changed", path)
+                return None
+            text_index_fresh = all(
+                _source_unchanged(item) for item in header.get("text_sources") or []
+            )
+            view = memoryview(mapped)
+            try:
+                payload = pickle.loads(view[header_end:])
+            except Exception as exc:  # pragma: no cover - corrupt snapshot
+                logger.warning("Failed to read search index snapshot %s: %s", path, exc)
+                return None
+            finally:
+                view.release()
+
+    finder = PolicyFinder.from_entries(
+        payload["entries"],
+        payload["excluded_entries"],
+        payload["search_index"],
+    )
+    clause_entries = payload.get("clause_entries")
+    lookup = ClauseLookup.from_entries(clause_entries) if clause_entries is not None else None
+    text_index = payload.get("text_index")
+    if text_index is not None and text_index_fresh:
+        finder.install_text_index(
+            text_index, lookup if payload.get("text_index_uses_lookup") else None
+        )
+    elif text_index is not None:
+        logger.info("Not restoring full-text index from %s: extracted texts changed", path)
+    return finder, lookup
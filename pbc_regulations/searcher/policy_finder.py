@@ -8,11 +8,16 @@ Usage:
 """
 
 from __future__ import annotations
+import functools
+import hashlib
+import heapq
 import io
 import json
 import re
 import sys
+import threading
 import unicodedata
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
@@ -22,6 +27,29 @@ import xml.etree.ElementTree as ET
 
 from bs4 import BeautifulSoup
 
+from pbc_regulations.icrawler.state import read_state_data
+from pbc_regulations.text_structure import (  # noqa: F401 - re-exported for callers
+    STRUCTURE_SUFFIX,
+    STRUCTURE_VERSION,
+    _CLAUSE_NUMBER_CLASS,
+    _chinese_to_int,
+    _find_article_bounds,
+    _find_paragraph_bounds,
+    _normalize_clause_line,
+    _prepare_clause_lines,
+    _sanitize_clause_text,
+    build_outline_from_text,
+    build_text_structure,
+    structure_path_for,
+    write_text_structure,
+)
+
+from .document_pool import DocumentPoolBusy, get_document_pool
+from .text_cache import DEFAULT_TEXT_CACHE_BYTES, TextCache
+from .text_index import FullTextIndex, query_terms
+from .tfidf import TfidfRanker
+from .title_index import TitleIndex
+
 
 ZHENGWUGONGKAI_ADMINISTRATIVE_NORMATIVE_DOCUMENTS = (
     "zhengwugongkai_administrative_normative_documents"
@@ -113,165 +141,11 @@ def tokenize_zh(s: str) -> List[str]:
     return [p for p in parts if p not in STOPWORDS]
 
 
-_CHINESE_DIGIT_MAP = {
-    "零": 0,
-    "〇": 0,
-    "○": 0,
-    "Ｏ": 0,
-    "一": 1,
-    "二": 2,
-    "三": 3,
-    "四": 4,
-    "五": 5,
-    "六": 6,
-    "七": 7,
-    "八": 8,
-    "九": 9,
-    "壹": 1,
-    "贰": 2,
-    "叁": 3,
-    "肆": 4,
-    "伍": 5,
-    "陆": 6,
-    "柒": 7,
-    "捌": 8,
-    "玖": 9,
-    "两": 2,
-    "俩": 2,
-}
-
-_CHINESE_UNIT_MAP = {
-    "十": 10,
-    "拾": 10,
-    "百": 100,
-    "佰": 100,
-    "千": 1000,
-    "仟": 1000,
-    "万": 10000,
-}
-
-
-def _chinese_to_int(text: str) -> Optional[int]:
-    if text is None:
-        return None
-    stripped = text.strip()
-    if not stripped:
-        return None
-    if stripped.isdigit():
-        try:
-            return int(stripped)
-        except ValueError:
-            return None
-    total = 0
-    current = 0
-    for char in stripped:
-        if char in _CHINESE_DIGIT_MAP:
-            current = _CHINESE_DIGIT_MAP[char]
-        elif char in _CHINESE_UNIT_MAP:
-            unit_value = _CHINESE_UNIT_MAP[char]
-            if current == 0:
-                current = 1
-            total += current * unit_value
-            current = 0
-        elif char in {"、", " ", "\t"}:
-            continue
-        else:
-            return None
-    total += current * (1 if current else 0)
-    return total if total != 0 or current != 0 else 0
-
-
-def _int_to_chinese(number: int) -> str:
-    if number == 0:
-        return "零"
-
-    digits = ["零", "一", "二", "三", "四", "五", "六", "七", "八", "九"]
-    units = ["", "十", "百", "千"]
-    big_units = ["", "万", "亿", "兆"]
-
-    def convert_section(section: int) -> str:
-        if section == 0:
-            return "零"
-        pieces: List[str] = []
-        zero_flag = False
-        unit_index = 0
-        value = section
-        while value > 0:
-            value, remainder = divmod(value, 10)
-            if remainder == 0:
-                zero_flag = True
-            else:
-                if zero_flag and pieces:
-                    pieces.append("零")
-                pieces.append(digits[remainder] + units[unit_index])
-                zero_flag = False
-            unit_index += 1
-        result_section = "".join(reversed(pieces))
-        result_section = re.sub(r"零+", "零", result_section)
-        result_section = result_section.strip("零")
-        if section < 20 and result_section.startswith("一十"):
-            result_section = result_section[1:]
-        return result_section or "零"
-
-    parts: List[str] = []
-    unit_index = 0
-    remaining = number
-    while remaining > 0:
-        remaining, section = divmod(remaining, 10000)
-        if section:
-            section_text = convert_section(section)
-            if big_units[unit_index]:
-                section_text += big_units[unit_index]
-            parts.insert(0, section_text)
-        else:
-            if parts and not parts[0].startswith("零"):
-                parts.insert(0, "零")
-        unit_index += 1
-
-    result = "".join(parts)
-    result = re.sub(r"零+", "零", result)
-    result = result.strip("零")
-    if number < 20 and result.startswith("一十"):
-        result = result[1:]
-    return result or "零"
-
-
-def _parse_clause_number(text: Optional[str]) -> Optional[int]:
-    """Parse clause numbering that may contain Chinese numerals or digits."""
-
-    if text is None:
-        return None
-    value = _chinese_to_int(text)
-    if value is not None:
-        return value
-    digits = re.sub(r"\D", "", text)
-    if digits:
-        try:
-            return int(digits)
-        except ValueError:
-            return None
-    return None
-
-
-def _number_variants(number: int) -> Sequence[str]:
-    variants = {str(number), _int_to_chinese(number)}
-    if number == 2:
-        variants.update({"两", "俩"})
-    return [variant for variant in variants if variant]
-
-
-def _number_pattern(number: int) -> Optional[str]:
-    variants = _number_variants(number)
-    if not variants:
-        return None
-    pieces = []
-    for variant in variants:
-        escaped_chars = [re.escape(ch) for ch in variant]
-        pieces.append(r"\s*".join(escaped_chars))
-    return "|".join(pieces)
-
+_ITEM_RE = re.compile(
+    rf"(?:[\(（]\s*({_CLAUSE_NUMBER_CLASS}+)\s*[\)）]\s*(?:项|目)?)|"
+    rf"(?:第\s*({_CLAUSE_NUMBER_CLASS}+)\s*(?:项|目))"
+)
 
-_CLAUSE_NUMBER_CLASS = r"[一二三四五六七八九十百千万零〇0-9两俩壹贰叁肆伍陆柒捌玖]"
 
 def extract_docno(s: str) -> Optional[str]:
     s = norm_text(s)
@@ -605,47 +479,6 @@ class ClauseResult:
         return payload
 
 
-def _normalize_clause_line(text: str) -> str:
-    normalized = unicodedata.normalize("NFKC", text or "")
-    normalized = (
-        normalized.replace("（", "(")
-        .replace("）", ")")
-        .replace("〔", "[")
-        .replace("〕", "]")
-        .replace("【", "[")
-        .replace("】", "]")
-        .replace("《", "\"")
-        .replace("》", "\"")
-        .replace("“", "\"")
-        .replace("”", "\"")
-    )
-    normalized = normalized.replace("\u3000", " ")
-    normalized = re.sub(r"\s+", " ", normalized).strip()
-    return normalized
-
-
-_CLAUSE_CONCLUSION_PATTERNS = (
-    re.compile(
-        r"^(本通知|本办法|本规定|本细则|本规则|本意见|本通告|本方案|本决定|本措施|本指南|本公告)自.+(实施|施行|执行|印发|公布|发布)"
-    ),
-    re.compile(r"^特此(通知|公告|通告|说明)"),
-)
-
-
-def _is_conclusion_line(norm_line: str) -> bool:
-    stripped = norm_line.strip()
-    if not stripped:
-        return False
-    return any(pattern.search(stripped) for pattern in _CLAUSE_CONCLUSION_PATTERNS)
-
-
-def _prepare_clause_lines(text: str) -> Tuple[List[str], List[str]]:
-    sanitized = text.replace("\r\n", "\n").replace("\r", "\n")
-    raw_lines = sanitized.split("\n")
-    norm_lines = [_normalize_clause_line(line) for line in raw_lines]
-    return raw_lines, norm_lines
-
-
 def _strip_empty_edges(
     lines: Sequence[str], norm_lines: Sequence[str]
 ) -> Tuple[List[str], List[str]]:
@@ -669,47 +502,21 @@ def _extract_article_slice(
     norm_lines: Sequence[str],
     reference: ClauseReference,
 ) -> Tuple[Optional[List[str]], Optional[List[str]]]:
-    number_pattern = _number_pattern(reference.article)
-    if not number_pattern:
-        return None, None
-    article_pattern = re.compile(rf"^\s*第\s*(?:{number_pattern})\s*条")
-    generic_article_pattern = re.compile(
-        rf"^\s*第\s*{_CLAUSE_NUMBER_CLASS}+\s*条"
-    )
-    start_index: Optional[int] = None
-    boundary_pattern = generic_article_pattern
-    for idx, norm_line in enumerate(norm_lines):
-        if article_pattern.search(norm_line):
-            start_index = idx
-            break
-    if start_index is None:
-        bullet_pattern = re.compile(
-            rf"^\s*(?:{number_pattern})\s*(?:、|\\.|．|﹒|:|：|·|•)"
-        )
-        generic_bullet_pattern = re.compile(
-            rf"^\s*{_CLAUSE_NUMBER_CLASS}+\s*(?:、|\\.|．|﹒|:|：|·|•)"
-        )
-        for idx, norm_line in enumerate(norm_lines):
-            if bullet_pattern.search(norm_line):
-                start_index = idx
-                boundary_pattern = generic_bullet_pattern
-                break
-    if start_index is None:
+    bounds = _find_article_bounds(norm_lines, reference.article)
+    if bounds is None:
         return None, None
-    end_index = len(lines)
-    for idx in range(start_index + 1, len(norm_lines)):
-        norm_line = norm_lines[idx]
-        if boundary_pattern.search(norm_line):
-            end_index = idx
-            break
-        if _is_conclusion_line(norm_line):
-            end_index = idx
-            break
+    start_index, end_index = bounds
     article_lines = list(lines[start_index:end_index])
     article_norm_lines = list(norm_lines[start_index:end_index])
     return _strip_empty_edges(article_lines, article_norm_lines)
 
 
+def _paragraph_units(reference: ClauseReference) -> List[str]:
+    if reference.paragraph_unit in {"款", "段"}:
+        return [reference.paragraph_unit]
+    return ["款", "段"]
+
+
 def _extract_paragraph_slice(
     article_lines: Sequence[str],
     article_norm_lines: Sequence[str],
@@ -717,37 +524,12 @@ def _extract_paragraph_slice(
 ) -> Tuple[Optional[List[str]], Optional[List[str]]]:
     if reference.paragraph is None:
         return list(article_lines), list(article_norm_lines)
-    number_pattern = _number_pattern(reference.paragraph)
-    if not number_pattern:
-        return None, None
-    candidate_units: List[str] = []
-    if reference.paragraph_unit in {"款", "段"}:
-        candidate_units.append(reference.paragraph_unit)
-    else:
-        candidate_units.extend(["款", "段"])
-    start_index: Optional[int] = None
-    matched_unit: Optional[str] = None
-    for unit in candidate_units:
-        paragraph_pattern = re.compile(
-            rf"^\s*第\s*(?:{number_pattern})\s*{re.escape(unit)}"
-        )
-        for idx, norm_line in enumerate(article_norm_lines):
-            if paragraph_pattern.search(norm_line):
-                start_index = idx
-                matched_unit = unit
-                break
-        if start_index is not None:
-            break
-    if start_index is None or matched_unit is None:
-        return None, None
-    boundary_pattern = re.compile(
-        rf"^\s*第\s*{_CLAUSE_NUMBER_CLASS}+\s*{re.escape(matched_unit)}"
+    bounds = _find_paragraph_bounds(
+        article_norm_lines, reference.paragraph, _paragraph_units(reference)
     )
-    end_index = len(article_lines)
-    for idx in range(start_index + 1, len(article_norm_lines)):
-        if boundary_pattern.search(article_norm_lines[idx]):
-            end_index = idx
-            break
+    if bounds is None:
+        return None, None
+    start_index, end_index, _unit = bounds
     paragraph_lines = list(article_lines[start_index:end_index])
     paragraph_norm_lines = list(article_norm_lines[start_index:end_index])
     return _strip_empty_edges(paragraph_lines, paragraph_norm_lines)
@@ -756,12 +538,8 @@ def _extract_paragraph_slice(
 def _extract_item_text(text: str, reference: ClauseReference) -> Tuple[Optional[str], Optional[str]]:
     if reference.item is None:
         return None, None
-    item_pattern = re.compile(
-        rf"(?:[\(（]\s*({_CLAUSE_NUMBER_CLASS}+)\s*[\)）]\s*(?:项|目)?)|"
-        rf"(?:第\s*({_CLAUSE_NUMBER_CLASS}+)\s*(?:项|目))"
-    )
     matches: List[Tuple[int, int, int]] = []
-    for match in item_pattern.finditer(text):
+    for match in _ITEM_RE.finditer(text):
         number_text = match.group(1) or match.group(2)
         if not number_text:
             continue
@@ -834,6 +612,16 @@ def _resolve_document_path(path_value: str) -> Optional[Path]:
     return None
 
 
+def _file_key(path: Path) -> Optional[Tuple[int, int]]:
+    """Return ``(mtime_ns, size)`` of *path*, or ``None`` when it is missing."""
+
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 def _document_candidates(entry: Entry) -> Iterable[Tuple[str, Optional[str]]]:
     seen: set = set()
     for document in entry.documents:
@@ -851,83 +639,75 @@ def _document_candidates(entry: Entry) -> Iterable[Tuple[str, Optional[str]]]:
         yield entry.best_path, None
 
 
-def build_outline_from_text(text: str) -> List[Dict[str, Any]]:
-    """Build a hierarchical outline from extracted policy text."""
+@dataclass
+class TextStructure:
+    text: str
+    articles: Dict[int, Dict[str, Any]]
+    outline: List[Dict[str, Any]]
 
-    if not text:
-        return []
+    def slice(self, node: Dict[str, Any]) -> str:
+        return self.text[node["start"]:node["end"]]
 
-    lines, norm_lines = _prepare_clause_lines(text)
-    article_pattern = re.compile(rf"^第\s*({_CLAUSE_NUMBER_CLASS}+)\s*条")
-    paragraph_pattern = re.compile(rf"^第\s*({_CLAUSE_NUMBER_CLASS}+)\s*(款|段)")
-    item_pattern = re.compile(r"^[（(]\s*({_CLAUSE_NUMBER_CLASS}+)\s*[)）]")
-    bullet_pattern = re.compile(
-        rf"^({_CLAUSE_NUMBER_CLASS}+)\s*(?:、|\\.|．|﹒|:|：|·|•)"
-    )
 
-    outline: List[Dict[str, Any]] = []
-    current_article: Optional[Dict[str, Any]] = None
-    current_paragraph: Optional[Dict[str, Any]] = None
+@functools.lru_cache(maxsize=128)
+def _read_text_structure(path: str, _mtime_ns: int, _size: int) -> Optional[TextStructure]:
+    text_path = Path(path)
+    sidecar = structure_path_for(text_path)
+    try:
+        payload = json.loads(sidecar.read_text("utf-8"))
+        text = _sanitize_clause_text(_decode_bytes(text_path.read_bytes()))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != STRUCTURE_VERSION:
+        return None
+    if payload.get("text_length") != len(text):
+        return None
+    if payload.get("text_sha256") != hashlib.sha256(text.encode("utf-8")).hexdigest():
+        return None
+    articles = {
+        article["number"]: article
+        for article in reversed(payload.get("articles") or [])
+        if isinstance(article, dict)
+    }
+    return TextStructure(text=text, articles=articles, outline=payload.get("outline") or [])
 
-    for raw_line, norm_line in zip(lines, norm_lines):
-        label = raw_line.strip() or norm_line
-        if not label:
-            continue
 
-        article_match = article_pattern.match(norm_line)
-        if article_match:
-            article_number = _parse_clause_number(article_match.group(1))
-            current_article = {
-                "type": "article",
-                "number": article_number,
-                "label": label,
-                "children": [],
-            }
-            outline.append(current_article)
-            current_paragraph = None
-            continue
+def load_text_structure(text_path: Path) -> Optional[TextStructure]:
+    """Return the validated structure of *text_path*, or ``None`` without a usable sidecar.
 
-        if current_article is None:
-            continue
+    Results are cached per file version, so repeated clause requests for the
+    same policy skip both the disk read and the validation.
+    """
 
-        paragraph_match = paragraph_pattern.match(norm_line)
-        if paragraph_match:
-            paragraph_number = _parse_clause_number(paragraph_match.group(1))
-            current_paragraph = {
-                "type": "paragraph",
-                "number": paragraph_number,
-                "label": label,
-                "children": [],
-            }
-            current_article.setdefault("children", []).append(current_paragraph)
-            continue
+    try:
+        sidecar_stat = structure_path_for(text_path).stat()
+        stat = Path(text_path).stat()
+    except OSError:
+        return None
+    return _read_text_structure(
+        str(text_path),
+        max(stat.st_mtime_ns, sidecar_stat.st_mtime_ns),
+        stat.st_size,
+    )
 
-        item_match = item_pattern.match(norm_line)
-        if item_match:
-            item_number = _parse_clause_number(item_match.group(1))
-            parent = current_paragraph or current_article
-            parent.setdefault("children", []).append(
-                {
-                    "type": "item",
-                    "number": item_number,
-                    "label": label,
-                }
-            )
-            continue
 
-        bullet_match = bullet_pattern.match(norm_line)
-        if bullet_match:
-            item_number = _parse_clause_number(bullet_match.group(1))
-            parent = current_paragraph or current_article
-            parent.setdefault("children", []).append(
-                {
-                    "type": "item",
-                    "number": item_number,
-                    "label": label,
-                }
-            )
+def _is_text_document(path_value: str, doc_type: Optional[str]) -> bool:
+    return doc_type in {"text", "txt"} or path_value.lower().endswith((".txt", ".text", ".md"))
+
+
+def structured_text_for_entry(entry: "Entry") -> Optional[Tuple[Path, TextStructure]]:
+    """Return the first text document of *entry* that has a valid structure sidecar."""
 
-    return outline
+    for path_value, doc_type in _document_candidates(entry):
+        if not _is_text_document(str(path_value), doc_type):
+            continue
+        resolved = _resolve_document_path(str(path_value))
+        if resolved is None:
+            continue
+        structure = load_text_structure(resolved)
+        if structure is not None:
+            return resolved, structure
+    return None
 
 
 def _extract_docx_text(data: bytes) -> Tuple[Optional[str], Optional[str]]:
@@ -997,8 +777,38 @@ def _select_clause_document(entry: Entry) -> List[Tuple[Path, Optional[str]]]:
     return [(path, resolved_type) for _score, path, resolved_type in ranked]
 
 
+# Errors caused by the state of the document pool rather than by the document;
+# the same request may succeed later, so results carrying them are not cached.
+TRANSIENT_DOCUMENT_ERRORS = frozenset({"parser_busy", "parse_timeout", "parse_error"})
+
+_INLINE_DOCUMENT_TYPES = {"text", "txt", "md", "json"}
+_INLINE_DOCUMENT_SUFFIXES = {".txt", ".text", ".md", ".json"}
+
+
 def _load_document_text(
     path: Path, declared_type: Optional[str]
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    """Return ``(text, document type, error)``; heavy formats go to the document pool."""
+
+    pool = get_document_pool()
+    if (
+        pool is None
+        or (declared_type or "").lower() in _INLINE_DOCUMENT_TYPES
+        or path.suffix.lower() in _INLINE_DOCUMENT_SUFFIXES
+    ):
+        return _read_document_text(path, declared_type)
+    try:
+        return pool.run(_read_document_text, path, declared_type)
+    except DocumentPoolBusy:
+        return None, declared_type, "parser_busy"
+    except TimeoutError:
+        return None, declared_type, "parse_timeout"
+    except BrokenProcessPool:
+        return None, declared_type, "parse_error"
+
+
+def _read_document_text(
+    path: Path, declared_type: Optional[str]
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
     try:
         data = path.read_bytes()
@@ -1106,55 +916,57 @@ def parse_clause_reference(query: str) -> Optional[ClauseReference]:
     return reference
 
 
-def extract_clause_from_entry(
-    entry: Entry, reference: ClauseReference
-) -> ClauseResult:
-    result = ClauseResult(reference=reference)
-    candidates = _select_clause_document(entry)
-    if not candidates:
-        result.error = "document_unavailable"
-        return result
-    article_lines: List[str]
-    article_norm_lines: List[str]
-    last_error: Optional[str] = None
+def _clause_lines(text: str) -> Tuple[List[str], List[str]]:
+    lines = text.split("\n")
+    return lines, [_normalize_clause_line(line) for line in lines]
 
-    for path, declared_type in candidates:
-        candidate_text, doc_type, error = _load_document_text(path, declared_type)
-        if error or candidate_text is None:
-            last_error = error or "document_unavailable"
-            continue
-        lines, norm_lines = _prepare_clause_lines(candidate_text)
-        article_slice = _extract_article_slice(lines, norm_lines, reference)
-        if article_slice[0] is None or article_slice[1] is None:
-            if last_error is None:
-                last_error = "article_not_found"
-            continue
-        article_lines, article_norm_lines = article_slice
-        result.source_path = str(path)
-        if doc_type:
-            result.document_type = doc_type
-        break
-    else:
-        result.error = last_error or "document_unavailable"
-        return result
 
+def _structured_clause(
+    path: Path, structure: TextStructure, reference: ClauseReference
+) -> Optional[ClauseResult]:
+    article = structure.articles.get(reference.article)
+    if article is None:
+        return None
+    result = ClauseResult(reference=reference, source_path=str(path), document_type="text")
+    article_lines, article_norm_lines = _clause_lines(structure.slice(article))
+    paragraph_slice: Optional[Tuple[List[str], List[str]]] = None
+    if reference.paragraph is not None:
+        paragraphs = {
+            (paragraph["unit"], paragraph["number"]): paragraph
+            for paragraph in reversed(article.get("paragraphs") or [])
+        }
+        for unit in _paragraph_units(reference):
+            paragraph = paragraphs.get((unit, reference.paragraph))
+            if paragraph is not None:
+                paragraph_slice = _clause_lines(structure.slice(paragraph))
+                break
+    _fill_clause_result(result, reference, article_lines, article_norm_lines, paragraph_slice)
+    return result
+
+
+def _fill_clause_result(
+    result: ClauseResult,
+    reference: ClauseReference,
+    article_lines: List[str],
+    article_norm_lines: List[str],
+    paragraph_slice: Optional[Tuple[Optional[List[str]], Optional[List[str]]]] = None,
+) -> None:
     result.article_matched = True
     article_text = _compose_text(article_lines)
     result.article_text = article_text
-    paragraph_slice = _extract_paragraph_slice(
-        article_lines, article_norm_lines, reference
-    )
+    if paragraph_slice is None:
+        paragraph_slice = _extract_paragraph_slice(
+            article_lines, article_norm_lines, reference
+        )
     paragraph_lines: List[str]
     if paragraph_slice[0] is None or paragraph_slice[1] is None:
         paragraph_lines = article_lines
-        paragraph_norm_lines = article_norm_lines
         if reference.paragraph is not None:
             result.paragraph_matched = False
         else:
             result.paragraph_matched = None
     else:
         paragraph_lines = paragraph_slice[0]
-        paragraph_norm_lines = paragraph_slice[1]
         result.paragraph_matched = True
     paragraph_text = _compose_text(paragraph_lines)
     if paragraph_text:
@@ -1172,13 +984,81 @@ def extract_clause_from_entry(
         result.item_matched = None
         if reference.paragraph is not None and result.paragraph_matched is False:
             result.error = "paragraph_not_found"
+
+
+# Documents already loaded and split into lines, keyed by (path, declared type).
+# Callers resolving many references share one dict so each file is read once.
+ClauseDocumentCache = Dict[
+    Tuple[Path, Optional[str]],
+    Tuple[Optional[Tuple[List[str], List[str]]], Optional[str], Optional[str]],
+]
+
+
+def _load_clause_document(
+    path: Path,
+    declared_type: Optional[str],
+    document_cache: Optional[ClauseDocumentCache],
+) -> Tuple[Optional[Tuple[List[str], List[str]]], Optional[str], Optional[str]]:
+    key = (path, declared_type)
+    if document_cache is not None and key in document_cache:
+        return document_cache[key]
+    text, doc_type, error = _load_document_text(path, declared_type)
+    lines = _prepare_clause_lines(text) if not error and text is not None else None
+    loaded = (lines, doc_type, error)
+    if document_cache is not None and error not in TRANSIENT_DOCUMENT_ERRORS:
+        document_cache[key] = loaded
+    return loaded
+
+
+def extract_clause_from_entry(
+    entry: Entry,
+    reference: ClauseReference,
+    document_cache: Optional[ClauseDocumentCache] = None,
+) -> ClauseResult:
+    structured = structured_text_for_entry(entry)
+    if structured is not None:
+        result = _structured_clause(structured[0], structured[1], reference)
+        if result is not None:
+            return result
+
+    result = ClauseResult(reference=reference)
+    candidates = _select_clause_document(entry)
+    if not candidates:
+        result.error = "document_unavailable"
+        return result
+    article_lines: List[str]
+    article_norm_lines: List[str]
+    last_error: Optional[str] = None
+
+    for path, declared_type in candidates:
+        prepared, doc_type, error = _load_clause_document(path, declared_type, document_cache)
+        if error or prepared is None:
+            last_error = error or "document_unavailable"
+            continue
+        lines, norm_lines = prepared
+        article_slice = _extract_article_slice(lines, norm_lines, reference)
+        if article_slice[0] is None or article_slice[1] is None:
+            if last_error is None:
+                last_error = "article_not_found"
+            continue
+        article_lines, article_norm_lines = article_slice
+        result.source_path = str(path)
+        if doc_type:
+            result.document_type = doc_type
+        break
+    else:
+        result.error = last_error or "document_unavailable"
+        return result
+
+    _fill_clause_result(result, reference, article_lines, article_norm_lines)
     return result
 
 def load_entries(json_path: str, source_task: Optional[str] = None) -> List[Entry]:
-    with open(json_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    # Include updates the crawler has only journaled so far.
+    data = read_state_data(json_path)
+    raw_entries = data.get('entries', []) if isinstance(data, dict) else data
     es = []
-    for i, raw in enumerate(data.get('entries', []), 1):
+    for i, raw in enumerate(raw_entries, 1):
         e = Entry(
             id=raw.get('serial', i),
             title=raw.get('title', ''),
@@ -1198,45 +1078,80 @@ def jaccard(a: List[str], b: List[str]) -> float:
     uni   = len(sa | sb)
     return inter / uni if uni else 0.0
 
-def fuzzy_score(query: str, e: Entry) -> float:
-    qn = norm_text(query)
+_CJK_PHRASE_RE = re.compile(r'[\u4e00-\u9fff]{2,}')
+
+
+@dataclass
+class QueryFeatures:
+    """Signals ``fuzzy_score`` extracts from a query, parsed once per search."""
+
+    normalized: str
+    doc_no: Optional[str]
+    years: List[str]
+    doctype: Optional[str]
+    agency: Optional[str]
+    phrases: List[str]
+    tokens: List[str]
+
+    @classmethod
+    def parse(cls, query: str) -> "QueryFeatures":
+        qn = norm_text(query)
+        return cls(
+            normalized=qn,
+            doc_no=extract_docno(qn),
+            years=re.findall(r'(19|20)\d{2}', qn),
+            doctype=guess_doctype(qn),
+            agency=guess_agency(qn),
+            phrases=_CJK_PHRASE_RE.findall(qn),
+            tokens=tokenize_zh(qn),
+        )
+
+
+def _strip_docno(docno: str) -> str:
+    return docno.replace('[', '').replace(']', '')
+
+
+def metadata_boost(q: QueryFeatures, e: Entry) -> float:
+    """Doc-number, year, doctype and agency signals shared by every ranking mode."""
+
     score = 0.0
 
     # 1) Doc number hard match (very strong)
-    q_doc = extract_docno(qn)
-    if q_doc and e.doc_no:
-        if q_doc == e.doc_no:
+    if q.doc_no and e.doc_no:
+        if q.doc_no == e.doc_no:
             score += 120.0
-        elif q_doc.replace('[','').replace(']','') in (e.doc_no or '').replace('[','').replace(']',''):
+        elif _strip_docno(q.doc_no) in _strip_docno(e.doc_no):
             score += 80.0
 
     # 2) Year hint: boost match, small penalty mismatch when query has a clear year
-    q_years = re.findall(r'(19|20)\d{2}', qn)
-    if q_years:
-        if e.year and e.year in q_years:
+    if q.years:
+        if e.year and e.year in q.years:
             score += 30.0
         elif e.year:
             score -= 5.0
 
     # 3) Doctype hint
-    q_doctype = guess_doctype(qn)
-    if q_doctype and e.doctype == q_doctype:
+    if q.doctype and e.doctype == q.doctype:
         score += 15.0
 
     # 4) Agency hint
-    q_agency = guess_agency(qn)
-    if q_agency and e.agency and (q_agency in e.agency or e.agency in q_agency):
+    if q.agency and e.agency and (q.agency in e.agency or e.agency in q.agency):
         score += 10.0
 
+    return score
+
+
+def score_features(q: QueryFeatures, e: Entry) -> float:
+    qn = q.normalized
+    score = metadata_boost(q, e)
+
     # 5) Exact phrase presence for CJK words from the query
-    phrases = [ph for ph in re.findall(r'[\u4e00-\u9fff]{2,}', qn) if len(ph) >= 2]
-    for ph in phrases:
+    for ph in q.phrases:
         if ph in e.norm_title:
             score += min(8.0, 2.0 + len(ph) * 0.8)
 
     # 6) Token overlap (Jaccard)
-    q_tokens = tokenize_zh(qn)
-    overlap = jaccard(q_tokens, e.tokens)
+    overlap = jaccard(q.tokens, e.tokens)
     score += 40.0 * overlap
 
     # 7) Exact substring boosts
@@ -1246,11 +1161,126 @@ def fuzzy_score(query: str, e: Entry) -> float:
         score += 10.0
 
     # 8) Prefer PDF path
-    if e.best_path and e.best_path.lower().endswith('.pdf'):
+    if _has_pdf_path(e):
         score += 3.0
 
     return score
 
+
+def fuzzy_score(query: str, e: Entry) -> float:
+    return score_features(QueryFeatures.parse(query), e)
+
+
+def _has_pdf_path(e: Entry) -> bool:
+    return bool(e.best_path and e.best_path.lower().endswith('.pdf'))
+
+
+def _cjk_bigrams(text: str) -> Set[str]:
+    grams: Set[str] = set()
+    for run in _CJK_PHRASE_RE.findall(text):
+        for i in range(len(run) - 1):
+            grams.add(run[i:i + 2])
+    return grams
+
+
+class SearchIndex:
+    """Postings over entry metadata so :meth:`PolicyFinder.search` scores few entries.
+
+    Every ``fuzzy_score`` signal except the year hint and the PDF bonus needs
+    the entry to share something with the query: a document number, a title
+    token, the CJK bigrams of a query phrase, a doctype or an agency. Those
+    entries form the candidate set and get the full score. Everything else
+    scores only the year/PDF baseline, which depends on two attributes, so the
+    remaining entries are kept in per-(PDF, year) postings in load order and
+    the top of each list fills any slots the candidates leave open. Results,
+    including tie order, match a linear scan.
+    """
+
+    def __init__(self, entries: Sequence[Entry]):
+        self.entries: List[Entry] = list(entries)
+        self.by_docno: Dict[str, List[int]] = {}
+        self.by_token: Dict[str, List[int]] = {}
+        self.by_bigram: Dict[str, List[int]] = {}
+        self.by_doctype: Dict[str, List[int]] = {}
+        self.by_agency: Dict[str, List[int]] = {}
+        self.by_baseline: Dict[Tuple[bool, Optional[str]], List[int]] = {}
+        for pos, entry in enumerate(self.entries):
+            if entry.doc_no:
+                self.by_docno.setdefault(entry.doc_no, []).append(pos)
+            for token in set(entry.tokens):
+                self.by_token.setdefault(token, []).append(pos)
+            for gram in _cjk_bigrams(entry.norm_title):
+                self.by_bigram.setdefault(gram, []).append(pos)
+            if entry.doctype:
+                self.by_doctype.setdefault(entry.doctype, []).append(pos)
+            if entry.agency:
+                self.by_agency.setdefault(entry.agency, []).append(pos)
+            key = (_has_pdf_path(entry), entry.year)
+            self.by_baseline.setdefault(key, []).append(pos)
+
+    def candidates(self, q: QueryFeatures) -> Set[int]:
+        found: Set[int] = set()
+        qn = q.normalized
+        stripped_query_doc = _strip_docno(q.doc_no) if q.doc_no else None
+        for docno, positions in self.by_docno.items():
+            if docno in qn or (
+                stripped_query_doc is not None
+                and (docno == q.doc_no or stripped_query_doc in _strip_docno(docno))
+            ):
+                found.update(positions)
+        for token in q.tokens:
+            found.update(self.by_token.get(token, ()))
+        for phrase in q.phrases:
+            matches: Optional[Set[int]] = None
+            for i in range(len(phrase) - 1):
+                postings = self.by_bigram.get(phrase[i:i + 2])
+                if not postings:
+                    matches = set()
+                    break
+                matches = set(postings) if matches is None else matches & set(postings)
+                if not matches:
+                    break
+            if matches:
+                found.update(matches)
+        for doctype, positions in self.by_doctype.items():
+            if doctype == q.doctype or doctype in qn:
+                found.update(positions)
+        if q.agency:
+            for agency, positions in self.by_agency.items():
+                if q.agency in agency or agency in q.agency:
+                    found.update(positions)
+        return found
+
+    def _baseline(self, q: QueryFeatures, has_pdf: bool, year: Optional[str]) -> float:
+        score = 0.0
+        if q.years and year:
+            score += 30.0 if year in q.years else -5.0
+        if has_pdf:
+            score += 3.0
+        return score
+
+    def search(self, query: str, topk: int = 1) -> List[Tuple[Entry, float]]:
+        if topk < 1:
+            return []
+        q = QueryFeatures.parse(query)
+        candidates = self.candidates(q)
+        scored: List[Tuple[int, float]] = [
+            (pos, score_features(q, self.entries[pos])) for pos in candidates
+        ]
+        for (has_pdf, year), positions in self.by_baseline.items():
+            baseline = self._baseline(q, has_pdf, year)
+            taken = 0
+            for pos in positions:
+                if taken >= topk:
+                    break
+                if pos in candidates:
+                    continue
+                scored.append((pos, baseline))
+                taken += 1
+        scored.sort(key=lambda item: (-item[1], item[0]))
+        return [(self.entries[pos], score) for pos, score in scored[:topk]]
+
+
 def _flatten_paths(paths: Iterable[Any]) -> List[str]:
     normalized: List[str] = []
     for item in paths:
@@ -1337,15 +1367,37 @@ def _dedupe_entries(entries: List[Entry]) -> List[Entry]:
     return deduped
 
 
+_UNCACHED = object()
+
+SEARCH_MODES = ("fuzzy", "tfidf")
+
+# TF-IDF mode re-scores this many of the best cosine matches (at least) with
+# ``metadata_boost``; the cosine is scaled to sit alongside those boosts.
+TFIDF_CANDIDATES = 50
+TFIDF_WEIGHT = 100.0
+
+
 class PolicyFinder:
-    def __init__(self, *json_paths: Any):
+    def __init__(
+        self,
+        *json_paths: Any,
+        text_cache_bytes: int = DEFAULT_TEXT_CACHE_BYTES,
+        compress_text_cache: bool = True,
+    ):
         self.entries: List[Entry] = []
         self.idx_loaded = False
         self._entries_by_id: Dict[int, Entry] = {}
         self._entries_by_norm: Dict[str, List[Entry]] = {}
-        self._text_cache: Dict[int, Optional[str]] = {}
-        self._normalized_text_cache: Dict[int, Optional[str]] = {}
+        self._title_index = TitleIndex()
+        # Raw and normalised texts share one budget, keyed by (kind, entry id).
+        self.text_cache = TextCache(text_cache_bytes, compress=compress_text_cache)
         self._excluded_entries: List[Entry] = []
+        self._search_index = SearchIndex([])
+        self._text_index: Optional[FullTextIndex] = None
+        self._text_index_lookup: Optional["ClauseLookup"] = None
+        self._text_index_lock = threading.Lock()
+        self._tfidf: Optional[TfidfRanker] = None
+        self._tfidf_lock = threading.Lock()
         if json_paths:
             self.load(*json_paths)
 
@@ -1357,29 +1409,98 @@ class PolicyFinder:
         for path in paths:
             task_name = _guess_task_from_path(path)
             entries.extend(load_entries(path, task_name))
-        deduped_entries = _dedupe_entries(entries)
+        self.index_entries(entries)
+
+    def index_entries(self, entries: Iterable[Entry]) -> None:
+        """Deduplicate freshly built *entries* and make them searchable."""
+
+        deduped_entries = _dedupe_entries(list(entries))
         self._excluded_entries = [entry for entry in deduped_entries if not entry.is_policy]
         self.entries = [entry for entry in deduped_entries if entry.is_policy]
         self.idx_loaded = True
         self._rebuild_indexes()
 
-    def search(self, query: str, topk: int = 1) -> List[Tuple[Entry, float]]:
-        assert self.idx_loaded, "Index not loaded"
-        scored: List[Tuple[Entry, float]] = []
-        for e in self.entries:
-            s = fuzzy_score(query, e)
-            scored.append((e, s))
-        scored.sort(key=lambda x: x[1], reverse=True)
-        return scored[:topk]
-
-    def extract_clause(self, entry: Entry, reference: ClauseReference) -> ClauseResult:
-        return extract_clause_from_entry(entry, reference)
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Sequence[Entry],
+        excluded_entries: Sequence[Entry] = (),
+        search_index: Optional[SearchIndex] = None,
+    ) -> "PolicyFinder":
+        """Create a finder from entries that were already built and deduplicated."""
+
+        finder = cls()
+        finder.entries = list(entries)
+        finder._excluded_entries = list(excluded_entries)
+        finder.idx_loaded = True
+        finder._rebuild_indexes(search_index)
+        return finder
+
+    def search(
+        self, query: str, topk: int = 1, mode: str = "fuzzy"
+    ) -> List[Tuple[Entry, float]]:
+        """Return the *topk* best entries for *query*.
+
+        ``mode="fuzzy"`` ranks with :func:`fuzzy_score`; ``mode="tfidf"``
+        ranks by TF-IDF cosine over title and remark bigrams plus
+        :func:`metadata_boost` on the leading candidates.
+        """
 
-    def _rebuild_indexes(self) -> None:
+        assert self.idx_loaded, "Index not loaded"
+        if mode == "fuzzy":
+            return self._search_index.search(query, topk)
+        if mode == "tfidf":
+            return self._tfidf_search(query, topk)
+        raise ValueError(f"Unknown search mode: {mode}")
+
+    def tfidf_ranker(self) -> TfidfRanker:
+        """Return the TF-IDF ranker, building it on first use."""
+
+        with self._tfidf_lock:
+            if self._tfidf is None:
+                self._tfidf = TfidfRanker(
+                    [f"{entry.norm_title} {norm_text(entry.remark)}" for entry in self.entries]
+                )
+            return self._tfidf
+
+    def _tfidf_search(self, query: str, topk: int) -> List[Tuple[Entry, float]]:
+        if topk < 1:
+            return []
+        cosine = self.tfidf_ranker().scores(query)
+        leading = heapq.nlargest(
+            max(topk, TFIDF_CANDIDATES),
+            cosine.items(),
+            key=lambda item: (item[1], -item[0]),
+        )
+        features = QueryFeatures.parse(query)
+        scored = [
+            (
+                TFIDF_WEIGHT * similarity + metadata_boost(features, self.entries[position]),
+                position,
+            )
+            for position, similarity in leading
+        ]
+        scored.sort(key=lambda item: (-item[0], item[1]))
+        return [(self.entries[position], score) for score, position in scored[:topk]]
+
+    def extract_clause(
+        self,
+        entry: Entry,
+        reference: ClauseReference,
+        document_cache: Optional[ClauseDocumentCache] = None,
+    ) -> ClauseResult:
+        return extract_clause_from_entry(entry, reference, document_cache)
+
+    def _rebuild_indexes(self, search_index: Optional[SearchIndex] = None) -> None:
         self._entries_by_id = {}
         self._entries_by_norm = {}
-        self._text_cache = {}
-        self._normalized_text_cache = {}
+        self.text_cache.clear()
+        self._search_index = (
+            search_index if search_index is not None else SearchIndex(self.entries)
+        )
+        self._text_index = None
+        self._text_index_lookup = None
+        self._tfidf = None
         for entry in self.entries:
             self._entries_by_id[entry.id] = entry
             normalized = entry.norm_title or norm_text(entry.title)
@@ -1387,11 +1508,20 @@ class PolicyFinder:
                 continue
             bucket = self._entries_by_norm.setdefault(normalized, [])
             bucket.append(entry)
+        self._title_index = TitleIndex(self._entries_by_norm)
 
     def all_entries(self) -> List[Entry]:
         assert self.idx_loaded, "Index not loaded"
         return list(self.entries)
 
+    def excluded_entries(self) -> List[Entry]:
+        assert self.idx_loaded, "Index not loaded"
+        return list(self._excluded_entries)
+
+    @property
+    def search_index(self) -> SearchIndex:
+        return self._search_index
+
     def find_entry(self, identifier: Any) -> Optional[Entry]:
         if isinstance(identifier, Entry):
             return identifier
@@ -1413,20 +1543,18 @@ class PolicyFinder:
             bucket = self._entries_by_norm.get(normalized)
             if bucket:
                 return bucket[0]
+            if numeric is None:
+                close = self._title_index.close_match(normalized)
+                if close is not None:
+                    return self._entries_by_norm[close][0]
         return None
 
-    def _store_text_cache(self, entry_id: int, text: str) -> str:
-        self._text_cache[entry_id] = text
-        self._normalized_text_cache[entry_id] = norm_text(text)
-        return text
-
     def _text_document_candidates(self, entry: Entry) -> Iterable[Path]:
         seen: set = set()
         for path_value, declared_type in _document_candidates(entry):
             path_str = str(path_value)
-            lowered = path_str.lower()
-            doc_type = (declared_type or "").lower() if declared_type else ""
-            if doc_type in {"text", "txt"} or lowered.endswith((".txt", ".text", ".md")):
+            doc_type = (declared_type or "").lower() if declared_type else None
+            if _is_text_document(path_str, doc_type):
                 if path_str in seen:
                     continue
                 seen.add(path_str)
@@ -1434,45 +1562,171 @@ class PolicyFinder:
                 if resolved:
                     yield resolved
 
-    def get_entry_text(
+    def _entry_text_paths(
         self, entry: Entry, clause_lookup: Optional["ClauseLookup"] = None
-    ) -> Optional[str]:
-        if entry.id in self._text_cache:
-            return self._text_cache[entry.id]
-
-        for candidate in self._text_document_candidates(entry):
-            text, _doc_type, error = _load_document_text(candidate, "text")
-            if error or text is None:
-                continue
-            return self._store_text_cache(entry.id, text)
+    ) -> List[Path]:
+        """Return the text files tried for *entry*, in order, without reading them."""
 
+        paths = list(self._text_document_candidates(entry))
         if clause_lookup is not None:
             text_path = clause_lookup.find_text_path(entry.title)
             if text_path:
-                text, _doc_type, error = _load_document_text(text_path, "text")
-                if not error and text is not None:
-                    return self._store_text_cache(entry.id, text)
+                paths.append(Path(text_path))
+        return paths
+
+    def _read_entry_text(
+        self,
+        entry: Entry,
+        clause_lookup: Optional["ClauseLookup"] = None,
+        paths: Optional[Sequence[Path]] = None,
+    ) -> Optional[str]:
+        """Return the text of the first readable file among *paths*.
+
+        *paths* defaults to :meth:`_entry_text_paths`.
+        """
 
-        self._text_cache[entry.id] = None
-        self._normalized_text_cache[entry.id] = None
+        if paths is None:
+            paths = self._entry_text_paths(entry, clause_lookup)
+        for candidate in paths:
+            text, _doc_type, error = _load_document_text(candidate, "text")
+            if error or text is None:
+                continue
+            return text
         return None
 
+    def get_entry_text(
+        self, entry: Entry, clause_lookup: Optional["ClauseLookup"] = None
+    ) -> Optional[str]:
+        key = ("text", entry.id)
+        cached = self.text_cache.get(key, _UNCACHED)
+        if cached is not _UNCACHED:
+            return cached
+        text = self._read_entry_text(entry, clause_lookup)
+        self.text_cache.put(key, text)
+        return text
+
     def get_entry_normalized_text(
         self, entry: Entry, clause_lookup: Optional["ClauseLookup"] = None
     ) -> Optional[str]:
-        if entry.id in self._normalized_text_cache:
-            return self._normalized_text_cache[entry.id]
+        key = ("normalized", entry.id)
+        cached = self.text_cache.get(key, _UNCACHED)
+        if cached is not _UNCACHED:
+            return cached
+        text = self.get_entry_text(entry, clause_lookup)
+        normalized = norm_text(text) if text is not None else None
+        self.text_cache.put(key, normalized)
+        return normalized
+
+    def text_cache_stats(self) -> Dict[str, int]:
+        return self.text_cache.stats()
+
+    def get_entry_outline(
+        self, entry: Entry, clause_lookup: Optional["ClauseLookup"] = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Return the outline of *entry*, read from its structure sidecar when present."""
+
+        text_paths = list(self._text_document_candidates(entry))
+        if clause_lookup is not None:
+            text_path = clause_lookup.find_text_path(entry.title)
+            if text_path:
+                text_paths.append(Path(text_path))
+        for text_path in text_paths:
+            structure = load_text_structure(text_path)
+            if structure is not None:
+                return structure.outline
         text = self.get_entry_text(entry, clause_lookup)
         if text is None:
-            self._normalized_text_cache[entry.id] = None
             return None
-        normalized = norm_text(text)
-        self._normalized_text_cache[entry.id] = normalized
-        return normalized
+        return build_outline_from_text(text)
+
+    def build_text_index(
+        self,
+        clause_lookup: Optional["ClauseLookup"] = None,
+        previous: Optional[FullTextIndex] = None,
+    ) -> FullTextIndex:
+        """Index the extracted text of every entry for :meth:`keyword_search`.
+
+        This is the only step that reads text files; servers call it once at
+        startup so keyword queries are answered from memory. Texts are read
+        past :attr:`text_cache` so indexing the corpus does not flush it.
+
+        Each entry is keyed by its candidate text files with their mtime and
+        size. Entries whose key is unchanged in *previous* (the index of an
+        earlier generation) have their postings copied over, so a reload only
+        reads the texts that changed.
+        """
+
+        assert self.idx_loaded, "Index not loaded"
+        index = FullTextIndex()
+        previous_ids: Dict[Any, int] = {}
+        if previous is not None:
+            for doc_id, key in getattr(previous, "doc_keys", {}).items():
+                previous_ids.setdefault(key, doc_id)
+        reused: Dict[int, List[int]] = {}
+        for position, entry in enumerate(self.entries):
+            paths = self._entry_text_paths(entry, clause_lookup)
+            index.sources.extend(str(path) for path in paths)
+            key = tuple((str(path), _file_key(path)) for path in paths)
+            index.doc_keys[position] = key
+            previous_id = previous_ids.get(key)
+            if previous_id is not None:
+                reused.setdefault(previous_id, []).append(position)
+                continue
+            text = self._read_entry_text(entry, clause_lookup, paths)
+            normalized_text = norm_text(text) if text else None
+            if normalized_text:
+                index.add(position, normalized_text)
+        if previous is not None:
+            index.copy_documents(previous, reused)
+        index.sources = list(dict.fromkeys(index.sources))
+        self._text_index = index
+        self._text_index_lookup = clause_lookup
+        return index
+
+    @property
+    def text_index(self) -> Optional[FullTextIndex]:
+        return self._text_index
+
+    @property
+    def text_index_uses_lookup(self) -> bool:
+        return self._text_index_lookup is not None
+
+    def install_text_index(
+        self, index: FullTextIndex, clause_lookup: Optional["ClauseLookup"] = None
+    ) -> None:
+        """Use a previously built *index*, e.g. one restored from a snapshot."""
+
+        with self._text_index_lock:
+            self._text_index = index
+            self._text_index_lookup = clause_lookup
+
+    def _text_index_current(self, clause_lookup: Optional["ClauseLookup"]) -> bool:
+        return self._text_index is not None and (
+            clause_lookup is None or self._text_index_lookup is not None
+        )
+
+    def ensure_text_index(self, clause_lookup: Optional["ClauseLookup"]) -> FullTextIndex:
+        index = self._text_index
+        if self._text_index_current(clause_lookup):
+            return index
+        # Concurrent first queries wait for one build instead of each reading
+        # the corpus.
+        with self._text_index_lock:
+            if not self._text_index_current(clause_lookup):
+                self.build_text_index(clause_lookup)
+            return self._text_index
 
     def keyword_search(
         self, query: str, clause_lookup: Optional["ClauseLookup"] = None
     ) -> List[Tuple[Entry, int, int, int]]:
+        """Return ``(entry, title_exact, title_hits, content_hits)`` matches.
+
+        Title matches rank first, then entries whose text contains more of the
+        query tokens (``content_hits``); an entry sharing only part of a token
+        with the text does not match. BM25 over the full-text index orders
+        entries with the same coverage.
+        """
+
         assert self.idx_loaded, "Index not loaded"
         normalized_query = norm_text(query)
         tokens = [token for token in tokenize_zh(normalized_query) if token]
@@ -1480,40 +1734,20 @@ class PolicyFinder:
         if not normalized_query and not unique_tokens:
             return []
 
-        results: List[Tuple[Entry, int, int, int]] = []
-        token_count = len(unique_tokens)
+        phrases = [query_terms(token) for token in (unique_tokens or [normalized_query])]
+        terms = [term for phrase in phrases for term in phrase]
+        content = self.ensure_text_index(clause_lookup).search(terms, phrases)
 
-        for entry in self.entries:
+        ranked: List[Tuple[Entry, int, int, int, float]] = []
+        for position, entry in enumerate(self.entries):
             title_exact = 1 if normalized_query and normalized_query in entry.norm_title else 0
             title_hits = sum(1 for token in unique_tokens if token in entry.norm_title)
-
-            content_hits = 0
-            need_content = False
-            if title_exact or title_hits > 0:
-                need_content = False
-            elif token_count or normalized_query:
-                need_content = True
-
-            if need_content:
-                normalized_text = self.get_entry_normalized_text(entry, clause_lookup)
-                if normalized_text:
-                    if token_count:
-                        content_hits = sum(
-                            1 for token in unique_tokens if token in normalized_text
-                        )
-                    elif normalized_query:
-                        content_hits = 1 if normalized_query in normalized_text else 0
-            else:
-                if token_count:
-                    content_hits = title_hits
-                elif normalized_query and title_exact:
-                    content_hits = 1
-
+            content_score, content_hits = content.get(position, (0.0, 0))
             if title_exact or title_hits > 0 or content_hits > 0:
-                results.append((entry, title_exact, title_hits, content_hits))
+                ranked.append((entry, title_exact, title_hits, content_hits, content_score))
 
-        results.sort(key=lambda item: (-item[1], -item[2], -item[3], item[0].title))
-        return results
+        ranked.sort(key=lambda item: (-item[1], -item[2], -item[3], -item[4], item[0].title))
+        return [(entry, exact, hits, content_hits) for entry, exact, hits, content_hits, _ in ranked]
 
 def main(argv: List[str]):
     if len(argv) < 2:
@@ -0,0 +1,132 @@
+"""LRU cache for search responses with request coalescing."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
+
+
+__all__ = [
+    "DEFAULT_QUERY_CACHE_SIZE",
+    "QueryCache",
+]
+
+
+DEFAULT_QUERY_CACHE_SIZE = 1024
+
+T = TypeVar("T")
+
+
+class _Pending:
+    __slots__ = ("done", "value", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class QueryCache:
+    """Remember the last *max_entries* computed responses.
+
+    Every lookup names the index that answered it (``owner``, normally the
+    :class:`PolicyFinder` instance). A reload publishes a new finder, so the
+    first lookup against it empties the cache and results computed from the
+    old index are never served again. Concurrent misses for the same key are
+    coalesced: one caller computes while the others wait for its result (or
+    its exception). Cached values are shared between callers and must be
+    treated as read-only. A value rejected by the *cacheable* predicate of
+    :meth:`get_or_compute` is handed to the coalesced callers but not stored.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_QUERY_CACHE_SIZE) -> None:
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._pending: Dict[Hashable, _Pending] = {}
+        self._owner: Any = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _bind(self, owner: Any) -> None:
+        if owner is not self._owner:
+            if self._owner is not None:
+                self.invalidations += 1
+            self._owner = owner
+            self._entries.clear()
+            self._pending.clear()
+
+    def get_or_compute(
+        self,
+        owner: Any,
+        key: Hashable,
+        compute: Callable[[], T],
+        cacheable: Optional[Callable[[T], bool]] = None,
+    ) -> T:
+        with self._lock:
+            self._bind(owner)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            pending = self._pending.get(key)
+            if pending is not None:
+                self.coalesced += 1
+                leader = False
+            else:
+                pending = _Pending()
+                self._pending[key] = pending
+                self.misses += 1
+                leader = True
+
+        if not leader:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.value
+
+        try:
+            value = compute()
+        except BaseException as exc:
+            pending.error = exc
+            raise
+        else:
+            pending.value = value
+            with self._lock:
+                if (
+                    owner is self._owner
+                    and self.max_entries
+                    and (cacheable is None or cacheable(value))
+                ):
+                    self._entries[key] = value
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+            return value
+        finally:
+            with self._lock:
+                if self._pending.get(key) is pending:
+                    del self._pending[key]
+            pending.done.set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses + self.coalesced
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "invalidations": self.invalidations,
+                "hit_ratio": round((self.hits + self.coalesced) / lookups, 4) if lookups else None,
+            }
@@ -0,0 +1,224 @@
+"""Background reloading of the search index when crawl output changes."""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+from pbc_regulations.icrawler.state import journal_path
+
+from .clause_lookup import ClauseLookup, ClauseLookupEntry
+from .policy_finder import Entry, PolicyFinder, _guess_task_from_path, load_entries
+
+
+logger = logging.getLogger(__name__)
+
+PathLike = Union[str, Path]
+StatKey = Optional[Tuple[int, int]]
+Fingerprint = Optional[Tuple[Tuple[int, int], StatKey]]
+ReloadCallback = Callable[[PolicyFinder, Optional[ClauseLookup]], None]
+
+
+__all__ = ["SearchIndexReloader"]
+
+
+def _stat_key(path: Path) -> StatKey:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _fingerprint(path: Path) -> Fingerprint:
+    """Return the mtime and size of *path* and of its state journal, if any."""
+
+    key = _stat_key(path)
+    if key is None:
+        return None
+    return (key, _stat_key(Path(journal_path(str(path)))))
+
+
+class SearchIndexReloader:
+    """Keep a :class:`PolicyFinder`/:class:`ClauseLookup` pair in sync with disk.
+
+    :meth:`check` compares the mtime and size of every state and extract file,
+    and of each state file's journal, with the last seen values. Only changed files are parsed again: built
+    entries and clause entries are cached per file, so one crawl finishing
+    rebuilds one task before the combined entry list is deduplicated. The
+    full-text index is built before publishing, so no request reads the
+    corpus itself; only entries whose text files changed (by mtime and size)
+    are read again. The new pair is published by replacing a single tuple, so a request that already
+    called :meth:`current` keeps using a consistent index while the next one
+    sees the new generation. :meth:`start` runs :meth:`check` on a daemon
+    thread.
+
+    When the reloader is seeded with an index restored from a snapshot, the
+    per-file caches start empty and the first reload parses every state file
+    once.
+    """
+
+    def __init__(
+        self,
+        state_paths: Sequence[PathLike],
+        extract_paths: Sequence[PathLike] = (),
+        *,
+        finder: Optional[PolicyFinder] = None,
+        clause_lookup: Optional[ClauseLookup] = None,
+        on_reload: Optional[ReloadCallback] = None,
+    ) -> None:
+        self.state_paths = [Path(path) for path in state_paths]
+        self.extract_paths = [Path(path) for path in extract_paths if path]
+        self.on_reload = on_reload
+        self._state_entries: Dict[Path, List[Entry]] = {}
+        self._extract_entries: Dict[Path, List[ClauseLookupEntry]] = {}
+        self._fingerprints: Dict[Path, Fingerprint] = {}
+        self._check_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.generation = 0
+        self.last_reload_seconds: Optional[float] = None
+        self.last_reload_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+        started = time.perf_counter()
+        for path in [*self.state_paths, *self.extract_paths]:
+            self._fingerprints[path] = _fingerprint(path)
+        if finder is None:
+            finder = self._build_finder(self.state_paths)
+        if clause_lookup is None and self.extract_paths:
+            clause_lookup = self._build_clause_lookup(self.extract_paths)
+        finder.ensure_text_index(clause_lookup)
+        self._current: Tuple[PolicyFinder, Optional[ClauseLookup]] = (finder, clause_lookup)
+        self._record_reload(started)
+
+    def current(self) -> Tuple[PolicyFinder, Optional[ClauseLookup]]:
+        return self._current
+
+    @property
+    def finder(self) -> PolicyFinder:
+        return self._current[0]
+
+    @property
+    def clause_lookup(self) -> Optional[ClauseLookup]:
+        return self._current[1]
+
+    def _build_finder(self, changed: Sequence[Path]) -> PolicyFinder:
+        for path in self.state_paths:
+            if path in changed or path not in self._state_entries:
+                self._state_entries[path] = load_entries(str(path), _guess_task_from_path(path))
+        finder = PolicyFinder()
+        finder.index_entries(
+            entry for path in self.state_paths for entry in self._state_entries[path]
+        )
+        return finder
+
+    def _build_clause_lookup(self, changed: Sequence[Path]) -> ClauseLookup:
+        for path in self.extract_paths:
+            if path in changed or path not in self._extract_entries:
+                self._extract_entries[path] = ClauseLookup([path]).all_entries()
+        return ClauseLookup.from_entries(
+            entry for path in self.extract_paths for entry in self._extract_entries[path]
+        )
+
+    def _record_reload(self, started: float) -> None:
+        self.generation += 1
+        self.last_reload_seconds = time.perf_counter() - started
+        self.last_reload_at = datetime.now()
+
+    def check(self) -> bool:
+        """Reload changed sources; return ``True`` when a new generation was published."""
+
+        with self._check_lock:
+            # Fingerprints are taken before parsing: a write that lands during
+            # the rebuild is picked up by the next check.
+            seen: Dict[Path, Fingerprint] = {}
+            for path in [*self.state_paths, *self.extract_paths]:
+                fingerprint = _fingerprint(path)
+                if fingerprint != self._fingerprints.get(path):
+                    seen[path] = fingerprint
+            changed = list(seen)
+            if not changed:
+                return False
+
+            started = time.perf_counter()
+            finder, clause_lookup = self._current
+            previous_index = finder.text_index
+            try:
+                if any(path in changed for path in self.state_paths):
+                    finder = self._build_finder(changed)
+                if any(path in changed for path in self.extract_paths):
+                    clause_lookup = self._build_clause_lookup(changed)
+                # Text paths come from the entries and the lookup, so either
+                # change reindexes; texts whose files are unchanged are copied
+                # from the previous generation instead of being read again.
+                finder.build_text_index(clause_lookup, previous=previous_index)
+            except Exception as exc:
+                # A crawl may still be writing the file; retry on the next check.
+                self.last_error = f"{type(exc).__name__}: {exc}"
+                logger.warning("Search index reload failed: %s", self.last_error)
+                return False
+            self._fingerprints.update(seen)
+            self._current = (finder, clause_lookup)
+            self._record_reload(started)
+            self.last_error = None
+            logger.info(
+                "Reloaded search index generation %d in %.3fs (%s)",
+                self.generation,
+                self.last_reload_seconds,
+                ", ".join(os.path.basename(str(path)) for path in changed),
+            )
+        if self.on_reload is not None:
+            try:
+                self.on_reload(finder, clause_lookup)
+            except Exception:  # pragma: no cover - callback is best effort
+                logger.exception("Search index reload callback failed")
+        return True
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            try:
+                self.check()
+            except Exception:  # pragma: no cover - keep the watcher alive
+                logger.exception("Search index watcher failed")
+
+    def start(self, interval: float) -> None:
+        if interval <= 0 or self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(interval,),
+            name="search-reloader",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        thread = self._thread
+        self._thread = None
+        if thread is not None:
+            thread.join()
+
+    def status(self) -> Dict[str, object]:
+        return {
+            "generation": self.generation,
+            "last_reload_seconds": (
+                round(self.last_reload_seconds, 6)
+                if self.last_reload_seconds is not None
+                else None
+            ),
+            "last_reload_at": (
+                self.last_reload_at.isoformat(timespec="seconds")
+                if self.last_reload_at is not None
+                else None
+            ),
+            "last_error": self.last_error,
+            "entries": len(self.finder.entries),
+        }
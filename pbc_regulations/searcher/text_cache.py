@@ -0,0 +1,176 @@
+"""Byte-bounded LRU cache for extracted policy text."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+
+__all__ = [
+    "DEFAULT_TEXT_CACHE_BYTES",
+    "TextCache",
+]
+
+
+DEFAULT_TEXT_CACHE_BYTES = 64 * 1024 * 1024
+
+# Share of the budget kept as plain ``str`` when compression is enabled.
+DEFAULT_HOT_FRACTION = 0.25
+
+# Bookkeeping cost charged for a cached ``None`` ("no text available").
+_NONE_COST = 64
+
+
+def _str_cost(value: Optional[str]) -> int:
+    return _NONE_COST if value is None else sys.getsizeof(value)
+
+
+class TextCache:
+    """Keep recently used texts within a fixed memory budget.
+
+    Entries live in two LRU segments. The hot segment stores plain strings and
+    is limited to *hot_bytes*; when it overflows, its least recently used
+    entries are compressed with zlib and moved to the cold segment. A cold hit
+    decompresses the text and promotes it back to the hot segment. When the
+    total exceeds *max_bytes*, the least recently used cold entries are
+    dropped first, then hot ones. Sizes are measured with
+    :func:`sys.getsizeof`, so the budget tracks the real object size (CJK text
+    costs two or four bytes per character in memory).
+
+    With ``compress=False`` there is a single plain segment bounded by
+    *max_bytes*. The cache is safe to share between request threads.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_TEXT_CACHE_BYTES,
+        *,
+        compress: bool = True,
+        hot_bytes: Optional[int] = None,
+        compress_level: int = 6,
+    ) -> None:
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+        self.max_bytes = max_bytes
+        self.compress = compress
+        if not compress:
+            self.hot_bytes = max_bytes
+        elif hot_bytes is None:
+            self.hot_bytes = int(max_bytes * DEFAULT_HOT_FRACTION)
+        else:
+            self.hot_bytes = min(hot_bytes, max_bytes)
+        self.compress_level = compress_level
+        self._hot: "OrderedDict[Hashable, Tuple[Optional[str], int]]" = OrderedDict()
+        self._cold: "OrderedDict[Hashable, Tuple[Optional[bytes], int]]" = OrderedDict()
+        self._hot_size = 0
+        self._cold_size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.cold_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.compressions = 0
+
+    def __len__(self) -> int:
+        return len(self._hot) + len(self._cold)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._hot or key in self._cold
+
+    @property
+    def size_bytes(self) -> int:
+        return self._hot_size + self._cold_size
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached text for *key* (which may be ``None``) or *default*."""
+
+        with self._lock:
+            hot = self._hot.get(key)
+            if hot is not None:
+                self._hot.move_to_end(key)
+                self.hits += 1
+                return hot[0]
+            cold = self._cold.pop(key, None)
+            if cold is None:
+                self.misses += 1
+                return default
+            self._cold_size -= cold[1]
+            self.hits += 1
+            self.cold_hits += 1
+            value = None if cold[0] is None else zlib.decompress(cold[0]).decode("utf-8")
+            self._insert_hot(key, value)
+            return value
+
+    def put(self, key: Hashable, value: Optional[str]) -> None:
+        with self._lock:
+            self._discard(key)
+            if _str_cost(value) > self.max_bytes:
+                return
+            self._insert_hot(key, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._hot.clear()
+            self._cold.clear()
+            self._hot_size = 0
+            self._cold_size = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._hot) + len(self._cold),
+                "hot_entries": len(self._hot),
+                "cold_entries": len(self._cold),
+                "bytes": self._hot_size + self._cold_size,
+                "hot_bytes": self._hot_size,
+                "cold_bytes": self._cold_size,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "cold_hits": self.cold_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "compressions": self.compressions,
+            }
+
+    def _discard(self, key: Hashable) -> None:
+        hot = self._hot.pop(key, None)
+        if hot is not None:
+            self._hot_size -= hot[1]
+        cold = self._cold.pop(key, None)
+        if cold is not None:
+            self._cold_size -= cold[1]
+
+    def _insert_hot(self, key: Hashable, value: Optional[str]) -> None:
+        cost = _str_cost(value)
+        self._hot[key] = (value, cost)
+        self._hot_size += cost
+        while self._hot_size > self.hot_bytes and len(self._hot) > 1:
+            self._demote_oldest()
+        while self.size_bytes > self.max_bytes and self._cold:
+            _key, (_data, cold_cost) = self._cold.popitem(last=False)
+            self._cold_size -= cold_cost
+            self.evictions += 1
+        while self.size_bytes > self.max_bytes and self._hot:
+            _key, (_value, hot_cost) = self._hot.popitem(last=False)
+            self._hot_size -= hot_cost
+            self.evictions += 1
+
+    def _demote_oldest(self) -> None:
+        old_key, (old_value, old_cost) = self._hot.popitem(last=False)
+        self._hot_size -= old_cost
+        if not self.compress:
+            self.evictions += 1
+            return
+        if old_value is None:
+            # "No text" markers are cheap and still save a disk probe.
+            self._cold[old_key] = (None, old_cost)
+            self._cold_size += old_cost
+            return
+        data = zlib.compress(old_value.encode("utf-8"), self.compress_level)
+        cost = sys.getsizeof(data)
+        self._cold[old_key] = (data, cost)
+        self._cold_size += cost
+        self.compressions += 1
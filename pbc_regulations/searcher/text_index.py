@@ -0,0 +1,216 @@
+"""Positional inverted index over extracted policy text, ranked with BM25."""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Dict, Hashable, Iterator, List, Mapping, Sequence, Set, Tuple
+
+
+__all__ = [
+    "FullTextIndex",
+    "iter_terms",
+    "query_terms",
+]
+
+
+_TERM_RE = re.compile(r'[\u4e00-\u9fff]+|[a-zA-Z0-9]+')
+
+
+def iter_terms(text: str) -> Iterator[Tuple[str, int]]:
+    """Yield ``(term, position)`` pairs for *text*.
+
+    Chinese runs become overlapping character bigrams (a lone character is kept
+    as is) and Latin/digit runs become one lower-cased term. Positions skip one
+    slot between runs so a phrase can never straddle punctuation.
+    """
+
+    position = 0
+    for match in _TERM_RE.finditer(text):
+        run = match.group(0)
+        if run.isascii():
+            yield run.lower(), position
+            position += 1
+        elif len(run) == 1:
+            yield run, position
+            position += 1
+        else:
+            for i in range(len(run) - 1):
+                yield run[i:i + 2], position
+                position += 1
+        position += 1
+
+
+def query_terms(text: str) -> List[str]:
+    return [term for term, _position in iter_terms(text)]
+
+
+class FullTextIndex:
+    """Map each term to the positions where it occurs in every document.
+
+    Documents are identified by caller-chosen integers. :meth:`search`
+    matches a document only when it contains at least one query phrase
+    contiguously, which the stored positions make cheap to verify; a shared
+    bigram alone is not a match. Matches are scored with Okapi BM25 over the
+    query terms plus the same weight again for every phrase found, and
+    callers rank by the matched phrase count first.
+    """
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75) -> None:
+        self.k1 = k1
+        self.b = b
+        self.postings: Dict[str, Dict[int, List[int]]] = {}
+        self.doc_lengths: Dict[int, int] = {}
+        self.total_length = 0
+        self._char_terms: Dict[str, Set[str]] = {}
+        # Files consulted while indexing, so a persisted index can be checked
+        # against them before reuse.
+        self.sources: List[str] = []
+        # Caller-chosen version key of each document's source (e.g. paths
+        # with their mtime and size); see :meth:`copy_documents`.
+        self.doc_keys: Dict[int, Hashable] = {}
+
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+
+    def add(self, doc_id: int, text: str) -> None:
+        length = 0
+        seen: Set[str] = set()
+        for term, position in iter_terms(text):
+            self.postings.setdefault(term, {}).setdefault(doc_id, []).append(position)
+            seen.add(term)
+            length += 1
+        for term in seen:
+            if len(term) == 2 and not term.isascii():
+                for char in term:
+                    self._char_terms.setdefault(char, set()).add(term)
+        self.doc_lengths[doc_id] = length
+        self.total_length += length
+
+    def copy_documents(self, source: "FullTextIndex", mapping: Mapping[int, Sequence[int]]) -> None:
+        """Copy the postings of *source* documents into this index.
+
+        *mapping* sends each document id of *source* to the ids it takes here,
+        so unchanged documents are carried over in one pass over the postings
+        instead of being read and tokenised again.
+        """
+
+        if not mapping:
+            return
+        for term, documents in source.postings.items():
+            targets = [
+                (new_id, positions)
+                for old_id, positions in documents.items()
+                for new_id in mapping.get(old_id, ())
+            ]
+            if not targets:
+                continue
+            postings = self.postings.setdefault(term, {})
+            for new_id, positions in targets:
+                postings[new_id] = positions
+            if len(term) == 2 and not term.isascii():
+                for char in term:
+                    self._char_terms.setdefault(char, set()).add(term)
+        for old_id, new_ids in mapping.items():
+            length = source.doc_lengths.get(old_id)
+            if length is None:
+                continue
+            for new_id in new_ids:
+                self.doc_lengths[new_id] = length
+                self.total_length += length
+
+    @property
+    def average_length(self) -> float:
+        if not self.doc_lengths:
+            return 0.0
+        return self.total_length / len(self.doc_lengths)
+
+    def _term_postings(self, term: str) -> Dict[int, int]:
+        """Return ``{doc_id: term frequency}``; single characters match inside bigrams."""
+
+        counts = {doc_id: len(positions) for doc_id, positions in self.postings.get(term, {}).items()}
+        if len(term) == 1 and not term.isascii():
+            for bigram in self._char_terms.get(term, ()):
+                for doc_id, positions in self.postings[bigram].items():
+                    counts[doc_id] = counts.get(doc_id, 0) + len(positions)
+        return counts
+
+    def idf(self, document_frequency: int) -> float:
+        total = len(self.doc_lengths)
+        return math.log(1.0 + (total - document_frequency + 0.5) / (document_frequency + 0.5))
+
+    def has_phrase(self, doc_id: int, terms: Sequence[str]) -> bool:
+        if not terms:
+            return False
+        position_sets = []
+        for term in terms:
+            positions = self.postings.get(term, {}).get(doc_id)
+            if not positions:
+                return False
+            position_sets.append(positions if not position_sets else set(positions))
+        return any(
+            all(start + offset in position_sets[offset] for offset in range(1, len(terms)))
+            for start in position_sets[0]
+        )
+
+    def phrase_documents(self, phrase: Sequence[str]) -> Set[int]:
+        """Return the documents containing every term of *phrase* contiguously."""
+
+        if not phrase:
+            return set()
+        if len(phrase) == 1:
+            return set(self._term_postings(phrase[0]))
+        candidates: Set[int] = set()
+        for index, term in enumerate(sorted(set(phrase), key=lambda item: len(self.postings.get(item, ())))):
+            documents = self.postings.get(term)
+            if not documents:
+                return set()
+            candidates = set(documents) if index == 0 else candidates & documents.keys()
+            if not candidates:
+                return set()
+        return {doc_id for doc_id in candidates if self.has_phrase(doc_id, phrase)}
+
+    def search(
+        self,
+        terms: Sequence[str],
+        phrases: Sequence[Sequence[str]] = (),
+    ) -> Dict[int, Tuple[float, int]]:
+        """Return ``{doc_id: (score, matched phrase count)}`` for matching documents.
+
+        A document matches when it contains at least one of *phrases*; *terms*
+        only contribute to the BM25 score of documents that match.
+        """
+
+        if not self.doc_lengths:
+            return {}
+        matched: Dict[int, int] = {}
+        found: List[Tuple[Sequence[str], Set[int]]] = []
+        for phrase in phrases:
+            documents = self.phrase_documents(phrase)
+            if documents:
+                found.append((phrase, documents))
+                for doc_id in documents:
+                    matched[doc_id] = matched.get(doc_id, 0) + 1
+        if not matched:
+            return {}
+
+        average_length = self.average_length or 1.0
+        scores: Dict[int, float] = dict.fromkeys(matched, 0.0)
+        weights: Dict[str, float] = {}
+        for term in dict.fromkeys(terms):
+            counts = self._term_postings(term)
+            if not counts:
+                continue
+            weight = self.idf(len(counts))
+            weights[term] = weight
+            for doc_id in matched:
+                frequency = counts.get(doc_id)
+                if not frequency:
+                    continue
+                norm = self.k1 * (1.0 - self.b + self.b * self.doc_lengths[doc_id] / average_length)
+                scores[doc_id] += weight * frequency * (self.k1 + 1.0) / (frequency + norm)
+        for phrase, documents in found:
+            bonus = sum(weights.get(term, 0.0) for term in phrase)
+            for doc_id in documents:
+                scores[doc_id] += bonus
+        return {doc_id: (scores[doc_id], matched[doc_id]) for doc_id in matched}
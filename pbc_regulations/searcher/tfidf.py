@@ -0,0 +1,105 @@
+"""TF-IDF ranking over policy titles and remarks."""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Dict, List, Sequence, Tuple
+
+try:  # Optional dependency used to score all entries in one vectorised pass.
+    import numpy as np
+except Exception:  # pragma: no cover - numpy is optional at runtime.
+    np = None
+
+from .text_index import query_terms
+
+
+__all__ = [
+    "TfidfRanker",
+    "numpy_available",
+]
+
+
+def numpy_available() -> bool:
+    return np is not None
+
+
+def _weights(terms: Sequence[str], idf: Dict[str, float]) -> Dict[str, float]:
+    """Return the L2-normalised ``(1 + log tf) * idf`` vector of *terms*."""
+
+    vector: Dict[str, float] = {}
+    for term, count in Counter(terms).items():
+        weight = idf.get(term)
+        if weight:
+            vector[term] = (1.0 + math.log(count)) * weight
+    norm = math.sqrt(sum(value * value for value in vector.values()))
+    if not norm:
+        return {}
+    return {term: value / norm for term, value in vector.items()}
+
+
+class TfidfRanker:
+    """Cosine similarity between a query and every document's TF-IDF vector.
+
+    Documents are tokenised like the full-text index (CJK bigrams plus
+    Latin/digit words). The matrix is stored term-major: for each term, the
+    ids of the documents that contain it and their normalised weights. With
+    numpy the postings live in flat arrays and :meth:`scores` is one
+    ``bincount`` over the query terms' slices, which is the sparse
+    matrix-vector product. Without numpy the same sums are accumulated in a
+    dictionary, so both engines rank identically.
+    """
+
+    def __init__(self, documents: Sequence[str]) -> None:
+        self.size = len(documents)
+        tokenised = [query_terms(text) for text in documents]
+        document_frequency: Counter = Counter()
+        for terms in tokenised:
+            document_frequency.update(set(terms))
+        self.idf: Dict[str, float] = {
+            term: math.log((self.size + 1) / (frequency + 1)) + 1.0
+            for term, frequency in document_frequency.items()
+        }
+        postings: Dict[str, List[Tuple[int, float]]] = {}
+        for doc_id, terms in enumerate(tokenised):
+            for term, weight in _weights(terms, self.idf).items():
+                postings.setdefault(term, []).append((doc_id, weight))
+
+        self.engine = "numpy" if np is not None else "python"
+        # Only one engine's postings are kept: the flat arrays replace the
+        # dictionary rather than doubling the ranker's memory.
+        self._postings: Dict[str, List[Tuple[int, float]]] = {}
+        self._slices: Dict[str, Tuple[int, int]] = {}
+        if np is None:
+            self._postings = postings
+        else:
+            doc_ids: List[int] = []
+            weights: List[float] = []
+            for term, items in postings.items():
+                start = len(doc_ids)
+                doc_ids.extend(doc_id for doc_id, _weight in items)
+                weights.extend(weight for _doc_id, weight in items)
+                self._slices[term] = (start, len(doc_ids))
+            self._doc_ids = np.asarray(doc_ids, dtype=np.int32)
+            self._weights = np.asarray(weights, dtype=np.float64)
+
+    def scores(self, query: str) -> Dict[int, float]:
+        """Return ``{doc_id: cosine}`` for every document sharing a term with *query*."""
+
+        vector = _weights(query_terms(query), self.idf)
+        if not vector:
+            return {}
+        if self.engine == "python":
+            totals: Dict[int, float] = {}
+            for term, query_weight in vector.items():
+                for doc_id, weight in self._postings.get(term, ()):
+                    totals[doc_id] = totals.get(doc_id, 0.0) + weight * query_weight
+            return totals
+        spans = [(self._slices[term], query_weight) for term, query_weight in vector.items()]
+        indices = np.concatenate([self._doc_ids[start:end] for (start, end), _w in spans])
+        contributions = np.concatenate(
+            [self._weights[start:end] * query_weight for (start, end), query_weight in spans]
+        )
+        totals_array = np.bincount(indices, weights=contributions, minlength=self.size)
+        matched = np.flatnonzero(totals_array)
+        return {int(doc_id): float(totals_array[doc_id]) for doc_id in matched}
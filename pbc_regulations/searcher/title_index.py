@@ -0,0 +1,120 @@
+"""Fuzzy lookup over normalised policy titles."""
+
+from __future__ import annotations
+
+from collections import Counter
+from difflib import SequenceMatcher
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+__all__ = ["TitleIndex"]
+
+
+# Similarity ``difflib.get_close_matches`` must reach for a close match.
+DEFAULT_CLOSE_CUTOFF = 0.75
+
+_NGRAM = 3
+
+
+def _ngrams(text: str) -> Set[str]:
+    return {text[i:i + _NGRAM] for i in range(len(text) - _NGRAM + 1)}
+
+
+class TitleIndex:
+    """Answer exact, substring and close-match queries over title keys.
+
+    Keys are normalised titles (see :func:`norm_text`) and keep their
+    insertion order, so results come back in the same order as a scan over the
+    original dictionary.
+
+    * :meth:`containing` finds keys that contain the query (via character
+      trigram postings, verified with ``in``) or are contained in it (by
+      probing the query's substrings of every indexed key length).
+    * :meth:`close_match` returns exactly what
+      ``difflib.get_close_matches(query, keys, n=1, cutoff=cutoff)`` would.
+      Per-key character counts give the same upper bound as
+      :meth:`SequenceMatcher.quick_ratio` for every key sharing a character
+      with the query, and the full ratio is only computed for keys whose bound
+      can still beat the best match so far.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()) -> None:
+        self._order: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._by_length: Dict[int, Set[str]] = {}
+        self._ngram_postings: Dict[str, Set[int]] = {}
+        self._char_postings: Dict[str, List[Tuple[int, int]]] = {}
+        for key in keys:
+            self.add(key)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._order
+
+    def add(self, key: str) -> None:
+        if key in self._order:
+            return
+        key_id = len(self._keys)
+        self._order[key] = key_id
+        self._keys.append(key)
+        self._by_length.setdefault(len(key), set()).add(key)
+        for gram in _ngrams(key):
+            self._ngram_postings.setdefault(gram, set()).add(key_id)
+        for char, count in Counter(key).items():
+            self._char_postings.setdefault(char, []).append((key_id, count))
+
+    def containing(self, query: str) -> List[str]:
+        """Return keys with ``query in key or key in query``, in insertion order."""
+
+        found: Set[int] = set()
+        if len(query) >= _NGRAM:
+            postings = sorted(
+                (self._ngram_postings.get(gram, set()) for gram in _ngrams(query)),
+                key=len,
+            )
+            if postings and postings[0]:
+                candidates = set(postings[0]).intersection(*postings[1:])
+                found.update(key_id for key_id in candidates if query in self._keys[key_id])
+        else:
+            found.update(key_id for key_id, key in enumerate(self._keys) if query in key)
+        for length, keys in self._by_length.items():
+            if length > len(query):
+                continue
+            for start in range(len(query) - length + 1):
+                piece = query[start:start + length]
+                if piece in keys:
+                    found.add(self._order[piece])
+        return [self._keys[key_id] for key_id in sorted(found)]
+
+    def close_match(self, query: str, cutoff: float = DEFAULT_CLOSE_CUTOFF) -> Optional[str]:
+        """Return the most similar key with a ratio of at least *cutoff*."""
+
+        if not query or not self._keys:
+            return None
+        query_counts = Counter(query)
+        overlap: Dict[int, int] = {}
+        for char, wanted in query_counts.items():
+            for key_id, count in self._char_postings.get(char, ()):
+                overlap[key_id] = overlap.get(key_id, 0) + min(wanted, count)
+
+        bounds: List[Tuple[float, int]] = []
+        for key_id, matches in overlap.items():
+            bound = 2.0 * matches / (len(query) + len(self._keys[key_id]))
+            if bound >= cutoff:
+                bounds.append((bound, key_id))
+        bounds.sort(reverse=True)
+
+        matcher = SequenceMatcher()
+        matcher.set_seq2(query)
+        best: Optional[Tuple[float, str]] = None
+        for bound, key_id in bounds:
+            if best is not None and bound < best[0]:
+                break
+            key = self._keys[key_id]
+            matcher.set_seq1(key)
+            score = matcher.ratio()
+            if score >= cutoff and (best is None or (score, key) > best):
+                best = (score, key)
+        return best[1] if best is not None else None
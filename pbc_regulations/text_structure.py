@@ -0,0 +1,497 @@
+"""Article/paragraph/item structure of extracted policy texts.
+
+The crawler's text extraction writes a ``.structure.json`` sidecar next to
+each text file and the searcher answers clause requests from it. Both sides
+import this module, which depends on the standard library only, so writing
+sidecars does not pull in the search stack.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import re
+import unicodedata
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+__all__ = [
+    "STRUCTURE_SUFFIX",
+    "STRUCTURE_VERSION",
+    "build_outline_from_text",
+    "build_text_structure",
+    "structure_path_for",
+    "write_text_structure",
+]
+
+
+_CHINESE_DIGIT_MAP = {
+    "零": 0,
+    "〇": 0,
+    "○": 0,
+    "Ｏ": 0,
+    "一": 1,
+    "二": 2,
+    "三": 3,
+    "四": 4,
+    "五": 5,
+    "六": 6,
+    "七": 7,
+    "八": 8,
+    "九": 9,
+    "壹": 1,
+    "贰": 2,
+    "叁": 3,
+    "肆": 4,
+    "伍": 5,
+    "陆": 6,
+    "柒": 7,
+    "捌": 8,
+    "玖": 9,
+    "两": 2,
+    "俩": 2,
+}
+
+_CHINESE_UNIT_MAP = {
+    "十": 10,
+    "拾": 10,
+    "百": 100,
+    "佰": 100,
+    "千": 1000,
+    "仟": 1000,
+    "万": 10000,
+}
+
+
+def _chinese_to_int(text: str) -> Optional[int]:
+    if text is None:
+        return None
+    stripped = text.strip()
+    if not stripped:
+        return None
+    if stripped.isdigit():
+        try:
+            return int(stripped)
+        except ValueError:
+            return None
+    total = 0
+    current = 0
+    for char in stripped:
+        if char in _CHINESE_DIGIT_MAP:
+            current = _CHINESE_DIGIT_MAP[char]
+        elif char in _CHINESE_UNIT_MAP:
+            unit_value = _CHINESE_UNIT_MAP[char]
+            if current == 0:
+                current = 1
+            total += current * unit_value
+            current = 0
+        elif char in {"、", " ", "\t"}:
+            continue
+        else:
+            return None
+    total += current * (1 if current else 0)
+    return total if total != 0 or current != 0 else 0
+
+
+def _int_to_chinese(number: int) -> str:
+    if number == 0:
+        return "零"
+
+    digits = ["零", "一", "二", "三", "四", "五", "六", "七", "八", "九"]
+    units = ["", "十", "百", "千"]
+    big_units = ["", "万", "亿", "兆"]
+
+    def convert_section(section: int) -> str:
+        if section == 0:
+            return "零"
+        pieces: List[str] = []
+        zero_flag = False
+        unit_index = 0
+        value = section
+        while value > 0:
+            value, remainder = divmod(value, 10)
+            if remainder == 0:
+                zero_flag = True
+            else:
+                if zero_flag and pieces:
+                    pieces.append("零")
+                pieces.append(digits[remainder] + units[unit_index])
+                zero_flag = False
+            unit_index += 1
+        result_section = "".join(reversed(pieces))
+        result_section = re.sub(r"零+", "零", result_section)
+        result_section = result_section.strip("零")
+        if section < 20 and result_section.startswith("一十"):
+            result_section = result_section[1:]
+        return result_section or "零"
+
+    parts: List[str] = []
+    unit_index = 0
+    remaining = number
+    while remaining > 0:
+        remaining, section = divmod(remaining, 10000)
+        if section:
+            section_text = convert_section(section)
+            if big_units[unit_index]:
+                section_text += big_units[unit_index]
+            parts.insert(0, section_text)
+        else:
+            if parts and not parts[0].startswith("零"):
+                parts.insert(0, "零")
+        unit_index += 1
+
+    result = "".join(parts)
+    result = re.sub(r"零+", "零", result)
+    result = result.strip("零")
+    if number < 20 and result.startswith("一十"):
+        result = result[1:]
+    return result or "零"
+
+
+def _parse_clause_number(text: Optional[str]) -> Optional[int]:
+    """Parse clause numbering that may contain Chinese numerals or digits."""
+
+    if text is None:
+        return None
+    value = _chinese_to_int(text)
+    if value is not None:
+        return value
+    digits = re.sub(r"\D", "", text)
+    if digits:
+        try:
+            return int(digits)
+        except ValueError:
+            return None
+    return None
+
+
+def _number_variants(number: int) -> Sequence[str]:
+    variants = {str(number), _int_to_chinese(number)}
+    if number == 2:
+        variants.update({"两", "俩"})
+    return [variant for variant in variants if variant]
+
+
+def _number_pattern(number: int) -> Optional[str]:
+    variants = _number_variants(number)
+    if not variants:
+        return None
+    pieces = []
+    for variant in variants:
+        escaped_chars = [re.escape(ch) for ch in variant]
+        pieces.append(r"\s*".join(escaped_chars))
+    return "|".join(pieces)
+
+
+_CLAUSE_NUMBER_CLASS = r"[一二三四五六七八九十百千万零〇0-9两俩壹贰叁肆伍陆柒捌玖]"
+_CLAUSE_BULLET_MARKS = r"(?:、|\\.|．|﹒|:|：|·|•)"
+
+_GENERIC_ARTICLE_RE = re.compile(rf"^\s*第\s*({_CLAUSE_NUMBER_CLASS}+)\s*条")
+_GENERIC_BULLET_RE = re.compile(rf"^\s*({_CLAUSE_NUMBER_CLASS}+)\s*{_CLAUSE_BULLET_MARKS}")
+_GENERIC_PARAGRAPH_RE = re.compile(rf"^\s*第\s*({_CLAUSE_NUMBER_CLASS}+)\s*(款|段)")
+_PARAGRAPH_BOUNDARY_RES = {
+    unit: re.compile(rf"^\s*第\s*{_CLAUSE_NUMBER_CLASS}+\s*{unit}") for unit in ("款", "段")
+}
+_OUTLINE_ARTICLE_RE = re.compile(rf"^第\s*({_CLAUSE_NUMBER_CLASS}+)\s*条")
+_OUTLINE_PARAGRAPH_RE = re.compile(rf"^第\s*({_CLAUSE_NUMBER_CLASS}+)\s*(款|段)")
+_OUTLINE_ITEM_RE = re.compile(rf"^[（(]\s*({_CLAUSE_NUMBER_CLASS}+)\s*[)）]")
+_OUTLINE_BULLET_RE = re.compile(rf"^({_CLAUSE_NUMBER_CLASS}+)\s*{_CLAUSE_BULLET_MARKS}")
+
+
+@functools.lru_cache(maxsize=256)
+def _numbered_pattern(number: int, template: str) -> Optional["re.Pattern[str]"]:
+    """Compile *template* with ``{number}`` replaced by every spelling of *number*."""
+
+    number_pattern = _number_pattern(number)
+    if not number_pattern:
+        return None
+    return re.compile(template.replace("{number}", number_pattern))
+
+
+def _normalize_clause_line(text: str) -> str:
+    normalized = unicodedata.normalize("NFKC", text or "")
+    normalized = (
+        normalized.replace("（", "(")
+        .replace("）", ")")
+        .replace("〔", "[")
+        .replace("〕", "]")
+        .replace("【", "[")
+        .replace("】", "]")
+        .replace("《", "\"")
+        .replace("》", "\"")
+        .replace("“", "\"")
+        .replace("”", "\"")
+    )
+    normalized = normalized.replace("\u3000", " ")
+    normalized = re.sub(r"\s+", " ", normalized).strip()
+    return normalized
+
+
+_CLAUSE_CONCLUSION_PATTERNS = (
+    re.compile(
+        r"^(本通知|本办法|本规定|本细则|本规则|本意见|本通告|本方案|本决定|本措施|本指南|本公告)自.+(实施|施行|执行|印发|公布|发布)"
+    ),
+    re.compile(r"^特此(通知|公告|通告|说明)"),
+)
+
+
+def _is_conclusion_line(norm_line: str) -> bool:
+    stripped = norm_line.strip()
+    if not stripped:
+        return False
+    return any(pattern.search(stripped) for pattern in _CLAUSE_CONCLUSION_PATTERNS)
+
+
+def _sanitize_clause_text(text: str) -> str:
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _prepare_clause_lines(text: str) -> Tuple[List[str], List[str]]:
+    raw_lines = _sanitize_clause_text(text).split("\n")
+    norm_lines = [_normalize_clause_line(line) for line in raw_lines]
+    return raw_lines, norm_lines
+
+
+def _strip_empty_bounds(lines: Sequence[str], start: int, end: int) -> Tuple[int, int]:
+    while start < end and not lines[start].strip():
+        start += 1
+    while end > start and not lines[end - 1].strip():
+        end -= 1
+    return start, end
+
+
+def _find_article_bounds(
+    norm_lines: Sequence[str], number: int
+) -> Optional[Tuple[int, int]]:
+    """Return the ``[start, end)`` line range of article *number*, if present."""
+
+    article_pattern = _numbered_pattern(number, r"^\s*第\s*(?:{number})\s*条")
+    if article_pattern is None:
+        return None
+    start_index: Optional[int] = None
+    boundary_pattern = _GENERIC_ARTICLE_RE
+    for idx, norm_line in enumerate(norm_lines):
+        if article_pattern.search(norm_line):
+            start_index = idx
+            break
+    if start_index is None:
+        bullet_pattern = _numbered_pattern(
+            number, rf"^\s*(?:{{number}})\s*{_CLAUSE_BULLET_MARKS}"
+        )
+        for idx, norm_line in enumerate(norm_lines):
+            if bullet_pattern is not None and bullet_pattern.search(norm_line):
+                start_index = idx
+                boundary_pattern = _GENERIC_BULLET_RE
+                break
+    if start_index is None:
+        return None
+    end_index = len(norm_lines)
+    for idx in range(start_index + 1, len(norm_lines)):
+        norm_line = norm_lines[idx]
+        if boundary_pattern.search(norm_line):
+            end_index = idx
+            break
+        if _is_conclusion_line(norm_line):
+            end_index = idx
+            break
+    return start_index, end_index
+
+
+def _find_paragraph_bounds(
+    norm_lines: Sequence[str], number: int, units: Sequence[str]
+) -> Optional[Tuple[int, int, str]]:
+    """Return ``(start, end, unit)`` for the first paragraph *number* in *units* order."""
+
+    for unit in units:
+        paragraph_pattern = _numbered_pattern(
+            number, rf"^\s*第\s*(?:{{number}})\s*{re.escape(unit)}"
+        )
+        if paragraph_pattern is None:
+            return None
+        for idx, norm_line in enumerate(norm_lines):
+            if not paragraph_pattern.search(norm_line):
+                continue
+            boundary_pattern = _PARAGRAPH_BOUNDARY_RES[unit]
+            end_index = len(norm_lines)
+            for next_idx in range(idx + 1, len(norm_lines)):
+                if boundary_pattern.search(norm_lines[next_idx]):
+                    end_index = next_idx
+                    break
+            return idx, end_index, unit
+    return None
+
+
+def _build_outline(
+    lines: Sequence[str],
+    norm_lines: Sequence[str],
+    line_starts: Optional[Sequence[int]] = None,
+) -> List[Dict[str, Any]]:
+    outline: List[Dict[str, Any]] = []
+    current_article: Optional[Dict[str, Any]] = None
+    current_paragraph: Optional[Dict[str, Any]] = None
+
+    for index, (raw_line, norm_line) in enumerate(zip(lines, norm_lines)):
+        label = raw_line.strip() or norm_line
+        if not label:
+            continue
+
+        node: Optional[Dict[str, Any]] = None
+        parent: Optional[Dict[str, Any]] = None
+        article_match = _OUTLINE_ARTICLE_RE.match(norm_line)
+        if article_match:
+            node = {
+                "type": "article",
+                "number": _parse_clause_number(article_match.group(1)),
+                "label": label,
+                "children": [],
+            }
+            outline.append(node)
+            current_article = node
+            current_paragraph = None
+        elif current_article is None:
+            continue
+        else:
+            paragraph_match = _OUTLINE_PARAGRAPH_RE.match(norm_line)
+            if paragraph_match:
+                node = {
+                    "type": "paragraph",
+                    "number": _parse_clause_number(paragraph_match.group(1)),
+                    "label": label,
+                    "children": [],
+                }
+                parent = current_article
+                current_paragraph = node
+            else:
+                item_match = _OUTLINE_ITEM_RE.match(norm_line) or _OUTLINE_BULLET_RE.match(norm_line)
+                if item_match:
+                    node = {
+                        "type": "item",
+                        "number": _parse_clause_number(item_match.group(1)),
+                        "label": label,
+                    }
+                    parent = current_paragraph or current_article
+            if node is not None and parent is not None:
+                parent.setdefault("children", []).append(node)
+        if node is not None and line_starts is not None:
+            node["start"] = line_starts[index]
+
+    return outline
+
+
+def build_outline_from_text(text: str) -> List[Dict[str, Any]]:
+    """Build a hierarchical outline from extracted policy text."""
+
+    if not text:
+        return []
+    lines, norm_lines = _prepare_clause_lines(text)
+    return _build_outline(lines, norm_lines)
+
+
+def _close_outline_offsets(nodes: List[Dict[str, Any]], end: int) -> None:
+    """Set each node's ``end`` to the start of its next sibling (or *end*)."""
+
+    for index, node in enumerate(nodes):
+        node_end = nodes[index + 1]["start"] if index + 1 < len(nodes) else end
+        node["end"] = node_end
+        children = node.get("children")
+        if children:
+            _close_outline_offsets(children, node_end)
+
+
+STRUCTURE_SUFFIX = ".structure.json"
+STRUCTURE_VERSION = 1
+
+
+def structure_path_for(text_path: Path) -> Path:
+    """Return the structure sidecar path written next to *text_path*."""
+
+    return Path(text_path).with_suffix(STRUCTURE_SUFFIX)
+
+
+def build_text_structure(text: str) -> Dict[str, Any]:
+    """Locate every article, paragraph and item of *text* once.
+
+    Offsets index *text* after ``\r\n``/``\r`` are normalised to ``\n``.
+    ``articles`` holds the slices
+    :func:`pbc_regulations.searcher.policy_finder.extract_clause_from_entry` would
+    compute for each article number (paragraphs keyed by number and unit), so
+    answering a clause request becomes a dictionary lookup; ``outline`` is the
+    :func:`build_outline_from_text` tree with ``start``/``end`` offsets.
+    """
+
+    sanitized = _sanitize_clause_text(text or "")
+    lines = sanitized.split("\n")
+    norm_lines = [_normalize_clause_line(line) for line in lines]
+    line_starts: List[int] = []
+    offset = 0
+    for line in lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+
+    def span(start: int, end: int) -> Tuple[int, int]:
+        return line_starts[start], line_starts[end - 1] + len(lines[end - 1])
+
+    numbers: Dict[int, None] = {}
+    for pattern in (_GENERIC_ARTICLE_RE, _GENERIC_BULLET_RE):
+        for norm_line in norm_lines:
+            match = pattern.search(norm_line)
+            if match:
+                number = _chinese_to_int(match.group(1))
+                if number is not None:
+                    numbers.setdefault(number, None)
+
+    articles: List[Dict[str, Any]] = []
+    for number in numbers:
+        bounds = _find_article_bounds(norm_lines, number)
+        if bounds is None:
+            continue
+        start, end = _strip_empty_bounds(lines, *bounds)
+        if start >= end:
+            continue
+        article_norm_lines = norm_lines[start:end]
+        paragraph_keys: Dict[Tuple[str, int], None] = {}
+        for norm_line in article_norm_lines:
+            match = _GENERIC_PARAGRAPH_RE.search(norm_line)
+            if match:
+                paragraph_number = _chinese_to_int(match.group(1))
+                if paragraph_number is not None:
+                    paragraph_keys.setdefault((match.group(2), paragraph_number), None)
+        paragraphs: List[Dict[str, Any]] = []
+        for unit, paragraph_number in paragraph_keys:
+            paragraph_bounds = _find_paragraph_bounds(article_norm_lines, paragraph_number, [unit])
+            if paragraph_bounds is None:
+                continue
+            p_start, p_end = _strip_empty_bounds(
+                lines, start + paragraph_bounds[0], start + paragraph_bounds[1]
+            )
+            if p_start >= p_end:
+                continue
+            p_offsets = span(p_start, p_end)
+            paragraphs.append(
+                {"number": paragraph_number, "unit": unit, "start": p_offsets[0], "end": p_offsets[1]}
+            )
+        offsets = span(start, end)
+        articles.append(
+            {"number": number, "start": offsets[0], "end": offsets[1], "paragraphs": paragraphs}
+        )
+
+    outline = _build_outline(lines, norm_lines, line_starts)
+    _close_outline_offsets(outline, len(sanitized))
+    return {
+        "version": STRUCTURE_VERSION,
+        "text_length": len(sanitized),
+        "text_sha256": hashlib.sha256(sanitized.encode("utf-8")).hexdigest(),
+        "articles": articles,
+        "outline": outline,
+    }
+
+
+def write_text_structure(text_path: Path, text: str) -> Path:
+    """Write the structure sidecar for *text_path* and return its path."""
+
+    target = structure_path_for(text_path)
+    payload = json.dumps(build_text_structure(text), ensure_ascii=False)
+    target.write_text(payload, encoding="utf-8")
+    return target
@@ -48,6 +48,9 @@
   };
   const slugButtons = new Map();
   const entriesCache = new Map();
+  // Entries are fetched in pages of projected fields and filtered server-side.
+  const ENTRIES_PAGE_SIZE = 200;
+  const ENTRY_FIELDS = "serial,title,remark,documents";
   const searchConfig =
     config && typeof config.search === "object" && config.search
       ? config.search
@@ -644,21 +647,73 @@
     }
   }
 
+  function entryPageParams(cursor) {
+    const params = new URLSearchParams();
+    params.set("limit", String(ENTRIES_PAGE_SIZE));
+    params.set("fields", ENTRY_FIELDS);
+    if (state.showAbolishOnly) {
+      params.set("abolished", "1");
+    }
+    if (cursor) {
+      params.set("cursor", cursor);
+    }
+    return params;
+  }
+
+  async function fetchNextEntriesPage(slugValue) {
+    const cached = entriesCache.get(slugValue);
+    if (!cached || !cached.nextCursor) {
+      return;
+    }
+    const params = entryPageParams(cached.nextCursor);
+    const path = `/api/tasks/${encodeURIComponent(slugValue)}/entries?${params}`;
+    const response = await fetch(buildUrl(apiBase, path), {
+      headers: { Accept: "application/json" },
+      cache: "no-cache",
+    });
+    if (!response.ok) {
+      throw new Error(`${response.status} ${response.statusText}`);
+    }
+    const payload = await response.json();
+    const taskInfo = payload && typeof payload.task === "object" ? payload.task : cached.task;
+    const entries = normalizeEntries(
+      Array.isArray(payload.entries) ? payload.entries : [],
+      slugValue,
+      taskInfo,
+    );
+    entriesCache.set(slugValue, {
+      entries: cached.entries.concat(entries),
+      task: taskInfo,
+      nextCursor: payload.next_cursor || null,
+      total: typeof payload.total === "number" ? payload.total : cached.total,
+    });
+  }
+
+  async function loadMoreEntries(slugs) {
+    try {
+      await Promise.all(slugs.map((slug) => fetchNextEntriesPage(slug)));
+    } catch (error) {
+      showMessage(`Failed to load more entries: ${error.message || error}`);
+      return;
+    }
+    refreshEntries();
+  }
+
   async function fetchMultipleTaskEntries(slugValues) {
     const validSlugs = Array.isArray(slugValues)
       ? slugValues
           .map((value) => (value || value === 0 ? String(value).trim() : ""))
           .filter(Boolean)
       : [];
-    const params = new URLSearchParams();
+    const params = entryPageParams(null);
     validSlugs.forEach((slug) => {
       params.append("slugs", slug);
     });
     const baseUrl = buildUrl(apiBase, "/api/tasks/entries");
-    const requestUrl = params.toString() ? `${baseUrl}?${params}` : baseUrl;
+    const requestUrl = `${baseUrl}?${params}`;
     const response = await fetch(requestUrl, {
       headers: { Accept: "application/json" },
-      cache: "no-store",
+      cache: "no-cache",
     });
     if (!response.ok) {
       let errorDetail = `${response.status} ${response.statusText}`;
@@ -714,6 +769,8 @@
           entriesCache.set(slugValue, {
             entries: normalized,
             task: taskInfo || null,
+            nextCursor: item.next_cursor || null,
+            total: typeof item.total === "number" ? item.total : normalized.length,
           });
           handled.add(slugValue);
           if (!succeeded.includes(slugValue)) {
@@ -1076,9 +1133,90 @@
       });
     }
 
+    const pagedSlugs = usableSlugs.filter((slug) => {
+      const cached = entriesCache.get(slug);
+      return Boolean(cached && cached.nextCursor);
+    });
+    if (bodyEl && pagedSlugs.length) {
+      const loaded = usableSlugs.reduce((acc, slug) => {
+        const cached = entriesCache.get(slug);
+        return acc + (cached ? cached.entries.length : 0);
+      }, 0);
+      const total = usableSlugs.reduce((acc, slug) => {
+        const cached = entriesCache.get(slug);
+        return acc + (cached && typeof cached.total === "number" ? cached.total : 0);
+      }, 0);
+      const button = document.createElement("button");
+      button.type = "button";
+      button.className = "button button--ghost entries-load-more";
+      button.textContent = `Load more (${loaded}/${total})`;
+      button.addEventListener("click", () => {
+        button.disabled = true;
+        loadMoreEntries(pagedSlugs);
+      });
+      bodyEl.appendChild(button);
+    }
+
     updateSelectionSummary(usableSlugs, combinedEntries, filteredEntries);
   }
 
+  // Drop cached entries of a task whose state changed and reload them if shown.
+  function handleTaskChange(task) {
+    if (!task || typeof task !== "object" || !task.slug) {
+      return false;
+    }
+    const slugValue = String(task.slug);
+    registerKnownSlug(slugValue, task);
+    const cached = entriesCache.get(slugValue);
+    if (!cached || !cached.task) {
+      return false;
+    }
+    if (
+      cached.task.state_last_updated === task.state_last_updated &&
+      cached.task.entries_total === task.entries_total &&
+      cached.task.downloaded_total === task.downloaded_total
+    ) {
+      return false;
+    }
+    entriesCache.delete(slugValue);
+    return getActiveSlugs().includes(slugValue);
+  }
+
+  function connectEvents() {
+    if (typeof window.EventSource !== "function") {
+      return;
+    }
+    const source = new EventSource(buildUrl(apiBase, "/api/events"));
+    const parse = (event) => {
+      try {
+        return JSON.parse(event.data);
+      } catch (error) {
+        console.error("Invalid task event", error);
+        return null;
+      }
+    };
+    source.addEventListener("tasks", (event) => {
+      const tasks = parse(event);
+      if (!Array.isArray(tasks)) {
+        return;
+      }
+      const known = state.slugOptions.length;
+      const changed = tasks.map(handleTaskChange).some(Boolean);
+      if (state.slugOptions.length !== known) {
+        renderSlugFilters();
+        updateSlugButtonsState();
+      }
+      if (changed) {
+        refreshEntries();
+      }
+    });
+    source.addEventListener("task", (event) => {
+      if (handleTaskChange(parse(event))) {
+        refreshEntries();
+      }
+    });
+  }
+
   async function init() {
     setGeneratedAt(config.generatedAt || null);
     updateHeader(null, null);
@@ -1099,6 +1237,8 @@
           "is-active",
           state.showAbolishOnly,
         );
+        // The filter is applied server-side, so loaded pages no longer apply.
+        entriesCache.clear();
         refreshEntries();
       });
     }
@@ -1136,6 +1276,7 @@
     updateSlugButtonsState();
 
     await refreshEntries();
+    connectEvents();
   }
 
   if (document.readyState === "loading") {
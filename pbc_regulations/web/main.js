@@ -22,6 +22,7 @@
   const filterToggleText = document.getElementById("task-filter-toggle-text");
 
   let currentData = null;
+  let streamConnected = false;
   const taskFilters = {
     query: "",
     status: "all",
@@ -37,6 +38,7 @@
   }
 
   const tasksEndpoint = buildUrl(apiBase, "/api/tasks");
+  const eventsEndpoint = buildUrl(apiBase, "/api/events");
   function escapeHtml(value) {
     return String(value)
       .replace(/&/g, "&amp;")
@@ -312,12 +314,17 @@
           .join(", ");
         const docTypesDisplay = documentTypes || "—";
 
-        const nextWindow =
+        let nextWindow =
           task.next_run_earliest && task.next_run_latest
             ? `${formatDate(task.next_run_earliest)} ↔ ${formatDate(
                 task.next_run_latest
               )}`
             : "—";
+        if (task.schedule_status === "running") {
+          nextWindow = "Running now";
+        } else if (task.next_run_at) {
+          nextWindow = formatDate(task.next_run_at);
+        }
 
         const statusClass = STATUS_CLASS[task.status] || "status-waiting";
 
@@ -485,6 +492,69 @@
     }
   }
 
+  function parseEventData(event) {
+    try {
+      return JSON.parse(event.data);
+    } catch (error) {
+      console.error("Invalid dashboard event", error);
+      return null;
+    }
+  }
+
+  function mergeTask(task) {
+    if (!task || typeof task !== "object" || !task.slug) {
+      return;
+    }
+    const tasks = Array.isArray(currentData) ? currentData.slice() : [];
+    const index = tasks.findIndex((item) => item && item.slug === task.slug);
+    if (index >= 0) {
+      tasks[index] = task;
+    } else {
+      tasks.push(task);
+    }
+    renderDashboard(tasks);
+    setGeneratedAt(new Date());
+  }
+
+  // Subscribe to pushed task changes; returns false when the browser cannot.
+  function connectEvents() {
+    if (typeof window.EventSource !== "function") {
+      return false;
+    }
+    const source = new EventSource(eventsEndpoint);
+    source.addEventListener("open", () => {
+      streamConnected = true;
+    });
+    source.addEventListener("error", () => {
+      // EventSource reconnects by itself; poll in the meantime.
+      streamConnected = false;
+      if (!currentData) {
+        loadData();
+      }
+    });
+    source.addEventListener("tasks", (event) => {
+      const payload = parseEventData(event);
+      if (Array.isArray(payload)) {
+        renderDashboard(payload);
+        hideMessage();
+        setGeneratedAt(new Date());
+      }
+    });
+    source.addEventListener("task", (event) => {
+      mergeTask(parseEventData(event));
+    });
+    source.addEventListener("download", (event) => {
+      const payload = parseEventData(event);
+      if (payload && payload.name) {
+        showMessage(
+          `New file downloaded for ${payload.task || payload.slug}: ${payload.name}`,
+          "info",
+        );
+      }
+    });
+    return true;
+  }
+
   function init() {
     setAutoRefreshDisplay(autoRefreshValue);
     setGeneratedAt(config.generatedAt || null);
@@ -500,9 +570,15 @@
     }
 
     if (!staticSnapshot) {
-      loadData();
+      if (!connectEvents()) {
+        loadData();
+      }
       if (autoRefreshValue && autoRefreshValue > 0) {
-        setInterval(loadData, autoRefreshValue * 1000);
+        setInterval(() => {
+          if (!streamConnected) {
+            loadData();
+          }
+        }, autoRefreshValue * 1000);
       }
     }
   }
@@ -1,15 +1,28 @@
 import sys
+import threading
+import time
 from pathlib import Path
+from typing import List
+
+import pytest
 
 
 ROOT = Path(__file__).resolve().parents[1]
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from pbc_regulations.searcher.document_pool import (  # noqa: E402
+    DocumentPool,
+    DocumentPoolBusy,
+    install_document_pool,
+)
 from pbc_regulations.searcher.policy_finder import (  # noqa: E402
     Entry,
+    build_outline_from_text,
     extract_clause_from_entry,
+    load_text_structure,
     parse_clause_reference,
+    write_text_structure,
 )
 
 
@@ -75,3 +88,118 @@ def test_extract_clause_omits_conclusion_lines(tmp_path):
     assert result.error is None
     assert "参照本通知执行" in (result.article_text or "")
     assert "本通知自" not in (result.article_text or "")
+
+
+def test_structure_sidecar_answers_like_text_scan(tmp_path):
+    text = (
+        "总则\r\n"
+        "第一条 为了规范管理，制定本办法。\r\n"
+        "第二条 本办法适用于：\r\n"
+        "第一款 银行业金融机构；\r\n"
+        "（一）商业银行；\r\n"
+        "（二）农村信用社。\r\n"
+        "第二款 非银行支付机构。\r\n"
+        "第三条 本办法自发布之日起施行。\r\n"
+    )
+    doc_path = tmp_path / "policy.txt"
+    doc_path.write_bytes(text.encode("utf-8"))
+    entry = Entry(
+        id=1,
+        title="测试办法",
+        remark="",
+        documents=[{"type": "text", "local_path": str(doc_path)}],
+    )
+    entry.build()
+    queries = ["第一条", "第二条第一款", "第二条第一款第二项", "第二条第二款", "第二条第三款", "第四条"]
+    scanned = [extract_clause_from_entry(entry, parse_clause_reference(query)) for query in queries]
+
+    sidecar = write_text_structure(doc_path, text)
+    assert sidecar.name == "policy.structure.json"
+    structure = load_text_structure(doc_path)
+    assert structure is not None
+    assert sorted(structure.articles) == [1, 2, 3]
+    outline = build_outline_from_text(text)
+    assert [node["label"] for node in structure.outline] == [node["label"] for node in outline]
+    assert structure.slice(structure.outline[1]).startswith("第二条")
+    assert [child["type"] for child in structure.outline[1]["children"]] == ["paragraph", "paragraph"]
+
+    for query, expected in zip(queries, scanned):
+        assert extract_clause_from_entry(entry, parse_clause_reference(query)) == expected
+
+    doc_path.write_text("第一条 内容已修改。\n", "utf-8")
+    assert load_text_structure(doc_path) is None
+
+
+def test_document_pool_parses_html_in_worker_process(tmp_path):
+    doc_path = tmp_path / "policy.html"
+    doc_path.write_text(
+        "<html><body><p>第一条 总则内容。</p><p>第二条 适用范围。</p></body></html>",
+        "utf-8",
+    )
+    entry = Entry(
+        id=1,
+        title="测试文件",
+        remark="",
+        documents=[{"type": "html", "local_path": str(doc_path)}],
+    )
+    entry.build()
+    pool = DocumentPool(1, timeout=60)
+    previous = install_document_pool(pool)
+    try:
+        result = extract_clause_from_entry(entry, parse_clause_reference("第二条"))
+    finally:
+        install_document_pool(previous)
+        pool.shutdown()
+    assert result.error is None
+    assert "适用范围" in (result.article_text or "")
+    stats = pool.stats()
+    assert stats["submitted"] == 1 and stats["completed"] == 1
+
+
+def test_document_pool_bounds_queue_and_times_out():
+    pool = DocumentPool(1, timeout=30, max_pending=1)
+    try:
+        assert pool.run(len, "warm") == 4
+        worker = threading.Thread(target=pool.run, args=(time.sleep, 1))
+        worker.start()
+        deadline = time.monotonic() + 5
+        while not pool.stats()["pending"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        with pytest.raises(DocumentPoolBusy):
+            pool.run(len, "busy")
+        worker.join()
+        with pytest.raises(TimeoutError):
+            pool.run(time.sleep, 60, timeout=0.2)
+        assert pool.stats()["pending"] == 0
+        assert pool.run(len, "ok") == 2
+        stats = pool.stats()
+        assert stats["timeouts"] == 1 and stats["rejected"] == 1
+    finally:
+        pool.shutdown()
+
+
+def test_document_pool_recycles_only_the_stuck_worker():
+    pool = DocumentPool(2, timeout=30)
+    outcome: List[object] = []
+
+    def _parallel_job() -> None:
+        try:
+            outcome.append(pool.run(time.sleep, 1.5))
+        except BaseException as exc:  # pragma: no cover - reported below
+            outcome.append(exc)
+
+    try:
+        assert pool.run(len, "warm") == 4
+        other = threading.Thread(target=_parallel_job)
+        other.start()
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            pool.run(time.sleep, 60, timeout=0.5)
+        other.join()
+        assert outcome == [None]
+        assert pool.run(len, "ok") == 2
+        assert time.monotonic() - started < 30
+        stats = pool.stats()
+        assert stats["timeouts"] == 1 and stats["recycled"] == 1
+    finally:
+        pool.shutdown()
@@ -15,6 +15,12 @@ collect_task_overviews = dashboard.collect_task_overviews
 create_dashboard_app = dashboard.create_dashboard_app
 render_dashboard_html = dashboard.render_dashboard_html
 
+from pbc_regulations.icrawler.artifact_stats import (
+    MANIFEST_FILENAME,
+    audit_artifact_directory,
+    load_artifact_stats,
+    record_artifact_write,
+)
 from pbc_regulations.icrawler.crawler import safe_filename
 from pbc_regulations.icrawler.fetching import build_cache_path_for_url
 from pbc_regulations.icrawler.state import PBCState, save_state
@@ -169,6 +175,32 @@ def test_collect_task_overview(tmp_path) -> None:
     assert len(overview_json["entries"]) == overview_with_entries.entries_total
 
 
+def test_collect_task_overview_prefers_scheduler_times(tmp_path) -> None:
+    config_path, expected_time, _ = _prepare_dashboard_environment(tmp_path)
+    next_run_at = datetime(2023, 1, 2, 3, 4, 5)
+    schedule = {
+        "tasks": {
+            "Demo Task": {
+                "status": "sleeping",
+                "next_run_at": next_run_at.isoformat(),
+                "next_run_earliest": "2023-01-01T20:00:00",
+                "next_run_latest": "2023-01-02T08:00:00",
+            }
+        }
+    }
+    schedule_path = tmp_path / "artifacts" / "schedule.json"
+    schedule_path.write_text(json.dumps(schedule), encoding="utf-8")
+
+    overview = collect_task_overviews(str(config_path))[0]
+
+    assert overview.next_run_at == next_run_at
+    assert overview.next_run_earliest == datetime(2023, 1, 1, 20, 0, 0)
+    assert overview.next_run_latest == datetime(2023, 1, 2, 8, 0, 0)
+    assert overview.schedule_status == "sleeping"
+    assert overview.state_last_updated == expected_time
+    assert overview.to_jsonable()["next_run_at"] == "2023-01-02T03:04:05"
+
+
 def test_entries_endpoint_returns_entries(tmp_path) -> None:
     config_path, _, task_slug = _prepare_dashboard_environment(tmp_path)
 
@@ -276,3 +308,336 @@ def test_api_explorer_includes_search_config(tmp_path) -> None:
     assert match is not None
     config_payload = json.loads(match.group(1))
     assert config_payload["search"] == search_config
+
+
+def test_overview_memo_skips_unchanged_tasks(tmp_path) -> None:
+    config_path, _, task_slug = _prepare_dashboard_environment(tmp_path)
+    output_dir = tmp_path / "artifacts" / "downloads" / task_slug
+    state_path = tmp_path / "artifacts" / "downloads" / f"{task_slug}_state.json"
+    memo = dashboard.OverviewMemo()
+
+    first = collect_task_overviews(str(config_path), memo=memo)[0]
+    assert memo.stats() == {"state_loads": 1, "directory_scans": 1}
+    again = collect_task_overviews(str(config_path), memo=memo)[0]
+    assert memo.stats() == {"state_loads": 1, "directory_scans": 1}
+    assert again.to_jsonable() == first.to_jsonable()
+
+    (output_dir / "file3.pdf").write_bytes(b"more data")
+    record_artifact_write(str(output_dir / "file3.pdf"))
+    state = PBCState()
+    state.ensure_entry({"title": "Only entry", "remark": ""})
+    save_state(str(state_path), state)
+    updated = collect_task_overviews(str(config_path), memo=memo)[0]
+    assert memo.stats() == {"state_loads": 2, "directory_scans": 1}
+    assert updated.output_files == 3
+    assert updated.output_size_bytes == 17
+    assert updated.entries_total == 1
+    assert updated.entries_without_documents == 1
+
+
+def test_overview_cache_serves_snapshot_while_refreshing(tmp_path) -> None:
+    import threading
+
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def collect(memo):
+        calls.append(memo)
+        if len(calls) > 1:
+            started.set()
+            release.wait(5)
+        return [f"snapshot-{len(calls)}"]
+
+    cache = dashboard.OverviewCache(collect, max_age=0)
+    assert cache.get() == ["snapshot-1"]
+    assert cache.get() == ["snapshot-1"]
+    assert started.wait(5)
+    assert cache.get() == ["snapshot-1"]
+    assert len(calls) == 2
+    assert all(memo is cache.memo for memo in calls)
+    release.set()
+    for _ in range(500):
+        if cache.stats()["refreshes"] == 2 and not cache.stats()["refreshing"]:
+            break
+        threading.Event().wait(0.01)
+    cache.max_age = 60
+    assert cache.get() == ["snapshot-2"]
+
+    config_path, _, task_slug = _prepare_dashboard_environment(tmp_path)
+    app = create_dashboard_app(
+        str(config_path),
+        auto_refresh=30,
+        task=None,
+        artifact_dir_override=None,
+    )
+    tasks_route = _get_app_route(app, "/api/tasks", "GET")
+    for _ in range(3):
+        assert json.loads(tasks_route.endpoint().body.decode("utf-8"))[0]["slug"] == task_slug
+    assert app.state.overview_cache.stats()["state_loads"] == 1
+
+
+def test_artifact_manifest_tracks_writes_and_audits(tmp_path) -> None:
+    config_path, _, task_slug = _prepare_dashboard_environment(tmp_path)
+    output_dir = tmp_path / "artifacts" / "downloads" / task_slug
+    (output_dir / "doc.html.validators.json").write_text("{}", encoding="utf-8")
+
+    overview = collect_task_overviews(str(config_path))[0]
+    assert (output_dir / MANIFEST_FILENAME).is_file()
+    assert (overview.output_files, overview.output_size_bytes) == (2, 8)
+    assert overview.output_type_totals == {"pdf": {"files": 2, "bytes": 8}}
+
+    (output_dir / "file1.pdf").write_bytes(b"longer data")
+    record_artifact_write(str(output_dir / "file1.pdf"), previous_size=4)
+    (output_dir / "doc.html").write_bytes(b"<p>")
+    record_artifact_write(str(output_dir / "doc.html"))
+    stats = load_artifact_stats(str(output_dir))
+    assert (stats.files, stats.bytes) == (3, 18)
+    assert stats.types == {"html": {"files": 1, "bytes": 3}, "pdf": {"files": 2, "bytes": 15}}
+    overview = collect_task_overviews(str(config_path))[0]
+    assert (overview.output_files, overview.output_size_bytes) == (3, 18)
+
+    # Files that bypass the hooks are reconciled by the next audit.
+    (output_dir / "file2.pdf").unlink()
+    audited = audit_artifact_directory(str(output_dir))
+    assert (audited.files, audited.bytes) == (2, 14)
+    assert load_artifact_stats(str(output_dir)).to_jsonable() == audited.to_jsonable()
+
+
+def test_artifact_manifest_counts_writes_in_subdirectories(tmp_path) -> None:
+    output_dir = tmp_path / "artifacts" / "downloads" / "task"
+    nested = output_dir / "texts" / "2024"
+    nested.mkdir(parents=True)
+    (output_dir / "file1.pdf").write_bytes(b"data")
+    audit_artifact_directory(str(output_dir))
+
+    (nested / "file1.txt").write_bytes(b"text")
+    record_artifact_write(str(nested / "file1.txt"), root=str(output_dir / "texts"))
+    assert load_artifact_stats(str(output_dir)).files == 1
+    record_artifact_write(str(nested / "file1.txt"), root=str(tmp_path / "elsewhere"))
+    assert load_artifact_stats(str(output_dir)).files == 1
+    record_artifact_write(str(nested / "file1.txt"), root=str(output_dir))
+    stats = load_artifact_stats(str(output_dir))
+    assert (stats.files, stats.bytes) == (2, 8)
+    assert stats.recent[-1]["name"] == os.path.join("texts", "2024", "file1.txt")
+    assert load_artifact_stats(str(nested)) is None
+    assert audit_artifact_directory(str(output_dir)).to_jsonable()["files"] == stats.files
+
+
+def test_event_hub_publishes_task_changes_and_downloads(tmp_path) -> None:
+    import asyncio
+
+    config_path, _, task_slug = _prepare_dashboard_environment(tmp_path)
+    output_dir = tmp_path / "artifacts" / "downloads" / task_slug
+    app = create_dashboard_app(
+        str(config_path),
+        auto_refresh=30,
+        task=None,
+        artifact_dir_override=None,
+        event_poll_interval=3600,
+    )
+    hub = app.state.event_hub
+    loop = asyncio.new_event_loop()
+    try:
+        subscriber, snapshot = hub.subscribe(loop)
+        assert [task["slug"] for task in snapshot] == [task_slug]
+        assert hub.stats()["watching"] is True
+        assert hub.poll() == []
+
+        (output_dir / "file3.pdf").write_bytes(b"new")
+        record_artifact_write(str(output_dir / "file3.pdf"))
+        events = hub.poll()
+        assert [name for name, _data in events] == ["task", "download"]
+        assert events[0][1]["output_files"] == 3
+        assert events[1][1]["slug"] == task_slug
+        assert events[1][1]["name"] == "file3.pdf"
+        assert events[1][1]["bytes"] == 3
+        assert hub.poll() == []
+
+        loop.run_until_complete(asyncio.sleep(0))
+        delivered = [subscriber.queue.get_nowait() for _ in range(subscriber.queue.qsize())]
+        assert delivered == events
+    finally:
+        hub.unsubscribe(subscriber)
+        loop.close()
+    assert hub.stats() == {
+        "subscribers": 0,
+        "watching": False,
+        "poll_interval": 3600,
+        "polls": 3,
+        "published": 2,
+    }
+
+    class _DisconnectingRequest:
+        async def is_disconnected(self):
+            return True
+
+    route = _get_app_route(app, "/api/events", "GET")
+
+    async def first_chunk():
+        response = await route.endpoint(request=_DisconnectingRequest())
+        assert response.media_type == "text/event-stream"
+        iterator = response.body_iterator
+        chunk = await iterator.__anext__()
+        await iterator.aclose()
+        return chunk
+
+    chunk = asyncio.run(first_chunk())
+    assert chunk.startswith("event: tasks\ndata: ")
+    assert json.loads(chunk.split("data: ", 1)[1])[0]["slug"] == task_slug
+    assert hub.stats()["subscribers"] == 0
+
+
+def test_entries_endpoint_paginates_filters_and_revalidates(tmp_path) -> None:
+    import gzip
+
+    config_path, _, task_slug = _prepare_dashboard_environment(tmp_path)
+    state_path = tmp_path / "artifacts" / "downloads" / f"{task_slug}_state.json"
+    state = PBCState()
+    for index in range(5):
+        entry_id = state.ensure_entry({"title": f"通知 {index}", "remark": ""})
+        state.merge_documents(
+            entry_id,
+            [
+                {
+                    "url": f"http://example.com/doc{index}.pdf",
+                    "type": "pdf" if index % 2 == 0 else "html",
+                    "title": "已废止" if index == 3 else f"Doc {index}",
+                    "downloaded": index < 3,
+                }
+            ],
+        )
+    save_state(str(state_path), state)
+
+    app = create_dashboard_app(
+        str(config_path),
+        auto_refresh=30,
+        task=None,
+        artifact_dir_override=None,
+    )
+    route = _get_app_route(app, "/api/tasks/{slug}/entries", "GET")
+
+    class _Request:
+        def __init__(self, **headers):
+            self.headers = headers
+
+    def call(request=None, **params):
+        response = route.endpoint(slug=task_slug, request=request, **params)
+        body = response.body
+        if response.headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        return response, json.loads(body.decode("utf-8")) if body else None
+
+    _, first = call(limit=2, fields="serial,title")
+    assert [entry["title"] for entry in first["entries"]] == ["通知 0", "通知 1"]
+    assert set(first["entries"][0]) == {"serial", "title"}
+    assert first["total"] == 5
+    _, second = call(limit=2, fields="serial,title", cursor=first["next_cursor"])
+    assert [entry["title"] for entry in second["entries"]] == ["通知 2", "通知 3"]
+    _, last = call(limit=2, fields="serial,title", cursor=second["next_cursor"])
+    assert [entry["title"] for entry in last["entries"]] == ["通知 4"]
+    assert last["next_cursor"] is None
+
+    bulk_route = _get_app_route(app, "/api/tasks/entries", "GET")
+
+    def bulk_page(cursor=None):
+        response = bulk_route.endpoint(slugs=[task_slug], limit=2, fields="title", cursor=cursor)
+        return response, json.loads(response.body.decode("utf-8"))
+
+    _, bulk_first = bulk_page()
+    bulk_cursor = bulk_first["results"][0]["next_cursor"]
+    assert bulk_cursor == first["next_cursor"]
+    _, bulk_second = bulk_page([f"{task_slug}:{bulk_cursor}"])
+    assert [entry["title"] for entry in bulk_second["results"][0]["entries"]] == ["通知 2", "通知 3"]
+    response, error = bulk_page(["no-separator"])
+    assert response.status_code == 400 and error == {"error": "invalid_cursor"}
+
+    _, pending_html = call(status="pending", document_type="html")
+    assert [entry["title"] for entry in pending_html["entries"]] == ["通知 3"]
+    _, abolished = call(abolished="1")
+    assert [entry["title"] for entry in abolished["entries"]] == ["通知 3"]
+    _, by_title = call(q="通知 4")
+    assert by_title["total"] == 1
+    response, error = call(status="broken")
+    assert response.status_code == 400 and error == {"error": "invalid_status"}
+
+    response, payload = call(request=_Request(**{"accept-encoding": "br;q=0, gzip"}))
+    assert response.headers["content-encoding"] == "gzip"
+    assert payload["total"] == 5
+    etag = response.headers["etag"]
+    response, payload = call(request=_Request(**{"if-none-match": etag}))
+    assert response.status_code == 304 and payload is None
+    assert app.state.entries_cache.loads == 1
+
+    state.ensure_entry({"title": "通知 5", "remark": ""})
+    save_state(str(state_path), state)
+    app.state.overview_cache.refresh()
+    response, payload = call(request=_Request(**{"if-none-match": etag}))
+    assert response.status_code == 200
+    assert payload["total"] == 6
+    assert response.headers["etag"] != etag
+
+
+def test_history_endpoint_returns_recorded_runs(tmp_path) -> None:
+    from pbc_regulations.icrawler.run_history import RunHistory, default_history_path
+    from pbc_regulations.icrawler.task_models import TaskStats
+
+    config_path, _, task_slug = _prepare_dashboard_environment(tmp_path)
+    app = create_dashboard_app(
+        str(config_path),
+        auto_refresh=30,
+        task=None,
+        artifact_dir_override=None,
+    )
+    route = _get_app_route(app, "/api/tasks/{slug}/history", "GET")
+
+    empty = json.loads(route.endpoint(slug=task_slug).body.decode("utf-8"))
+    assert empty == {"slug": task_slug, "task": "Demo Task", "runs": []}
+
+    history = RunHistory(default_history_path(str(tmp_path / "artifacts")))
+    base = datetime(2024, 5, 1, 8, 0, 0)
+    for index in range(3):
+        history.record(
+            "Demo Task",
+            TaskStats(pages_fetched=index, files_downloaded=index, wall_seconds=2.0),
+            context=f"iteration {index + 1}",
+            iteration=index + 1,
+            started_at=base + timedelta(hours=index),
+        )
+    history.record("Other Task", TaskStats(), context="run-once", started_at=base)
+
+    payload = json.loads(route.endpoint(slug=task_slug, limit=2).body.decode("utf-8"))
+    assert [run["iteration"] for run in payload["runs"]] == [3, 2]
+    assert payload["runs"][0]["pages_fetched"] == 2
+    since = (base + timedelta(hours=1)).isoformat()
+    payload = json.loads(route.endpoint(slug=task_slug, since=since).body.decode("utf-8"))
+    assert [run["iteration"] for run in payload["runs"]] == [3, 2]
+
+    response = route.endpoint(slug=task_slug, since="yesterday")
+    assert response.status_code == 400
+    assert json.loads(response.body.decode("utf-8")) == {"error": "invalid_since"}
+
+
+def test_run_history_readers_never_write(tmp_path) -> None:
+    import sqlite3
+
+    from pbc_regulations.icrawler.run_history import RunHistory, load_run_history
+    from pbc_regulations.icrawler.task_models import TaskStats
+
+    path = tmp_path / "artifacts" / "run_history.sqlite3"
+    history = RunHistory(str(path))
+    assert not path.exists()
+    assert history.query("Demo Task") == []
+
+    path.parent.mkdir()
+    sqlite3.connect(str(path)).close()
+    assert load_run_history(str(path), "Demo Task") == []
+    with sqlite3.connect(str(path)) as connection:
+        assert connection.execute("SELECT name FROM sqlite_master").fetchall() == []
+
+    history.record("Demo Task", TaskStats(pages_fetched=3), context="run-once", started_at=datetime(2024, 5, 1))
+    with sqlite3.connect(str(path)) as writer:
+        writer.execute("BEGIN IMMEDIATE")
+        runs = load_run_history(str(path), "Demo Task")
+        writer.rollback()
+    assert [run["pages_fetched"] for run in runs] == [3]
@@ -84,3 +84,28 @@ def test_copy_documents_by_title_dry_run(tmp_path):
     assert planned.source == source.resolve()
     assert planned.destination.name == "测试_文档.pdf"
     assert not destination.exists()
+
+
+def test_copy_documents_by_title_skips_duplicate_content(tmp_path):
+    downloads = tmp_path / "downloads"
+    downloads.mkdir()
+    first = downloads / "a.pdf"
+    first.write_bytes(b"same")
+    second = downloads / "b.pdf"
+    second.write_bytes(b"same")
+
+    state = PBCState()
+    entry_one = state.ensure_entry({"title": "通知", "remark": ""})
+    state.mark_downloaded(entry_one, "http://example.com/a.pdf", "通知", "pdf", str(first), "d1")
+    entry_two = state.ensure_entry({"title": "转发通知", "remark": ""})
+    state.mark_downloaded(entry_two, "http://example.com/b.pdf", "转发通知", "pdf", str(second), "d1")
+
+    state_file = tmp_path / "state.json"
+    _write_state(state, state_file)
+
+    report, plans = copy_documents_by_title(state_file, tmp_path / "renamed")
+
+    assert report.copied == 1
+    assert report.skipped_duplicate == 1
+    assert report.total_processed() == 2
+    assert [plan.destination.name for plan in plans] == ["通知.pdf"]
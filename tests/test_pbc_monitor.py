@@ -17,6 +17,8 @@ sys.modules.setdefault("pdfkit", pdfkit_stub)
 
 from pbc_regulations.icrawler import pbc_monitor
 from pbc_regulations.icrawler import parser as parser_module
+from pbc_regulations.icrawler.fetcher import FetchedPage
+from pbc_regulations.icrawler.state import read_state_data
 
 
 def _make_soup(html: str) -> BeautifulSoup:
@@ -640,6 +642,125 @@ def test_state_roundtrip():
         assert loaded.to_jsonable() == stored
 
 
+def test_journal_state_appends_and_replays_changes(tmp_path):
+    state_path = str(tmp_path / "state.json")
+    state = pbc_monitor.PBCState()
+    entry_a = state.ensure_entry({"serial": 1, "title": "公告A", "remark": ""})
+    state.merge_documents(
+        entry_a,
+        [{"url": "http://example.com/a.pdf", "type": "pdf", "title": "公告A"}],
+    )
+    pbc_monitor.journal_state(state_path, state)
+    with open(state_path, "r", encoding="utf-8") as handle:
+        snapshot = handle.read()
+
+    state.mark_downloaded(entry_a, "http://example.com/a.pdf", "公告A", "pdf", "a.pdf")
+    pbc_monitor.journal_state(state_path, state)
+    entry_b = state.ensure_entry({"title": "公告B", "remark": ""})
+    state.merge_documents(
+        entry_b,
+        [{"url": "http://example.com/b.pdf", "type": "pdf", "title": "公告B"}],
+    )
+    pbc_monitor.journal_state(state_path, state)
+
+    with open(state_path, "r", encoding="utf-8") as handle:
+        assert handle.read() == snapshot
+    with open(state_path + ".journal", "r", encoding="utf-8") as handle:
+        assert len(handle.readlines()) == 3
+
+    loaded = pbc_monitor.load_state(state_path)
+    assert loaded.to_jsonable() == state.to_jsonable()
+    assert loaded.is_downloaded("http://example.com/a.pdf")
+
+    loaded.clear_downloaded("http://example.com/a.pdf")
+    pbc_monitor.journal_state(state_path, loaded)
+    with open(state_path + ".journal", "a", encoding="utf-8") as handle:
+        handle.write('{"entries": [{"serial"')
+    reloaded = pbc_monitor.load_state(state_path)
+    assert reloaded.to_jsonable() == loaded.to_jsonable()
+
+    reloaded.update_document_title("http://example.com/b.pdf", "公告B（修订）")
+    pbc_monitor.journal_state(state_path, reloaded)
+    assert not os.path.exists(state_path + ".journal")
+    with open(state_path, "r", encoding="utf-8") as handle:
+        assert json.load(handle) == reloaded.to_jsonable()
+
+
+def test_load_state_ignores_journal_from_other_snapshot(tmp_path):
+    state_path = str(tmp_path / "state.json")
+    state = pbc_monitor.PBCState()
+    entry_id = state.ensure_entry({"serial": 1, "title": "公告A", "remark": ""})
+    pbc_monitor.save_state(state_path, state)
+    state.merge_documents(
+        entry_id,
+        [{"url": "http://example.com/a.pdf", "type": "pdf", "title": "公告A"}],
+    )
+    pbc_monitor.journal_state(state_path, state)
+
+    other = pbc_monitor.PBCState()
+    other.ensure_entry({"serial": 7, "title": "其他", "remark": ""})
+    with open(state_path, "w", encoding="utf-8") as handle:
+        json.dump(other.to_jsonable(), handle)
+
+    loaded = pbc_monitor.load_state(state_path)
+    assert loaded.to_jsonable() == other.to_jsonable()
+
+
+def test_save_state_replaces_snapshot_atomically(tmp_path):
+    state_path = str(tmp_path / "state.json")
+    state = pbc_monitor.PBCState()
+    state.ensure_entry({"serial": 1, "title": "公告A", "remark": ""})
+    pbc_monitor.save_state(state_path, state)
+    os.chmod(state_path, 0o640)
+
+    original_replace = os.replace
+    try:
+        def failing_replace(src, dst):
+            raise OSError("disk full")
+
+        os.replace = failing_replace
+        state.ensure_entry({"serial": 2, "title": "公告B", "remark": ""})
+        try:
+            pbc_monitor.save_state(state_path, state)
+        except OSError:
+            pass
+        else:
+            raise AssertionError("save_state should propagate the failure")
+    finally:
+        os.replace = original_replace
+
+    with open(state_path, "r", encoding="utf-8") as handle:
+        assert len(json.load(handle)["entries"]) == 1
+    assert os.listdir(tmp_path) == ["state.json"]
+
+    pbc_monitor.save_state(state_path, state)
+    with open(state_path, "r", encoding="utf-8") as handle:
+        assert len(json.load(handle)["entries"]) == 2
+    assert os.stat(state_path).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["state.json"]
+
+
+def test_state_flusher_coalesces_writes(tmp_path):
+    state_path = str(tmp_path / "state.json")
+    state = pbc_monitor.PBCState()
+    entry_id = state.ensure_entry({"serial": 1, "title": "公告A", "remark": ""})
+    pbc_monitor.save_state(state_path, state)
+
+    with pbc_monitor.StateFlusher(state_path, interval=60) as flusher:
+        for index in range(5):
+            url = f"http://example.com/{index}.pdf"
+            state.merge_documents(entry_id, [{"url": url, "type": "pdf", "title": "A"}])
+            state.mark_downloaded(entry_id, url, "A", "pdf", f"{index}.pdf")
+            pbc_monitor._persist_state(state_path, state)
+        assert flusher.flush_count <= 1
+    assert flusher.flush_count <= 2
+    assert pbc_monitor._active_flushers == {}
+
+    assert read_state_data(state_path) == state.to_jsonable()
+    with open(state_path + ".journal", "r", encoding="utf-8") as handle:
+        assert len(handle.readlines()) <= 3
+
+
 def test_ensure_entry_preserves_and_assigns_serials():
     state = pbc_monitor.PBCState()
 
@@ -706,6 +827,42 @@ def test_ensure_entry_preserves_and_assigns_serials():
     assert state.entries[third_id]["serial"] == 3
 
 
+def test_state_indexes_track_documents_and_serials():
+    state = pbc_monitor.PBCState()
+    first_id = state.ensure_entry({"serial": 3, "title": "公告一", "remark": ""})
+    state.merge_documents(
+        first_id,
+        [{"url": "http://example.com/a.pdf", "type": "pdf", "title": "A"}],
+    )
+    second_id = state.ensure_entry({"title": "公告二", "remark": ""})
+    assert state.entries[second_id]["serial"] == 4
+
+    state.files.pop("http://example.com/a.pdf")
+    matched_id = state.ensure_entry(
+        {
+            "title": "公告一（更新）",
+            "remark": "",
+            "documents": [{"url": "http://example.com/a.pdf", "type": "pdf"}],
+        }
+    )
+    assert matched_id == first_id
+
+    state.mark_downloaded(first_id, "http://example.com/a.pdf", "A", "pdf", "a.pdf")
+    state.update_document_title("http://example.com/a.pdf", "A 新标题")
+    document = state.entries[first_id]["documents"][0]
+    assert len(state.entries[first_id]["documents"]) == 1
+    assert document["title"] == "A 新标题"
+    assert document["local_path"] == "a.pdf"
+
+    state.clear_downloaded("http://example.com/a.pdf")
+    assert "local_path" not in document
+    assert "downloaded" not in document
+
+    state.set_serial(second_id, 1)
+    assert state.ensure_entry({"serial": 1, "title": "公告三", "remark": ""}) != second_id
+    assert state._next_serial() == 5
+
+
 def test_load_state_from_legacy_list():
     with tempfile.TemporaryDirectory() as tmpdir:
         state_path = os.path.join(tmpdir, "state.json")
@@ -771,13 +928,13 @@ def test_collect_new_files_saves_state_on_each_download():
         os.makedirs(output_dir, exist_ok=True)
         if file_url.endswith("file2.pdf"):
             raise RuntimeError("fail second download")
-        return os.path.join(output_dir, os.path.basename(file_url))
+        return os.path.join(output_dir, os.path.basename(file_url)), None
 
     save_calls = []
     skip_messages = []
     original_iterate = pbc_monitor.iterate_listing_pages
     original_download = pbc_monitor.download_document
-    original_save = pbc_monitor.save_state
+    original_journal = pbc_monitor.journal_state
     original_print = builtins.print
     try:
         pbc_monitor.iterate_listing_pages = fake_iterate
@@ -786,11 +943,11 @@ def test_collect_new_files_saves_state_on_each_download():
         with tempfile.TemporaryDirectory() as tmpdir:
             state_path = os.path.join(tmpdir, "state.json")
 
-            def wrapped_save_state(path, state_obj):
+            def wrapped_journal_state(path, state_obj):
                 save_calls.append((path, state_obj.to_jsonable()))
-                original_save(path, state_obj)
+                original_journal(path, state_obj)
 
-            pbc_monitor.save_state = wrapped_save_state
+            pbc_monitor.journal_state = wrapped_journal_state
 
             def fake_print(*args, **kwargs):
                 message = " ".join(str(arg) for arg in args)
@@ -826,10 +983,12 @@ def test_collect_new_files_saves_state_on_each_download():
                 if doc.get("downloaded")
             }
             assert saved_urls == {"http://example.com/file1.pdf"}
-
-            pbc_monitor.save_state(state_path, state)
             jsonable = state.to_jsonable()
             assert save_calls[-1][1] == jsonable
+            assert read_state_data(state_path) == jsonable
+
+            pbc_monitor.save_state(state_path, state)
+            assert not os.path.exists(state_path + ".journal")
             with open(state_path, "r", encoding="utf-8") as handle:
                 data = json.load(handle)
             assert data == jsonable
@@ -851,10 +1010,486 @@ def test_collect_new_files_saves_state_on_each_download():
     finally:
         pbc_monitor.iterate_listing_pages = original_iterate
         pbc_monitor.download_document = original_download
-        pbc_monitor.save_state = original_save
+        pbc_monitor.journal_state = original_journal
+        builtins.print = original_print
+
+
+def test_token_bucket_spaces_requests_per_host():
+    from pbc_regulations.icrawler.throttle import HostRateLimiter
+
+    now = [0.0]
+    slept = []
+
+    def fake_sleep(seconds):
+        slept.append(seconds)
+
+    limiter = HostRateLimiter(2.0, clock=lambda: now[0], sleep=fake_sleep)
+    assert limiter.acquire("http://example.com/a.pdf") == 0.0
+    assert limiter.acquire("http://example.com/b.pdf") == 0.5
+    assert limiter.acquire("http://example.com/c.pdf") == 1.0
+    assert limiter.acquire("http://other.example.com/a.pdf") == 0.0
+    now[0] = 10.0
+    assert limiter.acquire("http://example.com/d.pdf") == 0.0
+    assert slept == [0.5, 1.0]
+
+    assert HostRateLimiter.from_delay(0.0, 0.0) is None
+    assert HostRateLimiter.from_delay(2.0, 2.0).rate == 1.0 / 3.0
+
+
+def test_collect_new_files_downloads_in_parallel(tmp_path):
+    import threading
+
+    html = """
+    <html><body>
+      <a href="file1.pdf">文件一</a>
+      <a href="file2.pdf">文件二</a>
+      <a href="file3.pdf">文件三</a>
+      <a href="file4.pdf">文件四</a>
+    </body></html>
+    """
+
+    def fake_iterate(session, start_url, delay, jitter, timeout, page_cache_dir=None, **kwargs):
+        yield start_url, _make_soup(html), None
+
+    owner = threading.current_thread()
+    worker_threads = set()
+    lock = threading.Lock()
+
+    def fake_download_document(session, file_url, output_dir, delay, jitter, timeout, doc_type):
+        with lock:
+            worker_threads.add(threading.current_thread())
+        assert (delay, jitter) == (0.0, 0.0)
+        if file_url.endswith("file3.pdf"):
+            raise RuntimeError("fail third download")
+        return os.path.join(output_dir, os.path.basename(file_url)), None
+
+    persisted_on = set()
+    original_iterate = pbc_monitor.iterate_listing_pages
+    original_download = pbc_monitor.download_document
+    original_journal = pbc_monitor.journal_state
+    original_print = builtins.print
+    try:
+        pbc_monitor.iterate_listing_pages = fake_iterate
+        pbc_monitor.download_document = fake_download_document
+
+        def wrapped_journal_state(path, state_obj):
+            persisted_on.add(threading.current_thread())
+            original_journal(path, state_obj)
+
+        pbc_monitor.journal_state = wrapped_journal_state
+        builtins.print = lambda *args, **kwargs: None
+
+        state_path = str(tmp_path / "state.json")
+        out_dir = str(tmp_path / "out")
+        state = pbc_monitor.PBCState()
+        stats = pbc_monitor.TaskStats()
+        downloaded = pbc_monitor.collect_new_files(
+            session=None,
+            start_url="http://example.com/index.html",
+            output_dir=out_dir,
+            state=state,
+            delay=0.0,
+            jitter=0.0,
+            timeout=10.0,
+            state_file=state_path,
+            page_cache_dir=None,
+            stats=stats,
+            max_concurrency=3,
+        )
+    finally:
+        pbc_monitor.iterate_listing_pages = original_iterate
+        pbc_monitor.download_document = original_download
+        pbc_monitor.journal_state = original_journal
+        builtins.print = original_print
+
+    assert sorted(downloaded) == [
+        os.path.join(out_dir, name) for name in ("file1.pdf", "file2.pdf", "file4.pdf")
+    ]
+    assert stats.files_downloaded == 3
+    assert owner not in worker_threads
+    assert persisted_on == {owner}
+    for name in ("file1.pdf", "file2.pdf", "file4.pdf"):
+        assert state.is_downloaded(f"http://example.com/{name}")
+    assert not state.is_downloaded("http://example.com/file3.pdf")
+    assert read_state_data(state_path) == state.to_jsonable()
+
+
+def test_async_fetch_engine_serves_fetch_and_download(tmp_path):
+    import hashlib
+    import time
+    from pbc_regulations.icrawler import async_fetch
+    from pbc_regulations.icrawler.fetching import fetch
+
+    requested = []
+
+    class FakeResponse:
+        def __init__(self, url):
+            self.url = url
+            self.encoding = "utf-8"
+            self.apparent_encoding = "utf-8"
+            self.text = f"<html>{url}</html>"
+
+        def raise_for_status(self):
+            return None
+
+        def iter_content(self, chunk_size=8192):
+            yield b"data:" + self.url.encode("utf-8")
+
+    class FakeSession:
+        def get(self, url, stream=False, timeout=None):
+            requested.append((url, time.monotonic()))
+            return FakeResponse(url)
+
+    engine = async_fetch.AsyncFetchEngine(2, session_factory=FakeSession, use_httpx=False)
+    previous = async_fetch.install_fetch_engine(engine)
+    try:
+        assert fetch(None, "http://example.com/a.html", 0.05, 0.0, 5.0) == "<html>http://example.com/a.html</html>"
+        path, digest = pbc_monitor.download_file(
+            None,
+            "http://example.com/files/doc.pdf",
+            str(tmp_path),
+            0.05,
+            0.0,
+            5.0,
+        )
+        futures = [
+            engine.prefetch(f"http://example.com/index_{page}.html", 0.05, 0.0, 5.0)
+            for page in (1, 2)
+        ]
+        assert [future.result().text for future in futures] == [
+            "<html>http://example.com/index_1.html</html>",
+            "<html>http://example.com/index_2.html</html>",
+        ]
+    finally:
+        async_fetch.install_fetch_engine(previous)
+        engine.close()
+
+    assert path == str(tmp_path / "doc.pdf")
+    assert (tmp_path / "doc.pdf").read_bytes() == b"data:http://example.com/files/doc.pdf"
+    assert digest == hashlib.sha256(b"data:http://example.com/files/doc.pdf").hexdigest()
+    times = sorted(moment for _, moment in requested)
+    assert len(times) == 4
+    assert all(later - earlier >= 0.04 for earlier, later in zip(times, times[1:]))
+
+
+def test_iterate_listing_pages_prefetches_only_next_page():
+    from concurrent.futures import Future
+    from pbc_regulations.icrawler import async_fetch
+
+    start_url = "http://example.com/list/index.html"
+    first_page = """
+    <html><body>
+      <a href="index_1.html">下一页</a>
+      <a href="index_2.html">3</a>
+      <a href="index_5.html">尾页</a>
+    </body></html>
+    """
+    prefetched = {}
+
+    class FakeEngine:
+        def prefetch(self, url, delay, jitter, timeout, headers=None):
+            future = Future()
+            prefetched[url] = future
+            return future
+
+    original_fetch_page = pbc_monitor._fetch_page
+    previous = async_fetch.install_fetch_engine(FakeEngine())
+    try:
+        pbc_monitor._fetch_page = lambda *args, **kwargs: FetchedPage(200, first_page, {})
+        pages = pbc_monitor.iterate_listing_pages(None, start_url, 0.0, 0.0, 5.0)
+        url, _soup, _path = next(pages)
+        pages.close()
+    finally:
+        async_fetch.install_fetch_engine(previous)
+        pbc_monitor._fetch_page = original_fetch_page
+
+    assert url == start_url
+    assert list(prefetched) == ["http://example.com/list/index_1.html"]
+    assert prefetched["http://example.com/list/index_1.html"].cancelled()
+
+
+def test_async_fetch_engine_cancelled_prefetch_releases_its_slot():
+    import time
+    from pbc_regulations.icrawler import async_fetch
+
+    requested = []
+
+    class FakeResponse:
+        encoding = "utf-8"
+        apparent_encoding = "utf-8"
+        text = "<html></html>"
+        headers = {}
+
+        def raise_for_status(self):
+            return None
+
+    class FakeSession:
+        def get(self, url, stream=False, timeout=None, headers=None):
+            requested.append((url, time.monotonic()))
+            return FakeResponse()
+
+    engine = async_fetch.AsyncFetchEngine(2, session_factory=FakeSession, use_httpx=False)
+    try:
+        engine.fetch_page("http://example.com/a.html", 0.3, 0.0, 5.0)
+        queued = engine.prefetch("http://example.com/b.html", 0.3, 0.0, 5.0)
+        queued.cancel()
+        engine.fetch_page("http://example.com/c.html", 0.3, 0.0, 5.0)
+    finally:
+        engine.close()
+
+    assert [url for url, _ in requested] == ["http://example.com/a.html", "http://example.com/c.html"]
+    elapsed = requested[1][1] - requested[0][1]
+    assert 0.25 <= elapsed < 0.55
+
+
+def test_collect_new_files_stops_after_known_pages(tmp_path):
+    pages = [
+        '<html><body><a href="new.pdf">新文件</a></body></html>',
+        '<html><body><a href="old1.pdf">旧文件一</a></body></html>',
+        '<html><body><a href="old2.pdf">旧文件二</a></body></html>',
+        '<html><body><a href="old3.pdf">旧文件三</a></body></html>',
+    ]
+    served = []
+
+    def fake_iterate(session, start_url, delay, jitter, timeout, page_cache_dir=None, **kwargs):
+        for index, html in enumerate(pages, start=1):
+            served.append(index)
+            yield f"http://example.com/index_{index}.html", _make_soup(html), None
+
+    def fake_download_document(session, file_url, output_dir, delay, jitter, timeout, doc_type):
+        return os.path.join(output_dir, os.path.basename(file_url)), None
+
+    state = pbc_monitor.PBCState()
+    for name in ("old1", "old2", "old3"):
+        entry_id = state.ensure_entry(
+            {"title": name, "documents": [{"url": f"http://example.com/{name}.pdf", "type": "pdf"}]}
+        )
+        state.merge_documents(entry_id, [{"url": f"http://example.com/{name}.pdf", "type": "pdf"}])
+        state.mark_downloaded(entry_id, f"http://example.com/{name}.pdf", name, "pdf", f"/tmp/{name}.pdf")
+    assert state.is_known_entry({"documents": [{"url": "http://example.com/old1.pdf"}]})
+    assert not state.is_known_entry({"documents": [{"url": "http://example.com/new.pdf"}]})
+
+    original_iterate = pbc_monitor.iterate_listing_pages
+    original_download = pbc_monitor.download_document
+    original_print = builtins.print
+    try:
+        pbc_monitor.iterate_listing_pages = fake_iterate
+        pbc_monitor.download_document = fake_download_document
+        builtins.print = lambda *args, **kwargs: None
+        downloaded = pbc_monitor.collect_new_files(
+            session=None,
+            start_url="http://example.com/index_1.html",
+            output_dir=str(tmp_path),
+            state=state,
+            delay=0.0,
+            jitter=0.0,
+            timeout=5.0,
+            state_file=None,
+            page_cache_dir=None,
+            incremental_pages=2,
+        )
+        assert downloaded == [str(tmp_path / "new.pdf")]
+        assert served == [1, 2, 3]
+
+        served.clear()
+        pbc_monitor.collect_new_files(
+            session=None,
+            start_url="http://example.com/index_1.html",
+            output_dir=str(tmp_path),
+            state=state,
+            delay=0.0,
+            jitter=0.0,
+            timeout=5.0,
+            state_file=None,
+            page_cache_dir=None,
+        )
+        assert served == [1, 2, 3, 4]
+
+        # Empty pages do not count as known ones.
+        pages[1:1] = ["<html><body>维护中</body></html>"] * 2
+        served.clear()
+        pbc_monitor.collect_new_files(
+            session=None,
+            start_url="http://example.com/index_1.html",
+            output_dir=str(tmp_path),
+            state=state,
+            delay=0.0,
+            jitter=0.0,
+            timeout=5.0,
+            state_file=None,
+            page_cache_dir=None,
+            incremental_pages=2,
+        )
+        assert served == [1, 2, 3, 4, 5]
+    finally:
+        pbc_monitor.iterate_listing_pages = original_iterate
+        pbc_monitor.download_document = original_download
         builtins.print = original_print
 
 
+def test_run_monitor_iteration_schedules_full_sweeps():
+    seen = []
+
+    def fake_monitor_once(*args, **kwargs):
+        seen.append(kwargs["incremental_pages"])
+        return []
+
+    original_monitor_once = pbc_monitor.monitor_once
+    original_print = builtins.print
+    try:
+        pbc_monitor.monitor_once = fake_monitor_once
+        builtins.print = lambda *args, **kwargs: None
+        for iteration in range(1, 6):
+            pbc_monitor.run_monitor_iteration(
+                "http://example.com/index.html",
+                "out",
+                None,
+                0.0,
+                0.0,
+                5.0,
+                None,
+                iteration=iteration,
+                force_no_use_cache=True,
+                incremental_pages=2,
+                full_sweep_every=2,
+            )
+    finally:
+        pbc_monitor.monitor_once = original_monitor_once
+        builtins.print = original_print
+
+    assert seen == [0, 2, 0, 2, 0]
+
+
+def test_run_monitor_iteration_records_history_without_reloading_state(tmp_path):
+    from pbc_regulations.icrawler.run_history import RunHistory, install_run_history
+
+    def fake_monitor_once(*args, **kwargs):
+        stats = kwargs["stats"]
+        stats.pages_total = stats.pages_fetched = 3
+        stats.files_downloaded = 1
+        stats.bytes_downloaded = 42
+        stats.entries_total = 7
+        stats.wall_seconds = 1.5
+        return ["out/new.pdf"]
+
+    def fail_load_state(*args, **kwargs):
+        raise AssertionError("state reloaded after the iteration")
+
+    history = RunHistory(str(tmp_path / "run_history.sqlite3"))
+    original_monitor_once = pbc_monitor.monitor_once
+    original_load_state = pbc_monitor.load_state
+    original_print = builtins.print
+    previous_history = install_run_history(history)
+    try:
+        pbc_monitor.monitor_once = fake_monitor_once
+        pbc_monitor.load_state = fail_load_state
+        builtins.print = lambda *args, **kwargs: None
+        pbc_monitor.run_monitor_iteration(
+            "http://example.com/index.html",
+            "out",
+            None,
+            0.0,
+            0.0,
+            5.0,
+            None,
+            iteration=4,
+            task_name="Demo",
+            force_no_use_cache=True,
+        )
+    finally:
+        install_run_history(previous_history)
+        pbc_monitor.monitor_once = original_monitor_once
+        pbc_monitor.load_state = original_load_state
+        builtins.print = original_print
+
+    (run,) = history.query("Demo")
+    assert run["context"] == "iteration 4"
+    assert run["iteration"] == 4
+    assert run["pages_fetched"] == 3
+    assert run["bytes_downloaded"] == 42
+    assert run["entries_total"] == 7
+    assert run["new_files"] == 1
+    assert run["wall_seconds"] == 1.5
+
+
+def test_download_file_stores_identical_content_once(tmp_path):
+    import hashlib
+    from pbc_regulations.icrawler import blob_store
+
+    class FakeResponse:
+        def raise_for_status(self):
+            return None
+
+        def iter_content(self, chunk_size=8192):
+            yield b"same "
+            yield b"content"
+
+    class FakeSession:
+        def get(self, url, stream=False, timeout=None):
+            return FakeResponse()
+
+    store = blob_store.BlobStore(str(tmp_path / "blobs"))
+    previous = blob_store.install_blob_store(store)
+    try:
+        first, first_digest = pbc_monitor.download_file(
+            FakeSession(), "http://a.example.com/x.pdf", str(tmp_path / "task1"), 0.0, 0.0, 5.0
+        )
+        second, second_digest = pbc_monitor.download_file(
+            FakeSession(), "http://b.example.com/y.pdf", str(tmp_path / "task2"), 0.0, 0.0, 5.0
+        )
+    finally:
+        blob_store.install_blob_store(previous)
+
+    digest = hashlib.sha256(b"same content").hexdigest()
+    assert first_digest == second_digest == digest
+    assert blob_store.file_digest(first) == digest
+    assert os.path.samefile(first, second)
+    assert os.path.samefile(first, store.path_for(digest))
+    assert not os.path.exists(first + ".part")
+
+    state = pbc_monitor.PBCState()
+    entry_id = state.ensure_entry({"title": "文件", "documents": [{"url": "http://a.example.com/x.pdf"}]})
+    state.mark_downloaded(entry_id, "http://a.example.com/x.pdf", "文件", "pdf", first, digest)
+    state_path = str(tmp_path / "state.json")
+    pbc_monitor.save_state(state_path, state)
+    reloaded = pbc_monitor.load_state(state_path)
+    assert reloaded.files["http://a.example.com/x.pdf"]["sha256"] == digest
+
+
+def test_download_file_updates_artifact_manifest(tmp_path):
+    from pbc_regulations.icrawler import artifact_stats
+
+    bodies = [b"first", b"second version"]
+
+    class FakeResponse:
+        def __init__(self, body):
+            self.body = body
+
+        def raise_for_status(self):
+            return None
+
+        def iter_content(self, chunk_size=8192):
+            yield self.body
+
+    class FakeSession:
+        def get(self, url, stream=False, timeout=None):
+            return FakeResponse(bodies.pop(0))
+
+    task_dir = tmp_path / "task"
+    task_dir.mkdir()
+    artifact_stats.audit_artifact_directory(str(task_dir))
+    for _ in range(2):
+        pbc_monitor.download_document(
+            FakeSession(), "http://example.com/a/doc.pdf", str(task_dir), 0.0, 0.0, 5.0, "pdf"
+        )
+
+    stats = artifact_stats.load_artifact_stats(str(task_dir))
+    assert (stats.files, stats.bytes) == (1, len(b"second version"))
+    assert stats.types == {"pdf": {"files": 1, "bytes": len(b"second version")}}
+    audited = artifact_stats.audit_artifact_directory(str(task_dir))
+    assert (audited.files, audited.bytes, audited.types) == (stats.files, stats.bytes, stats.types)
+
+
 def test_collect_new_files_updates_missing_name():
     html = """
     <html><body>
@@ -984,14 +1619,14 @@ def test_snapshot_listing_overwrites_cached_pages(tmp_path):
     page_cache_dir = os.path.join(tmp_path, "pages")
     counter = {"value": 0}
 
-    def fake_fetch(session, url, delay, jitter, timeout):
+    def fake_fetch_page(session, url, delay, jitter, timeout, cache_path):
         counter["value"] += 1
-        return f"<html><body>version {counter['value']}</body></html>"
+        return FetchedPage(200, f"<html><body>version {counter['value']}</body></html>")
 
-    original_fetch = pbc_monitor._fetch
+    original_fetch = pbc_monitor._fetch_page
     original_session = getattr(pbc_monitor.requests, "Session", None)
     try:
-        pbc_monitor._fetch = fake_fetch
+        pbc_monitor._fetch_page = fake_fetch_page
         pbc_monitor.requests.Session = lambda: types.SimpleNamespace(headers={})
 
         snapshot1 = pbc_monitor.snapshot_listing(
@@ -1019,7 +1654,7 @@ def test_snapshot_listing_overwrites_cached_pages(tmp_path):
         html_files = [name for name in os.listdir(page_cache_dir) if name.endswith(".html")]
         assert len(html_files) == 1
     finally:
-        pbc_monitor._fetch = original_fetch
+        pbc_monitor._fetch_page = original_fetch
         if original_session is not None:
             pbc_monitor.requests.Session = original_session
         elif hasattr(pbc_monitor.requests, "Session"):
@@ -1070,7 +1705,7 @@ def test_download_from_structure_downloads_files(tmp_path):
             with open(target, "w", encoding="utf-8") as fh:
                 fh.write(f"dummy for {doc_type}")
             downloaded_targets.append(target)
-            return target
+            return target, None
 
         pbc_monitor.download_document = fake_download_document
         result = pbc_monitor.download_from_structure(
@@ -1102,6 +1737,55 @@ def test_download_from_structure_downloads_files(tmp_path):
     assert pdf_doc["local_path"].endswith("file1.pdf")
 
 
+def test_download_from_structure_records_run_stats(tmp_path):
+    from pbc_regulations.icrawler.run_history import RunHistory, install_run_history
+
+    structure_path = os.path.join(tmp_path, "structure.json")
+    output_dir = os.path.join(tmp_path, "downloads")
+    state_path = os.path.join(tmp_path, "state.json")
+    documents = [
+        {"url": "http://example.com/file1.pdf", "type": "pdf", "title": "附件一"},
+        {"url": "http://example.com/file2.pdf", "type": "pdf", "title": "附件二"},
+    ]
+    with open(structure_path, "w", encoding="utf-8") as handle:
+        json.dump({"entries": [{"serial": 1, "title": "公告", "documents": documents}]}, handle)
+
+    def fake_download_document(session, file_url, out_dir, delay, jitter, timeout, doc_type):
+        os.makedirs(out_dir, exist_ok=True)
+        target = os.path.join(out_dir, os.path.basename(file_url))
+        with open(target, "wb") as fh:
+            fh.write(b"x" * 10)
+        return target, None
+
+    history = RunHistory(os.path.join(tmp_path, "run_history.sqlite3"))
+    original_download_document = pbc_monitor.download_document
+    previous_history = install_run_history(history)
+    try:
+        pbc_monitor.download_document = fake_download_document
+        pbc_monitor.download_from_structure(
+            structure_path,
+            output_dir,
+            state_path,
+            delay=0.0,
+            jitter=0.0,
+            timeout=5.0,
+            task_name="Demo",
+        )
+    finally:
+        install_run_history(previous_history)
+        pbc_monitor.download_document = original_download_document
+
+    (run,) = history.query("Demo")
+    assert run["context"] == "download-from-structure"
+    assert run["files_downloaded"] == 2
+    assert run["bytes_downloaded"] == 20
+    assert run["entries_total"] == 1
+    assert run["documents_total"] == 2
+    assert run["files_marked_downloaded"] == 2
+    assert run["new_files"] == 2
+    assert run["wall_seconds"] >= run["download_seconds"] >= 0
+
+
 def test_download_from_structure_ignores_javascript_links(tmp_path):
     structure_path = os.path.join(tmp_path, "structure.json")
     output_dir = os.path.join(tmp_path, "downloads")
@@ -1143,7 +1827,7 @@ def test_download_from_structure_ignores_javascript_links(tmp_path):
         target = os.path.join(out_dir, name)
         with open(target, "w", encoding="utf-8") as fh:
             fh.write("dummy")
-        return target
+        return target, None
 
     original_download_document = pbc_monitor.download_document
     try:
@@ -1168,11 +1852,65 @@ def test_download_from_structure_ignores_javascript_links(tmp_path):
     assert documents[javascript_url].get("downloaded") is not True
 
 
+def test_iterate_listing_pages_revalidates_with_validators(tmp_path):
+    start_url = "http://example.com/list/index.html"
+    page_cache_dir = str(tmp_path / "pages")
+    sent_headers = []
+
+    class FakeResponse:
+        def __init__(self, status_code, text, headers):
+            self.status_code = status_code
+            self.text = text
+            self.headers = headers
+            self.encoding = "utf-8"
+            self.apparent_encoding = "utf-8"
+
+        def raise_for_status(self):
+            return None
+
+    class FakeSession:
+        headers = {}
+
+        def get(self, url, timeout=None, headers=None):
+            sent_headers.append(dict(headers or {}))
+            if headers and headers.get("If-None-Match") == '"v1"':
+                return FakeResponse(304, "", {})
+            return FakeResponse(200, "<html><body>listing v1</body></html>", {"ETag": '"v1"'})
+
+    def crawl():
+        stats = pbc_monitor.TaskStats()
+        pages = [
+            soup.get_text()
+            for _, soup, _ in pbc_monitor.iterate_listing_pages(
+                FakeSession(),
+                start_url,
+                0.0,
+                0.0,
+                5.0,
+                page_cache_dir=page_cache_dir,
+                stats=stats,
+            )
+        ]
+        return pages, stats
+
+    pages, stats = crawl()
+    assert pages == ["listing v1"]
+    assert (stats.pages_fetched, stats.pages_from_cache) == (1, 0)
+    assert sent_headers == [{}]
+
+    pages, stats = crawl()
+    assert pages == ["listing v1"]
+    assert (stats.pages_fetched, stats.pages_from_cache) == (0, 1)
+    assert sent_headers[-1] == {"If-None-Match": '"v1"'}
+
+
 def test_download_document_html_uses_path_segments(tmp_path):
-    original_fetch = pbc_monitor._fetch
+    original_fetch = pbc_monitor._fetch_page
     try:
-        pbc_monitor._fetch = lambda session, url, delay, jitter, timeout: "<html>content</html>"
-        path = pbc_monitor.download_document(
+        pbc_monitor._fetch_page = lambda session, url, delay, jitter, timeout, cache_path: FetchedPage(
+            200, "<html>content</html>"
+        )
+        path, digest = pbc_monitor.download_document(
             session=None,
             file_url="http://example.com/dir/sub/index.html",
             output_dir=os.path.join(tmp_path, "out"),
@@ -1182,7 +1920,7 @@ def test_download_document_html_uses_path_segments(tmp_path):
             doc_type="html",
         )
     finally:
-        pbc_monitor._fetch = original_fetch
+        pbc_monitor._fetch_page = original_fetch
 
     assert os.path.basename(path) == "dir_sub_index.html"
     with open(path, "r", encoding="utf-8") as handle:
@@ -1229,7 +1967,7 @@ def test_collect_new_files_downloads_html_documents(tmp_path):
         with open(target, "w", encoding="utf-8") as handle:
             handle.write(doc_type or "")
         download_calls.append((file_url, doc_type, target))
-        return target
+        return target, None
 
     original_iterate = pbc_monitor.iterate_listing_pages
     original_extract = pbc_monitor.extract_listing_entries
@@ -1302,7 +2040,7 @@ def test_collect_new_files_respects_allowed_types(tmp_path):
         with open(target, "w", encoding="utf-8") as handle:
             handle.write(doc_type or "")
         download_calls.append((file_url, doc_type))
-        return target
+        return target, None
 
     original_iterate = pbc_monitor.iterate_listing_pages
     original_extract = pbc_monitor.extract_listing_entries
@@ -1430,7 +2168,7 @@ def test_collect_new_files_verify_local_recovers_missing(tmp_path):
         with open(target, "w", encoding="utf-8") as handle:
             handle.write("re-downloaded")
         downloads.append(file_url)
-        return target
+        return target, None
 
     original_iterate = pbc_monitor.iterate_listing_pages
     original_extract = pbc_monitor.extract_listing_entries
@@ -1,4 +1,6 @@
+import asyncio
 import json
+import os
 import sys
 from pathlib import Path
 from typing import Dict
@@ -13,9 +15,19 @@ if str(ROOT) not in sys.path:
 
 from pbc_regulations.searcher.api_server import create_app  # noqa: E402
 from pbc_regulations.searcher.clause_lookup import ClauseLookup  # noqa: E402
+from pbc_regulations.searcher.index_snapshot import (  # noqa: E402
+    load_index_snapshot,
+    write_index_snapshot,
+)
+from pbc_regulations.searcher.query_cache import QueryCache  # noqa: E402
+from pbc_regulations.searcher.reloader import SearchIndexReloader  # noqa: E402
+from pbc_regulations.searcher.text_cache import TextCache  # noqa: E402
+from pbc_regulations.searcher import tfidf  # noqa: E402
+from pbc_regulations.searcher.title_index import TitleIndex  # noqa: E402
 from pbc_regulations.searcher.policy_finder import (  # noqa: E402
     DEFAULT_SEARCH_TASKS,
     PolicyFinder,
+    fuzzy_score,
 )
 
 
@@ -247,6 +259,279 @@ def test_search_covers_additional_tasks(policy_api):
     assert any("金融稳定法" in title for title in titles)
 
 
+def test_search_index_matches_linear_scan(policy_api):
+    finder, _, _ = policy_api
+    queries = [
+        "人民银行公告",
+        "中国人民银行公告〔2023〕第3号",
+        "2021 年度总结",
+        "金融控股公司监督管理办法",
+        "支付",
+        "unrelated query",
+        "",
+    ]
+    for query in queries:
+        expected = sorted(
+            ((entry, fuzzy_score(query, entry)) for entry in finder.entries),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+        for topk in (1, 3, len(finder.entries) + 2):
+            results = finder.search(query, topk=topk)
+            assert [(entry.id, score) for entry, score in results] == [
+                (entry.id, score) for entry, score in expected[:topk]
+            ]
+
+
+def test_index_snapshot_round_trip_and_invalidation(sample_state_files, tmp_path):
+    state_paths, extract_paths = sample_state_files
+    ordered_state_paths = [
+        state_paths[name] for name in DEFAULT_SEARCH_TASKS if name in state_paths
+    ]
+    extracts = list(extract_paths.values())
+    finder = PolicyFinder(*(str(path) for path in ordered_state_paths))
+    lookup = ClauseLookup(extracts)
+    snapshot = tmp_path / "snapshot" / "search_index.bin"
+    write_index_snapshot(snapshot, finder, lookup, ordered_state_paths, extracts)
+
+    restored = load_index_snapshot(snapshot, ordered_state_paths, extracts)
+    assert restored is not None
+    restored_finder, restored_lookup = restored
+    assert [entry.title for entry in restored_finder.entries] == [
+        entry.title for entry in finder.entries
+    ]
+    assert [
+        (entry.id, score) for entry, score in restored_finder.search("金融稳定法", topk=2)
+    ] == [(entry.id, score) for entry, score in finder.search("金融稳定法", topk=2)]
+    assert restored_lookup.available_titles() == lookup.available_titles()
+
+    touched = ordered_state_paths[0]
+    stat = touched.stat()
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10_000_000))
+    assert load_index_snapshot(snapshot, ordered_state_paths, extracts) is not None
+
+    touched.write_text(touched.read_text("utf-8").replace("测试备注", "新备注"), "utf-8")
+    assert load_index_snapshot(snapshot, ordered_state_paths, extracts) is None
+    assert load_index_snapshot(snapshot, ordered_state_paths[1:], extracts) is None
+
+
+def test_index_snapshot_restores_full_text_index(sample_state_files, tmp_path):
+    state_paths, extract_paths = sample_state_files
+    ordered_state_paths = [
+        state_paths[name] for name in DEFAULT_SEARCH_TASKS if name in state_paths
+    ]
+    extracts = list(extract_paths.values())
+    finder = PolicyFinder(*(str(path) for path in ordered_state_paths))
+    lookup = ClauseLookup(extracts)
+    finder.build_text_index(lookup)
+    assert str(tmp_path / "policy.txt") in finder.text_index.sources
+    snapshot = tmp_path / "snapshot" / "search_index.bin"
+    write_index_snapshot(snapshot, finder, lookup, ordered_state_paths, extracts)
+
+    restored_finder, restored_lookup = load_index_snapshot(snapshot, ordered_state_paths, extracts)
+    assert restored_finder.text_index is not None
+    assert restored_finder.ensure_text_index(restored_lookup) is restored_finder.text_index
+    assert [entry.id for entry, *_ in restored_finder.keyword_search("风险评估", restored_lookup)] == [1]
+
+    policy_text = tmp_path / "policy.txt"
+    policy_text.write_text(policy_text.read_text("utf-8") + "第四条 新增条款。\n", "utf-8")
+    restored_finder, _lookup = load_index_snapshot(snapshot, ordered_state_paths, extracts)
+    assert restored_finder.text_index is None
+    assert len(restored_finder.entries) == len(finder.entries)
+
+
+def test_index_snapshot_rewrite_hashes_only_changed_files(sample_state_files, tmp_path, monkeypatch):
+    from pbc_regulations.searcher import index_snapshot
+
+    state_paths, extract_paths = sample_state_files
+    ordered_state_paths = [
+        state_paths[name] for name in DEFAULT_SEARCH_TASKS if name in state_paths
+    ]
+    extracts = list(extract_paths.values())
+    finder = PolicyFinder(*(str(path) for path in ordered_state_paths))
+    lookup = ClauseLookup(extracts)
+    finder.build_text_index(lookup)
+    snapshot = tmp_path / "snapshot" / "search_index.bin"
+    write_index_snapshot(snapshot, finder, lookup, ordered_state_paths, extracts)
+
+    hashed = []
+    original_hash = index_snapshot._file_sha256
+
+    def counting_hash(path):
+        hashed.append(path.name)
+        return original_hash(path)
+
+    monkeypatch.setattr(index_snapshot, "_file_sha256", counting_hash)
+    write_index_snapshot(snapshot, finder, lookup, ordered_state_paths, extracts)
+    assert hashed == []
+
+    policy_text = tmp_path / "policy.txt"
+    policy_text.write_text(policy_text.read_text("utf-8") + "第四条 新增条款。\n", "utf-8")
+    write_index_snapshot(snapshot, finder, lookup, ordered_state_paths, extracts)
+    assert hashed == ["policy.txt"]
+
+
+def test_search_sources_follow_state_journal(sample_state_files, tmp_path):
+    from pbc_regulations.icrawler.state import journal_state, load_state
+
+    state_paths, extract_paths = sample_state_files
+    ordered_state_paths = [
+        state_paths[name] for name in DEFAULT_SEARCH_TASKS if name in state_paths
+    ]
+    extracts = list(extract_paths.values())
+    reloader = SearchIndexReloader(ordered_state_paths, extracts)
+    snapshot = tmp_path / "snapshot" / "search_index.bin"
+    write_index_snapshot(snapshot, reloader.finder, reloader.clause_lookup, ordered_state_paths, extracts)
+
+    law_path = str(state_paths["tiaofasi_national_law"])
+    snapshot_text = Path(law_path).read_text("utf-8")
+    state = load_state(law_path, None)
+    state.ensure_entry({"serial": 7, "title": "国家法律 中国人民银行法", "remark": ""})
+    journal_state(law_path, state)
+    assert Path(law_path).read_text("utf-8") == snapshot_text
+    assert os.path.exists(law_path + ".journal")
+
+    assert load_index_snapshot(snapshot, ordered_state_paths, extracts) is None
+    assert reloader.check() is True
+    assert reloader.finder.search("中国人民银行法", topk=1)[0][0].title == "国家法律 中国人民银行法"
+
+
+def test_reloader_keeps_writes_made_during_rebuild(sample_state_files, monkeypatch):
+    import threading
+    import time
+
+    state_paths, extract_paths = sample_state_files
+    ordered_state_paths = [
+        state_paths[name] for name in DEFAULT_SEARCH_TASKS if name in state_paths
+    ]
+    reloader = SearchIndexReloader(ordered_state_paths, list(extract_paths.values()))
+    assert reloader.finder._text_index is not None
+
+    law_path = state_paths["tiaofasi_national_law"]
+
+    def rewrite(title):
+        payload = json.loads(law_path.read_text("utf-8"))
+        payload["entries"][0]["title"] = title
+        law_path.write_text(json.dumps(payload, ensure_ascii=False), "utf-8")
+        stat = law_path.stat()
+        os.utime(law_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    original_build = reloader._build_finder
+
+    def build_while_crawler_writes(changed):
+        finder = original_build(changed)
+        rewrite("国家法律 反洗钱法（修订）")
+        return finder
+
+    rewrite("国家法律 反洗钱法")
+    monkeypatch.setattr(reloader, "_build_finder", build_while_crawler_writes)
+    assert reloader.check() is True
+    assert reloader.finder._text_index is not None
+    monkeypatch.undo()
+    assert reloader.check() is True
+    titles = [entry.title for entry in reloader.finder.entries]
+    assert "国家法律 反洗钱法（修订）" in titles
+
+    finder = PolicyFinder(*(str(path) for path in ordered_state_paths))
+    builds = []
+    original_build_text_index = finder.build_text_index
+
+    def slow_build(clause_lookup=None):
+        builds.append(1)
+        time.sleep(0.1)
+        return original_build_text_index(clause_lookup)
+
+    monkeypatch.setattr(finder, "build_text_index", slow_build)
+    threads = [
+        threading.Thread(target=finder.keyword_search, args=("外包",)) for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    assert builds == [1]
+
+
+def test_reloader_swaps_in_changed_task(sample_state_files):
+    state_paths, extract_paths = sample_state_files
+    ordered_state_paths = [
+        state_paths[name] for name in DEFAULT_SEARCH_TASKS if name in state_paths
+    ]
+    reloaded = []
+    reloader = SearchIndexReloader(
+        ordered_state_paths,
+        list(extract_paths.values()),
+        on_reload=lambda finder, lookup: reloaded.append(finder),
+    )
+    first_finder, first_lookup = reloader.current()
+    assert reloader.generation == 1
+    assert reloader.check() is False
+
+    law_path = state_paths["tiaofasi_national_law"]
+    payload = json.loads(law_path.read_text("utf-8"))
+    payload["entries"].append(
+        {
+            "serial": 7,
+            "title": "国家法律 中国人民银行法",
+            "remark": "国家法律",
+            "documents": [{"type": "pdf", "local_path": "/tmp/pbc_law.pdf"}],
+        }
+    )
+    law_path.write_text(json.dumps(payload, ensure_ascii=False), "utf-8")
+    untouched = state_paths["tiaofasi_departmental_rule"]
+    cached_entries = reloader._state_entries[untouched]
+
+    assert reloader.check() is True
+    finder, lookup = reloader.current()
+    assert reloader.generation == 2
+    assert reloaded == [finder]
+    assert finder is not first_finder
+    assert lookup is first_lookup
+    assert reloader._state_entries[untouched] is cached_entries
+    assert finder.search("中国人民银行法", topk=1)[0][0].title == "国家法律 中国人民银行法"
+    assert len(first_finder.entries) == len(DEFAULT_SEARCH_TASKS)
+    status = reloader.status()
+    assert status["generation"] == 2
+    assert status["last_reload_seconds"] is not None
+
+
+def test_reloader_reads_only_changed_texts(sample_state_files, tmp_path, monkeypatch):
+    from pbc_regulations.searcher import policy_finder as policy_finder_module
+
+    state_paths, extract_paths = sample_state_files
+    ordered_state_paths = [
+        state_paths[name] for name in DEFAULT_SEARCH_TASKS if name in state_paths
+    ]
+    reloader = SearchIndexReloader(ordered_state_paths, list(extract_paths.values()))
+    law_path = state_paths["tiaofasi_national_law"]
+    policy_text = tmp_path / "policy.txt"
+
+    reads = []
+    original_load = policy_finder_module._load_document_text
+
+    def counting_load(path, doc_type):
+        reads.append(Path(path).name)
+        return original_load(path, doc_type)
+
+    monkeypatch.setattr(policy_finder_module, "_load_document_text", counting_load)
+
+    def touch(path):
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    touch(law_path)
+    assert reloader.check() is True
+    assert reads == []
+    assert [entry.id for entry, *_ in reloader.finder.keyword_search("风险评估")] == [1]
+
+    policy_text.write_text(policy_text.read_text("utf-8") + "第四条 数据安全要求。\n", "utf-8")
+    touch(law_path)
+    assert reloader.check() is True
+    assert set(reads) == {"policy.txt"}
+    assert [entry.id for entry, *_ in reloader.finder.keyword_search("数据安全")] == [1]
+    assert [entry.id for entry, *_ in reloader.finder.keyword_search("风险评估")] == [1]
+
+
 def test_get_search_includes_clause(policy_api):
     finder, get_route, _ = policy_api
     response = get_route.endpoint(
@@ -295,6 +580,85 @@ def test_list_policies_with_query(policy_app):
     assert data["policies"][0]["title"].startswith("中国人民银行")
 
 
+def test_list_policies_query_uses_text_index(policy_app, tmp_path):
+    app, finder, lookup = policy_app
+    route = _get_route(app, "/policies", "GET")
+    (tmp_path / "policy.txt").unlink()
+    (tmp_path / "policy.html").unlink()
+    finder.text_cache.clear()
+
+    response = route.endpoint(
+        query="管理制度",
+        finder_instance=finder,
+        clause_lookup_instance=lookup,
+    )
+    data = json.loads(response.body.decode("utf-8"))
+    assert data["result_count"] == 1
+    assert data["policies"][0]["title"].startswith("中国人民银行")
+
+    matches = finder.keyword_search("风险评估", lookup)
+    assert [entry.id for entry, _exact, _hits, _content in matches] == [1]
+    assert matches[0][3] == 1
+    assert finder.keyword_search("证券期货", lookup) == []
+
+
+def test_keyword_search_matches_any_two_character_word(tmp_path):
+    texts = {
+        1: "本办法规范非银行支付机构的业务。",
+        2: "清算机构应当建立风险管理制度。",
+        3: "支付清算业务应当遵守本条例。",
+        4: "本通知自发布之日起施行。",
+    }
+    entries = []
+    for serial, text in texts.items():
+        text_path = tmp_path / f"doc{serial}.txt"
+        text_path.write_text(text, "utf-8")
+        entries.append(
+            {
+                "serial": serial,
+                "title": f"文件{serial}",
+                "remark": "",
+                "documents": [{"type": "text", "local_path": str(text_path)}],
+            }
+        )
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({"entries": entries}, ensure_ascii=False), "utf-8")
+    finder = PolicyFinder(str(state_path))
+
+    matches = finder.keyword_search("支付 清算")
+    assert [entry.id for entry, _exact, _hits, _content in matches][0] == 3
+    assert sorted(entry.id for entry, _exact, _hits, _content in matches) == [1, 2, 3]
+    assert [content for _entry, _exact, _hits, content in matches] == [2, 1, 1]
+
+
+def test_keyword_search_requires_a_whole_query_token(tmp_path):
+    texts = {
+        1: "中国人民银行关于加强支付结算管理的通知全文。",
+        2: "本通知自发布之日起施行。",
+        3: "加强支付业务管理。",
+    }
+    entries = []
+    for serial, text in texts.items():
+        text_path = tmp_path / f"doc{serial}.txt"
+        text_path.write_text(text, "utf-8")
+        entries.append(
+            {
+                "serial": serial,
+                "title": f"文件{serial}",
+                "remark": "",
+                "documents": [{"type": "text", "local_path": str(text_path)}],
+            }
+        )
+    state_path = tmp_path / "state.json"
+    state_path.write_text(json.dumps({"entries": entries}, ensure_ascii=False), "utf-8")
+    finder = PolicyFinder(str(state_path))
+
+    matches = finder.keyword_search("中国人民银行关于加强支付结算管理的通知")
+    assert [(entry.id, content) for entry, _exact, _hits, content in matches] == [(1, 1)]
+    matches = finder.keyword_search("支付结算")
+    assert [entry.id for entry, _exact, _hits, _content in matches] == [1]
+
+
 def test_get_policy_meta(policy_app):
     app, finder, lookup = policy_app
     route = _get_route(app, "/policies/{policy_id}", "GET")
@@ -342,3 +706,279 @@ def test_get_policy_outline(policy_app):
     assert outline
     assert outline[0]["type"] == "article"
     assert outline[0]["children"]
+
+
+def test_text_cache_compresses_cold_entries_within_budget():
+    text = "中国人民银行关于规范支付业务的通知。" * 200
+    cache = TextCache(max_bytes=sys.getsizeof(text) * 2, hot_bytes=sys.getsizeof(text))
+    cache.put("a", text)
+    cache.put("b", text + "乙")
+    stats = cache.stats()
+    assert stats["hot_entries"] == 1 and stats["cold_entries"] == 1
+    assert stats["compressions"] == 1
+    assert stats["bytes"] <= stats["max_bytes"]
+
+    assert cache.get("a") == text
+    assert cache.stats()["cold_hits"] == 1
+    assert cache.get("missing", "default") == "default"
+    cache.put("none", None)
+    assert cache.get("none", "default") is None
+
+    plain = TextCache(max_bytes=sys.getsizeof(text) + 100, compress=False)
+    plain.put("a", text)
+    plain.put("b", text + "乙")
+    assert "a" not in plain and "b" in plain
+    stats = plain.stats()
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 0 and stats["misses"] == 0
+
+
+def test_policy_text_cache_respects_budget(policy_app):
+    _app, finder, lookup = policy_app
+    finder.text_cache = TextCache(max_bytes=0)
+    entry = next(e for e in finder.entries if finder.get_entry_text(e, lookup))
+    first = finder.get_entry_text(entry, lookup)
+    assert first
+    assert finder.get_entry_text(entry, lookup) == first
+    stats = finder.text_cache_stats()
+    assert stats["entries"] == 0
+    assert stats["hits"] == 0
+
+
+def test_title_index_matches_difflib_semantics():
+    import random
+    from difflib import get_close_matches
+
+    rng = random.Random(7)
+    alphabet = "中国人民银行关于支付结算业务管理办法通知规定实施细则金融机构"
+    keys = list(dict.fromkeys(
+        "".join(rng.choice(alphabet) for _ in range(rng.randint(2, 14))) for _ in range(300)
+    ))
+    index = TitleIndex(keys)
+    queries = [key[:-1] + "款" for key in keys[:60]] + [key[1:] for key in keys[60:90]]
+    queries += ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12))) for _ in range(60)]
+    for query in queries:
+        expected = get_close_matches(query, keys, n=1, cutoff=0.75)
+        assert index.close_match(query) == (expected[0] if expected else None)
+        assert index.containing(query) == [key for key in keys if query in key or key in query]
+
+
+def test_find_entry_falls_back_to_close_title(policy_app):
+    _app, finder, _lookup = policy_app
+    entry = finder.entries[0]
+    assert finder.find_entry(entry.title[:-1] + "某") is entry
+
+
+def _collect_stream(response) -> Dict:
+    async def consume() -> bytes:
+        chunks = []
+        async for chunk in response.body_iterator:
+            chunks.append(chunk if isinstance(chunk, bytes) else chunk.encode("utf-8"))
+        return b"".join(chunks)
+
+    return json.loads(asyncio.run(consume()).decode("utf-8"))
+
+
+def test_batch_endpoints_stream_results_in_order(policy_app, monkeypatch):
+    import pbc_regulations.searcher.policy_finder as policy_finder_module
+
+    app, finder, lookup = policy_app
+    loads = []
+    original = policy_finder_module._load_document_text
+
+    def counting_load(path, declared_type):
+        loads.append(path)
+        return original(path, declared_type)
+
+    monkeypatch.setattr(policy_finder_module, "_load_document_text", counting_load)
+
+    clause_route = _get_route(app, "/clause/batch", "POST")
+    body = {
+        "items": [
+            "《中国人民银行公告〔2023〕第3号 关于测试》第三条第一款",
+            {"title": "中国人民银行公告〔2023〕第3号 关于测试", "item": "第三条第二款"},
+            {"title": "不存在的文件", "item": "第一条"},
+            "没有书名号",
+        ]
+    }
+    response = asyncio.run(
+        clause_route.endpoint(
+            request=_SimpleRequest(json.dumps(body, ensure_ascii=False).encode("utf-8")),
+            lookup=lookup,
+        )
+    )
+    data = _collect_stream(response)
+    assert data["result_count"] == 4
+    assert [item["index"] for item in data["results"]] == [0, 1, 2, 3]
+    assert [item["status"] for item in data["results"]] == [200, 200, 404, 400]
+    assert "收单机构" in data["results"][0]["clause_text"]
+    assert "依法合规" in data["results"][1]["clause_text"]
+    assert loads and len(loads) == len(set(loads))
+
+    search_route = _get_route(app, "/search/batch", "POST")
+    body = {"queries": ["人民银行公告", {"query": "支付清算", "topk": 1}, {"topk": 2}], "topk": 2}
+    response = asyncio.run(
+        search_route.endpoint(
+            request=_SimpleRequest(json.dumps(body, ensure_ascii=False).encode("utf-8")),
+            finder_instance=finder,
+        )
+    )
+    data = _collect_stream(response)
+    assert [item["status"] for item in data["results"]] == [200, 200, 400]
+    assert data["results"][0]["query"] == "人民银行公告"
+    assert data["results"][0]["topk"] == 2
+    assert data["results"][1]["results"][0]["title"] == "行政法规 支付清算管理条例"
+
+
+def test_search_responses_are_cached_per_normalized_query(policy_app):
+    app, finder, _lookup = policy_app
+    route = _get_route(app, "/search", "GET")
+
+    def call(query):
+        response = route.endpoint(
+            query=query,
+            q=None,
+            topk="1",
+            include_documents=None,
+            documents=None,
+            finder_instance=finder,
+        )
+        return json.loads(response.body.decode("utf-8"))
+
+    first = call("中国人民银行公告 第三条第一款")
+    second = call("中国人民银行公告  第三条第一款")
+    assert second["query"] == "中国人民银行公告  第三条第一款"
+    assert second["clause_reference"]["raw"] == "中国人民银行公告  第三条第一款"
+    assert second["results"][0]["clause"]["reference"]["raw"] == "中国人民银行公告  第三条第一款"
+    assert first["results"][0]["title"] == second["results"][0]["title"]
+    stats = app.state.query_cache.stats()
+    assert stats["hits"] == 1 and stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_search_cache_skips_transient_clause_errors(policy_app, monkeypatch):
+    from pbc_regulations.searcher import policy_finder as policy_finder_module
+
+    app, finder, _lookup = policy_app
+    route = _get_route(app, "/search", "GET")
+    monkeypatch.setattr(
+        policy_finder_module,
+        "_load_document_text",
+        lambda path, declared_type: (None, declared_type, "parser_busy"),
+    )
+    finder.text_cache.clear()
+
+    def call():
+        response = route.endpoint(
+            query="中国人民银行公告 第三条第一款",
+            q=None,
+            topk="1",
+            include_documents=None,
+            documents=None,
+            finder_instance=finder,
+        )
+        return json.loads(response.body.decode("utf-8"))
+
+    assert call()["results"][0]["clause"]["error"] == "parser_busy"
+    assert len(app.state.query_cache) == 0
+    monkeypatch.undo()
+    assert call()["results"][0]["clause"].get("error") != "parser_busy"
+    assert len(app.state.query_cache) == 1
+
+
+def test_query_cache_coalesces_and_invalidates():
+    import threading
+
+    cache = QueryCache(max_entries=2)
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "value"
+
+    owner = object()
+    results = []
+    leader = threading.Thread(target=lambda: results.append(cache.get_or_compute(owner, "k", slow)))
+    leader.start()
+    assert started.wait(5)
+    follower = threading.Thread(target=lambda: results.append(cache.get_or_compute(owner, "k", slow)))
+    follower.start()
+    while cache.stats()["coalesced"] == 0:
+        pass
+    release.set()
+    leader.join(5)
+    follower.join(5)
+    assert results == ["value", "value"]
+    assert len(calls) == 1
+    assert cache.get_or_compute(owner, "k", slow) == "value"
+    assert len(calls) == 1
+
+    assert cache.get_or_compute(object(), "k", lambda: "new") == "new"
+    stats = cache.stats()
+    assert stats["invalidations"] == 1
+    assert stats["hits"] == 1 and stats["coalesced"] == 1 and stats["misses"] == 2
+
+
+def test_tfidf_numpy_engine_matches_python_engine(monkeypatch):
+    pytest.importorskip("numpy")
+    documents = [
+        "行政法规 支付清算管理条例",
+        "非银行支付机构监督管理条例",
+        "金融控股公司监督管理办法",
+        "清算机构 清算业务 风险管理",
+        "",
+    ]
+    queries = ("支付清算", "监督管理 条例", "清算", "证券")
+    vectorised = tfidf.TfidfRanker(documents)
+    assert vectorised.engine == "numpy"
+    assert vectorised._postings == {}
+    vectorised_scores = [vectorised.scores(query) for query in queries]
+    monkeypatch.setattr(tfidf, "np", None)
+    reference = tfidf.TfidfRanker(documents)
+    assert reference.engine == "python"
+
+    for query, actual in zip(queries, vectorised_scores):
+        expected = reference.scores(query)
+        assert set(actual) == set(expected)
+        for doc_id, score in expected.items():
+            assert actual[doc_id] == pytest.approx(score)
+
+
+def test_tfidf_mode_ranks_by_title_terms(policy_app, monkeypatch):
+    app, finder, _lookup = policy_app
+    route = _get_route(app, "/search", "GET")
+
+    def call(**params):
+        response = route.endpoint(
+            query=params.pop("query"),
+            q=None,
+            topk="2",
+            include_documents=None,
+            documents=None,
+            finder_instance=finder,
+            **params,
+        )
+        return response.status_code, json.loads(response.body.decode("utf-8"))
+
+    status, data = call(query="支付清算 条例", mode="tfidf")
+    assert status == 200
+    assert data["mode"] == "tfidf"
+    assert data["results"][0]["title"] == "行政法规 支付清算管理条例"
+    status, data = call(query="支付清算 条例", mode="bm25")
+    assert status == 400
+
+    ranked = [(entry.id, score) for entry, score in finder.search("支付清算", topk=3, mode="tfidf")]
+    monkeypatch.setattr(tfidf, "np", None)
+    fallback = PolicyFinder()
+    fallback.index_entries(finder.entries)
+    assert fallback.tfidf_ranker().engine == "python"
+    expected = fallback.search("支付清算", topk=3, mode="tfidf")
+    assert [entry.id for entry, _score in expected] == [entry_id for entry_id, _ in ranked]
+    for (_entry, score), (_id, reference) in zip(expected, ranked):
+        assert score == pytest.approx(reference)
+    with pytest.raises(ValueError):
+        finder.search("支付清算", mode="bm25")
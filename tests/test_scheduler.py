@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from pbc_regulations.icrawler import pbc_monitor
+from pbc_regulations.icrawler import parser_policy
+from pbc_regulations.icrawler.scheduler import MonitorScheduler, load_schedule
+from pbc_regulations.icrawler.throttle import HostThrottle
+
+
+def test_host_throttle_spaces_requests_per_host():
+    clock = [100.0]
+    throttle = HostThrottle(2.0, clock=lambda: clock[0], sleep=lambda s: None)
+
+    assert throttle.reserve("http://www.pbc.gov.cn/a.html") == 0
+    assert throttle.reserve("http://www.pbc.gov.cn/b.html") == 2.0
+    assert throttle.reserve("http://WWW.PBC.GOV.CN/c.html") == 4.0
+    assert throttle.reserve("http://other.example.com/") == 0
+
+    clock[0] = 110.0
+    assert throttle.reserve("http://www.pbc.gov.cn/d.html") == 0
+
+
+def test_host_throttle_try_reserve_claims_only_free_slots():
+    clock = [0.0]
+    throttle = HostThrottle(2.0, clock=lambda: clock[0], sleep=lambda s: None)
+
+    assert throttle.try_reserve("http://a.example/1") == 0.0
+    assert throttle.try_reserve("http://a.example/2") == 2.0
+    clock[0] = 1.5
+    assert throttle.try_reserve("http://a.example/3") == 0.5
+    clock[0] = 2.0
+    assert throttle.try_reserve("http://a.example/4") == 0.0
+    assert throttle.reserve("http://a.example/5") == 2.0
+
+
+def test_scheduler_records_next_run_times(tmp_path):
+    schedule_path = tmp_path / "schedule.json"
+    now = datetime(2024, 5, 1, 12, 0, 0)
+    scheduler = MonitorScheduler(str(schedule_path), now=lambda: now)
+    calls = []
+    job = scheduler.add_task("demo", lambda iteration: calls.append(iteration), 1, 1)
+
+    original_compute = pbc_monitor._compute_sleep_seconds
+    pbc_monitor._compute_sleep_seconds = lambda min_hours, max_hours: 3600.0
+    try:
+        sleep_seconds = scheduler.run_iteration(job)
+    finally:
+        pbc_monitor._compute_sleep_seconds = original_compute
+
+    assert calls == [1]
+    assert sleep_seconds == 3600.0
+    assert job.status == "sleeping"
+    assert job.next_run_at == now + timedelta(hours=1)
+
+    stored = json.loads(schedule_path.read_text(encoding="utf-8"))
+    assert stored["tasks"]["demo"]["next_run_at"] == "2024-05-01T13:00:00"
+
+    schedule = load_schedule(str(schedule_path))
+    assert schedule["demo"]["next_run_earliest"] == now + timedelta(hours=1)
+    assert schedule["demo"]["iteration"] == 1
+
+
+def test_scheduler_keeps_running_after_task_error(tmp_path):
+    scheduler = MonitorScheduler()
+
+    def _fail(iteration):
+        raise RuntimeError("boom")
+
+    job = scheduler.add_task("broken", _fail, 0, 0)
+    scheduler.run_iteration(job)
+
+    assert job.status == "error"
+    assert job.last_error == "boom"
+    assert job.next_run_at is not None
+
+
+def test_scheduler_runs_tasks_concurrently_with_own_parser():
+    scheduler = MonitorScheduler()
+    barrier = threading.Barrier(2, timeout=5)
+    seen = {}
+
+    def _make_run(name):
+        def _run(iteration):
+            seen[name] = pbc_monitor._active_parser_module()
+            barrier.wait()
+            scheduler.stop()
+
+        return _run
+
+    scheduler.add_task("default", _make_run("default"), 0, 0)
+    scheduler.add_task("policy", _make_run("policy"), 0, 0, parser_module=parser_policy)
+    scheduler.start()
+    scheduler.join(timeout=5)
+
+    assert seen["default"] is pbc_monitor._current_parser_module
+    assert seen["policy"] is parser_policy
+    assert all(job.status == "stopped" for job in scheduler.tasks)
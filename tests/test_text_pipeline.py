@@ -275,7 +275,8 @@ def test_process_state_data_extracts_text(tmp_path, fake_pdf_extractor):
     report = process_state_data(state_data, output_dir, state_path=state_path)
 
     assert len(report.records) == 4
-    assert len(list(output_dir.iterdir())) == 4
+    assert len(list(output_dir.glob("*.txt"))) == 4
+    assert len(list(output_dir.glob("*.structure.json"))) == 4
 
     records_by_serial = {record.serial: record for record in report.records}
 
@@ -342,3 +343,106 @@ def test_process_state_data_reports_progress(tmp_path):
 
     assert len(report.records) == 2
     assert progress_updates == [(0, "制度一"), (1, "制度二")]
+
+
+def test_process_state_data_reuses_text_by_hash(tmp_path, monkeypatch):
+    downloads = tmp_path / "downloads"
+    downloads.mkdir()
+    first = downloads / "first.html"
+    first.write_text("<html><body><p>相同正文</p></body></html>", encoding="utf-8")
+    second = downloads / "second.html"
+    second.write_text("<html><body><p>相同正文</p></body></html>", encoding="utf-8")
+
+    def _state():
+        return {
+            "entries": [
+                {
+                    "serial": 1,
+                    "title": "制度一",
+                    "documents": [
+                        {"url": "http://example.com/a.html", "type": "html", "local_path": str(first), "sha256": "abc"}
+                    ],
+                },
+                {
+                    "serial": 2,
+                    "title": "制度二",
+                    "documents": [
+                        {"url": "http://example.com/b.html", "type": "html", "local_path": str(second), "sha256": "abc"}
+                    ],
+                },
+            ]
+        }
+
+    calls: List[str] = []
+    original_attempt = text_pipeline._attempt_extract
+
+    def counting_attempt(candidate):
+        calls.append(str(candidate.path))
+        return original_attempt(candidate)
+
+    monkeypatch.setattr(text_pipeline, "_attempt_extract", counting_attempt)
+
+    output_dir = tmp_path / "texts"
+    previous = _state()
+    report = process_state_data(previous, output_dir)
+    assert calls == [str(first)]
+    assert [record.status for record in report.records] == ["success", "success"]
+    text_docs = [entry["documents"][-1] for entry in previous["entries"]]
+    assert [doc["source_sha256"] for doc in text_docs] == ["abc", "abc"]
+    assert (output_dir / text_docs[1]["url"][len("local-text://"):]).read_text(encoding="utf-8") == "相同正文"
+
+    calls.clear()
+    current = _state()
+    report = process_state_data(current, output_dir, previous_state=previous)
+    assert calls == []
+    assert [record.text_path for record in report.records] == [Path(doc["local_path"]) for doc in text_docs]
+    assert current["entries"][0]["documents"][-1]["url"] == text_docs[0]["url"]
+
+    current["entries"][1]["documents"][0]["sha256"] = "changed"
+    report = process_state_data(current, output_dir, previous_state=previous)
+    assert calls == [str(second)]
+
+
+def test_process_state_data_reextracts_when_preferred_source_added(tmp_path, fake_pdf_extractor):
+    downloads = tmp_path / "downloads"
+    downloads.mkdir()
+    page = downloads / "page.html"
+    page.write_text("<html><body><p>网页正文</p></body></html>", encoding="utf-8")
+    pdf_path = downloads / "with_text.pdf"
+    pdf_path.write_bytes(b"%PDF-1.4")
+
+    html_document = {"url": "http://example.com/a.html", "type": "html", "local_path": str(page), "sha256": "abc"}
+    output_dir = tmp_path / "texts"
+    previous = {"entries": [{"serial": 1, "title": "制度一", "documents": [dict(html_document)]}]}
+    process_state_data(previous, output_dir)
+    assert previous["entries"][0]["documents"][-1]["source_url"] == html_document["url"]
+
+    pdf_document = {"url": "http://example.com/a.pdf", "type": "pdf", "local_path": str(pdf_path), "sha256": "def"}
+    current = {"entries": [{"serial": 1, "title": "制度一", "documents": [dict(html_document), pdf_document]}]}
+    report = process_state_data(current, output_dir, previous_state=previous)
+
+    assert report.records[0].source_type == "pdf"
+    text_document = current["entries"][0]["documents"][-1]
+    assert text_document["source_url"] == pdf_document["url"]
+    assert Path(text_document["local_path"]).read_text(encoding="utf-8") == "PDF 正文内容"
+
+
+def test_text_pipeline_does_not_import_searcher() -> None:
+    import subprocess
+    import sys
+
+    repo_root = Path(__file__).resolve().parents[1]
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, pbc_regulations.icrawler.text_pipeline; "
+            "print(sorted(name for name in sys.modules if name.startswith('pbc_regulations.searcher')))",
+        ],
+        capture_output=True,
+        check=True,
+        cwd=repo_root,
+        text=True,
+    )
+
+    assert result.stdout.strip() == "[]"